@@ -0,0 +1,25 @@
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from config.project_config import get_data_path, PROJECT_ROOT
+from src.analyses.parquet_store import export_experiments_to_parquet
+
+# Columnar export (Parquet) of all experiments; read with src.analyses.parquet_store.scan_schedule_operations(...)
+
+# max_bottleneck_utilization_list = [0.75, 0.80, 0.85, 0.90, 0.95, 1.0]
+max_bottleneck_utilization_list = [None]    # None = all experiments
+
+# Use root DB
+db_path = str(PROJECT_ROOT / "experiments.db")
+parquet_root = get_data_path(file_name="parquet")
+
+for max_utilization in max_bottleneck_utilization_list:
+    start = time.perf_counter()
+    row_counts = export_experiments_to_parquet(
+        root=parquet_root,
+        max_bottleneck_utilization=max_utilization,
+        db_path=db_path
+    )
+    print(f"Max bottleneck utilization {max_utilization}: {row_counts} in {time.perf_counter() - start:.2f} s")
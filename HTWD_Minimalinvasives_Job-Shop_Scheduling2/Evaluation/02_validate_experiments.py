@@ -0,0 +1,19 @@
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from config.project_config import PROJECT_ROOT
+from src.analyses.schedule_validation import validate_experiments
+
+# Checks all schedules and simulations of the database (machine conflicts, technological order, earliest start,
+# simulated durations) in one pass
+
+# Use root DB
+db_path = str(PROJECT_ROOT / "experiments.db")
+
+start = time.perf_counter()
+df_violations = validate_experiments(db_path=db_path)
+print(f"Validation in {time.perf_counter() - start:.2f} s: {len(df_violations)} violation(s)")
+if not df_violations.empty:
+    print(df_violations.groupby(["Source", "Check", "Experiment_ID"]).size().to_string())
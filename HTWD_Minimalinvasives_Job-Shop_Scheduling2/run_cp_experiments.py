@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-from decimal import Decimal
 from itertools import product
 
 try:
@@ -10,9 +9,8 @@ except ModuleNotFoundError:
     import tomli as pytoml
 
 from config.project_config import get_config_path
+from src.CP_Grid_Executor import GridExecutor, GridPoint
 from src.Logger import Logger
-from src.domain.Initializer import ExperimentInitializer
-from src.CP_Experiment_Runner import run_experiment
 
 
 def _is_in_list_tol(x: float, values: list[float], tol: float = 1e-12) -> bool:
@@ -58,6 +56,35 @@ def main() -> None:
         help='Simulation noise sigma. Must be one of "simulation_sigma" from the config file.',
     )
 
+    parser.add_argument(
+        "--warm_start",
+        action="store_true",
+        help="Use the repaired previous schedule as CP-SAT solution hints.",
+    )
+    parser.add_argument(
+        "--probe_without_hints",
+        action="store_true",
+        help="With --warm_start: also measure the time to first solution without hints per shift.",
+    )
+
+    parser.add_argument(
+        "--parallel_experiments",
+        type=int,
+        default=1,
+        help="Number of experiments running in parallel (process pool).",
+    )
+    parser.add_argument(
+        "--total_cores",
+        type=int,
+        default=None,
+        help="Cores shared by the parallel experiments (default: MAX_CPU_NUMB or all cores).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue existing experiments and skip shifts already persisted in schedule_operation.",
+    )
+
     args = parser.parse_args()
 
     # Load config
@@ -99,36 +126,46 @@ def main() -> None:
     sigma = float(args.sigma)
 
     # Generate combinations (ohne sigma) und run
-    for (util, a_lat, i_tar) in product(
-        selected_utils,
-        grid["absolute_lateness_ratio"],
-        grid["inner_tardiness_ratio"],
-    ):
-        experiment_id = ExperimentInitializer.insert_experiment(
-            source_name=source_name,
+    grid_points = [
+        GridPoint(
+            max_bottleneck_utilization=util,
             absolute_lateness_ratio=a_lat,
             inner_tardiness_ratio=i_tar,
-            max_bottleneck_utilization=Decimal(f"{util:.2f}"),
             sim_sigma=sigma,  # feste Sigma aus CLI
-            experiment_type="CP",
         )
-        logger_name = f"experiments_{util:.2f}_sig{sigma:g}"
-        logger = Logger(name=logger_name, log_file=f"{logger_name}.log")
-        run_experiment(
-            experiment_id=experiment_id,
-            shift_length=shift_length,
-            total_shift_number=total_shift_number,
-            logger=logger,
-            time_limit=args.time_limit,
-            bound_no_improvement_time=args.bound_no_improvement_time,
-            bound_warmup_time=args.bound_warmup_time,
+        for (util, a_lat, i_tar) in product(
+            selected_utils,
+            grid["absolute_lateness_ratio"],
+            grid["inner_tardiness_ratio"],
         )
-
+    ]
+
+    logger_name = f"experiments_grid_sig{sigma:g}"
+    logger = Logger(name=logger_name, log_file=f"{logger_name}.log")
+
+    executor = GridExecutor(
+        source_name=source_name,
+        shift_length=shift_length,
+        total_shift_number=total_shift_number,
+        logger=logger,
+        parallel_experiments=args.parallel_experiments,
+        total_cores=args.total_cores,
+        experiment_type="CP",
+        resume=args.resume,
+        time_limit=args.time_limit,
+        bound_no_improvement_time=args.bound_no_improvement_time,
+        bound_warmup_time=args.bound_warmup_time,
+        warm_start=args.warm_start,
+        probe_without_hints=args.probe_without_hints,
+    )
+    executor.run(grid_points)
 
 if __name__ == "__main__":
     """
     Example usage:
     python run_cp_experiments.py --util 0.75 --sigma 0.1 --time_limit 1800 --bound_no_improvement_time 600 --bound_warmup_time 60
     python run_cp_experiments.py --util all --time_limit 900 --bound_no_improvement_time 300 --bound_warmup_time 30 --sigma 0.05
+    python run_cp_experiments.py --util 1.0 --sigma 0.2 --time_limit 600 --bound_no_improvement_time 120 --bound_warmup_time 30 --warm_start --probe_without_hints
+    python run_cp_experiments.py --util all --sigma 0.1 --time_limit 900 --bound_no_improvement_time 300 --bound_warmup_time 30 --parallel_experiments 4 --total_cores 64 --resume
     """
     main()
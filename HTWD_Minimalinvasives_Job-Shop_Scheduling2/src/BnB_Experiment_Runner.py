@@ -4,7 +4,9 @@ from decimal import Decimal
 from typing import Dict, Any
 
 from src.domain.Collection import LiveJobCollection
-from src.domain.Query import JobQuery, MachineInstanceQuery, ExperimentQuery
+from src.domain.JobCatalog import JobCatalog
+from src.domain.Query import ExperimentQuery
+from src.domain.OperationEnrichment import set_sim_durations
 from src.simulation.LognormalFactorGenerator import LognormalFactorGenerator
 from src.simulation.ProductionSimulation import ProductionSimulation
 
@@ -22,32 +24,15 @@ def run_experiment(
     # EIN Experiment
     simulation = ProductionSimulation(verbose=False)
 
-    jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
-        source_name=source_name,
-        max_bottleneck_utilization=Decimal(f"{max_bottleneck_utilization}"),
-        arrival_limit=60 * 24 * total_shift_number,
-    )
-    jobs_collection = LiveJobCollection(jobs)
-
-    machines_instances = MachineInstanceQuery.get_by_source_name_and_max_bottleneck_utilization(
-        source_name=source_name,
-        max_bottleneck_utilization=Decimal(f"{max_bottleneck_utilization}"),
-    )
-
-    # Transition times setzen
-    for machine_instance in machines_instances:
-        for job in jobs_collection.values():
-            for operation in job.operations:
-                if operation.machine_name == machine_instance.name:
-                    operation.transition_time = machine_instance.transition_time
+    # Jobs Collection with transition times (catalog loaded once per source and utilization)
+    job_catalog = JobCatalog.get(source_name=source_name, max_bottleneck_utilization=max_bottleneck_utilization)
+    jobs_collection = job_catalog.get_jobs_collection(arrival_limit=60 * 24 * total_shift_number)
 
     # Simulations-Dauern samplen
     factor_gen = LognormalFactorGenerator(sigma=sim_sigma, seed=42)
     jobs_collection.sort_jobs_by_id()
     jobs_collection.sort_operations()
-    for job in jobs_collection.values():
-        for operation in job.operations:
-            operation.sim_duration = int(operation.duration * factor_gen.sample())
+    set_sim_durations(jobs_collection, factor_gen)
 
     schedule_jobs_collection = LiveJobCollection()
     active_job_ops_collection = LiveJobCollection()
@@ -1,20 +1,63 @@
-from decimal import Decimal
-from typing import Optional
+import time
+from typing import Optional, Dict, Tuple, Sequence
 
-from config.project_config import get_solver_logs_path
 from src.EmailNotifier import EmailNotifier
 from src.Logger import Logger
 from src.domain.Collection import LiveJobCollection
-from src.domain.Query import JobQuery, ExperimentQuery, MachineQuery, MachineInstanceQuery
+from src.domain.JobCatalog import JobCatalog
+from src.domain.Query import ExperimentQuery, MachineQuery
 from src.domain.orm_models import Experiment
+from src.domain.OperationEnrichment import set_sim_durations
 from src.simulation.LognormalFactorGenerator import LognormalFactorGenerator
 from src.simulation.ProductionSimulation import ProductionSimulation
+from src.solvers.CP_RollingHorizonSolver import RollingHorizonSolver
 from src.solvers.CP_Solver import Solver
+from src.solvers.CP_StopPolicies import StopPolicy, TimeBudgetAllocator
+from src.solvers.TS_Solver import Solver as TabuSearchSolver
 
 
 def run_experiment(
         experiment_id: int,  shift_length: int, total_shift_number: int, logger: Logger,
-        time_limit: Optional[int] = 60*20, bound_warmup_time: int = 30, bound_no_improvement_time: Optional[int] = 60):
+        time_limit: Optional[int] = 60*20, bound_warmup_time: int = 30, bound_no_improvement_time: Optional[int] = 60,
+        warm_start: bool = False, probe_without_hints: bool = False,
+        num_search_workers: Optional[int] = None, resume: bool = False,
+        rolling_window_size: Optional[int] = None, rolling_overlap: int = 0,
+        stop_policies: Optional[Sequence[StopPolicy]] = None,
+        total_time_budget: Optional[float] = None, catalog_snapshot_dir: Optional[str] = None,
+        tabu_search: bool = False, tabu_max_no_improvement: Optional[int] = 1000) -> Dict[str, int]:
+    """
+    :param warm_start: If True, the previous schedule (shifted and repaired) is given to CP-SAT as solution hints
+    :param probe_without_hints: If True (and warm_start), each shift model is additionally solved until the first
+                                solution without hints to report the time to first solution with and without hints
+    :param num_search_workers: CP-SAT workers per solve (default: environment variable MAX_CPU_NUMB or 8)
+    :param resume: If True, shifts whose schedule is already persisted are not solved again. Their schedule is
+                   loaded from the database and only simulated (the simulation is deterministic).
+    :param rolling_window_size: If given, each shift is solved with the RollingHorizonSolver (due date windows of
+                                this length in minutes, time_limit shared by the windows) instead of one monolithic
+                                model
+    :param rolling_overlap: Overlap of the due date windows in minutes (jobs solved again in the next window)
+    :param stop_policies: Stop policies (CP_StopPolicies) instead of the BoundGuard (bound_* parameters)
+    :param total_time_budget: Time budget in seconds for all shifts to solve. Replaces time_limit: each shift gets
+                              an equal share of the remaining budget, time saved by early stops goes to later shifts.
+                              The whole wall time of a solved shift is charged (model building, probe, solving,
+                              simulation and persistence), so the budget is not overrun
+    :param catalog_snapshot_dir: Directory for JobCatalog snapshots (.npz), shared by runs in other processes
+    :param tabu_search: If True, each shift is solved with the tabu search (TS_Solver, time_limit in seconds)
+                        instead of CP-SAT. Cannot be combined with the CP-SAT options rolling_window_size,
+                        stop_policies, warm_start and probe_without_hints (ValueError)
+    :param tabu_max_no_improvement: The tabu search of a shift stops after this many iterations without a new best
+                                    solution (None: only time_limit)
+    :return: Number of solved and resumed shifts
+    """
+    if tabu_search:
+        cp_options = {
+            "rolling_window_size": rolling_window_size is not None, "stop_policies": bool(stop_policies),
+            "warm_start": warm_start, "probe_without_hints": probe_without_hints
+        }
+        combined = [name for name, is_set in cp_options.items() if is_set]
+        if combined:
+            raise ValueError(f"tabu_search cannot be combined with {', '.join(combined)}.")
+
     experiment = ExperimentQuery.get_experiment(experiment_id)
 
     source_name = experiment.routing_source.name
@@ -25,26 +68,11 @@ def run_experiment(
     # Preparation  ----------------------------------------------------------------------------------
     simulation = ProductionSimulation(verbose=False)
 
-    # Jobs Collection
-    jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
-        source_name=source_name,
-        max_bottleneck_utilization=Decimal(f"{max_bottleneck_utilization}"),
-        arrival_limit=60 * 24 * total_shift_number
-    )
-    jobs_collection = LiveJobCollection(jobs)
-
-    # Machines with transition times
-    machines_instances = MachineInstanceQuery.get_by_source_name_and_max_bottleneck_utilization(
-        source_name=source_name,
-        max_bottleneck_utilization=Decimal(f"{max_bottleneck_utilization}"),
+    # Jobs Collection with transition times (catalog loaded once per source and utilization)
+    job_catalog = JobCatalog.get(
+        source_name=source_name, max_bottleneck_utilization=max_bottleneck_utilization, snapshot_dir=catalog_snapshot_dir
     )
-
-    # Add transition times to operations
-    for machine_instance in machines_instances:
-        for job in jobs_collection.values():
-            for operation in job.operations:
-                if operation.machine_name == machine_instance.name:
-                    operation.transition_time = machine_instance.transition_time
+    jobs_collection = job_catalog.get_jobs_collection(arrival_limit=60 * 24 * total_shift_number)
 
     # Add simulation durations to operations
     factor_gen = LognormalFactorGenerator(
@@ -53,10 +81,7 @@ def run_experiment(
     )
     jobs_collection.sort_jobs_by_id()
     jobs_collection.sort_operations()
-    for job in jobs_collection.values():
-        for operation in job.operations:
-            sim_duration_float = operation.duration * factor_gen.sample()
-            operation.sim_duration = int(sim_duration_float)
+    set_sim_durations(jobs_collection, factor_gen)
 
 
     # Collections(empty)
@@ -65,8 +90,21 @@ def run_experiment(
 
     waiting_job_ops_collection = LiveJobCollection()
 
+    # shift_number -> (time to first solution with hints, without hints)
+    first_solution_times: Dict[int, Tuple[Optional[float], Optional[float]]] = {}
+
+    persisted_shift_numbers = ExperimentQuery.get_scheduled_shift_numbers(experiment_id) if resume else set()
+    solved_shifts = 0
+
+    budget_allocator = None
+    if total_time_budget is not None:
+        shifts_to_solve = len(set(range(1, total_shift_number + 1)) - persisted_shift_numbers)
+        budget_allocator = TimeBudgetAllocator(total_budget=total_time_budget, number_of_shifts=max(shifts_to_solve, 1))
+    resumed_shifts = 0
+
     # Shifts ----------------------------------------------------------------------------------------
     for shift_number in range(1, total_shift_number + 1):
+        shift_started = time.perf_counter()
         shift_start = shift_number * shift_length
         shift_end = (shift_number + 1) * shift_length
         logger.info(f"Experiment {experiment_id} shift {shift_number}: {shift_start} to {shift_end}")
@@ -75,43 +113,112 @@ def run_experiment(
         current_jobs_collection = new_jobs_collection + waiting_job_ops_collection
 
         # Scheduling --------------------------------------------------------------
-        solver = Solver(
-            jobs_collection=current_jobs_collection,
-            logger = logger,
-            schedule_start=shift_start
-        )
-
-        solver.build_model__absolute_lateness__start_deviation__minimization(
-            previous_schedule_jobs_collection=schedule_jobs_collection,
-            active_jobs_collection=active_job_ops_collection,
-            w_t=w_t, w_e=w_e, w_dev=w_dev
-        )
-
-        solver.log_model_info()
-
-        file_path = get_solver_logs_path(
-            sub_directory=f"Experiment_{experiment_id:03d}",
-            file_name=f"Shift_{shift_number:02d}.log",
-            as_string=True
-        )
-
-        solver.solve_model(
-            gap_limit=0.002,
-            time_limit=time_limit,
-            log_file=file_path,
-            bound_relative_change= 0.01,
-            bound_no_improvement_time= bound_no_improvement_time,
-            bound_warmup_time=bound_warmup_time,
-        )
-
-        solver.log_solver_info()
-        schedule_jobs_collection = solver.get_schedule()
-
-        ExperimentQuery.save_schedule_jobs(
-            experiment_id=experiment_id,
-            shift_number=shift_number,
-            live_jobs=schedule_jobs_collection.values(),
-        )
+        persisted_schedule = None
+        if shift_number in persisted_shift_numbers:
+            persisted_schedule = load_persisted_schedule(experiment_id, shift_number, current_jobs_collection)
+
+        shift_time_limit = time_limit
+        if budget_allocator is not None and persisted_schedule is None:
+            shift_time_limit = budget_allocator.next_time_limit()
+            logger.info(f"Experiment {experiment_id} shift {shift_number}: time limit {shift_time_limit:.1f}s "
+                        f"(remaining budget {budget_allocator.remaining_budget:.1f}s)")
+
+        if persisted_schedule is not None:
+            logger.info(f"Experiment {experiment_id} shift {shift_number}: schedule loaded from database")
+            schedule_jobs_collection = persisted_schedule
+            resumed_shifts += 1
+        elif tabu_search:
+            solver = TabuSearchSolver(
+                jobs_collection=current_jobs_collection,
+                logger=logger,
+                schedule_start=shift_start,
+            )
+            solver.build_model__absolute_lateness__start_deviation__minimization(
+                previous_schedule_jobs_collection=schedule_jobs_collection,
+                active_jobs_collection=active_job_ops_collection,
+                w_t=w_t, w_e=w_e, w_dev=w_dev
+            )
+            solver.solve_model(time_limit=shift_time_limit, max_no_improvement=tabu_max_no_improvement)
+            solver.log_solver_info()
+            schedule_jobs_collection = solver.get_schedule()
+            solved_shifts += 1
+        elif rolling_window_size is not None:
+            solver = RollingHorizonSolver(
+                jobs_collection=current_jobs_collection,
+                logger=logger,
+                schedule_start=shift_start,
+                window_size=rolling_window_size,
+                overlap=rolling_overlap,
+            )
+            solver.build_model__absolute_lateness__start_deviation__minimization(
+                previous_schedule_jobs_collection=schedule_jobs_collection,
+                active_jobs_collection=active_job_ops_collection,
+                w_t=w_t, w_e=w_e, w_dev=w_dev
+            )
+            solver.solve_model(
+                warm_start=warm_start,
+                gap_limit=0.002,
+                num_search_workers=num_search_workers,
+                time_limit=shift_time_limit,
+                bound_relative_change=0.01,
+                bound_no_improvement_time=bound_no_improvement_time,
+                bound_warmup_time=bound_warmup_time,
+                stop_policies=stop_policies,
+            )
+            solver.log_solver_info()
+            schedule_jobs_collection = solver.get_schedule()
+            solved_shifts += 1
+        else:
+            solver = Solver(
+                jobs_collection=current_jobs_collection,
+                logger = logger,
+                schedule_start=shift_start
+            )
+
+            solver.build_model__absolute_lateness__start_deviation__minimization(
+                previous_schedule_jobs_collection=schedule_jobs_collection,
+                active_jobs_collection=active_job_ops_collection,
+                w_t=w_t, w_e=w_e, w_dev=w_dev
+            )
+
+            if warm_start:
+                solver.add_warm_start_hints()
+
+            solver.log_model_info()
+
+            probe_time = None
+            if warm_start and probe_without_hints:
+                probe_time = solver.probe_time_to_first_solution(
+                    with_hints=False, time_limit=shift_time_limit, num_search_workers=num_search_workers
+                )
+
+            solver.solve_model(
+                gap_limit=0.002,
+                num_search_workers=num_search_workers,
+                time_limit=shift_time_limit,
+                bound_relative_change= 0.01,
+                bound_no_improvement_time= bound_no_improvement_time,
+                bound_warmup_time=bound_warmup_time,
+                stop_policies=stop_policies,
+            )
+
+            solver.log_solver_info()
+            schedule_jobs_collection = solver.get_schedule()
+
+            # Convergence of the search (instead of the solver log file)
+            ExperimentQuery.save_solver_progress(
+                experiment_id=experiment_id,
+                shift_number=shift_number,
+                progress_points=solver.progress_recorder.get_points(),
+            )
+
+            first_solution_time = solver.solution_timer.first_solution_time
+            if warm_start:
+                first_solution_times[shift_number] = (first_solution_time, probe_time)
+            else:
+                first_solution_times[shift_number] = (None, first_solution_time)
+
+            solved_shifts += 1
 
         # Simulation --------------------------------------------------------------
         simulation.run(
@@ -120,22 +227,69 @@ def run_experiment(
             end_time=shift_end
         )
 
+        # Schedule and finished operations of the shift in one transaction: after an interruption either both
+        # are persisted (shift is resumed from the schedule) or neither (shift is solved and simulated again)
+        ExperimentQuery.save_shift_jobs(
+            experiment_id=experiment_id,
+            shift_number=shift_number,
+            schedule_jobs=schedule_jobs_collection.values() if persisted_schedule is None else None,
+            simulation_jobs=simulation.get_finished_operation_collection().values(),
+        )
+
         active_job_ops_collection = simulation.get_active_operation_collection()
         waiting_job_ops_collection = simulation.get_waiting_operation_collection()
 
+        if budget_allocator is not None and persisted_schedule is None:
+            budget_allocator.register(time.perf_counter() - shift_started)
+
         if shift_number == 1:
             notify(experiment, logger, shift_number, last_lines=30)
         elif shift_number % 10 == 0:
             notify(experiment, logger, shift_number, last_lines=100)
 
-    # Save entire Simulation -------------------------------------------------------
-    entire_simulation_jobs = simulation.get_entire_finished_operation_collection()
-    ExperimentQuery.save_simulation_jobs(
-        experiment_id=experiment_id,
-        live_jobs=entire_simulation_jobs.values(),
-    )
-    logger.info(f"Experiment {experiment_id} finished")
+    log_first_solution_times(logger, first_solution_times)
+    logger.info(f"Experiment {experiment_id} finished ({solved_shifts} solved, {resumed_shifts} resumed shifts)")
     notify(experiment, logger, last_lines= 2)
+    return {"solved_shifts": solved_shifts, "resumed_shifts": resumed_shifts}
+
+
+def load_persisted_schedule(
+        experiment_id: int, shift_number: int, jobs_collection: LiveJobCollection) -> Optional[LiveJobCollection]:
+    """
+    Rebuilds the persisted schedule of a shift for the operations of the given collection.
+
+    :return: Schedule or None if the persisted schedule does not match the operations (shift must be solved again)
+    """
+    operation_times = ExperimentQuery.get_schedule_operation_times(experiment_id, shift_number)
+
+    # same order as Solver.get_schedule()
+    jobs_collection.sort_operations()
+    jobs_collection.sort_jobs_by_arrival()
+
+    schedule_jobs_collection = LiveJobCollection()
+    for job in jobs_collection.values():
+        for operation in job.operations:
+            times = operation_times.get((job.id, operation.position_number))
+            if times is None:
+                return None
+            start, end = times
+            schedule_jobs_collection.add_operation_instance(op=operation, new_start=start, new_end=end)
+
+    if schedule_jobs_collection.count_operations() != len(operation_times):
+        return None
+    return schedule_jobs_collection
+
+
+def log_first_solution_times(logger: Logger, first_solution_times: Dict[int, Tuple[Optional[float], Optional[float]]]):
+    """
+    Logs the time to first solution per shift with and without solution hints ('-' if not measured).
+    """
+    def _format(value: Optional[float]) -> str:
+        return f"{value:.2f}s" if value is not None else "-"
+
+    logger.info("Time to first solution " + "-" * 15)
+    for shift_number, (with_hints, without_hints) in first_solution_times.items():
+        logger.info(f"Shift {shift_number:02d}: with hints {_format(with_hints):>9} | without hints {_format(without_hints):>9}")
 
 
 def notify(experiment:Experiment, logger: Logger, shift_number: Optional[int] = None, last_lines: int = 10):
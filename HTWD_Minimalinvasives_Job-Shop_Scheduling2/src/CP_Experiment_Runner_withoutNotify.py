@@ -6,6 +6,8 @@ from src.Logger import Logger
 from src.domain.Collection import LiveJobCollection
 from src.domain.Query import JobQuery, ExperimentQuery, MachineQuery, MachineInstanceQuery
 from src.domain.orm_models import Experiment
+from src.domain.OperationEnrichment import enrich_operations_by_machine, machine_attributes_from_instances, \
+    set_sim_durations
 from src.simulation.LognormalFactorGenerator import LognormalFactorGenerator
 from src.simulation.ProductionSimulation import ProductionSimulation
 from src.solvers.CP_Solver import Solver
@@ -39,11 +41,7 @@ def run_experiment(
     )
 
     # Add transition times to operations
-    for machine_instance in machines_instances:
-        for job in jobs_collection.values():
-            for operation in job.operations:
-                if operation.machine_name == machine_instance.name:
-                    operation.transition_time = machine_instance.transition_time
+    enrich_operations_by_machine(jobs_collection, machine_attributes_from_instances(machines_instances))
 
     # Add simulation durations to operations
     factor_gen = LognormalFactorGenerator(
@@ -52,10 +50,7 @@ def run_experiment(
     )
     jobs_collection.sort_jobs_by_id()
     jobs_collection.sort_operations()
-    for job in jobs_collection.values():
-        for operation in job.operations:
-            sim_duration_float = operation.duration * factor_gen.sample()
-            operation.sim_duration = int(sim_duration_float)
+    set_sim_durations(jobs_collection, factor_gen)
 
 
     # Collections(empty)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Optional, List, Dict, Any
+
+from src.CP_Experiment_Runner import run_experiment
+from src.Logger import Logger
+from src.domain.Initializer import ExperimentInitializer
+from src.domain.Query import ExperimentQuery
+from src.domain.orm_setup import my_engine
+
+
+@dataclass(frozen=True)
+class GridPoint:
+    max_bottleneck_utilization: float
+    absolute_lateness_ratio: float
+    inner_tardiness_ratio: float
+    sim_sigma: float
+
+    @property
+    def logger_name(self) -> str:
+        return f"experiments_{self.max_bottleneck_utilization:.2f}_sig{self.sim_sigma:g}"
+
+
+@dataclass
+class GridExperimentResult:
+    experiment_id: int
+    grid_point: GridPoint
+    solved_shifts: int = 0
+    resumed_shifts: int = 0
+    wall_time: float = 0.0
+    skipped: bool = False
+    error: Optional[str] = field(default=None, repr=False)
+
+
+class GridExecutor:
+    """
+    Runs the CP experiments of a parameter grid, optionally several experiments in parallel
+    (process pool). The available cores are split between the concurrent experiments and the
+    CP-SAT search workers of each solve.
+    """
+    def __init__(
+            self, source_name: str, shift_length: int, total_shift_number: int, logger: Logger,
+            parallel_experiments: int = 1, total_cores: Optional[int] = None,
+            experiment_type: str = "CP", resume: bool = False, **run_kwargs: Any):
+        """
+        :param parallel_experiments: Number of experiments running at the same time
+        :param total_cores: Cores to share (default: environment variable MAX_CPU_NUMB or os.cpu_count())
+        :param experiment_type: Type of the experiments in the database
+        :param resume: If True, existing experiments with the same parameters are continued. Shifts whose schedule
+                       is already persisted are not solved again, completed experiments are skipped.
+        :param run_kwargs: Further arguments for run_experiment (time_limit, bound_no_improvement_time, ...)
+        """
+        if parallel_experiments < 1:
+            raise ValueError("parallel_experiments must be >= 1.")
+        if total_cores is None:
+            total_cores = int(os.environ.get("MAX_CPU_NUMB", os.cpu_count() or 1))
+
+        self.source_name = source_name
+        self.shift_length = shift_length
+        self.total_shift_number = total_shift_number
+        self.logger = logger
+        self.parallel_experiments = parallel_experiments
+        self.num_search_workers = max(1, total_cores // parallel_experiments)
+        self.experiment_type = experiment_type
+        self.resume = resume
+        self.run_kwargs = run_kwargs
+
+    def run(self, grid_points: List[GridPoint]) -> List[GridExperimentResult]:
+        self.logger.info(
+            f"Grid with {len(grid_points)} experiments: {self.parallel_experiments} in parallel "
+            f"with {self.num_search_workers} CP-SAT workers each"
+        )
+        started = time.monotonic()
+        results: List[GridExperimentResult] = []
+
+        pending: Dict[int, GridPoint] = {}
+        for grid_point in grid_points:
+            experiment_id = self._get_experiment_id(grid_point)
+            if experiment_id is None:
+                continue
+            if self.resume and self._is_completed(experiment_id):
+                self.logger.info(f"Experiment {experiment_id} already completed - skipped")
+                results.append(GridExperimentResult(experiment_id, grid_point, skipped=True))
+                continue
+            pending[experiment_id] = grid_point
+
+        task_kwargs = dict(
+            shift_length=self.shift_length,
+            total_shift_number=self.total_shift_number,
+            num_search_workers=self.num_search_workers,
+            resume=self.resume,
+            separate_logs=self.parallel_experiments > 1,
+            run_kwargs=self.run_kwargs,
+        )
+
+        if self.parallel_experiments == 1:
+            for experiment_id, grid_point in pending.items():
+                result = _run_grid_experiment(experiment_id, grid_point, **task_kwargs)
+                results.append(result)
+                self._log_progress(result, results, len(grid_points), started)
+        else:
+            with ProcessPoolExecutor(max_workers=self.parallel_experiments, initializer=_init_worker) as pool:
+                futures = {
+                    pool.submit(_run_grid_experiment, experiment_id, grid_point, **task_kwargs): experiment_id
+                    for experiment_id, grid_point in pending.items()
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    results.append(result)
+                    self._log_progress(result, results, len(grid_points), started)
+
+        self._log_summary(results, started)
+        return results
+
+    def _get_experiment_id(self, grid_point: GridPoint) -> Optional[int]:
+        max_bottleneck_utilization = Decimal(f"{grid_point.max_bottleneck_utilization:.2f}")
+        if self.resume:
+            experiment_id = ExperimentQuery.find_experiment_id(
+                source_name=self.source_name,
+                absolute_lateness_ratio=grid_point.absolute_lateness_ratio,
+                inner_tardiness_ratio=grid_point.inner_tardiness_ratio,
+                max_bottleneck_utilization=max_bottleneck_utilization,
+                sim_sigma=grid_point.sim_sigma,
+                experiment_type=self.experiment_type,
+            )
+            if experiment_id is not None:
+                return experiment_id
+
+        return ExperimentInitializer.insert_experiment(
+            source_name=self.source_name,
+            absolute_lateness_ratio=grid_point.absolute_lateness_ratio,
+            inner_tardiness_ratio=grid_point.inner_tardiness_ratio,
+            max_bottleneck_utilization=max_bottleneck_utilization,
+            sim_sigma=grid_point.sim_sigma,
+            experiment_type=self.experiment_type,
+        )
+
+    def _is_completed(self, experiment_id: int) -> bool:
+        scheduled_shifts = ExperimentQuery.get_scheduled_shift_numbers(experiment_id)
+        all_shifts = set(range(1, self.total_shift_number + 1))
+        return all_shifts <= scheduled_shifts and ExperimentQuery.has_simulation_jobs(experiment_id)
+
+    def _log_progress(
+            self, result: GridExperimentResult, results: List[GridExperimentResult], total: int, started: float):
+        elapsed = time.monotonic() - started
+        done = len(results)
+        if result.error is not None:
+            self.logger.error(f"Experiment {result.experiment_id} failed: {result.error}")
+        else:
+            self.logger.info(
+                f"Experiment {result.experiment_id} finished in {result.wall_time:.0f}s "
+                f"({result.solved_shifts} solved, {result.resumed_shifts} resumed shifts)"
+            )
+
+        solved_shifts = sum(r.solved_shifts for r in results)
+        hours = max(elapsed, 1e-9) / 3600
+        remaining = elapsed / done * (total - done) if done else 0.0
+        self.logger.info(
+            f"Progress {done}/{total} experiments | elapsed {elapsed / 60:.1f} min | "
+            f"{done / hours:.2f} experiments/h | {solved_shifts / hours:.1f} solved shifts/h | "
+            f"ETA {remaining / 60:.1f} min"
+        )
+
+    def _log_summary(self, results: List[GridExperimentResult], started: float):
+        elapsed = time.monotonic() - started
+        failed = [r.experiment_id for r in results if r.error is not None]
+        self.logger.info("Grid summary " + "-" * 20)
+        self.logger.info(f"{'Experiments':20}: {len(results)}")
+        self.logger.info(f"{'Skipped (completed)':20}: {sum(r.skipped for r in results)}")
+        self.logger.info(f"{'Failed':20}: {failed if failed else 0}")
+        self.logger.info(f"{'Solved shifts':20}: {sum(r.solved_shifts for r in results)}")
+        self.logger.info(f"{'Resumed shifts':20}: {sum(r.resumed_shifts for r in results)}")
+        self.logger.info(f"{'Wall time':20}: {elapsed / 60:.1f} min")
+
+
+def _init_worker():
+    # SQLite connections must not be shared with the parent process
+    my_engine.dispose(close=False)
+
+
+def _run_grid_experiment(
+        experiment_id: int, grid_point: GridPoint, shift_length: int, total_shift_number: int,
+        num_search_workers: int, resume: bool, separate_logs: bool, run_kwargs: Dict[str, Any]
+) -> GridExperimentResult:
+    logger_name = grid_point.logger_name
+    if separate_logs:
+        logger_name = f"{logger_name}_exp{experiment_id:03d}"
+    logger = Logger(name=logger_name, log_file=f"{logger_name}.log")
+
+    started = time.monotonic()
+    result = GridExperimentResult(experiment_id, grid_point)
+    try:
+        shift_counts = run_experiment(
+            experiment_id=experiment_id,
+            shift_length=shift_length,
+            total_shift_number=total_shift_number,
+            logger=logger,
+            num_search_workers=num_search_workers,
+            resume=resume,
+            **run_kwargs,
+        )
+        result.solved_shifts = shift_counts["solved_shifts"]
+        result.resumed_shifts = shift_counts["resumed_shifts"]
+    except Exception as e:
+        logger.exception(f"Experiment {experiment_id} failed")
+        result.error = repr(e)
+    result.wall_time = time.monotonic() - started
+    return result
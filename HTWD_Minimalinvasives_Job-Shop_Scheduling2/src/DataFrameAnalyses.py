@@ -14,7 +14,7 @@ from matplotlib import pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
-from typing import Literal, Optional, Union
+from typing import Literal, Optional, Union, List
 
 class DataFrameChecker:
     def __init__(self):
@@ -48,15 +48,104 @@ class DataFrameChecker:
         if not cls._is_job_timing_correct(df_schedule, job_id_column, operation_column, start_column, end_column):
             checks_passed = False
 
-        if cls._is_start_correct(df_schedule, start_column, earliest_start_column) is False:
+        if cls._is_start_correct(
+                df_schedule, job_column=job_id_column, start_column=start_column,
+                earliest_start_column=earliest_start_column) is False:
             checks_passed = False
 
         return checks_passed
 
+    @classmethod
+    def get_schedule_violations(
+            cls, df_schedule: pd.DataFrame, group_columns: Optional[List[str]] = None,
+            job_id_column: str = "Job", machine_column: str = "Machine", operation_column: str = "Operation",
+            earliest_start_column: str = "Ready Time", start_column: str = "Start", end_column: str = "End",
+            duration_column: Optional[str] = None, check_column: str = "Check",
+            reference_column: str = "Reference") -> pd.DataFrame:
+        """
+        Vectorized validation of one or many schedules (e.g. all shifts of all experiments at once).
+
+        Checks (one row per violating operation):
+        - "machine conflict": the operation starts before an earlier operation on the same machine has ended
+          (Reference = latest end of the earlier operations on the machine)
+        - "job order": the operation starts before its predecessor in the job has ended (Reference = end of the
+          predecessor)
+        - "early start": the operation starts before the earliest start of the job (Reference = earliest start),
+          only if earliest_start_column exists
+        - "duration": end - start differs from duration_column (Reference = duration), only if duration_column is given
+
+        :param df_schedule: Schedule DataFrame.
+        :param group_columns: Columns that separate independent schedules, e.g. ["Experiment_ID", "Shift"].
+        :param duration_column: Optional column with the (simulated) duration of the operations.
+        :return: DataFrame with the columns check_column, group_columns, job, operation, machine, start, end and
+                 reference_column (empty if the schedule is valid).
+        """
+        group_columns = list(group_columns or [])
+        columns = group_columns + [job_id_column, operation_column, machine_column, start_column, end_column]
+        parts = [
+            cls._get_overlap_violations(
+                df_schedule, group_columns + [machine_column], start_column, end_column, order_column=start_column,
+                check="machine conflict", check_column=check_column, reference_column=reference_column,
+                columns=columns
+            ),
+            cls._get_overlap_violations(
+                df_schedule, group_columns + [job_id_column], start_column, end_column, order_column=operation_column,
+                check="job order", check_column=check_column, reference_column=reference_column, columns=columns
+            ),
+        ]
+        if earliest_start_column in df_schedule.columns:
+            mask = (df_schedule[start_column] < df_schedule[earliest_start_column]).to_numpy()
+            parts.append(cls._violation_frame(
+                df_schedule[mask], df_schedule[earliest_start_column].to_numpy()[mask], "early start",
+                check_column, reference_column, columns
+            ))
+        if duration_column is not None:
+            mask = ((df_schedule[end_column] - df_schedule[start_column]) != df_schedule[duration_column]).to_numpy()
+            parts.append(cls._violation_frame(
+                df_schedule[mask], df_schedule[duration_column].to_numpy()[mask], "duration",
+                check_column, reference_column, columns
+            ))
+        return pd.concat(parts, ignore_index=True)
 
     @staticmethod
+    def _get_overlap_violations(
+            df_schedule: pd.DataFrame, key_columns: List[str], start_column: str, end_column: str,
+            order_column: str, check: str, check_column: str, reference_column: str,
+            columns: List[str]) -> pd.DataFrame:
+        # sort once, then compare each start with the latest end of the previous rows of the same key
+        df = df_schedule.sort_values(key_columns + [order_column, end_column], kind="stable")
+        n = len(df)
+        if n < 2:
+            return DataFrameChecker._violation_frame(df.iloc[0:0], np.empty(0), check, check_column,
+                                                     reference_column, columns)
+
+        same_key = np.ones(n - 1, dtype=bool)
+        for column in key_columns:
+            values = df[column].to_numpy()
+            same_key &= values[1:] == values[:-1]
+
+        latest_end = df.groupby(key_columns, sort=False, dropna=False)[end_column].cummax().to_numpy()
+        starts = df[start_column].to_numpy()
+        mask = np.zeros(n, dtype=bool)
+        mask[1:] = same_key & (starts[1:] < latest_end[:-1])
+
+        reference = np.empty(n, dtype=latest_end.dtype)
+        reference[1:] = latest_end[:-1]
+        return DataFrameChecker._violation_frame(df[mask], reference[mask], check, check_column,
+                                                 reference_column, columns)
+
+    @staticmethod
+    def _violation_frame(
+            df_rows: pd.DataFrame, reference: np.ndarray, check: str, check_column: str, reference_column: str,
+            columns: List[str]) -> pd.DataFrame:
+        df = df_rows[[column for column in columns if column in df_rows.columns]].copy()
+        df.insert(0, check_column, check)
+        df[reference_column] = reference
+        return df.reset_index(drop=True)
+
+    @classmethod
     def _is_machine_conflict_free(
-            df_schedule: pd.DataFrame, machine_column: str = "Machine", start_column: str = "Start",
+            cls, df_schedule: pd.DataFrame, machine_column: str = "Machine", start_column: str = "Start",
             end_column: str = "End") -> bool:
         """
         Check if the schedule is free of machine conflicts.
@@ -67,24 +156,15 @@ class DataFrameChecker:
         :param end_column: Column name for end times.
         :return: True if no conflicts, False otherwise.
         """
-        df = df_schedule.sort_values([machine_column, start_column]).reset_index()
-        conflict_indices = []
-
-        for machine in df[machine_column].unique():
-            machine_df = df[df[machine_column] == machine].sort_values(start_column)
-
-            for i in range(1, len(machine_df)):
-                prev = machine_df.iloc[i - 1]
-                curr = machine_df.iloc[i]
-
-                if curr[start_column] < prev[end_column]:
-                    conflict_indices.extend([prev["index"], curr["index"]])
-
-        conflict_indices = sorted(set(conflict_indices))
+        conflicts = cls._get_overlap_violations(
+            df_schedule, [machine_column], start_column, end_column, order_column=start_column,
+            check="machine conflict", check_column="Check", reference_column="Reference",
+            columns=list(df_schedule.columns)
+        )
 
-        if conflict_indices:
-            print(f"- Machine conflicts found: {len(conflict_indices)} rows affected.")
-            print(df_schedule.loc[conflict_indices].sort_values([machine_column, start_column]))
+        if not conflicts.empty:
+            print(f"- Machine conflicts found: {len(conflicts)} operation(s) start before the previous one ended.")
+            print(conflicts.drop(columns=["Check"]).sort_values([machine_column, start_column]))
             return False
         else:
             print("+ No machine conflicts found.")
@@ -106,22 +186,19 @@ class DataFrameChecker:
         :param end_column: Column for operation end times (default: "End").
         :return: True if all jobs follow correct timing, otherwise False.
         """
-        violations = []
-
-        for group_id, grp in df_schedule.groupby(job_id_column):
-            grp = grp.sort_values(operation_column)
-            previous_end = -1
-            for _, row in grp.iterrows():
-                if row[start_column] < previous_end:
-                    violations.append((group_id, int(row[operation_column]), int(row[start_column]), int(previous_end)))
-                previous_end = row[end_column]
+        violations = cls._get_overlap_violations(
+            df_schedule, [job_id_column], start_column, end_column, order_column=operation_column,
+            check="job order", check_column="Check", reference_column="Reference",
+            columns=[job_id_column, operation_column, start_column, end_column]
+        )
 
-        if not violations:
+        if violations.empty:
             print("+ All job operations are scheduled in non-overlapping, correct sequence.")
             return True
 
         print(f"- {len(violations)} violation(s) of technological order found:")
-        for group_id, op, start, prev_end in violations:
+        for group_id, op, start, prev_end in violations[
+                [job_id_column, operation_column, start_column, "Reference"]].itertuples(index=False):
             print(f"  {job_id_column} {group_id!r}, Operation {op}: Start={start}, but previous ended at {prev_end}")
 
         # Additional check: is the start-based sequence consistent with operation order?
@@ -4,9 +4,11 @@ from typing import Literal
 from src.domain.Collection import LiveJobCollection
 from src.domain.Initializer import ExperimentInitializer
 from src.domain.Query import JobQuery, MachineInstanceQuery, ExperimentQuery
+from src.domain.OperationEnrichment import enrich_operations_by_machine, machine_attributes_from_instances, \
+    set_sim_durations
 from src.simulation.LognormalFactorGenerator import LognormalFactorGenerator
 from src.simulation.ProductionSimulation import ProductionSimulation
-from src.solvers.heuristics.GT_Scheduler import Scheduler
+from src.solvers.heuristics.GT_EventScheduler import EventScheduler
 
 
 def run_experiment(
@@ -31,11 +33,7 @@ def run_experiment(
     )
 
     # Add transition times to operations
-    for machine_instance in machines_instances:
-        for job in jobs_collection.values():
-            for operation in job.operations:
-                if operation.machine_name == machine_instance.name:
-                    operation.transition_time = machine_instance.transition_time
+    enrich_operations_by_machine(jobs_collection, machine_attributes_from_instances(machines_instances))
 
     # Add simulation durations to operations
     factor_gen = LognormalFactorGenerator(
@@ -44,10 +42,7 @@ def run_experiment(
     )
     jobs_collection.sort_jobs_by_id()
     jobs_collection.sort_operations()
-    for job in jobs_collection.values():
-        for operation in job.operations:
-            sim_duration_float = operation.duration * factor_gen.sample()
-            operation.sim_duration = int(sim_duration_float)
+    set_sim_durations(jobs_collection, factor_gen)
 
     # Collections(empty)
     schedule_jobs_collection = LiveJobCollection()  # pseudo previous schedule
@@ -65,7 +60,7 @@ def run_experiment(
         current_jobs_collection = new_jobs_collection + waiting_job_ops_collection
 
         # Scheduling --------------------------------------------------------------
-        scheduler = Scheduler(
+        scheduler = EventScheduler(
             jobs_collection=current_jobs_collection,
             schedule_start=shift_start,
         )
@@ -90,16 +85,16 @@ def run_experiment(
             end_time=shift_end
         )
 
+        # Finished operations of the shift (streamed instead of saving the entire simulation at the end)
+        ExperimentQuery.save_simulation_jobs(
+            experiment_id=experiment_id,
+            live_jobs=simulation.get_finished_operation_collection().values(),
+            ignore_existing=True,
+        )
+
         active_job_ops_collection = simulation.get_active_operation_collection()
         waiting_job_ops_collection = simulation.get_waiting_operation_collection()
 
-    # Save entire Simulation -------------------------------------------------------
-    entire_simulation_jobs = simulation.get_entire_finished_operation_collection()
-    ExperimentQuery.save_simulation_jobs(
-        experiment_id=experiment_id,
-        live_jobs=entire_simulation_jobs.values(),
-    )
-
 
 def init_experiment(shift_length: int, total_shift_number: int, priority_rule: Literal["SLACK", "DEVIATION"],
     source_name: str, max_bottleneck_utilization: Decimal, sim_sigma: float):
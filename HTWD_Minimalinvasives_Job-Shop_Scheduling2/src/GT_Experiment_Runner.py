@@ -1,12 +1,13 @@
-from decimal import Decimal
 from typing import Optional
 
 from config.project_config import get_solver_logs_path
 from src.EmailNotifier import EmailNotifier
 from src.Logger import Logger
 from src.domain.Collection import LiveJobCollection
-from src.domain.Query import JobQuery, ExperimentQuery, MachineQuery, MachineInstanceQuery
+from src.domain.JobCatalog import JobCatalog
+from src.domain.Query import ExperimentQuery, MachineQuery
 from src.domain.orm_models import Experiment
+from src.domain.OperationEnrichment import set_sim_durations
 from src.simulation.LognormalFactorGenerator import LognormalFactorGenerator
 from src.simulation.ProductionSimulation import ProductionSimulation
 from src.solvers.CP_Solver import Solver
@@ -25,26 +26,9 @@ def run_experiment(
     # Preparation  ----------------------------------------------------------------------------------
     simulation = ProductionSimulation(verbose=False)
 
-    # Jobs Collection
-    jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
-        source_name=source_name,
-        max_bottleneck_utilization=Decimal(f"{max_bottleneck_utilization}"),
-        arrival_limit=60 * 24 * total_shift_number
-    )
-    jobs_collection = LiveJobCollection(jobs)
-
-    # Machines with transition times
-    machines_instances = MachineInstanceQuery.get_by_source_name_and_max_bottleneck_utilization(
-        source_name=source_name,
-        max_bottleneck_utilization=Decimal(f"{max_bottleneck_utilization}"),
-    )
-
-    # Add transition times to operations
-    for machine_instance in machines_instances:
-        for job in jobs_collection.values():
-            for operation in job.operations:
-                if operation.machine_name == machine_instance.name:
-                    operation.transition_time = machine_instance.transition_time
+    # Jobs Collection with transition times (catalog loaded once per source and utilization)
+    job_catalog = JobCatalog.get(source_name=source_name, max_bottleneck_utilization=max_bottleneck_utilization)
+    jobs_collection = job_catalog.get_jobs_collection(arrival_limit=60 * 24 * total_shift_number)
 
     # Add simulation durations to operations
     factor_gen = LognormalFactorGenerator(
@@ -53,10 +37,7 @@ def run_experiment(
     )
     jobs_collection.sort_jobs_by_id()
     jobs_collection.sort_operations()
-    for job in jobs_collection.values():
-        for operation in job.operations:
-            sim_duration_float = operation.duration * factor_gen.sample()
-            operation.sim_duration = int(sim_duration_float)
+    set_sim_durations(jobs_collection, factor_gen)
 
 
     # Collections(empty)
@@ -1,14 +1,42 @@
 import re
 from pathlib import Path
-from typing import Union
+from typing import Union, Optional
 
 import pandas as pd
 
+from src.domain.Query import ExperimentAnalysisQuery
+
 
 class ConvergenceAnalysis:
     def __init__(self):
         raise NotImplementedError("This class cannot be instantiated.")
 
+    @staticmethod
+    def get_progress_dataframe(
+            experiment_id: int, shift_number: int, time_col: str = "Time", bestsol_col: str = "BestSol",
+            bound_col: str = "Bound", db_path: Optional[str] = None) -> pd.DataFrame:
+        """
+        Convergence of the CP-SAT search of one shift from the SolverProgress table (recorded by the
+        ProgressRecorder during the solve) - replaces parsing the solver log file.
+
+        :param experiment_id: ID of the experiment.
+        :param shift_number: Shift number of the solved model.
+        :param time_col: Column name for elapsed time values in the returned DataFrame.
+        :param bestsol_col: Column name for best solution values in the returned DataFrame.
+        :param bound_col: Column name for best bound values in the returned DataFrame.
+        :param db_path: Optional path to another experiments database.
+        :return: DataFrame with time, best solution, best bound and the cost split (tardiness, earliness,
+                 deviation) of the best solution, filtered for non-NaN best solutions.
+        :rtype: pd.DataFrame
+        """
+        df = ExperimentAnalysisQuery.get_solver_progress_dataframe(
+            experiment_id=experiment_id, shift_number=shift_number,
+            time_column=time_col, objective_column=bestsol_col, bound_column=bound_col, db_path=db_path
+        )
+        df = df.drop(columns=["Shift"])
+        df = df[df[bestsol_col].notna()].reset_index(drop=True)
+        return df
+
     @staticmethod
     def _parse_cp_sat_bound_log(
             file_path: Union[str, Path], time_key: str = "Time",
@@ -52,6 +80,7 @@ class ConvergenceAnalysis:
             cls, file_path: Union[str, Path], time_col: str = "Time", bestsol_col: str = "BestSol") -> pd.DataFrame:
         """
         Parse OR-Tools CP-SAT log file for bound updates (#Bound lines).
+        For solver logs of experiments without SolverProgress rows, otherwise see get_progress_dataframe().
 
         :param file_path: Path to the CP-SAT solver log file.
         :param time_col: Column name for elapsed time values in the returned DataFrame.
@@ -0,0 +1,246 @@
+"""
+Nervousness metrics (plan stability) between consecutive shifts of all experiments in one pass.
+
+Per pair (Experiment_ID, Shift) the schedule of the shift is compared with the schedule of the previous shift
+from the rescheduling time T1 = Shift * shift_length on:
+    - Shared Operations: operations that are in both schedules on the same machine (start >= T1 in both)
+    - Levenshtein:       sum over the machines of the edit distance between the two job sequences
+    - Kendall Tau:       mean over the machines of Kendall's Tau between the two job sequences
+    - Changed:           True if the job sequence of at least one machine changed
+    - P_T:               time-shift index sum g(t) * |t - t'| over the planned operations with t >= T1,
+                         g(t) = (ln T - ln t) / (ln T - ln T1) (see 00_raw/nervousness_comparator.py)
+
+The job sequences per machine are encoded as rank arrays (rank of the job in the previous sequence, in the
+order of the new sequence), so all machines, shifts and experiments are evaluated together:
+Kendall's Tau via a merge-sort inversion count, Levenshtein via a dynamic programming row update
+over a batch of sequences at once.
+"""
+
+from typing import List, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def get_nervousness_metrics(
+    df_ops: pd.DataFrame,
+    shift_length: int = 1440,
+    per_machine: bool = False,
+    experiment_column: str = "Experiment_ID",
+    shift_column: str = "Shift",
+    job_column: str = "Job",
+    operation_column: str = "Operation",
+    machine_column: str = "Machine",
+    start_column: str = "Start",
+    end_column: str = "End",
+) -> pd.DataFrame:
+    """
+    Nervousness metrics of every shift compared with the previous shift, for all experiments in df_ops
+    (e.g. ExperimentAnalysisQuery.get_schedule_jobs_operations_dataframe()).
+
+    :param shift_length: Length of a shift; the comparison starts at Shift * shift_length
+    :param per_machine: True - one row per (Experiment_ID, Shift, Machine) with Shared Operations,
+        Levenshtein and Kendall Tau instead of one row per (Experiment_ID, Shift)
+    :return: DataFrame with columns [Experiment_ID, Shift, Shared Operations, Levenshtein, Kendall Tau,
+        Changed, P_T]
+    """
+    pair_columns = [experiment_column, shift_column]
+    shifts = sorted(df_ops[shift_column].unique())
+    experiments = sorted(df_ops[experiment_column].unique())
+
+    # Schedule der vorherigen Schicht unter der Nummer der folgenden Schicht -> Paare über (Experiment, Schicht)
+    next_shift = dict(zip(shifts, shifts[1:]))
+    df_prev = df_ops.assign(**{shift_column: df_ops[shift_column].map(next_shift)})
+    df_prev = df_prev.dropna(subset=[shift_column]).astype({shift_column: df_ops[shift_column].dtype})
+    df_new = df_ops[df_ops[shift_column].isin(shifts[1:])]
+
+    df_machines = get_machine_sequence_metrics(
+        df_prev, df_new,
+        comparison_start=lambda df: df[shift_column] * shift_length,
+        pair_columns=pair_columns, job_column=job_column, machine_column=machine_column,
+        start_column=start_column,
+    )
+    if per_machine:
+        return df_machines
+
+    grid = pd.MultiIndex.from_product([experiments, shifts[1:]], names=pair_columns)
+    df_pairs = df_machines.groupby(pair_columns).agg(**{
+        "Shared Operations": ("Shared Operations", "sum"),
+        "Levenshtein": ("Levenshtein", "sum"),
+        "Kendall Tau": ("Kendall Tau", "mean"),
+        "Changed": ("Changed", "any"),
+    }).reindex(grid)
+    df_pairs["P_T"] = _time_shift_index(
+        df_prev, df_new, shift_length=shift_length, pair_columns=pair_columns, shift_column=shift_column,
+        job_column=job_column, operation_column=operation_column, start_column=start_column, end_column=end_column,
+    ).reindex(grid)
+
+    df_pairs = df_pairs.fillna({"Shared Operations": 0, "Levenshtein": 0, "Changed": False, "P_T": 0.0})
+    df_pairs = df_pairs.astype({"Shared Operations": int, "Levenshtein": int, "Changed": bool, "P_T": float})
+    return df_pairs.reset_index()
+
+
+def get_machine_sequence_metrics(
+    df_prev: pd.DataFrame,
+    df_new: pd.DataFrame,
+    comparison_start,
+    pair_columns: Sequence[str],
+    job_column: str = "Job",
+    machine_column: str = "Machine",
+    start_column: str = "Start",
+) -> pd.DataFrame:
+    """
+    Sequence metrics per (pair, machine) for machines that have operations with start >= comparison start
+    in both schedules. The sequences are symmetrically filtered to the jobs of both schedules.
+
+    :param comparison_start: Number or function DataFrame -> Series with the comparison start per row
+    :return: DataFrame with columns [*pair_columns, Machine, Shared Operations, Levenshtein, Kendall Tau, Changed]
+    """
+    pair_columns = list(pair_columns)
+    machine_keys = pair_columns + [machine_column]
+    columns = machine_keys + [job_column, start_column]
+
+    def after_comparison_start(df: pd.DataFrame) -> pd.DataFrame:
+        start = comparison_start(df) if callable(comparison_start) else comparison_start
+        return df.loc[df[start_column] >= start, columns]
+
+    df_prev = after_comparison_start(df_prev)
+    df_new = after_comparison_start(df_new)
+
+    # gemeinsame Maschinen je Paar (auch ohne gemeinsame Jobs, dann Tau = 1.0)
+    df_result = pd.merge(
+        df_prev[machine_keys].drop_duplicates(), df_new[machine_keys].drop_duplicates(), on=machine_keys
+    ).sort_values(machine_keys, ignore_index=True)
+
+    df_shared = pd.merge(
+        df_prev, df_new, on=machine_keys + [job_column], suffixes=("_prev", "_new")
+    ).sort_values(machine_keys + [f"{start_column}_prev"], kind="stable", ignore_index=True)
+
+    # Rang in der vorherigen Reihenfolge, dann Sortierung nach der neuen Reihenfolge
+    group_ids = df_shared.groupby(machine_keys, sort=False).ngroup().to_numpy()
+    prev_ranks = df_shared.groupby(machine_keys, sort=False).cumcount().to_numpy()
+    order = np.lexsort((df_shared[f"{start_column}_new"].to_numpy(), group_ids))
+    group_ids, ranks = group_ids[order], prev_ranks[order]
+
+    lengths = np.bincount(group_ids, minlength=group_ids.max() + 1 if len(group_ids) else 0)
+    inversions = count_inversions(ranks, group_ids, lengths)
+    pairs = lengths * (lengths - 1) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        taus = np.where(lengths >= 2, np.round(1 - 2 * inversions / pairs, 4), 1.0)
+
+    df_groups = df_shared[machine_keys].drop_duplicates(ignore_index=True)
+    df_groups["Shared Operations"] = lengths
+    df_groups["Levenshtein"] = levenshtein_to_identity(ranks, lengths)
+    df_groups["Kendall Tau"] = taus
+    df_groups["Changed"] = inversions > 0
+
+    df_result = df_result.merge(df_groups, on=machine_keys, how="left")
+    df_result = df_result.fillna({"Shared Operations": 0, "Levenshtein": 0, "Kendall Tau": 1.0, "Changed": False})
+    return df_result.astype({"Shared Operations": int, "Levenshtein": int, "Kendall Tau": float, "Changed": bool})
+
+
+def count_inversions(ranks: np.ndarray, group_ids: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Number of inversions (pairs i < j with ranks[i] > ranks[j]) per group.
+    Groups must be contiguous in ranks; ranks are 0..n-1 within a group.
+
+    Bottom-up merge sort over the whole array: the ranks get the offset of their group, so pairs
+    of different groups are never inverted. In each of the log2(n) merge passes the inversions between
+    left and right block are counted for all blocks at once with one searchsorted().
+    """
+    n = len(ranks)
+    if n == 0:
+        return np.zeros(len(lengths), dtype=np.int64)
+    group_offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    values = (group_offsets[group_ids] + ranks).astype(np.int64)
+
+    original_index = np.arange(n)
+    counts = np.zeros(n, dtype=np.int64)
+    position = np.arange(n)
+    width = 1
+    while width < n:
+        pair = position // (2 * width)
+        is_left = (position // width) % 2 == 0
+
+        # linke Blöcke sind sortiert -> mit Offset je Blockpaar global sortiert
+        keys = pair * n + values
+        left_keys = keys[is_left]
+        left_end = np.searchsorted(pair[is_left], np.arange(pair[-1] + 1), side="right")
+        right = ~is_left
+        smaller_or_equal = np.searchsorted(left_keys, keys[right], side="right")
+        counts[original_index[right]] += left_end[pair[right]] - smaller_or_equal
+
+        # Blockpaare zusammenführen
+        merged = np.argsort(keys, kind="stable")
+        values, original_index = values[merged], original_index[merged]
+        width *= 2
+
+    return np.bincount(group_ids, weights=counts, minlength=len(lengths)).astype(np.int64)
+
+
+def levenshtein_to_identity(ranks: np.ndarray, lengths: np.ndarray, batch_size: int = 512) -> np.ndarray:
+    """
+    Levenshtein distance of each group's rank sequence to the sequence 0..n-1 (the previous order).
+    Groups of similar length are evaluated together; per row of the DP matrix the substitution/deletion
+    step is elementwise and the insertion step a cumulative minimum.
+    """
+    distances = np.zeros(len(lengths), dtype=np.int64)
+    if len(ranks) == 0:
+        return distances
+    offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    by_length = np.argsort(lengths, kind="stable")
+
+    for batch in np.array_split(by_length, max(1, int(np.ceil(len(by_length) / batch_size)))):
+        batch_lengths = lengths[batch]
+        n_max = int(batch_lengths.max()) if len(batch) else 0
+        if n_max == 0:
+            continue
+        columns = np.arange(n_max + 1)
+        index = offsets[batch][:, None] + columns[None, :-1]
+        is_valid = columns[None, :-1] < batch_lengths[:, None]
+        sequences = np.where(is_valid, ranks[np.minimum(index, len(ranks) - 1)], -1)
+
+        row = np.broadcast_to(columns, (len(batch), n_max + 1)).copy()
+        for i in range(1, n_max + 1):
+            substitution = (sequences[:, i - 1][:, None] != columns[None, :-1])
+            new_row = np.empty_like(row)
+            new_row[:, 0] = i
+            new_row[:, 1:] = np.minimum(row[:, 1:] + 1, row[:, :-1] + substitution)
+            row = np.minimum.accumulate(new_row - columns, axis=1) + columns
+            finished = batch_lengths == i
+            distances[batch[finished]] = row[finished, i]
+    return distances
+
+
+def _time_shift_index(
+    df_prev: pd.DataFrame,
+    df_new: pd.DataFrame,
+    shift_length: int,
+    pair_columns: List[str],
+    shift_column: str,
+    job_column: str,
+    operation_column: str,
+    start_column: str,
+    end_column: str,
+) -> pd.Series:
+    # P_T je Paar: T1 = Schichtbeginn, T = spätestes Ende beider Schedules
+    keys = pair_columns + [job_column, operation_column]
+    details = pd.merge(
+        df_prev[keys + [start_column]], df_new[keys + [start_column]], on=keys, suffixes=("_plan", "_rev")
+    )
+    t1 = details[shift_column] * shift_length
+    details = details[details[f"{start_column}_plan"] >= t1]
+    t1 = t1.loc[details.index].to_numpy(dtype=float)
+
+    horizon = pd.concat([
+        df_prev.groupby(pair_columns)[end_column].max(), df_new.groupby(pair_columns)[end_column].max()
+    ], axis=1).max(axis=1)
+    t = pd.MultiIndex.from_frame(details[pair_columns])
+    horizon = horizon.reindex(t).to_numpy(dtype=float)
+
+    start_plan = details[f"{start_column}_plan"].to_numpy(dtype=float)
+    delta = np.abs(start_plan - details[f"{start_column}_rev"].to_numpy(dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = (np.log(horizon) - np.log(start_plan)) / (np.log(horizon) - np.log(t1))
+    contribution = np.where(np.isfinite(weight), weight, 0.0) * delta
+    return pd.Series(contribution, index=t).groupby(level=pair_columns).sum()
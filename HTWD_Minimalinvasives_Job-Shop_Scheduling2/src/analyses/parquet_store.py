@@ -0,0 +1,219 @@
+"""
+Columnar export of the experiment results (SQLite -> Arrow -> Parquet) and lazy reading for the analyses.
+
+Layout below the root directory (hive partitioning):
+    experiments.parquet
+    schedule_operations/Max_Bottleneck_Utilization=0.85/Experiment_ID=3/Shift=1/part-0.parquet
+    simulation_operations/Max_Bottleneck_Utilization=0.85/Experiment_ID=3/part-0.parquet
+
+The column names are those of ExperimentAnalysisQuery.get_schedule_jobs_operations_dataframe(), so the
+DataFrames can be passed to the functions in src/analyses and DataFrameAnalyses unchanged.
+"""
+
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from src.domain.Query import ExperimentAnalysisQuery, SCHEDULE_OPERATION_ROW_COLUMNS, SIMULATION_OPERATION_ROW_COLUMNS
+
+
+SCHEDULE_OPERATIONS_DIR = "schedule_operations"
+SIMULATION_OPERATIONS_DIR = "simulation_operations"
+EXPERIMENTS_FILE = "experiments.parquet"
+
+UTILIZATION_COLUMN = "Max_Bottleneck_Utilization"
+
+SCHEDULE_OPERATIONS_SCHEMA = pa.schema([
+    ("Job", pa.string()),
+    ("Routing_ID", pa.string()),
+    ("Experiment_ID", pa.int64()),
+    ("Arrival", pa.int64()),
+    ("Ready Time", pa.int64()),
+    ("Due Date", pa.int64()),
+    ("Shift", pa.int64()),
+    ("Operation", pa.int64()),
+    ("Machine", pa.string()),
+    ("Original Duration", pa.int64()),
+    ("Start", pa.int64()),
+    ("End", pa.int64()),
+    (UTILIZATION_COLUMN, pa.float64()),
+])
+
+SIMULATION_OPERATIONS_SCHEMA = pa.schema([
+    ("Job", pa.string()),
+    ("Routing_ID", pa.string()),
+    ("Experiment_ID", pa.int64()),
+    ("Arrival", pa.int64()),
+    ("Ready Time", pa.int64()),
+    ("Due Date", pa.int64()),
+    ("Operation", pa.int64()),
+    ("Machine", pa.string()),
+    ("Original Duration", pa.int64()),
+    ("Start", pa.int64()),
+    ("Simulated Duration", pa.int64()),
+    ("End", pa.int64()),
+    (UTILIZATION_COLUMN, pa.float64()),
+])
+
+SCHEDULE_PARTITIONING = pa.schema([
+    (UTILIZATION_COLUMN, pa.float64()), ("Experiment_ID", pa.int64()), ("Shift", pa.int64())
+])
+SIMULATION_PARTITIONING = pa.schema([(UTILIZATION_COLUMN, pa.float64()), ("Experiment_ID", pa.int64())])
+
+
+# Export ---------------------------------------------------------------------------------------------------------------
+def export_experiments_to_parquet(
+        root: Union[str, Path], max_bottleneck_utilization: Optional[float] = None,
+        db_path: Optional[str] = None, batch_size: int = 100_000) -> dict:
+    """
+    Export experiments, schedule operations and simulation operations below root.
+    Partitions that are exported again are replaced, other partitions stay untouched.
+
+    :return: Number of exported rows per dataset
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+
+    df_experiments = ExperimentAnalysisQuery.get_experiments_dataframe(
+        max_bottleneck_utilization=max_bottleneck_utilization, db_path=db_path
+    )
+    experiments_path = root / EXPERIMENTS_FILE
+    if experiments_path.exists():
+        # Experimente anderer Auslastungen (frühere Exporte) behalten
+        df_existing = pd.read_parquet(experiments_path)
+        df_existing = df_existing[~df_existing["Experiment_ID"].isin(df_experiments["Experiment_ID"])]
+        df_experiments = pd.concat([df_existing, df_experiments], ignore_index=True)
+        df_experiments = df_experiments.sort_values("Experiment_ID", ignore_index=True)
+    df_experiments.to_parquet(experiments_path, index=False)
+
+    schedule_rows = _write_dataset(
+        ExperimentAnalysisQuery.iter_schedule_operation_rows(
+            max_bottleneck_utilization=max_bottleneck_utilization, db_path=db_path, batch_size=batch_size
+        ),
+        row_columns=SCHEDULE_OPERATION_ROW_COLUMNS, schema=SCHEDULE_OPERATIONS_SCHEMA,
+        partitioning=SCHEDULE_PARTITIONING, base_dir=root / SCHEDULE_OPERATIONS_DIR,
+    )
+    simulation_rows = _write_dataset(
+        ExperimentAnalysisQuery.iter_simulation_operation_rows(
+            max_bottleneck_utilization=max_bottleneck_utilization, db_path=db_path, batch_size=batch_size
+        ),
+        row_columns=SIMULATION_OPERATION_ROW_COLUMNS, schema=SIMULATION_OPERATIONS_SCHEMA,
+        partitioning=SIMULATION_PARTITIONING, base_dir=root / SIMULATION_OPERATIONS_DIR,
+    )
+    return {
+        "experiments": len(df_experiments),
+        SCHEDULE_OPERATIONS_DIR: schedule_rows,
+        SIMULATION_OPERATIONS_DIR: simulation_rows,
+    }
+
+
+def _write_dataset(
+        row_batches: Iterable[List[tuple]], row_columns: Sequence[str], schema: pa.Schema,
+        partitioning: pa.Schema, base_dir: Path) -> int:
+    written = 0
+
+    def record_batches() -> Iterator[pa.RecordBatch]:
+        nonlocal written
+        for rows in row_batches:
+            # Zeilen -> Spalten (SQL-Spalten in Schema-Reihenfolge)
+            columns = list(zip(*rows))
+            arrays = [pa.array(values, type=field.type) for values, field in zip(columns, schema)]
+            written += len(rows)
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    assert len(row_columns) == len(schema)
+    ds.write_dataset(
+        pa.RecordBatchReader.from_batches(schema, record_batches()),
+        base_dir=str(base_dir),
+        format="parquet",
+        partitioning=ds.partitioning(partitioning, flavor="hive"),
+        existing_data_behavior="delete_matching",
+        max_partitions=1_000_000,
+    )
+    return written
+
+
+# Lazy reading ---------------------------------------------------------------------------------------------------------
+def scan_schedule_operations(
+        root: Union[str, Path], columns: Optional[List[str]] = None,
+        experiment_ids: Optional[Iterable[int]] = None, max_bottleneck_utilization: Optional[float] = None,
+        shifts: Optional[Iterable[int]] = None) -> pd.DataFrame:
+    """
+    Schedule operations as DataFrame (same columns as get_schedule_jobs_operations_dataframe()).
+    Only the requested columns are read; filters on utilization, experiment and shift only open
+    the matching partitions.
+    """
+    dataset = _open_dataset(Path(root) / SCHEDULE_OPERATIONS_DIR, SCHEDULE_PARTITIONING)
+    expression = _partition_filter(experiment_ids, max_bottleneck_utilization, shifts)
+    return _to_dataframe(dataset, SCHEDULE_OPERATIONS_SCHEMA, columns, expression,
+                         sort_by=["Experiment_ID", "Shift", "Job", "Operation"])
+
+
+def scan_simulation_operations(
+        root: Union[str, Path], columns: Optional[List[str]] = None,
+        experiment_ids: Optional[Iterable[int]] = None,
+        max_bottleneck_utilization: Optional[float] = None) -> pd.DataFrame:
+    """
+    Simulated operations as DataFrame; column pruning and partition filters like scan_schedule_operations().
+    """
+    dataset = _open_dataset(Path(root) / SIMULATION_OPERATIONS_DIR, SIMULATION_PARTITIONING)
+    expression = _partition_filter(experiment_ids, max_bottleneck_utilization, shifts=None)
+    return _to_dataframe(dataset, SIMULATION_OPERATIONS_SCHEMA, columns, expression,
+                         sort_by=["Experiment_ID", "Job", "Operation"])
+
+
+def get_schedule_partition_keys(
+        root: Union[str, Path], experiment_ids: Optional[Iterable[int]] = None,
+        max_bottleneck_utilization: Optional[float] = None) -> pd.DataFrame:
+    """
+    (Experiment_ID, Shift) of all exported schedule partitions - read from the directory layout only,
+    no data files are opened.
+    """
+    dataset = _open_dataset(Path(root) / SCHEDULE_OPERATIONS_DIR, SCHEDULE_PARTITIONING)
+    expression = _partition_filter(experiment_ids, max_bottleneck_utilization, shifts=None)
+    keys = set()
+    for fragment in dataset.get_fragments(filter=expression):
+        partition = ds.get_partition_keys(fragment.partition_expression)
+        keys.add((partition["Experiment_ID"], partition["Shift"]))
+    return pd.DataFrame(sorted(keys), columns=["Experiment_ID", "Shift"], dtype="int64")
+
+
+def read_experiments(root: Union[str, Path], columns: Optional[List[str]] = None) -> pd.DataFrame:
+    return pd.read_parquet(Path(root) / EXPERIMENTS_FILE, columns=columns)
+
+
+def _open_dataset(path: Path, partitioning: pa.Schema) -> ds.Dataset:
+    return ds.dataset(str(path), format="parquet", partitioning=ds.partitioning(partitioning, flavor="hive"))
+
+
+def _partition_filter(
+        experiment_ids: Optional[Iterable[int]], max_bottleneck_utilization: Optional[float],
+        shifts: Optional[Iterable[int]]) -> Optional[pc.Expression]:
+    expression = None
+    conditions = []
+    if max_bottleneck_utilization is not None:
+        conditions.append(pc.field(UTILIZATION_COLUMN) == float(max_bottleneck_utilization))
+    if experiment_ids is not None:
+        conditions.append(pc.field("Experiment_ID").isin([int(e) for e in experiment_ids]))
+    if shifts is not None:
+        conditions.append(pc.field("Shift").isin([int(s) for s in shifts]))
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def _to_dataframe(
+        dataset: ds.Dataset, schema: pa.Schema, columns: Optional[List[str]], expression: Optional[pc.Expression],
+        sort_by: List[str]) -> pd.DataFrame:
+    if columns is None:
+        columns = [name for name in schema.names if name != UTILIZATION_COLUMN]
+    table = dataset.to_table(columns=columns, filter=expression)
+
+    sort_keys = [(name, "ascending") for name in sort_by if name in columns]
+    if sort_keys:
+        table = table.sort_by(sort_keys)
+    return table.to_pandas()
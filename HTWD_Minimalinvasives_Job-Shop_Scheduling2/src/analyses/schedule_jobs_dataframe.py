@@ -1,7 +1,10 @@
-from typing import Literal
+from pathlib import Path
+from typing import Iterable, List, Literal, Optional, Union
 
 import pandas as pd
 
+from src.analyses.parquet_store import get_schedule_partition_keys, scan_schedule_operations
+
 
 def jobs_metrics_from_operations_df(
     df_ops: pd.DataFrame,
@@ -90,41 +93,92 @@ def _calculate_start_deviation_per_shift_df(
         raise ValueError("method must be 'sum' or 'mean'.")
 
     shifts = sorted(df_ops[shift_column].unique())
+    experiments = sorted(df_ops[experiment_column].unique())
+    return _aggregate_start_deviation(
+        df_ops, shifts=shifts, experiments=experiments, method=method, job_column=job_column,
+        operation_column=operation_column, shift_column=shift_column, start_column=start_column,
+        experiment_column=experiment_column,
+    )
+
+
+def start_deviation_per_shift_from_parquet(
+    root: Union[str, Path],
+    method: Literal["mean", "sum"] = "mean",
+    experiment_ids: Optional[Iterable[int]] = None,
+    max_bottleneck_utilization: Optional[float] = None,
+) -> pd.DataFrame:
+    """
+    Wie _calculate_start_deviation_per_shift_df(), liest die Schedule-Operationen aber Schicht für Schicht
+    aus dem Parquet-Export (src.analyses.parquet_store) - im Speicher sind höchstens zwei Schichten.
+    Return: DataFrame mit Spalten [Experiment_ID, Shift, Deviation, Pairs]
+    """
+    if method not in {"sum", "mean"}:
+        raise ValueError("method must be 'sum' or 'mean'.")
+
+    df_keys = get_schedule_partition_keys(
+        root, experiment_ids=experiment_ids, max_bottleneck_utilization=max_bottleneck_utilization
+    )
+    shifts = sorted(df_keys["Shift"].unique())
+    experiments = sorted(df_keys["Experiment_ID"].unique())
+    columns = ["Experiment_ID", "Job", "Operation", "Shift", "Start"]
+
+    def read_shift(shift: int) -> pd.DataFrame:
+        return scan_schedule_operations(
+            root, columns=columns, experiment_ids=experiment_ids,
+            max_bottleneck_utilization=max_bottleneck_utilization, shifts=[shift],
+        )
+
+    parts = []
+    df_prev = read_shift(shifts[0]) if shifts else None
+    for s_prev, s_curr in zip(shifts, shifts[1:]):
+        df_curr = read_shift(s_curr)
+        parts.append(_aggregate_start_deviation(
+            pd.concat([df_prev, df_curr], ignore_index=True), shifts=[s_prev, s_curr],
+            experiments=experiments, method=method,
+        ))
+        df_prev = df_curr
+
+    if not parts:
+        return pd.DataFrame(columns=["Experiment_ID", "Shift", "Deviation", "Pairs"])
+    return pd.concat(parts).sort_values(["Experiment_ID", "Shift"], ignore_index=True)
+
+
+def _aggregate_start_deviation(
+    df_ops: pd.DataFrame,
+    shifts: List[int],
+    experiments: List[int],
+    method: Literal["mean", "sum"] = "mean",
+    job_column: str = "Job",
+    operation_column: str = "Operation",
+    shift_column: str = "Shift",
+    start_column: str = "Start",
+    experiment_column: str = "Experiment_ID",
+) -> pd.DataFrame:
+    # Ein Durchlauf statt merge je (Schicht, Experiment): nach (Experiment, Job, Operation, Schicht) sortieren,
+    # der Vorgänger in der Gruppe ist die Operation der vorherigen Schicht (falls dort geplant)
     if len(shifts) < 2:
         return pd.DataFrame(columns=[experiment_column, shift_column, "Deviation", "Pairs"])
 
-    experiments = sorted(df_ops[experiment_column].unique())
-    rows = []
-
-    for s_idx in range(1, len(shifts)):
-        s_prev = shifts[s_idx - 1]
-        s_curr = shifts[s_idx]
-
-        for exp in experiments:
-            df_prev = df_ops.loc[
-                (df_ops[shift_column] == s_prev) & (df_ops[experiment_column] == exp),
-                [experiment_column, job_column, operation_column, start_column]
-            ].rename(columns={start_column: "Start_orig"})
-
-            df_curr = df_ops.loc[
-                (df_ops[shift_column] == s_curr) & (df_ops[experiment_column] == exp),
-                [experiment_column, job_column, operation_column, start_column]
-            ].rename(columns={start_column: "Start_new"})
-
-            merged = pd.merge(
-                df_curr,
-                df_prev,
-                on=[experiment_column, job_column, operation_column],
-                how="inner",
-            )
-
-            if merged.empty:
-                rows.append({experiment_column: exp, shift_column: s_curr, "Deviation": 0.0, "Pairs": 0})
-                continue
-
-            merged["Deviation"] = (merged["Start_new"] - merged["Start_orig"]).abs()
-            dev = merged["Deviation"].sum() if method == "sum" else merged["Deviation"].mean()
-            rows.append({experiment_column: exp, shift_column: s_curr, "Deviation": float(dev), "Pairs": int(len(merged))})
-
-    df_dev = pd.DataFrame(rows).sort_values([experiment_column, shift_column], ignore_index=True)
-    return df_dev
\ No newline at end of file
+    key_columns = [experiment_column, job_column, operation_column]
+    df = df_ops[key_columns + [shift_column, start_column]]
+    df = df.assign(_shift_index=df[shift_column].map({shift: index for index, shift in enumerate(shifts)}))
+    df = df.dropna(subset=["_shift_index"]).sort_values(key_columns + ["_shift_index"], kind="stable")
+
+    previous = df.groupby(key_columns, sort=False)[["_shift_index", start_column]].shift(1)
+    is_pair = (previous["_shift_index"] == df["_shift_index"] - 1).to_numpy()
+
+    df_pairs = df.loc[is_pair, [experiment_column, shift_column]]
+    df_pairs = df_pairs.assign(Deviation=(df.loc[is_pair, start_column] - previous.loc[is_pair, start_column]).abs())
+    df_dev = df_pairs.groupby([experiment_column, shift_column])["Deviation"].agg(["sum", "count"])
+
+    # vollständiges Raster: jede (Experiment, Schicht)-Kombination ab der zweiten Schicht, ohne Paare 0
+    grid = pd.MultiIndex.from_product([experiments, shifts[1:]], names=[experiment_column, shift_column])
+    df_dev = df_dev.reindex(grid, fill_value=0)
+    deviation = df_dev["sum"] if method == "sum" else (df_dev["sum"] / df_dev["count"].where(df_dev["count"] > 0))
+
+    return pd.DataFrame({
+        experiment_column: grid.get_level_values(experiment_column),
+        shift_column: grid.get_level_values(shift_column),
+        "Deviation": deviation.fillna(0.0).astype(float).to_numpy(),
+        "Pairs": df_dev["count"].astype(int).to_numpy(),
+    }).sort_values([experiment_column, shift_column], ignore_index=True)
@@ -0,0 +1,78 @@
+"""
+Validation of all persisted schedules and simulations in one pass over the database
+(vectorized checks of DataFrameChecker.get_schedule_violations()).
+
+The operations are read directly per SQL (ordered by experiment) and validated experiment by experiment,
+so memory stays bounded by the largest experiment.
+"""
+
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.DataFrameAnalyses import DataFrameChecker
+from src.domain.Query import ExperimentAnalysisQuery, SCHEDULE_OPERATION_ROW_COLUMNS, SIMULATION_OPERATION_ROW_COLUMNS
+
+
+SOURCE_COLUMN = "Source"
+
+_COLUMN_NAMES = {
+    "job_id": "Job",
+    "experiment_id": "Experiment_ID",
+    "earliest_start": "Ready Time",
+    "shift_number": "Shift",
+    "position_number": "Operation",
+    "machine_name": "Machine",
+    "start": "Start",
+    "end": "End",
+    "duration": "Simulated Duration",
+}
+
+
+def validate_experiments(
+        max_bottleneck_utilization: Optional[float] = None, db_path: Optional[str] = None,
+        batch_size: int = 100_000) -> pd.DataFrame:
+    """
+    Checks all schedules (per experiment and shift) and all simulations (per experiment) in the database:
+    machine conflicts, technological order, starts before the earliest start and - for simulations -
+    end - start = simulated duration.
+
+    :return: Violations table (column "Source" = "schedule" or "simulation"), empty if everything is valid
+    """
+    parts = []
+    schedule_rows = ExperimentAnalysisQuery.iter_schedule_operation_rows(
+        max_bottleneck_utilization=max_bottleneck_utilization, db_path=db_path, batch_size=batch_size
+    )
+    for df_experiment in _iter_experiment_frames(schedule_rows, SCHEDULE_OPERATION_ROW_COLUMNS):
+        violations = DataFrameChecker.get_schedule_violations(df_experiment, group_columns=["Experiment_ID", "Shift"])
+        parts.append(violations.assign(**{SOURCE_COLUMN: "schedule"}))
+
+    simulation_rows = ExperimentAnalysisQuery.iter_simulation_operation_rows(
+        max_bottleneck_utilization=max_bottleneck_utilization, db_path=db_path, batch_size=batch_size
+    )
+    for df_experiment in _iter_experiment_frames(simulation_rows, SIMULATION_OPERATION_ROW_COLUMNS):
+        violations = DataFrameChecker.get_schedule_violations(
+            df_experiment, group_columns=["Experiment_ID"], duration_column="Simulated Duration"
+        )
+        parts.append(violations.assign(**{SOURCE_COLUMN: "simulation"}))
+
+    if not parts:
+        return pd.DataFrame(columns=[SOURCE_COLUMN])
+    df = pd.concat(parts, ignore_index=True)
+    return df[[SOURCE_COLUMN] + [column for column in df.columns if column != SOURCE_COLUMN]]
+
+
+def _iter_experiment_frames(row_batches: Iterable[List[Tuple]], row_columns: Sequence[str]) -> Iterator[pd.DataFrame]:
+    # Zeilen sind nach Experiment sortiert -> ein DataFrame je Experiment
+    experiment_index = list(row_columns).index("experiment_id")
+    columns = [_COLUMN_NAMES.get(column, column) for column in row_columns]
+
+    pending: List[Tuple] = []
+    for rows in row_batches:
+        for row in rows:
+            if pending and row[experiment_index] != pending[-1][experiment_index]:
+                yield pd.DataFrame.from_records(pending, columns=columns)
+                pending = []
+            pending.append(row)
+    if pending:
+        yield pd.DataFrame.from_records(pending, columns=columns)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 from collections import UserDict
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional, List, Union
 
+import numpy as np
 import pandas as pd
 
 from src.domain.orm_models import JobOperation, LiveJob, Job, Routing
@@ -31,6 +33,130 @@ class RoutingCollection(UserDict[str, Routing]):
         return pd.DataFrame(records)
 
 
+class LiveOperationTable:
+    """
+    Columnar (NumPy) representation of the operations of a LiveJobCollection, one row per operation.
+
+    Structure columns (job index, position) are built directly, value columns
+    (machine index, duration, start, end, sim_duration) on first access. The DataFrame export
+    (LiveJobCollection.to_operations_dataframe()) is built from these arrays instead of one dict per operation.
+    """
+
+    def __init__(self, jobs: List[LiveJob], job_index: np.ndarray, position: np.ndarray, operations: np.ndarray):
+        self.jobs = jobs
+        self.job_index = job_index
+        self.position = position
+        self.operations = operations
+
+    @classmethod
+    def from_collection(cls, collection: LiveJobCollection) -> LiveOperationTable:
+        jobs = list(collection.values())
+        operations = [op for job in jobs for op in job.operations]
+        operation_counts = np.fromiter((len(job.operations) for job in jobs), dtype=np.int64, count=len(jobs))
+
+        return cls(
+            jobs=jobs,
+            job_index=np.repeat(np.arange(len(jobs), dtype=np.int64), operation_counts),
+            position=np.fromiter((op.position_number for op in operations), dtype=np.int64, count=len(operations)),
+            operations=np.fromiter(operations, dtype=object, count=len(operations)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.job_index)
+
+    # Columns ------------------------------------------------------------------------------------
+    @cached_property
+    def machines(self) -> List[str]:
+        return list(dict.fromkeys(op.machine_name for op in self.operations))
+
+    @cached_property
+    def machine_index(self) -> np.ndarray:
+        machine_codes = {name: idx for idx, name in enumerate(self.machines)}
+        return np.fromiter(
+            (machine_codes[op.machine_name] for op in self.operations), dtype=np.int64, count=len(self)
+        )
+
+    @cached_property
+    def duration(self) -> np.ndarray:
+        return _to_float_array(op.duration for op in self.operations)
+
+    @cached_property
+    def start(self) -> np.ndarray:
+        return _to_float_array(op.start for op in self.operations)
+
+    @cached_property
+    def end(self) -> np.ndarray:
+        return _to_float_array(op.end for op in self.operations)
+
+    @cached_property
+    def sim_duration(self) -> np.ndarray:
+        return _to_float_array(op.sim_duration for op in self.operations)
+
+    @cached_property
+    def job_arrival(self) -> np.ndarray:
+        return _to_float_array(job.arrival for job in self.jobs)
+
+    @cached_property
+    def job_due_date(self) -> np.ndarray:
+        return _to_float_array(job.due_date for job in self.jobs)
+
+    @cached_property
+    def job_earliest_start(self) -> np.ndarray:
+        return np.fromiter((job.earliest_start for job in self.jobs), dtype=np.int64, count=len(self.jobs))
+
+    def to_dataframe(
+            self, job_column: str = "Job", routing_column: str = "Routing_ID", position_column: str = "Operation",
+            machine_column: str = "Machine", start_column: str = "Start", duration_column: str = "Processing Time",
+            end_column: str = "End", arrival_column = "Arrival", earliest_start_column: str = "Ready Time",
+            due_date_column: str = "Due Date", sim_duration_column: Optional[str] = None) -> pd.DataFrame:
+        """
+        DataFrame with one row per operation (same columns as LiveJobCollection.to_operations_dataframe()).
+        """
+        if len(self) == 0:
+            return pd.DataFrame()
+
+        job_ids = np.array([job.id for job in self.jobs], dtype=object)
+        routing_ids = np.array([job.routing_id for job in self.jobs], dtype=object)
+        machines = np.array(self.machines, dtype=object)
+
+        columns = {
+            job_column: job_ids[self.job_index],
+            routing_column: routing_ids[self.job_index],
+            position_column: self.position,
+            machine_column: machines[self.machine_index],
+            start_column: _to_column(self.start),
+            duration_column: _to_column(self.duration),
+            end_column: _to_column(self.end),
+            arrival_column: _to_column(self.job_arrival[self.job_index]),
+            earliest_start_column: self.job_earliest_start[self.job_index],
+            due_date_column: _to_column(self.job_due_date[self.job_index]),
+        }
+        if sim_duration_column:
+            columns[sim_duration_column] = _to_column(self.sim_duration)
+        return pd.DataFrame(columns)
+
+
+def _to_float_array(values) -> np.ndarray:
+    """
+    Iterable with numbers or None -> float array (None = NaN).
+    """
+    return np.fromiter((np.nan if value is None else value for value in values), dtype=float)
+
+
+def _to_column(values: np.ndarray) -> np.ndarray:
+    """
+    Float array -> int64 if all values are set and integral, object (None) if no value is set.
+    """
+    missing = np.isnan(values)
+    if not missing.any():
+        if np.array_equal(values, np.floor(values)):
+            return values.astype(np.int64)
+        return values
+    if missing.all():
+        return np.full(len(values), None, dtype=object)
+    return values
+
+
 @dataclass
 class LiveJobCollection(UserDict[str, LiveJob]):
     """
@@ -121,14 +247,21 @@ class LiveJobCollection(UserDict[str, LiveJob]):
         Returns all jobs whose earliest_start matches the given value.
 
         :param earliest_start: Time threshold for selecting full jobs
-        :return: Filtered LiveJobCollection with complete jobs
+        :return: Filtered LiveJobCollection with complete jobs (same LiveJob objects)
         """
+        jobs = list(self.values())
+        earliest_starts = np.fromiter((job.earliest_start for job in jobs), dtype=np.int64, count=len(jobs))
         subset = LiveJobCollection()
-        for job in self.values():
-            if job.earliest_start == earliest_start:
-                subset[job.id] = job
+        for idx in np.flatnonzero(earliest_starts == earliest_start).tolist():
+            subset[jobs[idx].id] = jobs[idx]
         return subset
 
+    def to_operation_table(self) -> LiveOperationTable:
+        """
+        Columnar representation of all operations (see LiveOperationTable).
+        """
+        return LiveOperationTable.from_collection(self)
+
 
     def _get_last_operations_collection(self) -> LiveJobCollection:
         """
@@ -157,17 +290,15 @@ class LiveJobCollection(UserDict[str, LiveJob]):
         """
         result = cls()
 
-        # 1) Setze die auszuschließenden (job_id, position_number)-Paare
+        # Direkt auf den Operationen: eine Tabelle lohnt sich hier nicht (alle Operationen werden ohnehin kopiert)
         excluded_pairs = {
-            (op.job_id, op.position_number)
+            (job.id, op.position_number)
             for job in exclude.values()
             for op in job.operations
         }
-
-        # 2) Iteriere über alle Operationen in main
         for job in main.values():
             for op in job.operations:
-                if (op.job_id, op.position_number) not in excluded_pairs:
+                if (job.id, op.position_number) not in excluded_pairs:
                     result.add_operation_instance(op)
 
         result.sort_operations()
@@ -190,20 +321,20 @@ class LiveJobCollection(UserDict[str, LiveJob]):
         """
         result = cls()
 
-        # Zuerst alles aus Main übernehmen
+        # Direkt auf den Jobs (wie bei '/'): das Kopieren der Operationen überwiegt, eine Tabelle spart hier nichts
         for job_id, job_main in main.items():
-            result[job_id] = LiveJob.copy_from(job_main)
+            result.data[job_id] = LiveJob.copy_from(job_main)
 
-        # Dann fehlende Jobs + fehlende Operationen aus Include ergänzen
+        # Dann fehlende Jobs + fehlende Operationen (nach position_number) aus Include ergänzen
         for job_id, job_include in include.items():
-            if job_id not in result:
-                result[job_id] = LiveJob.copy_from(job_include)
+            job = result.data.get(job_id)
+            if job is None:
+                result.data[job_id] = LiveJob.copy_from(job_include)
             else:
-                # Nur neue Operationen übernehmen (nach position_number)
-                existing_ops = {op.position_number for op in result[job_id].operations}
+                existing_ops = {op.position_number for op in job.operations}
                 for op in job_include.operations:
                     if op.position_number not in existing_ops:
-                        result[job_id].add_operation_instance(op)
+                        job.add_operation_instance(op)
         result.sort_operations()
         result.sort_jobs_by_arrival()
         return result
@@ -278,24 +409,12 @@ class LiveJobCollection(UserDict[str, LiveJob]):
         Gibt einen DataFrame mit allen Operationen in der Collection zurück.
         Nur Jobs mit Attribut 'operations' (d.h. LiveJobs) werden berücksichtigt.
         """
-
-        records = []
-
-        for job in self.values():
-            for op in job.operations:
-                records.append({
-                    job_column: job.id,
-                    routing_column: job.routing_id,
-                    position_column: op.position_number,
-                    machine_column: op.machine_name,
-                    start_column: op.start,
-                    duration_column: op.duration,
-                    end_column: op.end,
-                    arrival_column: job.arrival,
-                    earliest_start_column: job.earliest_start,
-                    due_date_column: job.due_date
-                })
-        return pd.DataFrame(records)
+        return self.to_operation_table().to_dataframe(
+            job_column=job_column, routing_column=routing_column, position_column=position_column,
+            machine_column=machine_column, start_column=start_column, duration_column=duration_column,
+            end_column=end_column, arrival_column=arrival_column, earliest_start_column=earliest_start_column,
+            due_date_column=due_date_column
+        )
 
     def to_waiting_time_dataframe(
             self,
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import hashlib
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.Query import JobCatalogQuery
+from src.domain.orm_models import JobOperation, LiveJob
+
+
+class JobCatalog:
+    """
+    Jobs (with routing operations) and machine transition times of one routing source and
+    max_bottleneck_utilization in a compact, immutable columnar form (read-only NumPy arrays).
+
+    Loaded once per (source, utilization) with plain SQL instead of the joinedload chains of JobQuery and
+    MachineInstanceQuery, kept in a process-wide cache and optionally as .npz snapshot keyed by a content hash
+    of the underlying rows. get_jobs_collection() hands out new LiveJobCollections (incl. transition times),
+    so the experiments of a grid with the same job set share one load.
+    """
+
+    _cache: Dict[Tuple[str, str, Optional[str]], JobCatalog] = {}
+
+    def __init__(
+            self, source_name: str, max_bottleneck_utilization: Decimal, content_hash: str,
+            job_ids: np.ndarray, job_routing: np.ndarray, arrivals: np.ndarray, due_dates: np.ndarray,
+            routing_ids: np.ndarray, routing_offsets: np.ndarray, positions: np.ndarray,
+            operation_machines: np.ndarray, durations: np.ndarray,
+            machine_names: np.ndarray, transition_times: np.ndarray):
+        self.source_name = source_name
+        self.max_bottleneck_utilization = max_bottleneck_utilization
+        self.content_hash = content_hash
+
+        # Jobs (arrival/due_date NaN = None)
+        self.job_ids = _read_only(job_ids)
+        self.job_routing = _read_only(job_routing)
+        self.arrivals = _read_only(arrivals)
+        self.due_dates = _read_only(due_dates)
+
+        # Routings: operations of routing r in rows routing_offsets[r]:routing_offsets[r + 1]
+        self.routing_ids = _read_only(routing_ids)
+        self.routing_offsets = _read_only(routing_offsets)
+        self.positions = _read_only(positions)
+        self.operation_machines = _read_only(operation_machines)
+        self.durations = _read_only(durations)
+
+        # Machines with transition times (0 without MachineInstance)
+        self.machine_names = _read_only(machine_names)
+        self.transition_times = _read_only(transition_times)
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def __repr__(self) -> str:
+        return (f"JobCatalog(source_name={self.source_name!r}, "
+                f"max_bottleneck_utilization={self.max_bottleneck_utilization!r}, jobs={len(self)}, "
+                f"routings={len(self.routing_ids)}, content_hash={self.content_hash[:12]!r})")
+
+    # Loading ------------------------------------------------------------------------------------
+    @classmethod
+    def get(cls, source_name: str, max_bottleneck_utilization: Union[Decimal, float, str],
+            snapshot_dir: Optional[Union[str, Path]] = None, db_path: Optional[str] = None) -> JobCatalog:
+        """
+        Catalog of the source and utilization: from the process cache, from a snapshot in snapshot_dir or
+        from the database (then also written to snapshot_dir). The content hash is checked on every call,
+        so changed jobs, routings or transition times are loaded again.
+        """
+        max_bottleneck_utilization = _normalize_utilization(max_bottleneck_utilization)
+        content_hash = cls.get_content_hash(source_name, max_bottleneck_utilization, db_path=db_path)
+
+        key = (source_name, str(max_bottleneck_utilization), db_path)
+        catalog = cls._cache.get(key)
+        if catalog is not None and catalog.content_hash == content_hash:
+            return catalog
+
+        snapshot_path = Path(snapshot_dir) / f"job_catalog_{content_hash}.npz" if snapshot_dir else None
+        if snapshot_path is not None and snapshot_path.exists():
+            catalog = cls.load(snapshot_path)
+        else:
+            catalog = cls.from_database(source_name, max_bottleneck_utilization, db_path=db_path,
+                                        content_hash=content_hash)
+            if snapshot_path is not None:
+                catalog.save(snapshot_path)
+
+        cls._cache[key] = catalog
+        return catalog
+
+    @classmethod
+    def clear_cache(cls):
+        cls._cache.clear()
+
+    @staticmethod
+    def get_content_hash(source_name: str, max_bottleneck_utilization: Decimal, db_path: Optional[str] = None) -> str:
+        fingerprint = JobCatalogQuery.get_fingerprint(source_name, max_bottleneck_utilization, db_path=db_path)
+        content = repr((source_name, str(max_bottleneck_utilization), tuple(fingerprint)))
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def from_database(cls, source_name: str, max_bottleneck_utilization: Union[Decimal, float, str],
+                      db_path: Optional[str] = None, content_hash: Optional[str] = None) -> JobCatalog:
+        max_bottleneck_utilization = _normalize_utilization(max_bottleneck_utilization)
+        if content_hash is None:
+            content_hash = cls.get_content_hash(source_name, max_bottleneck_utilization, db_path=db_path)
+
+        job_rows = JobCatalogQuery.get_job_rows(source_name, max_bottleneck_utilization, db_path=db_path)
+        operation_rows = JobCatalogQuery.get_routing_operation_rows(source_name, db_path=db_path)
+        transition_rows = JobCatalogQuery.get_transition_time_rows(
+            source_name, max_bottleneck_utilization, db_path=db_path
+        )
+
+        routing_ids = list(dict.fromkeys(row[0] for row in operation_rows))
+        routing_index = {routing_id: idx for idx, routing_id in enumerate(routing_ids)}
+        machine_names = sorted({row[2] for row in operation_rows} | {row[0] for row in transition_rows})
+        machine_index = {name: idx for idx, name in enumerate(machine_names)}
+
+        operation_counts = np.bincount(
+            [routing_index[row[0]] for row in operation_rows], minlength=len(routing_ids)
+        )
+        transition_times = np.zeros(len(machine_names), dtype=np.int64)
+        for name, transition_time in transition_rows:
+            transition_times[machine_index[name]] = transition_time
+
+        return cls(
+            source_name=source_name,
+            max_bottleneck_utilization=max_bottleneck_utilization,
+            content_hash=content_hash,
+            job_ids=np.array([row[0] for row in job_rows], dtype=str),
+            job_routing=np.array([routing_index[row[1]] for row in job_rows], dtype=np.int32),
+            arrivals=np.array([np.nan if row[2] is None else row[2] for row in job_rows], dtype=np.float64),
+            due_dates=np.array([np.nan if row[3] is None else row[3] for row in job_rows], dtype=np.float64),
+            routing_ids=np.array(routing_ids, dtype=str),
+            routing_offsets=np.concatenate([[0], np.cumsum(operation_counts)]).astype(np.int64),
+            positions=np.array([row[1] for row in operation_rows], dtype=np.int64),
+            operation_machines=np.array([machine_index[row[2]] for row in operation_rows], dtype=np.int32),
+            durations=np.array([row[3] for row in operation_rows], dtype=np.int64),
+            machine_names=np.array(machine_names, dtype=str),
+            transition_times=transition_times,
+        )
+
+    # Snapshot -----------------------------------------------------------------------------------
+    _ARRAYS = ("job_ids", "job_routing", "arrivals", "due_dates", "routing_ids", "routing_offsets", "positions",
+               "operation_machines", "durations", "machine_names", "transition_times")
+
+    def save(self, path: Union[str, Path]):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp.npz")
+        np.savez_compressed(
+            tmp_path,
+            source_name=np.array(self.source_name),
+            max_bottleneck_utilization=np.array(str(self.max_bottleneck_utilization)),
+            content_hash=np.array(self.content_hash),
+            **{name: getattr(self, name) for name in self._ARRAYS},
+        )
+        tmp_path.replace(path)  # parallele Läufe sehen nie eine halb geschriebene Datei
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> JobCatalog:
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                source_name=str(data["source_name"]),
+                max_bottleneck_utilization=Decimal(str(data["max_bottleneck_utilization"])),
+                content_hash=str(data["content_hash"]),
+                **{name: data[name] for name in cls._ARRAYS},
+            )
+
+    # Collections --------------------------------------------------------------------------------
+    def get_jobs_collection(self, arrival_limit: Optional[int] = None,
+                            with_transition_times: bool = True) -> LiveJobCollection:
+        """
+        New LiveJobCollection with all jobs with arrival < arrival_limit (all jobs if None), ordered by arrival -
+        like LiveJobCollection(JobQuery.get_by_source_name_max_util_and_lt_arrival(...)) plus the transition
+        times of the MachineInstances set on the operations.
+        """
+        if arrival_limit is None:
+            rows = np.arange(len(self))
+        else:
+            rows = np.flatnonzero(self.arrivals < arrival_limit)
+
+        templates = self._get_operation_templates(with_transition_times)
+        job_ids = self.job_ids[rows].tolist()
+        job_routing = self.job_routing[rows].tolist()
+        arrivals = _to_optional_ints(self.arrivals[rows])
+        due_dates = _to_optional_ints(self.due_dates[rows])
+        routing_ids = self.routing_ids.tolist()
+
+        collection = LiveJobCollection()
+        for job_id, routing, arrival, due_date in zip(job_ids, job_routing, arrivals, due_dates):
+            job = LiveJob(
+                id=job_id, routing_id=routing_ids[routing], arrival=arrival, due_date=due_date,
+                max_bottleneck_utilization=self.max_bottleneck_utilization,
+            )
+            job.operations = [
+                template.copy_for_job(job, start=None, duration=template.duration, end=None)
+                for template in templates[routing]
+            ]
+            collection.data[job_id] = job
+        return collection
+
+    def get_transition_times(self) -> Dict[str, int]:
+        return dict(zip(self.machine_names.tolist(), self.transition_times.tolist()))
+
+    def _get_operation_templates(self, with_transition_times: bool) -> List[List[JobOperation]]:
+        # eine Vorlage je Routing-Operation, die Jobs erhalten Kopien (JobOperation.copy_for_job)
+        machine_names = self.machine_names.tolist()
+        transition_times = self.transition_times.tolist() if with_transition_times else [0] * len(machine_names)
+        positions, machines, durations = self.positions.tolist(), self.operation_machines.tolist(), self.durations.tolist()
+        offsets = self.routing_offsets.tolist()
+
+        templates = []
+        for start, end in zip(offsets, offsets[1:]):
+            templates.append([
+                JobOperation(
+                    job=None, position_number=positions[row], machine_name=machine_names[machines[row]],
+                    duration=durations[row], transition_time=transition_times[machines[row]],
+                )
+                for row in range(start, end)
+            ])
+        return templates
+
+
+def _normalize_utilization(value: Union[Decimal, float, str]) -> Decimal:
+    # wie Job.max_bottleneck_utilization (Numeric(5, 4))
+    return Decimal(str(value)).quantize(Decimal("0.0001"))
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array = np.array(array, copy=True)
+    array.setflags(write=False)
+    return array
+
+
+def _to_optional_ints(values: np.ndarray) -> List[Optional[int]]:
+    return [None if value != value else int(value) for value in values.tolist()]
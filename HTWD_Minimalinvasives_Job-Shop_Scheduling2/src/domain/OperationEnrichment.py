@@ -0,0 +1,69 @@
+from dataclasses import fields
+from typing import Any, Dict, Iterable, Mapping
+
+import numpy as np
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.orm_models import JobOperation, MachineInstance
+from src.simulation.LognormalFactorGenerator import LognormalFactorGenerator
+
+MachineAttributes = Mapping[str, Mapping[str, Any]]
+
+_OPERATION_FIELDS = {f.name for f in fields(JobOperation)}
+
+
+def machine_attributes_from_instances(machine_instances: Iterable[MachineInstance]) -> Dict[str, Dict[str, Any]]:
+    """
+    Machine attributes of the MachineInstances by machine name, e.g. {"M00": {"transition_time": 200}}.
+    """
+    return {instance.name: {"transition_time": instance.transition_time} for instance in machine_instances}
+
+
+def enrich_operations_by_machine(jobs_collection: LiveJobCollection, machine_attributes: MachineAttributes) -> int:
+    """
+    Sets the attributes of the machine on each operation (one pass over all operations, lookup by machine name).
+    Operations on machines without attributes stay unchanged.
+
+    :param machine_attributes: machine_name -> {JobOperation field: value}
+    :return: Number of enriched operations
+    """
+    unknown = {name for attributes in machine_attributes.values() for name in attributes} - _OPERATION_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown JobOperation attributes: {sorted(unknown)}")
+
+    enriched = 0
+    for job in jobs_collection.values():
+        job_enriched = enriched
+        for operation in job.operations:
+            attributes = machine_attributes.get(operation.machine_name)
+            if attributes:
+                for name, value in attributes.items():
+                    setattr(operation, name, value)
+                enriched += 1
+        if enriched > job_enriched:
+            job.invalidate_derived_values()  # e.g. transition_time -> sum_transition_time
+    return enriched
+
+
+def set_sim_durations(jobs_collection: LiveJobCollection, factor_gen: LognormalFactorGenerator,
+                      per_operation: bool = False) -> None:
+    """
+    sim_duration = int(duration * factor) for all operations in the order of the collection.
+    All factors are drawn at once from the generator (same stream as one sample() per operation),
+    so the factor of each operation stays the same as in the previous experiments.
+
+    :param per_operation: True - counter-based factors per (job_id, position_number)
+        (LognormalFactorGenerator.sample_operations(), independent of order and of the other jobs)
+    """
+    operations = [operation for job in jobs_collection.values() for operation in job.operations]
+    durations = np.fromiter((operation.duration for operation in operations), dtype=np.float64, count=len(operations))
+    if per_operation:
+        factors = factor_gen.sample_operations(
+            [operation.job_id for operation in operations], [operation.position_number for operation in operations]
+        )
+    else:
+        factors = np.asarray(factor_gen.sample_many(len(operations)), dtype=np.float64)
+
+    sim_durations = np.trunc(durations * factors).astype(np.int64).tolist()
+    for operation, sim_duration in zip(operations, sim_durations):
+        operation.sim_duration = sim_duration
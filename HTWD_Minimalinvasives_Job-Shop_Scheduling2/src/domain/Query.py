@@ -4,13 +4,14 @@ import numpy as np
 import pandas as pd
 
 from decimal import Decimal
-from typing import List, Union, Iterable, Tuple, Optional
+from typing import List, Union, Iterable, Iterator, Tuple, Optional, Set, Dict
 
-from sqlalchemy import text, create_engine
-from sqlalchemy.orm import joinedload, sessionmaker
+from sqlalchemy import text, create_engine, inspect
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload, sessionmaker, noload
 
 from src.domain.orm_models import Routing, RoutingSource, Job, Machine, Experiment, ScheduleOperation, ScheduleJob, \
-    LiveJob, SimulationJob, SimulationOperation, RoutingOperation, MachineInstance
+    LiveJob, SimulationJob, SimulationOperation, RoutingOperation, MachineInstance, SolverProgress
 from src.domain.orm_setup import SessionLocal
 
 
@@ -272,6 +273,104 @@ class MachineInstanceQuery:
             session.expunge_all()
             return machine_instances
 
+
+class JobCatalogQuery:
+    """
+    Raw SQL rows for the JobCatalog (jobs, routing operations and transition times of one source and
+    utilization) - without ORM objects and joinedload chains.
+    """
+    def __init__(self):
+        raise NotImplementedError("This class cannot be instantiated.")
+
+    @staticmethod
+    def get_job_rows(source_name: str, max_bottleneck_utilization: Decimal,
+                     db_path: Optional[str] = None) -> List[Tuple]:
+        """
+        (job_id, routing_id, arrival, due_date) of all jobs, sorted by arrival and job_id.
+        """
+        sql = """
+            SELECT j.id, j.routing_id, j.arrival, j.due_date
+            FROM job j
+            JOIN routing r ON r.id = j.routing_id
+            JOIN routing_source rs ON rs.id = r.source_id
+            WHERE rs.name = :source_name AND ROUND(j.max_bottleneck_utilization, 4) = ROUND(:util, 4)
+            ORDER BY j.arrival, j.id
+        """
+        return _fetch_all(sql, dict(source_name=source_name, util=max_bottleneck_utilization), db_path)
+
+    @staticmethod
+    def get_routing_operation_rows(source_name: str, db_path: Optional[str] = None) -> List[Tuple]:
+        """
+        (routing_id, position_number, machine_name, duration) of all routings of the source.
+        """
+        sql = """
+            SELECT ro.routing_id, ro.position_number, m.name, ro.duration
+            FROM routing_operation ro
+            JOIN routing r ON r.id = ro.routing_id
+            JOIN routing_source rs ON rs.id = r.source_id
+            JOIN machine m ON m.id = ro.machine_id
+            WHERE rs.name = :source_name
+            ORDER BY ro.routing_id, ro.position_number
+        """
+        return _fetch_all(sql, dict(source_name=source_name), db_path)
+
+    @staticmethod
+    def get_transition_time_rows(source_name: str, max_bottleneck_utilization: Decimal,
+                                 db_path: Optional[str] = None) -> List[Tuple]:
+        """
+        (machine_name, transition_time) of the MachineInstances of the source and utilization.
+        """
+        sql = """
+            SELECT m.name, mi.transition_time
+            FROM machine_instance mi
+            JOIN machine m ON m.id = mi.machine_id
+            JOIN routing_source rs ON rs.id = m.source_id
+            WHERE rs.name = :source_name AND ROUND(mi.max_bottleneck_utilization, 4) = ROUND(:util, 4)
+            ORDER BY m.name
+        """
+        return _fetch_all(sql, dict(source_name=source_name, util=max_bottleneck_utilization), db_path)
+
+    @staticmethod
+    def get_fingerprint(source_name: str, max_bottleneck_utilization: Decimal,
+                        db_path: Optional[str] = None) -> Tuple:
+        """
+        Aggregates over the rows of get_job_rows(), get_routing_operation_rows() and get_transition_time_rows() -
+        one cheap query that changes whenever these rows change. Besides counts and sums it contains rowid products
+        of the references (job -> routing, routing operation -> routing/machine) and the machine names of the source,
+        so reassigning or renaming rows without changing the totals also changes the fingerprint.
+        """
+        sql = """
+            SELECT
+                (SELECT COUNT(*) || ':' || TOTAL(j.arrival) || ':' || TOTAL(j.due_date) || ':'
+                        || TOTAL(j.rowid * COALESCE(j.due_date, -1)) || ':' || TOTAL(j.rowid * COALESCE(j.arrival, -1))
+                        || ':' || TOTAL(LENGTH(j.id) + LENGTH(j.routing_id)) || ':' || MIN(j.id) || ':' || MAX(j.id)
+                        || ':' || TOTAL(j.rowid * r.rowid)
+                 FROM job j
+                 JOIN routing r ON r.id = j.routing_id
+                 JOIN routing_source rs ON rs.id = r.source_id
+                 WHERE rs.name = :source_name AND ROUND(j.max_bottleneck_utilization, 4) = ROUND(:util, 4)),
+                (SELECT COUNT(*) || ':' || TOTAL(ro.duration) || ':' || TOTAL(ro.duration * (ro.position_number + 1))
+                        || ':' || TOTAL(ro.machine_id * (ro.position_number + 1)) || ':' || TOTAL(ro.rowid * ro.duration)
+                        || ':' || TOTAL(ro.rowid * r.rowid) || ':' || TOTAL(ro.rowid * ro.machine_id)
+                 FROM routing_operation ro
+                 JOIN routing r ON r.id = ro.routing_id
+                 JOIN routing_source rs ON rs.id = r.source_id
+                 WHERE rs.name = :source_name),
+                (SELECT COUNT(*) || ':' || TOTAL(mi.transition_time) || ':' || TOTAL(mi.transition_time * mi.machine_id)
+                 FROM machine_instance mi
+                 JOIN machine m ON m.id = mi.machine_id
+                 JOIN routing_source rs ON rs.id = m.source_id
+                 WHERE rs.name = :source_name AND ROUND(mi.max_bottleneck_utilization, 4) = ROUND(:util, 4)),
+                (SELECT GROUP_CONCAT(machine, ',')
+                 FROM (SELECT m.id || '=' || m.name AS machine
+                       FROM machine m
+                       JOIN routing_source rs ON rs.id = m.source_id
+                       WHERE rs.name = :source_name
+                       ORDER BY m.id))
+        """
+        return _fetch_all(sql, dict(source_name=source_name, util=max_bottleneck_utilization), db_path)[0]
+
+
 # ExperimentQuery ---------------------------------------------------------------------------------
 class ExperimentQuery:
     def __init__(self):
@@ -301,86 +400,242 @@ class ExperimentQuery:
             return exp
 
     @staticmethod
-    def save_schedule_jobs(experiment_id: int, shift_number: int, live_jobs: Iterable[LiveJob]):
+    def find_experiment_id(
+            source_name: str, absolute_lateness_ratio: float, inner_tardiness_ratio: float,
+            max_bottleneck_utilization: Decimal, sim_sigma: float,
+            experiment_type: Optional[str] = None) -> Optional[int]:
         """
-        Build ScheduleJob and ScheduleOperation ORM objects.
+        Retrieve the id of the latest experiment with exactly these parameters (e.g. to resume it).
 
-        This keeps the relationship to ScheduleJob view-only, so ScheduleOperation
-        must be created and tracked separately. No Session is used here — objects
-        are returned detached and can be added later.
+        :return: experiment_id or None if no such experiment exists
+        """
+        with SessionLocal() as session:
+            experiment_id = (
+                session.query(Experiment.id)
+                .join(Experiment.routing_source)
+                .filter(
+                    RoutingSource.name == source_name,
+                    Experiment.absolute_lateness_ratio == absolute_lateness_ratio,
+                    Experiment.inner_tardiness_ratio == inner_tardiness_ratio,
+                    Experiment.max_bottleneck_utilization == max_bottleneck_utilization,
+                    Experiment.sim_sigma == sim_sigma,
+                    Experiment.type == experiment_type,
+                )
+                .order_by(Experiment.id.desc())
+                .limit(1)
+                .scalar()
+            )
+            return experiment_id
+
+    @staticmethod
+    def get_scheduled_shift_numbers(experiment_id: int) -> Set[int]:
+        """
+        Retrieve the shift numbers for which a schedule of the experiment is already persisted.
+        """
+        with SessionLocal() as session:
+            rows = (
+                session.query(ScheduleOperation.shift_number)
+                .filter(ScheduleOperation.experiment_id == experiment_id)
+                .distinct()
+                .all()
+            )
+            return {shift_number for (shift_number,) in rows}
+
+    @staticmethod
+    def get_schedule_operation_times(experiment_id: int, shift_number: int) -> Dict[Tuple[str, int], Tuple[int, int]]:
+        """
+        Retrieve the persisted schedule of one shift.
+
+        :return: Dictionary (job_id, position_number) -> (start, end)
+        """
+        with SessionLocal() as session:
+            rows = (
+                session.query(
+                    ScheduleOperation.job_id, ScheduleOperation.position_number,
+                    ScheduleOperation.start, ScheduleOperation.end
+                )
+                .filter(
+                    ScheduleOperation.experiment_id == experiment_id,
+                    ScheduleOperation.shift_number == shift_number
+                )
+                .all()
+            )
+            return {(job_id, position_number): (start, end) for job_id, position_number, start, end in rows}
+
+    @staticmethod
+    def has_simulation_jobs(experiment_id: int) -> bool:
+        """
+        Check whether the simulation of the experiment is already persisted.
+        """
+        with SessionLocal() as session:
+            return session.query(
+                session.query(SimulationJob).filter(SimulationJob.experiment_id == experiment_id).exists()
+            ).scalar()
+
+    @staticmethod
+    def save_schedule_jobs(
+            experiment_id: int, shift_number: int, live_jobs: Iterable[LiveJob], batch_size: int = 5000):
+        """
+        Persist the schedule of one shift (ScheduleJob and ScheduleOperation rows).
+
+        The rows are written as plain dictionaries with a core INSERT (executemany) in batches
+        of batch_size within one transaction - no ORM objects and no unit of work.
 
         :param experiment_id: ID of the experiment the jobs belong to.
         :param shift_number: Shift number for all schedule jobs.
         :param live_jobs: Iterable of LiveJob dataclasses (source data).
-        :return: (List of ScheduleJob, List of ScheduleOperation), both not yet persisted.
+        :param batch_size: Number of rows per executemany call.
+        :return: Number of written rows (jobs + operations).
         """
-        schedule_jobs: list[ScheduleJob] = []
-        schedule_operations: list[ScheduleOperation] = []
-
-        for lj in live_jobs:
-            # Create ScheduleJob purely in memory
-            sj = ScheduleJob(
-                id=lj.id,  # PK matching the job.id
-                experiment_id=experiment_id,
-                shift_number=shift_number
-            )
-            schedule_jobs.append(sj)
-
-            # Create ScheduleOperation objects separately (since relationship is viewonly)
-            for op in lj.operations:
-                so = ScheduleOperation(
-                    job_id=lj.id,
-                    experiment_id=experiment_id,  # must be set manually
-                    shift_number=shift_number,  # must be set manually
-                    position_number=op.position_number,
-                    start=op.start,
-                    end=op.end,
-                )
-                schedule_operations.append(so)
+        schedule_jobs, schedule_operations = _schedule_rows(experiment_id, shift_number, live_jobs)
 
         with SessionLocal() as session:
-            session.add_all(schedule_jobs + schedule_operations)
+            _insert_rows(session, ScheduleJob, schedule_jobs, batch_size)
+            _insert_rows(session, ScheduleOperation, schedule_operations, batch_size)
             session.commit()
-
+        return len(schedule_jobs) + len(schedule_operations)
 
     @staticmethod
-    def save_simulation_jobs(experiment_id: int, live_jobs: Iterable[LiveJob]):
+    def save_simulation_jobs(
+            experiment_id: int, live_jobs: Iterable[LiveJob], batch_size: int = 5000,
+            ignore_existing: bool = False):
         """
-        Build SimulationJob and SimulationOperation ORM objects.
+        Persist simulated operations (SimulationJob and SimulationOperation rows).
 
-        Relationships are view-only, so SimulationOperation must be collected separately.
-        No Session is used here — returned objects are detached and can be added later.
+        Like save_schedule_jobs, the rows are written with a core INSERT (executemany) in batches.
+        With ignore_existing=True rows that are already persisted are skipped (INSERT ... ON CONFLICT DO NOTHING).
+        This allows to stream the finished operations shift by shift: the SimulationJob row is written with
+        the first finished operation of the job, and a resumed experiment can write its shifts again.
 
         :param experiment_id: ID of the experiment the simulation belongs to.
         :param live_jobs: Iterable of LiveJob dataclasses (source data).
-        :return: (List[SimulationJob], List[SimulationOperation]), both not yet persisted.
+        :param batch_size: Number of rows per executemany call.
+        :param ignore_existing: Skip rows whose primary key already exists instead of raising an IntegrityError.
+        :return: Number of rows passed to the database (jobs + operations).
         """
-        sim_jobs: List[SimulationJob] = []
-        sim_ops: List[SimulationOperation] = []
+        sim_jobs, sim_ops = _simulation_rows(experiment_id, live_jobs)
 
-        for lj in live_jobs:
-            # Parent row
-            sj = SimulationJob(
-                id=lj.id,  # PK matching job.id
-                experiment_id=experiment_id,
-            )
-            sim_jobs.append(sj)
-
-            # Child rows (no shift_number here; include duration)
-            for op in lj.operations:
-                so = SimulationOperation(
-                    job_id=lj.id,
-                    experiment_id=experiment_id,
-                    position_number=op.position_number,
-                    start=op.start,
-                    duration=op.duration,  # <-- wichtig für SimulationOperation
-                    end=op.end,
-                )
-                sim_ops.append(so)
+        with SessionLocal() as session:
+            _insert_rows(session, SimulationJob, sim_jobs, batch_size, ignore_existing)
+            _insert_rows(session, SimulationOperation, sim_ops, batch_size, ignore_existing)
+            session.commit()
+        return len(sim_jobs) + len(sim_ops)
+
+    @staticmethod
+    def save_shift_jobs(
+            experiment_id: int, shift_number: int, schedule_jobs: Optional[Iterable[LiveJob]],
+            simulation_jobs: Iterable[LiveJob], batch_size: int = 5000) -> int:
+        """
+        Persist the schedule of one shift together with the operations finished in the simulation of this shift,
+        in one transaction. A persisted schedule therefore always belongs to the persisted simulation rows
+        (and vice versa), also if the run is interrupted.
+
+        SimulationJob rows are written with the first finished operation of the job (existing rows are skipped).
+        SimulationOperation rows are inserted strictly, except if schedule_jobs is None (schedule already
+        persisted, resumed shift): the simulation of the persisted schedule is deterministic, so its existing
+        rows are skipped.
+
+        :param experiment_id: ID of the experiment.
+        :param shift_number: Shift number of the schedule.
+        :param schedule_jobs: Scheduled LiveJobs of the shift, None if the schedule is already persisted.
+        :param simulation_jobs: LiveJobs with the operations finished in the simulation of the shift.
+        :param batch_size: Number of rows per executemany call.
+        :return: Number of rows passed to the database.
+        """
+        sim_jobs, sim_ops = _simulation_rows(experiment_id, simulation_jobs)
+        schedule_rows, schedule_operations = [], []
+        if schedule_jobs is not None:
+            schedule_rows, schedule_operations = _schedule_rows(experiment_id, shift_number, schedule_jobs)
 
         with SessionLocal() as session:
-            session.add_all(sim_jobs + sim_ops)
+            _insert_rows(session, ScheduleJob, schedule_rows, batch_size)
+            _insert_rows(session, ScheduleOperation, schedule_operations, batch_size)
+            _insert_rows(session, SimulationJob, sim_jobs, batch_size, ignore_existing=True)
+            _insert_rows(session, SimulationOperation, sim_ops, batch_size, ignore_existing=schedule_jobs is None)
             session.commit()
+        return len(schedule_rows) + len(schedule_operations) + len(sim_jobs) + len(sim_ops)
+
+    @staticmethod
+    def save_solver_progress(
+            experiment_id: int, shift_number: int, progress_points: Iterable, batch_size: int = 5000) -> int:
+        """
+        Persist the convergence of the solver for one shift (SolverProgress rows).
+        Rows of an earlier solve of the same shift (e.g. an interrupted run) are replaced.
+
+        :param experiment_id: ID of the experiment.
+        :param shift_number: Shift number of the solved model.
+        :param progress_points: ProgressPoints of a ProgressRecorder (ordered by time).
+        :param batch_size: Number of rows per executemany call.
+        :return: Number of written rows.
+        """
+        rows = [
+            {
+                "experiment_id": experiment_id,
+                "shift_number": shift_number,
+                "sequence_number": sequence_number,
+                "wall_time": point.wall_time,
+                "objective": point.objective,
+                "best_bound": point.best_bound,
+                "tardiness_cost": point.tardiness_cost,
+                "earliness_cost": point.earliness_cost,
+                "deviation_cost": point.deviation_cost,
+            }
+            for sequence_number, point in enumerate(progress_points)
+        ]
+
+        with SessionLocal() as session:
+            session.query(SolverProgress).filter(
+                SolverProgress.experiment_id == experiment_id,
+                SolverProgress.shift_number == shift_number
+            ).delete(synchronize_session=False)
+            _insert_rows(session, SolverProgress, rows, batch_size)
+            session.commit()
+        return len(rows)
+
+
+def _schedule_rows(experiment_id: int, shift_number: int, live_jobs: Iterable[LiveJob]) -> Tuple[List[dict], List[dict]]:
+    schedule_jobs: List[dict] = []
+    schedule_operations: List[dict] = []
+    for lj in live_jobs:
+        schedule_jobs.append({"id": lj.id, "experiment_id": experiment_id, "shift_number": shift_number})
+        for op in lj.operations:
+            schedule_operations.append({
+                "job_id": lj.id,
+                "experiment_id": experiment_id,
+                "shift_number": shift_number,
+                "position_number": op.position_number,
+                "start": op.start,
+                "end": op.end,
+            })
+    return schedule_jobs, schedule_operations
+
+
+def _simulation_rows(experiment_id: int, live_jobs: Iterable[LiveJob]) -> Tuple[List[dict], List[dict]]:
+    sim_jobs: List[dict] = []
+    sim_ops: List[dict] = []
+    for lj in live_jobs:
+        sim_jobs.append({"id": lj.id, "experiment_id": experiment_id})
+        for op in lj.operations:
+            sim_ops.append({
+                "job_id": lj.id,
+                "experiment_id": experiment_id,
+                "position_number": op.position_number,
+                "start": op.start,
+                "duration": op.duration,
+                "end": op.end,
+            })
+    return sim_jobs, sim_ops
+
+
+def _insert_rows(session, model, rows: List[dict], batch_size: int, ignore_existing: bool = False):
+    # Core-INSERT mit executemany (ohne ORM-Objekte)
+    if not rows:
+        return
+    statement = sqlite_insert(model.__table__)
+    if ignore_existing:
+        statement = statement.on_conflict_do_nothing()
+    for i in range(0, len(rows), batch_size):
+        session.execute(statement, rows[i:i + batch_size])
 
 
 class ExperimentAnalysisQuery:
@@ -392,11 +647,13 @@ class ExperimentAnalysisQuery:
             experiment_id: Optional[int] = None,
             max_bottleneck_utilization: Optional[float] = None,
             db_path: Optional[str] = None,
+            load_jobs: bool = True,
     ) -> List[Experiment]:
         """
         Liefert eine Liste von Experiment-Objekten.
         - experiment_id=None → alle Experimente
         - max_bottleneck_utilization: optionaler Filter auf Experiment.max_bottleneck_utilization
+        - load_jobs=False: schedule_jobs und simulation_jobs werden nicht geladen (nur Experiment-Parameter)
         """
         if db_path:
             my_engine = create_engine(f"sqlite:///{db_path}")
@@ -405,6 +662,11 @@ class ExperimentAnalysisQuery:
             SessionFactory = SessionLocal
         with SessionFactory() as session:
             query = session.query(Experiment)
+            if not load_jobs:
+                query = query.options(
+                    noload(getattr(Experiment, "schedule_jobs")),
+                    noload(getattr(Experiment, "simulation_jobs")),
+                )
 
             if experiment_id is not None:
                 query = query.filter(Experiment.id == experiment_id)
@@ -485,7 +747,8 @@ class ExperimentAnalysisQuery:
         exps = cls.get_experiments(
             experiment_id=experiment_id,
             max_bottleneck_utilization=max_bottleneck_utilization,
-            db_path=db_path
+            db_path=db_path,
+            load_jobs=False,
         )
 
         records = []
@@ -541,27 +804,29 @@ class ExperimentAnalysisQuery:
         """
         Baut ein DataFrame aus ScheduleJobs.
         experiment_id=None → keine Filterung, es werden alle zurückgegeben.
+        Die Zeilen kommen direkt per SQL (iter_schedule_operation_rows), ohne ORM-Objekte.
         """
-        jobs = cls.get_schedule_jobs(experiment_id, max_bottleneck_utilization, db_path=db_path)
-
-        records = []
-        for sj in jobs:
-            for op in sj.operations:
-                route_op = sj.job.routing.get_operation_by_position(op.position_number)
-                records.append({
-                    job_column: sj.id,
-                    routing_column: sj.job.routing_id,
-                    experiment_column: sj.experiment_id,
-                    shift_column: sj.shift_number,
-                    position_column: op.position_number,
-                    machine_column: route_op.machine_name,
-                    arrival_column: sj.job.arrival,
-                    earliest_start_column: sj.job.earliest_start,
-                    due_date_column: sj.job.due_date,
-                    og_duration_column: route_op.duration,
-                    start_column: op.start,
-                    end_column: op.end,
-                })
+        row_columns = {
+            "job_id": job_column,
+            "routing_id": routing_column,
+            "experiment_id": experiment_column,
+            "arrival": arrival_column,
+            "earliest_start": earliest_start_column,
+            "due_date": due_date_column,
+            "shift_number": shift_column,
+            "position_number": position_column,
+            "machine_name": machine_column,
+            "routing_duration": og_duration_column,
+            "start": start_column,
+            "end": end_column,
+        }
+        records = [
+            row
+            for rows in cls.iter_schedule_operation_rows(experiment_id, max_bottleneck_utilization, db_path=db_path)
+            for row in rows
+        ]
+        df = pd.DataFrame.from_records(records, columns=list(SCHEDULE_OPERATION_ROW_COLUMNS))
+        df = df[list(row_columns)].rename(columns=row_columns)
 
         ordered_cols = [
             job_column,
@@ -578,8 +843,152 @@ class ExperimentAnalysisQuery:
             end_column,
         ]
 
-        df = (
-            pd.DataFrame.from_records(records, columns=ordered_cols)
-            .sort_values([shift_column, job_column, position_column], ignore_index=True)
-        )
-        return df
\ No newline at end of file
+        df = df[ordered_cols].sort_values([shift_column, job_column, position_column], ignore_index=True)
+        return df
+
+    @staticmethod
+    def iter_schedule_operation_rows(
+            experiment_id: Optional[int] = None,
+            max_bottleneck_utilization: Optional[float] = None,
+            db_path: Optional[str] = None,
+            batch_size: int = 100_000,
+    ) -> Iterator[List[Tuple]]:
+        """
+        Liefert die ScheduleOperations (mit Job-, Routing- und Experiment-Werten) direkt per SQL in Blöcken
+        von batch_size Zeilen - ohne ORM-Objekte.
+        Spalten wie SCHEDULE_OPERATION_ROW_COLUMNS, sortiert nach Experiment, Shift, Job, Operation.
+        """
+        sql = f"""
+            SELECT so.job_id, j.routing_id, so.experiment_id, j.arrival, {_SQL_EARLIEST_START}, j.due_date,
+                   so.shift_number, so.position_number, m.name, ro.duration, so.start, so."end",
+                   e.max_bottleneck_utilization
+            FROM schedule_operation so
+            JOIN job j ON j.id = so.job_id
+            JOIN routing_operation ro ON ro.routing_id = j.routing_id AND ro.position_number = so.position_number
+            JOIN machine m ON m.id = ro.machine_id
+            JOIN experiment e ON e.id = so.experiment_id
+            {_sql_experiment_filter(experiment_id, max_bottleneck_utilization, "so.experiment_id")}
+            ORDER BY so.experiment_id, so.shift_number, so.job_id, so.position_number
+        """
+        yield from _iter_rows(sql, dict(experiment_id=experiment_id, util=max_bottleneck_utilization),
+                              db_path=db_path, batch_size=batch_size)
+
+    @staticmethod
+    def iter_simulation_operation_rows(
+            experiment_id: Optional[int] = None,
+            max_bottleneck_utilization: Optional[float] = None,
+            db_path: Optional[str] = None,
+            batch_size: int = 100_000,
+    ) -> Iterator[List[Tuple]]:
+        """
+        Liefert die SimulationOperations (mit Job-, Routing- und Experiment-Werten) direkt per SQL in Blöcken
+        von batch_size Zeilen - ohne ORM-Objekte.
+        Spalten wie SIMULATION_OPERATION_ROW_COLUMNS, sortiert nach Experiment, Job, Operation.
+        """
+        sql = f"""
+            SELECT so.job_id, j.routing_id, so.experiment_id, j.arrival, {_SQL_EARLIEST_START}, j.due_date,
+                   so.position_number, m.name, ro.duration, so.start, so.duration, so."end",
+                   e.max_bottleneck_utilization
+            FROM simulation_operation so
+            JOIN job j ON j.id = so.job_id
+            JOIN routing_operation ro ON ro.routing_id = j.routing_id AND ro.position_number = so.position_number
+            JOIN machine m ON m.id = ro.machine_id
+            JOIN experiment e ON e.id = so.experiment_id
+            {_sql_experiment_filter(experiment_id, max_bottleneck_utilization, "so.experiment_id")}
+            ORDER BY so.experiment_id, so.job_id, so.position_number
+        """
+        yield from _iter_rows(sql, dict(experiment_id=experiment_id, util=max_bottleneck_utilization),
+                              db_path=db_path, batch_size=batch_size)
+
+    @staticmethod
+    def get_solver_progress_dataframe(
+            experiment_id: int,
+            shift_number: Optional[int] = None,
+            shift_column: str = "Shift",
+            time_column: str = "Time",
+            objective_column: str = "BestSol",
+            bound_column: str = "Bound",
+            tardiness_column: str = "Tardiness Cost",
+            earliness_column: str = "Earliness Cost",
+            deviation_column: str = "Deviation Cost",
+            db_path: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Konvergenz des Solvers (SolverProgress) eines Experiments, optional nur einer Schicht.
+        Eine Zeile je neuer Lösung bzw. neuer Schranke, sortiert nach Schicht und Zeit.
+        Ältere Datenbanken ohne Tabelle solver_progress liefern ein leeres DataFrame.
+        """
+        columns = [shift_column, time_column, objective_column, bound_column,
+                   tardiness_column, earliness_column, deviation_column]
+        if not _has_table(SolverProgress.__tablename__, db_path=db_path):
+            return pd.DataFrame(columns=columns)
+        shift_filter = "AND shift_number = :shift_number" if shift_number is not None else ""
+        sql = f"""
+            SELECT shift_number, wall_time, objective, best_bound, tardiness_cost, earliness_cost, deviation_cost
+            FROM solver_progress
+            WHERE experiment_id = :experiment_id {shift_filter}
+            ORDER BY shift_number, sequence_number
+        """
+        records = [
+            row
+            for rows in _iter_rows(sql, dict(experiment_id=experiment_id, shift_number=shift_number),
+                                   db_path=db_path, batch_size=100_000)
+            for row in rows
+        ]
+        return pd.DataFrame.from_records(records, columns=columns)
+
+
+SCHEDULE_OPERATION_ROW_COLUMNS = (
+    "job_id", "routing_id", "experiment_id", "arrival", "earliest_start", "due_date",
+    "shift_number", "position_number", "machine_name", "routing_duration", "start", "end",
+    "max_bottleneck_utilization",
+)
+
+SIMULATION_OPERATION_ROW_COLUMNS = (
+    "job_id", "routing_id", "experiment_id", "arrival", "earliest_start", "due_date",
+    "position_number", "machine_name", "routing_duration", "start", "duration", "end",
+    "max_bottleneck_utilization",
+)
+
+# = Job.earliest_start (nächster Tagesbeginn nach der Ankunft)
+_SQL_EARLIEST_START = "CASE WHEN j.arrival IS NULL THEN 0 ELSE ((j.arrival + 1440) / 1440) * 1440 END"
+
+
+def _sql_experiment_filter(
+        experiment_id: Optional[int], max_bottleneck_utilization: Optional[float], experiment_column: str) -> str:
+    conditions = []
+    if experiment_id is not None:
+        conditions.append(f"{experiment_column} = :experiment_id")
+    if max_bottleneck_utilization is not None:
+        conditions.append("ROUND(e.max_bottleneck_utilization, 4) = ROUND(:util, 4)")
+    return ("WHERE " + " AND ".join(conditions)) if conditions else ""
+
+
+def _has_table(table_name: str, db_path: Optional[str]) -> bool:
+    engine = create_engine(f"sqlite:///{db_path}") if db_path else SessionLocal.kw["bind"]
+    try:
+        return inspect(engine).has_table(table_name)
+    finally:
+        if db_path:
+            engine.dispose()
+
+
+def _fetch_all(sql: str, params: dict, db_path: Optional[str]) -> List[Tuple]:
+    return [row for rows in _iter_rows(sql, params, db_path=db_path, batch_size=100_000) for row in rows]
+
+
+def _iter_rows(sql: str, params: dict, db_path: Optional[str], batch_size: int) -> Iterator[List[Tuple]]:
+    engine = create_engine(f"sqlite:///{db_path}") if db_path else SessionLocal.kw["bind"]
+    params = {key: float(value) if isinstance(value, Decimal) else value
+              for key, value in params.items() if value is not None}
+    try:
+        with engine.connect() as connection:
+            result = connection.execute(text(sql), params)
+            while True:
+                rows = result.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [tuple(row) for row in rows]
+    finally:
+        if db_path:
+            engine.dispose()
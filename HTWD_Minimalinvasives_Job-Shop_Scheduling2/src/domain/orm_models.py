@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from decimal import Decimal
 from fractions import Fraction
 
 import numpy as np
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field
 from sqlalchemy import Column, Integer, String, ForeignKey, ForeignKeyConstraint, Float, Table, Numeric, \
     UniqueConstraint
 from sqlalchemy.orm import relationship, backref
@@ -677,9 +678,114 @@ class SimulationOperation:
     def route_duration(self) -> int:
         return self._routing_operation.duration
 
+@mapper_registry.mapped
+@dataclass
+class SolverProgress:
+    """
+    Convergence of the CP-SAT search of one shift (one row per new solution or new best bound,
+    see ProgressRecorder). Objective and costs are those of the best solution at wall_time.
+    """
+    __tablename__ = "solver_progress"
+    __sa_dataclass_metadata_key__ = "sa"
+
+    experiment_id: int = field(metadata={
+        "sa": Column(Integer, ForeignKey("experiment.id"), primary_key=True, nullable=False)
+    })
+    shift_number: int = field(metadata={
+        "sa": Column(Integer, primary_key=True, nullable=False)
+    })
+    sequence_number: int = field(metadata={
+        "sa": Column(Integer, primary_key=True, nullable=False)
+    })
+
+    wall_time: float = field(default=0.0, metadata={"sa": Column(Float, nullable=False)})
+    objective: Optional[float] = field(default=None, metadata={"sa": Column(Float, nullable=True)})
+    best_bound: Optional[float] = field(default=None, metadata={"sa": Column(Float, nullable=True)})
+    tardiness_cost: Optional[int] = field(default=None, metadata={"sa": Column(Integer, nullable=True)})
+    earliness_cost: Optional[int] = field(default=None, metadata={"sa": Column(Integer, nullable=True)})
+    deviation_cost: Optional[int] = field(default=None, metadata={"sa": Column(Integer, nullable=True)})
+
+
 # ---------------------------------------------------------------------------------------------------------------------
 # View/Helper domain (not ORM models): wrap ORM objects for easy access.
 
+class _OperationList(list):
+    """
+    List of the operations of a LiveJob. Every change invalidates the cached derived values of the job.
+    """
+    __slots__ = ("_job",)
+
+    def __init__(self, job: LiveJob, operations: Iterable[JobOperation] = ()):
+        super().__init__(operations)
+        self._job = job
+
+    def _changed(self):
+        job = getattr(self, "_job", None)  # not yet set while unpickling
+        if job is not None:
+            job.invalidate_derived_values()
+
+
+def _invalidating(method_name: str):
+    method = getattr(list, method_name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._changed()
+        return result
+
+    wrapper.__name__ = method_name
+    return wrapper
+
+
+for _method_name in ("append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+                     "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+    setattr(_OperationList, _method_name, _invalidating(_method_name))
+
+
+class _JobDerivedValues:
+    """
+    Values derived from the operations of a LiveJob, computed once per job (until the operations change).
+    Suffix sums over the operations sorted by position_number -> O(1) sum_left_duration(position).
+    """
+    __slots__ = ("operations", "positions", "sum_duration", "sum_transition_time", "_left_duration", "_left_transition_time",
+                 "_suffix_duration", "_suffix_transition_time")
+
+    def __init__(self, operations: List[JobOperation]):
+        self.operations = operations  # list the values belong to (reassigned LiveJob.operations -> rebuild)
+        ordered = sorted(operations, key=lambda op: op.position_number)
+        self.positions = [op.position_number for op in ordered]
+
+        suffix_duration = [0] * (len(ordered) + 1)
+        suffix_transition_time = [0] * (len(ordered) + 1)
+        for idx in range(len(ordered) - 1, -1, -1):
+            suffix_duration[idx] = suffix_duration[idx + 1] + ordered[idx].duration
+            suffix_transition_time[idx] = suffix_transition_time[idx + 1] + ordered[idx].transition_time
+        self._suffix_duration = suffix_duration
+        self._suffix_transition_time = suffix_transition_time
+
+        self.sum_duration = suffix_duration[0]
+        self.sum_transition_time = suffix_transition_time[0]
+
+        # exact positions -> O(1); with duplicate positions the smallest index counts
+        self._left_duration = {}
+        self._left_transition_time = {}
+        for idx in range(len(ordered) - 1, -1, -1):
+            self._left_duration[self.positions[idx]] = suffix_duration[idx]
+            self._left_transition_time[self.positions[idx]] = suffix_transition_time[idx]
+
+    def left_duration(self, position: int) -> int:
+        value = self._left_duration.get(position)
+        if value is None:
+            value = self._suffix_duration[bisect_left(self.positions, position)]
+        return value
+
+    def left_transition_time(self, position: int) -> int:
+        value = self._left_transition_time.get(position)
+        if value is None:
+            value = self._suffix_transition_time[bisect_left(self.positions, position)]
+        return value
+
+
 @dataclass
 class LiveJob:
     id: str
@@ -705,11 +811,39 @@ class LiveJob:
         }
         return "LiveJob(" + ", ".join(f"{key}={value!r}" for key, value in attrs.items()) + ")"
 
+    def invalidate_derived_values(self) -> None:
+        """
+        Discards the cached derived values (sum_duration, sum_left_duration, ...). Changes of the operations list
+        are detected automatically; call this after changing duration, transition_time or position_number of an
+        operation of this job.
+        """
+        self.__dict__.pop("_derived_values", None)
+
+    @property
+    def _derived(self) -> _JobDerivedValues:
+        derived = self.__dict__.get("_derived_values")
+        operations = self.operations
+        if derived is None or derived.operations is not operations:
+            if type(operations) is not _OperationList:
+                # (re)assigned list -> wrap it, so that its changes invalidate the cache
+                operations = _OperationList(self, operations)
+                self.__dict__["operations"] = operations
+            derived = _JobDerivedValues(operations)
+            self.__dict__["_derived_values"] = derived
+        return derived
+
     @property
     def earliest_start(self) -> int:
+        cached = self.__dict__.get("_earliest_start")
+        if cached is not None and cached[0] == self.arrival:
+            return cached[1]
         if self.arrival is None:
-            return 0
-        return int(np.ceil((self.arrival + 1) / 1440) * 1440)
+            earliest_start = 0
+        else:
+            # Beginn der nächsten Schicht nach arrival (= ceil((arrival + 1) / 1440) * 1440)
+            earliest_start = int(-(-(self.arrival + 1) // 1440) * 1440)
+        self.__dict__["_earliest_start"] = (self.arrival, earliest_start)
+        return earliest_start
 
 
     # Custom-Property für die Planungslogik
@@ -720,7 +854,7 @@ class LiveJob:
 
         :return: Sum of durations of all operations
         """
-        return sum(op.duration for op in self.operations)
+        return self._derived.sum_duration
 
     @property
     def last_operation_position_number(self) -> Optional[int]:
@@ -728,9 +862,8 @@ class LiveJob:
         Returns the highest position_number among all operations,
         i.e., the last technological step of the job.
         """
-        if not self.operations:
-            return None
-        return max(op.position_number for op in self.operations)
+        positions = self._derived.positions
+        return positions[-1] if positions else None
 
     @property
     def first_operation_position_number(self) -> Optional[int]:
@@ -738,9 +871,8 @@ class LiveJob:
         Returns the lowest position_number among all operations,
         i.e., the first technological step of the job.
         """
-        if not self.operations:
-            return None
-        return min(op.position_number for op in self.operations)
+        positions = self._derived.positions
+        return positions[0] if positions else None
 
     def get_previous_operation(self, this_position_number: int) -> Optional[JobOperation]:
         """
@@ -797,21 +929,21 @@ class LiveJob:
         """
         Total duration of all operations from given position for this job (inclusive)
         """
-        return sum(op.duration for op in self.operations if op.position_number >= position)
+        return self._derived.left_duration(position)
 
 
     def sum_left_transition_time(self, position: int) -> int:
         """
         Total transition time of all operations from given position for this job (inclusive)
         """
-        return sum(op.transition_time for op in self.operations if op.position_number >= position)
+        return self._derived.left_transition_time(position)
 
 
     def sum_transition_time(self, position: int) -> int:
         """
         Total transition time of all operations from the given position for this job (inclusive)
         """
-        return sum(op.transition_time for op in self.operations if op.position_number >= position)
+        return self._derived.left_transition_time(position)
 
 
     @classmethod
@@ -840,8 +972,7 @@ class LiveJob:
             self, operation: JobOperation, new_start: Optional[float] = None,
             new_duration: Optional[float] = None, new_end: Optional[float] = None) -> None:
 
-        new_op = replace(
-            operation,
+        new_op = operation.copy_for_job(
             job=self,
             start= operation.start if new_start is None else new_start,
             duration=operation.duration if new_duration is None else new_duration,
@@ -882,6 +1013,22 @@ class JobOperation:
         }
         return "JobOperation(" + ", ".join(f"{key}={value!r}" for key, value in attrs.items()) + ")"
 
+    def copy_for_job(
+            self, job: Union[Job, LiveJob], start: Optional[float] = None, duration: Optional[float] = None,
+            end: Optional[float] = None) -> JobOperation:
+        """
+        Shallow copy of this operation for another job (same result as dataclasses.replace,
+        but without running __init__ again - called for every operation on collection copies).
+        """
+        new_op = object.__new__(type(self))
+        values = new_op.__dict__
+        values.update(self.__dict__)
+        values["job"] = job
+        values["start"] = start
+        values["duration"] = duration
+        values["end"] = end
+        return new_op
+
     @property
     def job_id(self) -> str:
         return self.job.id
@@ -920,4 +1067,5 @@ class JobOperation:
         return self._unique_operation == other._unique_operation
 
     def __hash__(self):
-        return hash(self._unique_operation)
\ No newline at end of file
+        return hash(self._unique_operation)
+
@@ -1,6 +1,6 @@
 import os
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, registry
 
 from config.project_config import PROJECT_ROOT, get_data_path
@@ -12,8 +12,18 @@ DB_PATH = os.path.join(PROJECT_ROOT, "experiments.db")
 #DB_PATH = get_data_path(sub_directory="2025_09_08_Limit", file_name="experiments.db")
 
 
-# SQLite-Datenbank
-my_engine = create_engine(f"sqlite:///{DB_PATH}")
+# SQLite-Datenbank (timeout: parallel experiments write into the same file)
+my_engine = create_engine(f"sqlite:///{DB_PATH}", connect_args={"timeout": 60})
+
+
+@event.listens_for(my_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL: readers do not block the writer (parallel experiments); NORMAL sync is safe in WAL mode
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
 
 SessionLocal = sessionmaker(bind=my_engine)
 
@@ -1,23 +1,38 @@
+import hashlib
 import random
-from typing import List, Optional
+from typing import List, Optional, Literal, Sequence, Union
+
+import numpy as np
 
-import random
-from typing import List, Optional
 
 class LognormalFactorGenerator:
     """
     Generator für lognormal-verteilte Faktoren mit Erwartungswert 1.
     Diese Faktoren können später mit beliebigen Basisdauern multipliziert werden.
+
+    backend="random" (Standard): Folge von random.Random(seed) - die Faktoren der bisherigen Experimente.
+    backend="numpy": numpy.random.Generator, sample_many() vektorisiert (andere Folge als "random").
+    sample_operations() ist unabhängig vom Backend zählerbasiert: der Faktor einer Operation hängt nur von
+    (seed, job_id, position_number) ab, nicht von der Reihenfolge oder den übrigen Operationen.
     """
 
-    def __init__(self, sigma: float = 0.4, seed: Optional[int] = None):
+    def __init__(self, sigma: float = 0.4, seed: Optional[int] = None,
+                 backend: Literal["random", "numpy"] = "random"):
         """
         :param sigma: Standardabweichung im Log-Raum (>= 0).
         :param seed: Optionaler Seed für Reproduzierbarkeit.
+        :param backend: "random" (Python random, bisherige Folge) oder "numpy" (vektorisiert)
         """
+        if backend not in ("random", "numpy"):
+            raise ValueError("backend must be 'random' or 'numpy'.")
         self.sigma = abs(sigma)
         self.seed = seed
+        self.backend = backend
         self.rng = random.Random(seed)  # eigener RNG, bleibt über die gesamte Instanz gleich
+        self.np_rng = np.random.default_rng(seed) if backend == "numpy" else None
+
+        # Basis der zählerbasierten Faktoren (ohne Seed zufällig, aber für diese Instanz fest)
+        self._counter_seed = seed if seed is not None else random.getrandbits(63)
 
     @property
     def mu(self) -> float:
@@ -26,16 +41,71 @@ class LognormalFactorGenerator:
 
     def sample(self) -> float:
         """Einen einzelnen Faktor ziehen."""
+        if self.np_rng is not None:
+            return float(self.np_rng.lognormal(self.mu, self.sigma))
         return self.rng.lognormvariate(self.mu, self.sigma)
 
-    def sample_many(self, n: int) -> List[float]:
-        """n Faktoren ziehen."""
+    def sample_many(self, n: int) -> Union[List[float], np.ndarray]:
+        """n Faktoren ziehen (gleiche Folge wie n-mal sample(); Backend "numpy": ein vektorisierter Zug)."""
         if n < 0:
             raise ValueError("n muss >= 0 sein.")
-        return [self.sample() for _ in range(n)]
-
-
+        if self.np_rng is not None:
+            return self.np_rng.lognormal(self.mu, self.sigma, size=n)
+        lognormvariate, mu, sigma = self.rng.lognormvariate, self.mu, self.sigma
+        return [lognormvariate(mu, sigma) for _ in range(n)]
 
+    def sample_operations(self, job_ids: Sequence[str], positions: Sequence[int],
+                          seeds: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Zählerbasierte Faktoren je Operation (job_id, position_number): splitmix64-Hash von
+        (seed, job_id, position) -> zwei Gleichverteilte -> Box-Muller -> lognormal.
+        Reproduzierbar und unabhängig von Reihenfolge und Anzahl der Operationen (ein neuer Job ändert
+        keine anderen Faktoren).
+
+        :param seeds: Mehrere Seeds (z.B. Monte-Carlo-Replikationen) -> Matrix (len(seeds), n);
+            Zeile i entspricht LognormalFactorGenerator(sigma, seed=seeds[i]).sample_operations(...).
+            Ohne seeds: Vektor (n,) mit dem Seed dieser Instanz.
+        """
+        operation_keys = _operation_keys(job_ids, positions)
+        if seeds is None:
+            return self._lognormal(operation_keys, [self._counter_seed])[0]
+        return self._lognormal(operation_keys, seeds)
+
+    def _lognormal(self, operation_keys: np.ndarray, seeds: Sequence[int]) -> np.ndarray:
+        seeds = np.asarray(seeds, dtype=np.int64).astype(np.uint64)
+        with np.errstate(over="ignore"):
+            keys = _splitmix64(operation_keys[None, :] ^ _splitmix64(seeds)[:, None])
+            u1 = 1.0 - (_splitmix64(keys) >> np.uint64(11)) * _TO_UNIT  # (0, 1]
+            u2 = (_splitmix64(keys + _GOLDEN_GAMMA) >> np.uint64(11)) * _TO_UNIT
+        normal = np.sqrt(-2.0 * np.log(u1)) * np.cos(2.0 * np.pi * u2)
+        return np.exp(self.mu + self.sigma * normal)
+
+
+
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_TO_UNIT = 2.0 ** -53
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    # Mischfunktion von SplitMix64 (uint64, Überlauf gewollt)
+    with np.errstate(over="ignore"):
+        z = x + _GOLDEN_GAMMA
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+
+def _operation_keys(job_ids: Sequence[str], positions: Sequence[int]) -> np.ndarray:
+    # stabiler 64-bit-Schlüssel je (job_id, position) - unabhängig von Prozess und PYTHONHASHSEED
+    unique_ids, inverse = np.unique(np.asarray(job_ids, dtype=str), return_inverse=True)
+    job_hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(job_id.encode("utf-8"), digest_size=8).digest(), "little")
+         for job_id in unique_ids.tolist()),
+        dtype=np.uint64, count=len(unique_ids),
+    )
+    positions = np.asarray(positions, dtype=np.int64).astype(np.uint64)
+    with np.errstate(over="ignore"):
+        return _splitmix64(job_hashes[inverse] ^ _splitmix64(positions))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,222 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Tuple, Set, Iterable, Literal
+
+import numpy as np
+import pandas as pd
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.OperationEnrichment import set_sim_durations
+from src.simulation.LognormalFactorGenerator import LognormalFactorGenerator
+from src.simulation.ProductionSimulation import ProductionSimulation
+
+
+@dataclass
+class ReplicationResult:
+    """
+    Result of one stochastic realization (seed) of a schedule.
+    Tardiness/earliness only for jobs whose last operation is finished in the simulated period.
+    """
+    seed: int
+    tardiness: Dict[str, int] = field(default_factory=dict)
+    earliness: Dict[str, int] = field(default_factory=dict)
+    finished_operations: int = 0
+    active_operations: Set[Tuple[str, int]] = field(default_factory=set)
+    waiting_operations: Set[Tuple[str, int]] = field(default_factory=set)
+    wall_time: float = 0.0
+
+    @property
+    def finished_jobs(self) -> int:
+        return len(self.tardiness)
+
+    @property
+    def total_tardiness(self) -> int:
+        return sum(self.tardiness.values())
+
+    @property
+    def total_earliness(self) -> int:
+        return sum(self.earliness.values())
+
+
+@dataclass
+class MonteCarloResult:
+    replications: List[ReplicationResult]
+    wall_time: float
+    workers: int
+
+    @property
+    def replications_per_second(self) -> float:
+        return len(self.replications) / self.wall_time if self.wall_time > 0 else float("inf")
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        One row per replication (distribution of the key figures).
+        """
+        return pd.DataFrame([
+            {
+                "Seed": r.seed,
+                "Finished Jobs": r.finished_jobs,
+                "Total Tardiness": r.total_tardiness,
+                "Total Earliness": r.total_earliness,
+                "Max Tardiness": max(r.tardiness.values(), default=0),
+                "Tardy Jobs": sum(1 for value in r.tardiness.values() if value > 0),
+                "Finished Operations": r.finished_operations,
+                "Active Operations": len(r.active_operations),
+                "Waiting Operations": len(r.waiting_operations),
+            }
+            for r in self.replications
+        ])
+
+    def to_jobs_dataframe(self) -> pd.DataFrame:
+        """
+        One row per replication and finished job.
+        """
+        return pd.DataFrame([
+            {"Seed": r.seed, "Job": job_id, "Tardiness": tardiness, "Earliness": r.earliness[job_id]}
+            for r in self.replications
+            for job_id, tardiness in r.tardiness.items()
+        ])
+
+    def get_active_operation_frequencies(self) -> Dict[Tuple[str, int], float]:
+        """
+        Share of replications in which (job_id, position_number) is active at the end of the period.
+        """
+        counts: Dict[Tuple[str, int], int] = {}
+        for r in self.replications:
+            for key in r.active_operations:
+                counts[key] = counts.get(key, 0) + 1
+        return {key: count / len(self.replications) for key, count in counts.items()}
+
+
+class MonteCarloSimulation:
+    """
+    Evaluates a fixed schedule under N realizations of the lognormal durations (one seed per replication).
+    The replications are independent and run in a process pool (max_workers > 1) or sequentially.
+    """
+    def __init__(
+            self, schedule_collection: LiveJobCollection, start_time: int, end_time: Optional[int],
+            sigma: float, active_operations_collection: Optional[LiveJobCollection] = None,
+            max_workers: Optional[int] = None, engine: Literal["simpy", "replay"] = "replay",
+            per_operation_factors: bool = False):
+        """
+        :param schedule_collection: Schedule to evaluate (start times are the planned starts)
+        :param start_time: Start of the simulated period
+        :param end_time: End of the simulated period (None = until all operations are finished)
+        :param sigma: Sigma of the LognormalFactorGenerator
+        :param active_operations_collection: Operations still running at start_time (from the previous period)
+        :param max_workers: Number of processes (default: environment variable MAX_CPU_NUMB or os.cpu_count())
+        :param engine: Simulation engine of ProductionSimulation (identical results, "replay" is faster)
+        :param per_operation_factors: True - counter-based factors per (seed, job_id, position_number)
+            (independent of the other operations, see draw_factor_matrix()) instead of the random.Random stream
+        """
+        self.schedule_collection = schedule_collection
+        self.start_time = start_time
+        self.end_time = end_time
+        self.sigma = sigma
+        self.active_operations_collection = active_operations_collection
+        if max_workers is None:
+            max_workers = int(os.environ.get("MAX_CPU_NUMB", os.cpu_count() or 1))
+        self.max_workers = max(1, max_workers)
+        self.engine = engine
+        self.per_operation_factors = per_operation_factors
+
+    def run(self, seeds: Iterable[int]) -> MonteCarloResult:
+        seeds = list(seeds)
+        workers = min(self.max_workers, len(seeds)) or 1
+        config = (self.schedule_collection, self.start_time, self.end_time, self.sigma,
+                  self.active_operations_collection, self.engine, self.per_operation_factors)
+
+        started = time.perf_counter()
+        if workers == 1:
+            replications = [simulate_replication(*config, seed=seed) for seed in seeds]
+        else:
+            chunksize = max(1, len(seeds) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=config) as pool:
+                replications = list(pool.map(_simulate_seed, seeds, chunksize=chunksize))
+        wall_time = time.perf_counter() - started
+
+        return MonteCarloResult(replications=replications, wall_time=wall_time, workers=workers)
+
+
+def draw_sim_durations(
+        schedule_collection: LiveJobCollection, sigma: float, seed: int,
+        per_operation: bool = False) -> LiveJobCollection:
+    """
+    Copy of the schedule with sim_duration = int(duration * lognormal factor).
+    Factors are drawn in the order of the experiments (jobs by id, operations by position),
+    or counter-based per operation (per_operation=True).
+    """
+    collection = LiveJobCollection(list(schedule_collection.values()))
+    collection.sort_jobs_by_id()
+    collection.sort_operations()
+
+    set_sim_durations(collection, LognormalFactorGenerator(sigma=sigma, seed=seed), per_operation=per_operation)
+    return collection
+
+
+def draw_factor_matrix(
+        schedule_collection: LiveJobCollection, sigma: float,
+        seeds: Iterable[int]) -> Tuple[List[Tuple[str, int]], np.ndarray]:
+    """
+    Counter-based lognormal factors of all operations for all seeds at once.
+
+    :return: (job_id, position_number) per column and the factor matrix (len(seeds), number of operations);
+        row i equals the factors of draw_sim_durations(..., seed=seeds[i], per_operation=True)
+    """
+    keys = [(op.job_id, op.position_number) for job in schedule_collection.values() for op in job.operations]
+    factor_gen = LognormalFactorGenerator(sigma=sigma)
+    matrix = factor_gen.sample_operations([key[0] for key in keys], [key[1] for key in keys], seeds=list(seeds))
+    return keys, matrix
+
+
+def simulate_replication(
+        schedule_collection: LiveJobCollection, start_time: int, end_time: Optional[int], sigma: float,
+        active_operations_collection: Optional[LiveJobCollection], engine: str, per_operation_factors: bool = False,
+        *, seed: int) -> ReplicationResult:
+    started = time.perf_counter()
+    sim_schedule = draw_sim_durations(schedule_collection, sigma=sigma, seed=seed, per_operation=per_operation_factors)
+
+    simulation = ProductionSimulation(verbose=False, engine=engine)
+    if active_operations_collection is not None:
+        simulation.set_active_operations(active_operations_collection)
+    simulation.run(schedule_collection=sim_schedule, start_time=start_time, end_time=end_time)
+
+    finished = simulation.get_finished_operation_collection()
+    result = ReplicationResult(seed=seed, finished_operations=finished.count_operations())
+
+    for job in finished.values():
+        scheduled_job = sim_schedule.get(job.id)
+        last_position = scheduled_job.last_operation_position_number if scheduled_job else None
+        last_operation = job.get_last_operation()
+        if last_position is None or last_operation.position_number != last_position or job.due_date is None:
+            continue
+        lateness = last_operation.end - job.due_date
+        result.tardiness[job.id] = max(0, lateness)
+        result.earliness[job.id] = max(0, -lateness)
+
+    result.active_operations = {
+        (op.job_id, op.position_number) for job in simulation.get_active_operation_collection().values()
+        for op in job.operations
+    }
+    result.waiting_operations = {
+        (op.job_id, op.position_number) for job in simulation.get_waiting_operation_collection().values()
+        for op in job.operations
+    }
+    result.wall_time = time.perf_counter() - started
+    return result
+
+
+# Process pool --------------------------------------------------------------------------------------
+_worker_config: Optional[tuple] = None
+
+
+def _init_worker(*config):
+    # Schedule only transferred once per process
+    global _worker_config
+    _worker_config = config
+
+
+def _simulate_seed(seed: int) -> ReplicationResult:
+    return simulate_replication(*_worker_config, seed=seed)
@@ -2,20 +2,27 @@ import time
 import simpy
 import pandas as pd
 
-from dataclasses import replace
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, Literal
 
 from config.project_config import get_data_path, get_examples_path
 from src.domain.Collection import LiveJobCollection
 from src.domain.orm_models import JobOperation, LiveJob
 from src.simulation.LognormalFactorGenerator import LognormalFactorGenerator
+from src.simulation.ReplayEngine import ReplayEngine
 from src.simulation.sim_utils import duration_log_normal, get_duration, get_time_str, get_simulated_duration
 from src.simulation.SimulationMachine import SimulationMachine, SimulationMachineCollection
 
 
 class ProductionSimulation:
     def __init__(self,shift_length: int = 1440, verbose: bool = True,
-                 with_earliest_start: bool =False):
+                 with_earliest_start: bool =False, engine: Literal["simpy", "replay"] = "simpy"):
+        """
+        :param engine: "simpy" (SimPy processes) or "replay" (SimPy-free event replay, see ReplayEngine;
+                       same results, considerably faster)
+        """
+        if engine not in ("simpy", "replay"):
+            raise ValueError(f"Unknown simulation engine '{engine}' (expected 'simpy' or 'replay').")
+        self.engine = engine
 
         self.verbose = verbose
         self.shift_length = shift_length
@@ -90,6 +97,11 @@ class ProductionSimulation:
 
         self.start_time = start_time
         self.pause_time = end_time
+
+        if self.engine == "replay":
+            self._run_replay(schedule_collection, start_time=start_time, end_time=end_time)
+            return
+
         self.env = simpy.Environment(initial_time=start_time)
         self.machines.set_env(self.env)     # statt self._reload_machines()
 
@@ -111,6 +123,16 @@ class ProductionSimulation:
         else:
             self.env.run()
 
+    def _run_replay(self, schedule_collection: Optional[LiveJobCollection], start_time: int, end_time: Optional[int]):
+        self.env = None
+        self.current_schedule = schedule_collection if schedule_collection else LiveJobCollection()
+        self.finished_operations_collection = LiveJobCollection()
+
+        if schedule_collection is not None:
+            self.machines.add_machines(schedule_collection.get_unique_machine_names())
+
+        ReplayEngine(self).run(schedule_collection, start_time=start_time, end_time=end_time)
+
     def initialize_run(self, schedule_collection: LiveJobCollection, start_time: int = 0):
         end_time = start_time + self.shift_length
         self.run(schedule_collection=schedule_collection, start_time=start_time, end_time=end_time)
@@ -144,8 +166,8 @@ class ProductionSimulation:
             time.sleep(0.14)
 
     def _register_active_operation(self, job_op: JobOperation, sim_start, sim_duration):
-        updated_op = replace(
-            job_op,
+        updated_op = job_op.copy_for_job(
+            job=job_op.job,
             duration=sim_duration,
             start=sim_start,
             end=sim_start + sim_duration
@@ -154,8 +176,8 @@ class ProductionSimulation:
 
 
     def _add_finished_operation(self, job_op: JobOperation, sim_start, sim_end):
-        updated_op = replace(
-            job_op,
+        updated_op = job_op.copy_for_job(
+            job=job_op.job,
             duration=sim_end - sim_start,
             start=sim_start,
             end=sim_end
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from typing import Optional, List, Dict, Tuple, TYPE_CHECKING
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.orm_models import JobOperation, LiveJob
+
+if TYPE_CHECKING:
+    from src.simulation.ProductionSimulation import ProductionSimulation
+
+# Event priorities and event kinds (like simpy.core: URGENT before NORMAL at the same time)
+URGENT, NORMAL = 0, 1
+_INIT, _TIMEOUT, _GRANT, _RELEASE, _UNTIL = range(5)
+
+# Process phases
+_START, _AFTER_EARLIEST_START, _REQUEST, _GRANTED, _FINISHED = range(5)
+
+
+class _Machine:
+    """
+    Machine with capacity 1: current user and FIFO queue of waiting processes (= simpy.Resource).
+    """
+    __slots__ = ("user", "queue")
+
+    def __init__(self):
+        self.user = None
+        self.queue: deque = deque()
+
+
+class _JobProcess:
+    __slots__ = ("job", "index", "phase", "granted_time")
+
+    def __init__(self, job: LiveJob):
+        self.job = job
+        self.index = 0
+        self.phase = _START
+        self.granted_time = None
+
+
+class _ResumeProcess:
+    __slots__ = ("job_op", "phase")
+
+    def __init__(self, job_op: JobOperation):
+        self.job_op = job_op
+        self.phase = _START
+
+
+class ReplayEngine:
+    """
+    SimPy-free discrete-event replay of ProductionSimulation.run().
+
+    The schedule fixes the operations of each job; the machines are FIFO resources with capacity 1.
+    The kernel reproduces the event order of SimPy exactly - event heap ordered by (time, priority, event id),
+    timeouts and granted requests are NORMAL events, process starts and the 'until' event are URGENT,
+    a released machine is passed on to the next waiting request when the release event is processed
+    (or earlier, if a new request is made in between).
+    The results (start, end, request and granted times; active, finished and waiting operations) are identical
+    to the SimPy engine, the callbacks of the ProductionSimulation (register/finish/log) are called in the same order.
+    """
+
+    def __init__(self, simulation: ProductionSimulation):
+        self.simulation = simulation
+        self.now = 0
+        self._queue: List[Tuple] = []
+        self._event_id = 0
+        self._machines: Dict[str, _Machine] = {}
+
+    def run(self, schedule_collection: Optional[LiveJobCollection], start_time: int, end_time: Optional[int]):
+        self.now = start_time
+        self._queue = []
+        self._event_id = 0
+        self._machines = {}
+
+        for job_op in self.simulation.active_operations.values():
+            self._schedule(0, URGENT, _INIT, _ResumeProcess(job_op))
+
+        if schedule_collection is not None:
+            for job in schedule_collection.values():
+                self._schedule(0, URGENT, _INIT, _JobProcess(job))
+
+        if end_time is not None:
+            if end_time <= self.now:
+                raise ValueError(f"until ({end_time}) must be greater than the current simulation time")
+            self._schedule(end_time - self.now, URGENT, _UNTIL, None)
+
+        queue = self._queue
+        while queue:
+            time, _, _, kind, target = heapq.heappop(queue)
+            self.now = time
+            if kind == _UNTIL:
+                break
+            if kind == _RELEASE:
+                self._trigger_request(target)
+            elif isinstance(target, _JobProcess):
+                self._step_job_process(target)
+            else:
+                self._step_resume_process(target)
+
+    # Event queue ---------------------------------------------------------------------------------
+    def _schedule(self, delay, priority: int, kind: int, target):
+        heapq.heappush(self._queue, (self.now + delay, priority, self._event_id, kind, target))
+        self._event_id += 1
+
+    def _get_machine(self, machine_name: str) -> _Machine:
+        machine = self._machines.get(machine_name)
+        if machine is None:
+            machine = _Machine()
+            self._machines[machine_name] = machine
+        return machine
+
+    def _request(self, machine_name: str, process):
+        machine = self._get_machine(machine_name)
+        machine.queue.append(process)
+        self._trigger_request(machine)
+
+    def _trigger_request(self, machine: _Machine):
+        # nur der erste wartende Request wird geprüft (wie BaseResource._trigger_put)
+        if machine.queue and machine.user is None:
+            process = machine.queue.popleft()
+            machine.user = process
+            self._schedule(0, NORMAL, _GRANT, process)
+
+    def _release(self, machine_name: str):
+        machine = self._machines[machine_name]
+        machine.user = None
+        self._schedule(0, NORMAL, _RELEASE, machine)
+
+    # Processes -----------------------------------------------------------------------------------
+    def _step_job_process(self, process: _JobProcess):
+        """
+        = ProductionSimulation._job_process, from one yield to the next.
+        """
+        simulation = self.simulation
+        job = process.job
+
+        if process.phase == _START:
+            if simulation.with_earliest_start:
+                process.phase = _AFTER_EARLIEST_START
+                self._schedule(max(job.earliest_start - self.now, 0), NORMAL, _TIMEOUT, process)
+                return
+            process.phase = _AFTER_EARLIEST_START
+
+        if process.phase == _REQUEST:
+            op = job.operations[process.index]
+            op.request_time_on_machine = self.now
+            process.phase = _GRANTED
+            self._request(op.machine_name, process)
+            return
+
+        if process.phase == _GRANTED:
+            op = job.operations[process.index]
+            granted_time = self.now
+            process.granted_time = granted_time
+            op.granted_time_on_machine = granted_time
+            simulation._log_job_started_on_machine(granted_time, job_op=op)
+
+            simulated_duration = op.sim_duration
+            simulation._register_active_operation(job_op=op, sim_start=granted_time, sim_duration=simulated_duration)
+            process.phase = _FINISHED
+            self._schedule(simulated_duration, NORMAL, _TIMEOUT, process)
+            return
+
+        if process.phase == _FINISHED:
+            op = job.operations[process.index]
+            sim_end = self.now
+            simulation._log_job_finished_on_machine(sim_end, job_op=op, sim_duration=op.sim_duration)
+            self._release(op.machine_name)
+            simulation._add_finished_operation(job_op=op, sim_start=process.granted_time, sim_end=sim_end)
+            process.index += 1
+
+        # nächste Operation (Phase _AFTER_EARLIEST_START oder nach _FINISHED)
+        if process.index < len(job.operations):
+            op = job.operations[process.index]
+            planned_start = op.start if op.start is not None else simulation.start_time
+            process.phase = _REQUEST
+            self._schedule(max(planned_start - self.now, 0), NORMAL, _TIMEOUT, process)
+
+    def _step_resume_process(self, process: _ResumeProcess):
+        """
+        = ProductionSimulation._resume_operation_process, from one yield to the next.
+        """
+        simulation = self.simulation
+        job_op = process.job_op
+
+        if process.phase == _START:
+            simulation._log_job_resumed_on_machine(
+                time_stamp=self.now, remaining_time=self._remaining_time(job_op), job_op=job_op
+            )
+            process.phase = _GRANTED
+            self._request(job_op.machine_name, process)
+
+        elif process.phase == _GRANTED:
+            process.phase = _FINISHED
+            self._schedule(self._remaining_time(job_op), NORMAL, _TIMEOUT, process)
+
+        elif process.phase == _FINISHED:
+            sim_end = self.now
+            simulation._log_job_finished_on_machine(sim_end, job_op=job_op, sim_duration=self._remaining_time(job_op))
+            self._release(job_op.machine_name)
+            simulation._add_finished_operation(job_op=job_op, sim_start=job_op.start, sim_end=sim_end)
+
+    def _remaining_time(self, job_op: JobOperation) -> int:
+        return max(0, int(job_op.end) - self.simulation.start_time)
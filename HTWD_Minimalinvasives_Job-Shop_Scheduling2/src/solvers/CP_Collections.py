@@ -1,9 +1,10 @@
 import math
 from dataclasses import dataclass
 from collections import UserDict
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Dict, List
 
 from ortools.sat.python import cp_model
+from src.domain.Collection import LiveJobCollection
 from src.domain.orm_models import JobOperation
 
 class CostVarCollection(list):
@@ -26,14 +27,49 @@ class CostVarCollection(list):
 
 
 class OperationIndexMapper(UserDict[Tuple[int, int], JobOperation]):
+    """
+    Maps model indices (job_idx, op_idx) to operations and keeps a reverse index
+    keyed by (job_id, position_number) for constant-time lookups.
+    """
+    def __init__(self, *args, **kwargs):
+        self._index_by_operation: Dict[Tuple[str, int], Tuple[int, int]] = {}
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, key: Tuple[int, int], operation: JobOperation):
+        previous = self.data.get(key)
+        if previous is not None:
+            self._index_by_operation.pop((previous.job_id, previous.position_number), None)
+        super().__setitem__(key, operation)
+        self._index_by_operation[(operation.job_id, operation.position_number)] = key
+
+    def __delitem__(self, key: Tuple[int, int]):
+        operation = self.data[key]
+        super().__delitem__(key)
+        self._index_by_operation.pop((operation.job_id, operation.position_number), None)
+
     def add(self, job_idx: int, op_idx: int, operation: JobOperation):
         self[(job_idx, op_idx)] = operation
 
     def get_index_from_operation(self, operation: JobOperation) -> Optional[Tuple[int, int]]:
-        for index, op in self.items():
-            if op == operation:
-                return index
-        return None
+        return self._index_by_operation.get((operation.job_id, operation.position_number))
+
+    def map_collection(self, jobs_collection: LiveJobCollection) -> List[Tuple[Tuple[int, int], JobOperation]]:
+        """
+        Resolves all operations of a collection (e.g. the previous schedule) in one pass.
+
+        :param jobs_collection: Collection whose operations should be mapped onto the model.
+        :return: List of ((job_idx, op_idx), operation) for all operations that exist in the model,
+                 the operation being the one of the given collection.
+        """
+        index_by_operation = self._index_by_operation
+        mapped = []
+        for job in jobs_collection.values():
+            for operation in job.operations:
+                index = index_by_operation.get((job.id, operation.position_number))
+                if index is not None:
+                    mapped.append((index, operation))
+        return mapped
+
 
 class StartTimes(UserDict):
     def __setitem__(self, key: Tuple[int, int], value: cp_model.IntVar):
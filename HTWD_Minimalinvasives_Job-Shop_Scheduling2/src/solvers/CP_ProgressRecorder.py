@@ -0,0 +1,100 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Callable
+
+from src.solvers.CP_Collections import CostVarCollection
+from src.solvers.CP_SolutionTimer import SolutionTimer
+
+
+@dataclass(frozen=True)
+class ProgressPoint:
+    """
+    State of the search at one event (new solution or new best bound).
+    Objective and cost split are those of the best solution found so far (None before the first solution).
+    """
+    wall_time: float
+    objective: Optional[float]
+    best_bound: Optional[float]
+    tardiness_cost: Optional[int] = None
+    earliness_cost: Optional[int] = None
+    deviation_cost: Optional[int] = None
+
+
+class ProgressRecorder(SolutionTimer):
+    """
+    Records the convergence of a CP-SAT search as structured data instead of the search log.
+
+    Passed as solution_callback to solver.Solve() (new solutions, incl. the split of the objective into
+    the given cost terms) and called via solver.best_bound_callback (new best bound, e.g. together
+    with the BoundGuard). The points are kept in a ring buffer of the last `capacity` events.
+    """
+    def __init__(
+            self, cost_terms: Optional[Dict[str, CostVarCollection]] = None, capacity: int = 100_000,
+            on_point: Optional[Callable[[ProgressPoint], None]] = None):
+        """
+        :param cost_terms: Cost terms of the model, e.g. {"tardiness_cost": solver.tardiness_terms, ...}
+        :param capacity: Maximum number of kept points (the oldest points are dropped)
+        :param on_point: Optional function that is called with each new point (e.g. StopPolicyMonitor.on_point)
+        """
+        super().__init__()
+        self.cost_terms = cost_terms or {}
+        self.on_point = on_point
+        self.points: deque = deque(maxlen=capacity)
+        self.number_of_dropped_points = 0
+
+        # Start of the solve on the monotonic clock (recorder is created just before Solve(),
+        # calibrated with WallTime() at every solution)
+        self._solve_start = time.monotonic()
+        self._objective: Optional[float] = None
+        self._best_bound: Optional[float] = None
+        self._costs: Dict[str, int] = {}
+
+    def on_solution_callback(self):
+        super().on_solution_callback()
+        self._objective = self.ObjectiveValue()
+        self._best_bound = self.BestObjectiveBound()
+        self._costs = {name: terms.total_cost(self) for name, terms in self.cost_terms.items()}
+        wall_time = self.WallTime()
+        self._solve_start = time.monotonic() - wall_time
+        self._add_point(wall_time)
+
+    def on_best_bound(self, bound: float):
+        # best_bound_callback: WallTime() is only updated in on_solution_callback (stale here) -> solver wall time
+        # from the calibrated solve start, so both kinds of points are on the same clock
+        self._best_bound = bound
+        self._add_point(time.monotonic() - self._solve_start)
+
+    def _add_point(self, wall_time: float):
+        if len(self.points) == self.points.maxlen:
+            self.number_of_dropped_points += 1
+        point = ProgressPoint(
+            wall_time=round(wall_time, 4),
+            objective=self._objective,
+            best_bound=self._best_bound,
+            tardiness_cost=self._costs.get("tardiness_cost"),
+            earliness_cost=self._costs.get("earliness_cost"),
+            deviation_cost=self._costs.get("deviation_cost"),
+        )
+        self.points.append(point)
+        if self.on_point is not None:
+            self.on_point(point)
+
+    def get_points(self) -> List[ProgressPoint]:
+        return list(self.points)
+
+
+def chain_best_bound_callbacks(*callbacks: Optional[Callable[[float], None]]) -> Optional[Callable[[float], None]]:
+    """
+    CP-SAT accepts only one best_bound_callback - combines several callbacks (None entries are ignored).
+    """
+    callbacks = [callback for callback in callbacks if callback is not None]
+    if not callbacks:
+        return None
+    if len(callbacks) == 1:
+        return callbacks[0]
+
+    def best_bound_callback(bound: float):
+        for callback in callbacks:
+            callback(bound)
+    return best_bound_callback
@@ -0,0 +1,233 @@
+import math
+import time
+from typing import Optional, List, Dict, Any
+
+from src.Logger import Logger
+from src.domain.Collection import LiveJobCollection
+from src.domain.orm_models import LiveJob
+from src.solvers.CP_Solver import Solver
+
+
+class RollingHorizonSolver:
+    """
+    Decomposition of the shift model (absolute lateness + start deviation) into due date windows.
+
+    Window k contains the not yet frozen jobs with
+    due_date < schedule_start + k * (window_size - overlap) + window_size and is solved in full detail
+    with the CP Solver. Jobs of earlier windows are frozen: their operations are
+    not part of the model, but block their machines as fixed intervals. After window k the jobs with
+    due_date < schedule_start + (k + 1) * (window_size - overlap) are frozen; the jobs in the overlap
+    are solved again in the next window. Jobs beyond the window are not in the model (they are planned
+    into the remaining capacity by the following windows). Jobs without due date are planned in the last window.
+
+    The objective of the combined schedule is evaluated like in the monolithic model (get_solver_info()).
+    """
+
+    def __init__(
+            self, jobs_collection: LiveJobCollection, logger: Logger, schedule_start: int = 0,
+            window_size: int = 2 * 1440, overlap: int = 0):
+        """
+        :param window_size: Length of the due date window (minutes)
+        :param overlap: Part of the window (minutes) whose jobs are solved again in the next window
+        """
+        if window_size <= 0:
+            raise ValueError("window_size must be > 0.")
+        if not 0 <= overlap < window_size:
+            raise ValueError("overlap must be >= 0 and smaller than window_size.")
+
+        self.logger = logger
+        self.jobs_collection = jobs_collection
+        self.schedule_start = schedule_start
+        self.window_size = window_size
+        self.overlap = overlap
+
+        self.previous_schedule_jobs_collection: Optional[LiveJobCollection] = None
+        self.active_jobs_collection: Optional[LiveJobCollection] = None
+        self.w_t, self.w_e, self.w_dev = 1, 1, 1
+        self.model_completed: bool = False
+
+        self.schedule_jobs_collection: Optional[LiveJobCollection] = None
+        self.window_infos: List[Dict[str, Any]] = []
+        self.wall_time: float = 0.0
+
+    @property
+    def step(self) -> int:
+        return self.window_size - self.overlap
+
+    def build_model__absolute_lateness__start_deviation__minimization(
+            self, previous_schedule_jobs_collection: Optional[LiveJobCollection] = None,
+            active_jobs_collection: Optional[LiveJobCollection] = None,
+            w_t: int = 1, w_e: int = 1, w_dev: int = 1):
+        """
+        Same parameters as Solver.build_model__absolute_lateness__start_deviation__minimization().
+        The window models are built in solve_model().
+        """
+        self.previous_schedule_jobs_collection = previous_schedule_jobs_collection
+        self.active_jobs_collection = active_jobs_collection
+        if previous_schedule_jobs_collection is None or previous_schedule_jobs_collection.count_operations() == 0:
+            w_dev = 0
+        self.w_t, self.w_e, self.w_dev = w_t, w_e, w_dev
+        self.model_completed = True
+
+    def _get_window_end(self, window: int) -> int:
+        return self.schedule_start + window * self.step + self.window_size
+
+    def _get_freeze_limit(self, window: int) -> int:
+        return self.schedule_start + (window + 1) * self.step
+
+    def _get_first_window(self, jobs: List[LiveJob]) -> int:
+        # erstes Fenster, das einen der Jobs enthält (leere Fenster überspringen)
+        due_dates = [job.due_date for job in jobs if job.due_date is not None]
+        if not due_dates:
+            return 0
+        return max(0, math.floor((min(due_dates) - self.schedule_start - self.window_size) / self.step) + 1)
+
+    def solve_model(self, time_limit: Optional[float] = None, warm_start: bool = False, **solve_kwargs):
+        """
+        Solves the windows one after the other.
+
+        :param time_limit: Time limit for all windows together. Each window gets the share of its operations in the
+                           remaining operations of the remaining time (unused time is passed on to the next windows).
+        :param warm_start: If True, the previous schedule is given to each window model as solution hints
+        :param solve_kwargs: Further arguments for Solver.solve_model()
+        """
+        if not self.model_completed:
+            self.logger.warning("Model was not completed yet.")
+            return
+
+        started = time.perf_counter()
+        self.window_infos = []
+        frozen_collection = LiveJobCollection()
+        open_jobs = list(self.jobs_collection.values())
+
+        window = 0
+        while open_jobs:
+            window = max(window, self._get_first_window(open_jobs))
+            window_end = self._get_window_end(window)
+
+            # letztes Fenster: alle Jobs mit Liefertermin sind enthalten (+ Jobs ohne Liefertermin)
+            is_last = all(job.due_date is None or job.due_date < window_end for job in open_jobs)
+            window_jobs = [
+                job for job in open_jobs
+                if is_last or (job.due_date is not None and job.due_date < window_end)
+            ]
+
+            if time_limit is not None:
+                remaining_time = max(time_limit - (time.perf_counter() - started), 1.0)
+                window_operations = sum(len(job.operations) for job in window_jobs)
+                open_operations = sum(len(job.operations) for job in open_jobs)
+                solve_kwargs["time_limit"] = remaining_time * window_operations / open_operations
+
+            schedule = self._solve_window(window, window_jobs, frozen_collection, warm_start, solve_kwargs)
+            if schedule is None:
+                self.schedule_jobs_collection = None
+                self.wall_time = time.perf_counter() - started
+                return
+
+            # Jobs vor der Freeze-Grenze (bzw. alle im letzten Fenster) einfrieren
+            freeze_limit = self._get_freeze_limit(window)
+            frozen_ids = {job.id for job in window_jobs if is_last or job.due_date < freeze_limit}
+            for job in schedule.values():
+                if job.id in frozen_ids:
+                    for operation in job.operations:
+                        frozen_collection.add_operation_instance(operation)
+            open_jobs = [job for job in open_jobs if job.id not in frozen_ids]
+            window += 1
+
+        frozen_collection.sort_operations()
+        frozen_collection.sort_jobs_by_arrival()
+        self.schedule_jobs_collection = frozen_collection
+        self.wall_time = time.perf_counter() - started
+
+    def _solve_window(
+            self, window: int, window_jobs: List[LiveJob], frozen_collection: LiveJobCollection,
+            warm_start: bool, solve_kwargs: Dict[str, Any]) -> Optional[LiveJobCollection]:
+        window_collection = LiveJobCollection()
+        for job in window_jobs:
+            window_collection[job.id] = job
+
+        solver = Solver(
+            jobs_collection=window_collection, logger=self.logger, schedule_start=self.schedule_start,
+            fixed_operations_collection=frozen_collection
+        )
+        solver.build_model__absolute_lateness__start_deviation__minimization(
+            previous_schedule_jobs_collection=self.previous_schedule_jobs_collection,
+            active_jobs_collection=self.active_jobs_collection,
+            w_t=self.w_t, w_e=self.w_e, w_dev=self.w_dev
+        )
+        if warm_start:
+            solver.add_warm_start_hints()
+        solver.solve_model(**solve_kwargs)
+
+        info = solver.get_solver_info()
+        info["window"] = window
+        info["window_end"] = self._get_window_end(window)
+        info["number_of_operations"] = window_collection.count_operations()
+        info["number_of_frozen_operations"] = frozen_collection.count_operations()
+        self.window_infos.append(info)
+        self.logger.info(
+            f"Window {window} (due date < {info['window_end']}): {info['number_of_operations']} operations, "
+            f"{info['number_of_frozen_operations']} frozen - {info['status']} in {info['wall_time']} s"
+        )
+        return solver.get_schedule()
+
+    def get_schedule(self) -> Optional[LiveJobCollection]:
+        return self.schedule_jobs_collection
+
+    def get_solver_info(self) -> dict:
+        if not self.window_infos:
+            return {"access_fault": "Solver status is not available!"}
+
+        statuses = {info["status"] for info in self.window_infos}
+        if self.schedule_jobs_collection is None:
+            status = "INFEASIBLE" if "INFEASIBLE" in statuses else "UNKNOWN"
+        else:
+            status = "OPTIMAL" if statuses == {"OPTIMAL"} else "FEASIBLE"
+
+        solver_info = {
+            "status": status,
+            "number_of_windows": len(self.window_infos),
+            "wall_time": round(self.wall_time, 2),
+            "max_window_operations": max(info["number_of_operations"] for info in self.window_infos),
+        }
+        if self.schedule_jobs_collection is not None:
+            costs = evaluate_lateness_deviation_objective(
+                self.schedule_jobs_collection, self.previous_schedule_jobs_collection,
+                w_t=self.w_t, w_e=self.w_e, w_dev=self.w_dev
+            )
+            solver_info["objective_value"] = sum(costs.values())
+            solver_info.update(costs)
+        return solver_info
+
+    def log_solver_info(self):
+        self.logger.info("Solver info " + "-" * 14)
+        for key, value in self.get_solver_info().items():
+            label = key.replace("_", " ").capitalize()
+            self.logger.info(f"{label:20}: {value}")
+
+
+def evaluate_lateness_deviation_objective(
+        schedule_jobs_collection: LiveJobCollection,
+        previous_schedule_jobs_collection: Optional[LiveJobCollection] = None,
+        w_t: int = 1, w_e: int = 1, w_dev: int = 1) -> Dict[str, int]:
+    """
+    Objective terms of Solver.build_model__absolute_lateness__start_deviation__minimization()
+    for a given schedule (weighted tardiness, earliness and start deviation).
+    """
+    previous_starts = {}
+    if previous_schedule_jobs_collection is not None:
+        for job in previous_schedule_jobs_collection.values():
+            for operation in job.operations:
+                previous_starts[(job.id, operation.position_number)] = operation.start
+
+    tardiness_cost = earliness_cost = deviation_cost = 0
+    for job in schedule_jobs_collection.values():
+        for operation in job.operations:
+            previous_start = previous_starts.get((job.id, operation.position_number))
+            if previous_start is not None:
+                deviation_cost += w_dev * abs(operation.start - previous_start)
+            if operation.position_number == operation.job.last_operation_position_number:
+                tardiness_cost += w_t * max(operation.end - operation.job_due_date, 0)
+                earliness_cost += w_e * max(operation.job_due_date - operation.end, 0)
+
+    return {"tardiness_cost": tardiness_cost, "earliness_cost": earliness_cost, "deviation_cost": deviation_cost}
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from ortools.sat.python import cp_model
+
+
+class SolutionTimer(cp_model.CpSolverSolutionCallback):
+    """
+    Records when CP-SAT finds solutions (wall time since the start of the solve).
+    Passed as solution_callback to solver.Solve().
+    """
+    def __init__(self):
+        super().__init__()
+        self.number_of_solutions = 0
+        self.first_solution_time: Optional[float] = None
+        self.last_solution_time: Optional[float] = None
+
+    def on_solution_callback(self):
+        wall_time = self.WallTime()
+        if self.first_solution_time is None:
+            self.first_solution_time = wall_time
+        self.last_solution_time = wall_time
+        self.number_of_solutions += 1
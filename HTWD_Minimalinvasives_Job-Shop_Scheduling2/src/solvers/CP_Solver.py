@@ -1,22 +1,35 @@
-import contextlib
+import heapq
 import os
-import sys
 from collections import defaultdict
 from fractions import Fraction
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, Sequence
 from ortools.sat.python import cp_model
 
 from src.Logger import Logger
 from src.domain.Collection import LiveJobCollection
 from src.domain.orm_models import JobOperation
 from src.solvers.CP_BoundStagnationGuard import BoundGuard
+from src.solvers.CP_ProgressRecorder import ProgressRecorder, chain_best_bound_callbacks
+from src.solvers.CP_SolutionTimer import SolutionTimer
+from src.solvers.CP_StopPolicies import StopPolicy, StopPolicyMonitor
 from src.solvers.CP_Collections import MachineFixIntervalMap, OperationIndexMapper, JobDelayMap, MachineFixInterval, \
     StartTimes, EndTimes, Intervals, OriginalOperationStarts, CostVarCollection
 
 
 class Solver:
 
-    def __init__(self, jobs_collection: LiveJobCollection, logger: Logger, schedule_start: int = 0):
+    def __init__(
+            self, jobs_collection: LiveJobCollection, logger: Logger, schedule_start: int = 0,
+            fixed_operations_collection: Optional[LiveJobCollection] = None,
+            tight_domains: bool = True, max_tardiness: Optional[int] = None):
+        """
+        :param fixed_operations_collection: Already scheduled operations (start/end) that are not part of the model
+                                            but block their machines (e.g. frozen jobs of a RollingHorizonSolver)
+        :param tight_domains: If True, each start/end variable gets its own domain from the earliest start
+                              (head) and the latest end (tail) of the operation instead of [earliest_start, horizon]
+        :param max_tardiness: Optional tardiness cap (minutes) - the last operation of a job must end before
+                              due_date + max_tardiness (only with tight_domains; may make the model infeasible)
+        """
 
         self.logger = logger
 
@@ -35,6 +48,12 @@ class Solver:
         self.solver_status = None
         self.model_completed: bool = False
 
+        # Warm start (solution hints) and time to first solution
+        self.number_of_hinted_operations: int = 0
+        self.solution_timer: Optional[SolutionTimer] = None
+        self.progress_recorder: Optional[ProgressRecorder] = None
+        self.stop_policy_monitor: Optional[StopPolicyMonitor] = None
+
         # Cost collections
         self.tardiness_terms = CostVarCollection()
         self.earliness_terms = CostVarCollection()
@@ -53,6 +72,17 @@ class Solver:
         # for previous schedule operations starts
         self.original_operation_starts = OriginalOperationStarts()
 
+        # for fixed (frozen) operations: machine -> [(start, end)]
+        self.fixed_operation_intervals: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        latest_fixed_end = 0
+        if fixed_operations_collection is not None:
+            for job in fixed_operations_collection.values():
+                for operation in job.operations:
+                    self.fixed_operation_intervals[operation.machine_name].append((operation.start, operation.end))
+                    latest_fixed_end = max(latest_fixed_end, operation.end)
+        for intervals in self.fixed_operation_intervals.values():
+            intervals.sort()
+
         # Horizon (Worst-case upper bound)--------------------------------------------------------------
         total_duration = jobs_collection.get_total_duration()
 
@@ -60,37 +90,28 @@ class Solver:
             known_highest_value = jobs_collection.get_latest_due_date()
         else:
             known_highest_value = jobs_collection.get_latest_earliest_start()
-        self.horizon = known_highest_value + total_duration
+        self.horizon = max(known_highest_value, latest_fixed_end) + total_duration
 
-        # Create Variables -----------------------------------------------------------------------------
+        # Operation indices (the variables are created by the model builders) -------------------------
         jobs_collection.sort_operations()
         jobs_collection.sort_jobs_by_arrival()
 
         for job_idx, job in enumerate(jobs_collection.values()):
             for op_idx, operation in enumerate(job.operations):
-                suffix = f"{job_idx}_{op_idx}"
-                start = self.model.NewIntVar(job.earliest_start, self.horizon, f"start_{suffix}")
-                end = self.model.NewIntVar(job.earliest_start, self.horizon, f"end_{suffix}")
-
-                interval = self.model.NewIntervalVar(start, operation.duration, end, f"interval_{suffix}")
-                # interval = model.NewIntervalVar(start, operation.duration, start + operation.duration, f"interval_{suffix}")
-
-                self.start_times[(job_idx, op_idx)] = start
-                self.end_times[(job_idx, op_idx)] = end
-                self.intervals[(job_idx, op_idx)] = (interval, operation.machine_name)
                 self.index_mapper.add(job_idx, op_idx, operation)
 
+        # Domains: (job_idx, op_idx) -> (earliest start, latest end)
+        self.tight_domains = tight_domains
+        self.max_tardiness = max_tardiness
+        self.operation_bounds: Dict[Tuple[int, int], Tuple[int, int]] = {}
+
 
     # Rescheduling -------------------------------------------------------------------------------------------
     def _extract_previous_starts_for_deviation(self):
         # Previous schedule: extract start times for deviation penalties
         if self.previous_schedule_jobs_collection is not None:
-            for job in self.previous_schedule_jobs_collection.values():
-                for operation in job.operations:
-                    index = self.index_mapper.get_index_from_operation(operation)
-                    if index is not None:
-                        job_idx, op_idx = index
-                        self.original_operation_starts[(job_idx, op_idx)] = operation.start
+            for index, operation in self.index_mapper.map_collection(self.previous_schedule_jobs_collection):
+                self.original_operation_starts[index] = operation.start
 
     def _extract_delays_from_active_operations(self):
         # Active operations: block machines and delay jobs
@@ -114,12 +135,8 @@ class Solver:
             return orders_idx
 
         tmp = defaultdict(list)  # m -> [(start, j, o)]
-        for job in self.previous_schedule_jobs_collection.values():
-            for op_prev in job.operations:
-                index = self.index_mapper.get_index_from_operation(op_prev)
-                if index is not None:
-                    j, o = index
-                    tmp[op_prev.machine_name].append((op_prev.start, j, o))
+        for (j, o), op_prev in self.index_mapper.map_collection(self.previous_schedule_jobs_collection):
+            tmp[op_prev.machine_name].append((op_prev.start, j, o))
 
         for m, lst in tmp.items():
             lst.sort(key=lambda t: t[0])  # nach ursprünglichem Start
@@ -127,8 +144,254 @@ class Solver:
         return orders_idx
 
 
+    # Warm start ----------------------------------------------------------------------------------------------------
+    def _compute_warm_start_times(self) -> Dict[Tuple[int, int], Tuple[int, int]]:
+        """
+        Builds a feasible (start, end) for every operation of the model from the previous schedule.
+        Operations of the previous schedule keep their machine order and are only shifted to the right
+        where the simulation requires it (active operations, job delays). Operations that are new in
+        this model are appended behind them (earliest start, then due date) and, if earliness is
+        penalized, not started earlier than needed to finish the job on its due date.
+
+        Requires the extractions from the previous schedule and the active operations.
+        """
+        machine_ready: Dict[str, int] = defaultdict(int)
+        if self.active_jobs_collection:
+            for machine in self.machines:
+                fix_interval = self.machines_fix_intervals.get_interval(machine)
+                if fix_interval is not None and fix_interval.start < fix_interval.end:
+                    machine_ready[machine] = fix_interval.end
+
+        def priority(job_idx: int, op_idx: int, operation: JobOperation) -> tuple:
+            original_start = self.original_operation_starts.get((job_idx, op_idx))
+            if original_start is not None:
+                return 0, original_start, job_idx
+            due_date = operation.job_due_date if operation.job_due_date is not None else self.horizon
+            return 1, operation.job_earliest_start, due_date, job_idx
+
+        # Serial schedule generation over the first unscheduled operation of each job
+        heap = []
+        for (job_idx, op_idx), operation in self.index_mapper.items():
+            if op_idx == 0:
+                heapq.heappush(heap, (priority(job_idx, op_idx, operation), job_idx, op_idx))
+
+        times: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        while heap:
+            _, job_idx, op_idx = heapq.heappop(heap)
+            operation = self.index_mapper[(job_idx, op_idx)]
+
+            if op_idx == 0:
+                earliest_start = self._get_first_operation_min_start(operation, with_transition_times=True)
+            else:
+                earliest_start = times[(job_idx, op_idx - 1)][1]
+
+            start = max(earliest_start, machine_ready[operation.machine_name])
+            original_start = self.original_operation_starts.get((job_idx, op_idx))
+            if original_start is not None:
+                start = max(start, original_start)
+            elif self.earliness_terms.weight > 0 and operation.job_due_date is not None:
+                # new operations: not earlier than needed to finish the job just in time
+                start = max(start, operation.job_due_date - operation.job.sum_left_duration(operation.position_number))
+            start = self._get_start_after_fixed_operations(operation.machine_name, start, operation.duration)
+            end = start + operation.duration
+
+            times[(job_idx, op_idx)] = (start, end)
+            machine_ready[operation.machine_name] = end
+
+            next_index = (job_idx, op_idx + 1)
+            if next_index in self.index_mapper:
+                next_operation = self.index_mapper[next_index]
+                heapq.heappush(heap, (priority(*next_index, next_operation), *next_index))
+        return times
+
+    def _get_start_after_fixed_operations(self, machine: str, start: int, duration: int) -> int:
+        # first gap between the (sorted) frozen operations of the machine that fits the operation
+        for fixed_start, fixed_end in self.fixed_operation_intervals.get(machine, []):
+            if start < fixed_end and start + duration > fixed_start:
+                start = fixed_end
+        return start
+
+    def add_warm_start_hints(self) -> int:
+        """
+        Adds the repaired previous schedule as solution hints for all start and end variables.
+        Must be called after the model was built.
+
+        :return: Number of hinted operations
+        """
+        if not self.model_completed:
+            self.logger.warning("Model was not completed yet.")
+            return 0
+
+        self.model.ClearHints()
+        warm_start_times = self._compute_warm_start_times()
+        for index, (start, end) in warm_start_times.items():
+            self.model.AddHint(self.start_times[index], start)
+            self.model.AddHint(self.end_times[index], end)
+
+        self.number_of_hinted_operations = len(warm_start_times)
+        return self.number_of_hinted_operations
+
+    def probe_time_to_first_solution(
+            self, with_hints: bool = True, time_limit: Optional[int] = None,
+            num_search_workers: Optional[int] = None) -> Optional[float]:
+        """
+        Solves a copy of the model until the first solution is found (the model itself is not changed).
+
+        :param with_hints: If False, the solution hints are removed from the copy
+        :param time_limit: Time limit for the probe in seconds
+        :param num_search_workers: CP-SAT workers (default: environment variable MAX_CPU_NUMB or 8)
+        :return: Wall time until the first solution or None if no solution was found
+        """
+        if not self.model_completed:
+            self.logger.warning("Model was not completed yet.")
+            return None
+
+        model = self.model.clone()
+        if not with_hints:
+            model.ClearHints()
+
+        solver = cp_model.CpSolver()
+        solver.parameters.num_search_workers = _get_num_search_workers(num_search_workers)
+        solver.parameters.stop_after_first_solution = True
+        if time_limit is not None:
+            solver.parameters.max_time_in_seconds = time_limit
+
+        solution_timer = SolutionTimer()
+        solver.Solve(model, solution_timer)
+        return solution_timer.first_solution_time
+
+
+    # Variables -----------------------------------------------------------------------------------------------------
+    def _compute_operation_bounds(self, with_transition_times: bool) -> Dict[Tuple[int, int], Tuple[int, int]]:
+        """
+        Earliest start and latest end of every operation of the model.
+
+        - Head: earliest start of the first operation (_get_first_operation_min_start(), i.e. job earliest start,
+          schedule start and delays from active operations) plus the durations of the predecessors. An operation
+          with duration > 0 does not start on a machine that is blocked by an active operation from the schedule start
+          or inside a frozen operation it does not fit in front of.
+        - Tail: the job ends before the horizon (or before due_date + max_tardiness), minus the durations of the
+          successors.
+
+        Must be called after _extract_delays_from_active_operations(). Extends the horizon if a job
+        cannot be finished within it (e.g. long delays from active operations).
+        """
+        heads: Dict[Tuple[int, int], int] = {}
+        job_heads: Dict[int, int] = {}
+        for (job_idx, op_idx), operation in self.index_mapper.items():
+            if op_idx == 0:
+                head = self._get_first_operation_min_start(operation, with_transition_times=with_transition_times)
+            else:
+                previous = self.index_mapper[(job_idx, op_idx - 1)]
+                head = heads[(job_idx, op_idx - 1)] + previous.duration
+
+            if operation.duration > 0:
+                fix_interval = self.machines_fix_intervals.get_interval(operation.machine_name)
+                if self.active_jobs_collection and fix_interval is not None and fix_interval.start <= head:
+                    head = max(head, int(fix_interval.end))
+                head = self._get_start_after_fixed_operations(operation.machine_name, head, operation.duration)
+            heads[(job_idx, op_idx)] = int(head)
+            job_heads[job_idx] = head + operation.duration
+
+        # left-shifted schedule of all operations behind the latest release ends before this horizon
+        latest_release = max((heads[(job_idx, 0)] for job_idx in job_heads), default=0)
+        self.horizon = max(self.horizon, latest_release + self.jobs_collection.get_total_duration())
+
+        bounds: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        latest_ends: Dict[int, int] = {}
+        for (job_idx, op_idx), operation in sorted(self.index_mapper.items(), reverse=True):
+            if job_idx not in latest_ends:
+                # last operation of the job in the model
+                latest_end = self.horizon
+                if self.max_tardiness is not None and operation.job_due_date is not None:
+                    capped_end = operation.job_due_date + self.max_tardiness
+                    if capped_end >= job_heads[job_idx]:
+                        latest_end = min(latest_end, capped_end)
+                    else:
+                        self.logger.warning(
+                            f"Job {operation.job_id} cannot end before due date + max tardiness ({capped_end}) "
+                            f"- tardiness cap ignored for this job."
+                        )
+            else:
+                latest_end = latest_ends[job_idx]
+            bounds[(job_idx, op_idx)] = (heads[(job_idx, op_idx)], latest_end)
+            latest_ends[job_idx] = latest_end - operation.duration
+        return bounds
+
+    def _create_operation_variables(self, with_transition_times: bool = True):
+        """
+        Creates start, end and interval variables for all operations.
+        With tight_domains, the domains are the bounds from _compute_operation_bounds(),
+        otherwise [job earliest start, horizon] for all variables.
+
+        :param with_transition_times: Same value as the technological constraints of the model
+        """
+        if self.tight_domains:
+            self.operation_bounds = self._compute_operation_bounds(with_transition_times=with_transition_times)
+        else:
+            self.operation_bounds = {
+                index: (operation.job_earliest_start, self.horizon) for index, operation in self.index_mapper.items()
+            }
+
+        for (job_idx, op_idx), operation in self.index_mapper.items():
+            suffix = f"{job_idx}_{op_idx}"
+            earliest_start, latest_end = self.operation_bounds[(job_idx, op_idx)]
+            if self.tight_domains:
+                start = self.model.NewIntVar(earliest_start, latest_end - operation.duration, f"start_{suffix}")
+                end = self.model.NewIntVar(earliest_start + operation.duration, latest_end, f"end_{suffix}")
+            else:
+                start = self.model.NewIntVar(earliest_start, latest_end, f"start_{suffix}")
+                end = self.model.NewIntVar(earliest_start, latest_end, f"end_{suffix}")
+
+            interval = self.model.NewIntervalVar(start, operation.duration, end, f"interval_{suffix}")
+
+            self.start_times[(job_idx, op_idx)] = start
+            self.end_times[(job_idx, op_idx)] = end
+            self.intervals[(job_idx, op_idx)] = (interval, operation.machine_name)
+
+    def get_domain_info(self) -> dict:
+        """
+        Size of the start variable domains compared to [job earliest start, horizon].
+        """
+        if not self.start_times:
+            return {"access_fault": "Variables were not created yet!"}
+
+        loose_size = tight_size = 0
+        for index, operation in self.index_mapper.items():
+            domain = list(self.start_times[index].proto.domain)
+            tight_size += domain[-1] - domain[0] + 1
+            loose_size += self.horizon - operation.job_earliest_start + 1
+        return {
+            "horizon": self.horizon,
+            "average_start_domain_size": round(tight_size / len(self.start_times), 1),
+            "start_domain_size_reduction": f"{1 - tight_size / loose_size:.1%}",
+        }
+
     # Constraints ---------------------------------------------------------------------------------------------------
 
+    def _get_first_operation_min_start(self, operation: JobOperation, with_transition_times: bool = False) -> int:
+        """
+        Earliest start of the first operation of a job in this model
+        (job earliest start, schedule start and delays from active operations).
+
+        :param operation: First operation of the job within the model
+        :param with_transition_times: If True, a job that has not started yet (position 0) is not
+                                      started earlier than due_date - sum_duration - sum_transition_time
+        :return: Minimal start time
+        """
+        min_start = max(operation.job_earliest_start, int(self.schedule_start))
+
+        if with_transition_times and operation.position_number == 0:                #  oder Datenbankabfrage!
+            due_date = operation.job_due_date
+            sum_transition_time = operation.job.sum_transition_time(operation.position_number)
+            sum_duration = operation.job.sum_duration
+            reasonable_min_start = due_date - sum_duration - sum_transition_time
+            min_start = max(min_start, reasonable_min_start)
+
+        if operation.job_id in self.job_delays:
+            min_start = max(min_start, self.job_delays.get_time(operation.job_id))
+        return min_start
+
     def _add_technological_operation_constraints(self):
 
         for (job_idx, op_idx), operation in self.index_mapper.items():
@@ -136,9 +399,7 @@ class Solver:
 
             # 1. Technological constraint: earliest start of the first operation
             if op_idx == 0:
-                min_start = max(operation.job_earliest_start, int(self.schedule_start))
-                if operation.job_id in self.job_delays:
-                    min_start = max(min_start, self.job_delays.get_time(operation.job_id))
+                min_start = self._get_first_operation_min_start(operation, with_transition_times=False)
                 self.model.Add(start_var >= min_start)
 
             # 2. Technological constraint: operation order within the job
@@ -153,17 +414,7 @@ class Solver:
 
             # 1. Technological constraint: earliest start of the first operation
             if op_idx == 0:
-                min_start = max(operation.job_earliest_start, int(self.schedule_start))
-
-                if operation.position_number ==  0:                                            #  oder Datenbankabfrage!
-                    due_date = operation.job_due_date
-                    sum_transition_time = operation.job.sum_transition_time(operation.position_number)
-                    sum_duration = operation.job.sum_duration
-                    reasonable_min_start = due_date - sum_duration - sum_transition_time
-                    min_start = max(min_start, reasonable_min_start)
-
-                if operation.job_id in self.job_delays:
-                    min_start = max(min_start, self.job_delays.get_time(operation.job_id))
+                min_start = self._get_first_operation_min_start(operation, with_transition_times=True)
                 self.model.Add(start_var >= min_start)
 
             # 2. Technological constraint: operation order within the job
@@ -177,6 +428,7 @@ class Solver:
         - self.machines
         - self.intervals
         - self.machines_fix_intervals (from active_jobs_collection) - optional
+        - self.fixed_operation_intervals (from fixed_operations_collection) - optional
         """
 
         # Machine-level constraints (no overlap + fixed blocks from running ops) -----------------------
@@ -197,6 +449,11 @@ class Solver:
                     fixed_interval = self.model.NewIntervalVar(start, end - start, end, f"fixed_{machine}")
                     machine_intervals.append(fixed_interval)
 
+            # Fixed Intervals of frozen operations (not part of the model)
+            for k, (start, end) in enumerate(self.fixed_operation_intervals.get(machine, [])):
+                if start < end:
+                    machine_intervals.append(self.model.NewIntervalVar(start, end - start, end, f"frozen_{machine}_{k}"))
+
             # NoOverlap für diese Maschine
             self.model.AddNoOverlap(machine_intervals)
 
@@ -205,7 +462,8 @@ class Solver:
         if operation.position_number != operation.job.last_operation_position_number:
             raise ValueError(f"{operation} is not the last operation! '_add_tardiness_var()' failed!")
         end_var = self.end_times[(job_idx, op_idx)]
-        tardiness = self.model.NewIntVar(0, self.horizon, f"tardiness_{job_idx}")
+        earliest_start, latest_end = self.operation_bounds[(job_idx, op_idx)]
+        tardiness = self.model.NewIntVar(0, max(latest_end - operation.job_due_date, 0), f"tardiness_{job_idx}")
         self.model.AddMaxEquality(tardiness, [end_var - operation.job_due_date, 0])
 
         self.tardiness_terms.add(tardiness)
@@ -215,7 +473,9 @@ class Solver:
             raise ValueError(f"{operation} is not the last operation! '_add_earliness_var()' failed!")
 
         end_var = self.end_times[(job_idx, op_idx)]
-        earliness = self.model.NewIntVar(0, self.horizon, f"earliness_{job_idx}")
+        earliest_start, latest_end = self.operation_bounds[(job_idx, op_idx)]
+        earliest_end = earliest_start + operation.duration
+        earliness = self.model.NewIntVar(0, max(operation.job_due_date - earliest_end, 0), f"earliness_{job_idx}")
         self.model.AddMaxEquality(earliness, [operation.job_due_date - end_var, 0])
         self.earliness_terms.add(earliness)
 
@@ -223,8 +483,11 @@ class Solver:
         start_var = self.start_times[(job_idx, op_idx)]
 
         if (job_idx, op_idx) in self.original_operation_starts.keys():
-            deviation = self.model.NewIntVar(0, self.horizon, f"deviation_{job_idx}_{op_idx}")
             original_start = self.original_operation_starts[(job_idx, op_idx)]
+            earliest_start, latest_end = self.operation_bounds[(job_idx, op_idx)]
+            latest_start = latest_end - self.index_mapper[(job_idx, op_idx)].duration
+            max_deviation = max(original_start - earliest_start, latest_start - original_start, 0)
+            deviation = self.model.NewIntVar(0, max_deviation, f"deviation_{job_idx}_{op_idx}")
             self.model.AddAbsEquality(deviation, start_var - original_start)
             self.deviation_terms.add(deviation)
 
@@ -249,6 +512,7 @@ class Solver:
         self._extract_delays_from_active_operations()
 
         # II. Constraints (after I.)
+        self._create_operation_variables(with_transition_times=True)
         self._add_machine_no_overlap_constraints()
         self._add_technological_operation_constraints_with_transition_times()
 
@@ -306,6 +570,7 @@ class Solver:
 
         # Basis: aktive Blöcke/Job-Delays, NoOverlap, Technologie
         self._extract_delays_from_active_operations()
+        self._create_operation_variables(with_transition_times=True)
         self._add_machine_no_overlap_constraints()
         self._add_technological_operation_constraints_with_transition_times()
 
@@ -375,6 +640,7 @@ class Solver:
         self._extract_delays_from_active_operations()  # aktive Blöcke und Job-Delays
 
         # II) Basis-Constraints
+        self._create_operation_variables(with_transition_times=True)
         self._add_machine_no_overlap_constraints()
         self._add_technological_operation_constraints_with_transition_times()
 
@@ -463,6 +729,7 @@ class Solver:
         self._extract_delays_from_active_operations()
 
         # II. Basis-Constraints: Maschinen (inkl. Fixblöcke), Technologie
+        self._create_operation_variables(with_transition_times=True)
         self._add_machine_no_overlap_constraints()
         self._add_technological_operation_constraints_with_transition_times()
 
@@ -541,6 +808,7 @@ class Solver:
             return "Model is already completed"
 
         # Operation-level constraints
+        self._create_operation_variables(with_transition_times=False)
         self._add_technological_operation_constraints()
 
         #  Machine-level constraints
@@ -575,6 +843,7 @@ class Solver:
         self._extract_delays_from_active_operations()
 
         # II. Constraints (after I.)
+        self._create_operation_variables(with_transition_times=False)
         self._add_machine_no_overlap_constraints()
         self._add_technological_operation_constraints()
 
@@ -643,6 +912,7 @@ class Solver:
         self._extract_delays_from_active_operations()
 
         # II. Constraints (after I.)
+        self._create_operation_variables(with_transition_times=False)
         self._add_machine_no_overlap_constraints()
         self._add_technological_operation_constraints()
 
@@ -681,10 +951,17 @@ class Solver:
             bound_no_improvement_time: Optional[int] = 600,
             bound_relative_change: float = 0.01,
             bound_warmup_time: int = 30,
+            num_search_workers: Optional[int] = None,
+            stop_policies: Optional[Sequence[StopPolicy]] = None,
     ):
+        """
+        :param stop_policies: Stop policies (CP_StopPolicies) that replace the BoundGuard - the bound_* parameters
+                              are ignored. The search stops with the first policy that fires; the policy and the
+                              saved time are logged.
+        """
         if self.model_completed:
 
-            self.solver.parameters.num_search_workers = int(os.environ.get("MAX_CPU_NUMB", "8"))
+            self.solver.parameters.num_search_workers = _get_num_search_workers(num_search_workers)
 
             self.solver.parameters.log_search_progress = print_log_search_progress
             self.solver.parameters.relative_gap_limit = gap_limit
@@ -693,8 +970,14 @@ class Solver:
                 self.solver.parameters.max_time_in_seconds = time_limit
 
             # Bound-Callback vorbereiten
-            if bound_no_improvement_time is not None and bound_no_improvement_time > 0:
-                self.solver.best_bound_callback = BoundGuard(
+            bound_guard = None
+            self.stop_policy_monitor = None
+            if stop_policies:
+                self.stop_policy_monitor = StopPolicyMonitor(
+                    solver=self.solver, logger=self.logger, policies=stop_policies
+                )
+            elif bound_no_improvement_time is not None and bound_no_improvement_time > 0:
+                bound_guard = BoundGuard(
                     solver=self.solver,
                     logger=self.logger,
                     no_improvement_seconds=bound_no_improvement_time,
@@ -702,13 +985,39 @@ class Solver:
                     relative_change=bound_relative_change,
                 )
 
-            if log_file is not None:
-                # Für Log-Ausgabe ins File aktivieren
-                self.solver.parameters.log_search_progress = True
-                with _redirect_cpp_logs(log_file):
-                    self.solver_status = self.solver.Solve(self.model)
-            else:
-                self.solver_status = self.solver.Solve(self.model)
+            # Convergence (solutions + bounds) as structured data; also measures the time to first solution
+            self.progress_recorder = ProgressRecorder(
+                cost_terms={
+                    "tardiness_cost": self.tardiness_terms,
+                    "earliness_cost": self.earliness_terms,
+                    "deviation_cost": self.deviation_terms,
+                },
+                on_point=self.stop_policy_monitor.on_point if self.stop_policy_monitor else None
+            )
+            self.solution_timer = self.progress_recorder
+            self.solver.best_bound_callback = chain_best_bound_callbacks(
+                bound_guard, self.progress_recorder.on_best_bound
+            )
+
+            if self.stop_policy_monitor is not None:
+                self.stop_policy_monitor.start()
+            try:
+                if log_file is not None:
+                    # Search log via log callback into the file (no redirection of stdout/stderr)
+                    self.solver.parameters.log_search_progress = True
+                    self.solver.parameters.log_to_stdout = False
+                    with open(log_file, "w") as file:
+                        self.solver.log_callback = lambda message: file.write(message + "\n")
+                        self.solver_status = self.solver.Solve(self.model, self.solution_timer)
+                        self.solver.log_callback = None
+                else:
+                    self.solver_status = self.solver.Solve(self.model, self.solution_timer)
+            finally:
+                if self.stop_policy_monitor is not None:
+                    self.stop_policy_monitor.finish()
+
+            if self.stop_policy_monitor is not None:
+                self.stop_policy_monitor.log_result(time_limit=time_limit)
 
         else:
             self.logger.warning("Model was not completed yet.")
@@ -739,8 +1048,10 @@ class Solver:
                 "number_of_previous_operations": self.previous_schedule_jobs_collection.count_operations() if self.previous_schedule_jobs_collection else 0,
                 "number_of_active_operation": self.active_jobs_collection.count_operations() if self.active_jobs_collection else 0,
                 "number_of_variables": len(model_proto.variables),
-                "number_of_constraints": len(model_proto.constraints)
+                "number_of_constraints": len(model_proto.constraints),
+                "number_of_hinted_operations": self.number_of_hinted_operations
             }
+            model_info.update(self.get_domain_info())
             return model_info
         return {"access_fault": "Model is not complete!"}
 
@@ -753,10 +1064,16 @@ class Solver:
                 "number_of_branches": self.solver.NumBranches(),
                 "wall_time": round(self.solver.WallTime(), 2)
             }
+            if self.solution_timer is not None:
+                first_solution_time = self.solution_timer.first_solution_time
+                solver_info["time_to_first_solution"] = round(first_solution_time, 2) if first_solution_time is not None else None
+                solver_info["number_of_solutions"] = self.solution_timer.number_of_solutions
             if self.solver_status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
                 solver_info["tardiness_cost"] = self.tardiness_terms.total_cost(self.solver)
                 solver_info["earliness_cost"] = self.earliness_terms.total_cost(self.solver)
                 solver_info["deviation_cost"] = self.deviation_terms.total_cost(self.solver)
+            if self.stop_policy_monitor is not None and self.stop_policy_monitor.fired_policy is not None:
+                solver_info["stop_policy"] = self.stop_policy_monitor.fired_policy.name
 
             return solver_info
         return {"access_fault": "Solver status is not available!"}
@@ -780,34 +1097,10 @@ class Solver:
             self.logger.info(f"{label:{label_width}}: {value}")
 
 
-@contextlib.contextmanager
-def _redirect_cpp_logs(logfile_path: str = "cp_output.log"):
+def _get_num_search_workers(num_search_workers: Optional[int] = None) -> int:
     """
-    Context manager to temporarily redirect stdout/stderr,
-    e.g. to capture output from OR-Tools CP-SAT solver or other C++ logs.
-    After the block, original output streams are restored.
+    Number of CP-SAT search workers: explicit value or environment variable MAX_CPU_NUMB (default 8).
     """
-
-    # Flush any current output to avoid mixing content
-    sys.stdout.flush()
-    sys.stderr.flush()
-
-    # Save original file descriptors for stdout and stderr
-    original_stdout_fd = os.dup(1)
-    original_stderr_fd = os.dup(2)
-
-    with open(logfile_path, 'w') as f:
-        try:
-            # Redirect stdout and stderr to the log file
-            os.dup2(f.fileno(), 1)
-            os.dup2(f.fileno(), 2)
-            yield
-            f.flush()  # Ensures content is flushed to file, esp. in Jupyter
-        finally:
-            # Restore original stdout and stderr
-            os.dup2(original_stdout_fd, 1)
-            os.dup2(original_stderr_fd, 2)
-            os.close(original_stdout_fd)
-            os.close(original_stderr_fd)
-
-
+    if num_search_workers is not None:
+        return int(num_search_workers)
+    return int(os.environ.get("MAX_CPU_NUMB", "8"))
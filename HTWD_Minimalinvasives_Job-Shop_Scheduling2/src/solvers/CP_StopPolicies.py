@@ -0,0 +1,244 @@
+import threading
+import time
+from typing import Optional, List, Sequence
+
+from src.Logger import Logger
+from src.solvers.CP_ProgressRecorder import ProgressPoint
+
+
+class StopPolicy:
+    """
+    Criterion to stop the CP-SAT search early.
+    check() is called with the current state of the search (new solutions, new bounds and periodically)
+    and returns the reason for stopping or None. reset() is called before each solve, so one policy
+    object can be used for several models (e.g. all shifts of an experiment).
+    """
+    name: str = "stop policy"
+
+    def reset(self):
+        pass
+
+    def check(self, elapsed: float, objective: Optional[float], best_bound: Optional[float]) -> Optional[str]:
+        raise NotImplementedError
+
+
+class GapStopPolicy(StopPolicy):
+    """
+    Stops as soon as the relative gap between the best solution and the best bound is small enough.
+    """
+    name = "gap"
+
+    def __init__(self, relative_gap: float = 0.01, min_time: float = 0.0):
+        self.relative_gap = relative_gap
+        self.min_time = min_time
+
+    def check(self, elapsed: float, objective: Optional[float], best_bound: Optional[float]) -> Optional[str]:
+        if objective is None or best_bound is None or elapsed < self.min_time:
+            return None
+        gap = abs(objective - best_bound) / max(abs(objective), 1.0)
+        if gap <= self.relative_gap:
+            return f"relative gap {gap:.2%} <= {self.relative_gap:.2%}"
+        return None
+
+
+class _Stagnation:
+    """
+    Time since the last relevant change of a value. The allowed time without change adapts to the difficulty
+    of the model: max(min_seconds, factor * time of the last change) - easy models (early last improvement)
+    stop soon, models that still improved late get proportionally more time.
+    """
+    def __init__(self, min_seconds: float, factor: float, relative_change: float):
+        self.min_seconds = min_seconds
+        self.factor = factor
+        self.relative_change = relative_change
+        self.reset()
+
+    def reset(self):
+        self.value: Optional[float] = None
+        self.last_change: float = 0.0
+
+    def update(self, elapsed: float, value: Optional[float]):
+        if value is None:
+            return
+        if self.value is None or abs(value - self.value) > self.relative_change * max(abs(self.value), 1.0):
+            self.value = value
+            self.last_change = elapsed
+
+    def stagnated_for(self, elapsed: float) -> Optional[float]:
+        if self.value is None:
+            return None
+        limit = max(self.min_seconds, self.factor * self.last_change)
+        stagnation = elapsed - self.last_change
+        return stagnation if stagnation >= limit else None
+
+
+class PrimalStagnationStopPolicy(StopPolicy):
+    """
+    Stops if the best solution did not improve by more than relative_change for
+    max(min_seconds, factor * time of the last improvement).
+    """
+    name = "primal stagnation"
+
+    def __init__(self, min_seconds: float = 30, factor: float = 1.0, relative_change: float = 0.0):
+        self._objective = _Stagnation(min_seconds, factor, relative_change)
+
+    def reset(self):
+        self._objective.reset()
+
+    def check(self, elapsed: float, objective: Optional[float], best_bound: Optional[float]) -> Optional[str]:
+        self._objective.update(elapsed, objective)
+        stagnation = self._objective.stagnated_for(elapsed)
+        if stagnation is not None:
+            return f"no improvement of the best solution for {stagnation:.1f}s"
+        return None
+
+
+class BoundStagnationStopPolicy(StopPolicy):
+    """
+    Stops if the best bound did not change by more than relative_change for max(min_seconds, factor * time of
+    the last change) - the BoundGuard criterion with an adaptive waiting time.
+    """
+    name = "bound stagnation"
+
+    def __init__(self, min_seconds: float = 60, factor: float = 1.0, relative_change: float = 0.01,
+                 warmup_seconds: float = 0.0):
+        self.warmup_seconds = warmup_seconds
+        self._bound = _Stagnation(min_seconds, factor, relative_change)
+
+    def reset(self):
+        self._bound.reset()
+
+    def check(self, elapsed: float, objective: Optional[float], best_bound: Optional[float]) -> Optional[str]:
+        if elapsed < self.warmup_seconds:
+            return None
+        self._bound.update(elapsed, best_bound)
+        stagnation = self._bound.stagnated_for(elapsed)
+        if stagnation is not None:
+            return f"no relevant change of the best bound for {stagnation:.1f}s"
+        return None
+
+
+class CombinedStagnationStopPolicy(StopPolicy):
+    """
+    Stops only if both the best solution and the best bound stagnate
+    (a search that still improves one side of the gap continues).
+    """
+    name = "bound + incumbent stagnation"
+
+    def __init__(self, min_seconds: float = 30, factor: float = 1.0,
+                 objective_relative_change: float = 0.0, bound_relative_change: float = 0.01):
+        self._objective = _Stagnation(min_seconds, factor, objective_relative_change)
+        self._bound = _Stagnation(min_seconds, factor, bound_relative_change)
+
+    def reset(self):
+        self._objective.reset()
+        self._bound.reset()
+
+    def check(self, elapsed: float, objective: Optional[float], best_bound: Optional[float]) -> Optional[str]:
+        self._objective.update(elapsed, objective)
+        self._bound.update(elapsed, best_bound)
+        objective_stagnation = self._objective.stagnated_for(elapsed)
+        bound_stagnation = self._bound.stagnated_for(elapsed)
+        if objective_stagnation is not None and bound_stagnation is not None:
+            return (f"no improvement of the best solution for {objective_stagnation:.1f}s "
+                    f"and of the best bound for {bound_stagnation:.1f}s")
+        return None
+
+
+class StopPolicyMonitor:
+    """
+    Evaluates the stop policies during one solve and stops the search with the first policy that fires.
+    Gets the search events from the ProgressRecorder (on_point) and additionally checks the policies
+    every check_interval seconds in a background thread, so a stagnating search is also stopped if
+    CP-SAT reports nothing new.
+    """
+    def __init__(self, solver, logger: Logger, policies: Sequence[StopPolicy], check_interval: float = 1.0):
+        self.solver = solver
+        self.logger = logger
+        self.policies: List[StopPolicy] = list(policies)
+        self.check_interval = check_interval
+
+        self.fired_policy: Optional[StopPolicy] = None
+        self.reason: Optional[str] = None
+        self.stop_time: Optional[float] = None
+
+        self._objective: Optional[float] = None
+        self._best_bound: Optional[float] = None
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start = time.monotonic()
+
+    def start(self):
+        for policy in self.policies:
+            policy.reset()
+        self._start = time.monotonic()
+        self._finished.clear()
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+        self._thread.start()
+
+    def finish(self):
+        self._finished.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def on_point(self, point: ProgressPoint):
+        with self._lock:
+            self._objective = point.objective
+            self._best_bound = point.best_bound
+        self._check()
+
+    def _watch(self):
+        while not self._finished.wait(self.check_interval):
+            self._check()
+
+    def _check(self):
+        with self._lock:
+            if self.fired_policy is not None:
+                return
+            elapsed = time.monotonic() - self._start
+            for policy in self.policies:
+                reason = policy.check(elapsed, self._objective, self._best_bound)
+                if reason is not None:
+                    self.fired_policy, self.reason, self.stop_time = policy, reason, elapsed
+                    break
+            else:
+                return
+        self.solver.stop_search()
+
+    def log_result(self, time_limit: Optional[float]):
+        if self.fired_policy is None:
+            self.logger.info("Stop policies: no policy fired")
+            return
+        saved = f" - {max(time_limit - self.stop_time, 0):.1f}s of the time limit saved" if time_limit else ""
+        self.logger.info(
+            f"Stop policy '{self.fired_policy.name}' fired after {self.stop_time:.1f}s ({self.reason}){saved}"
+        )
+
+
+class TimeBudgetAllocator:
+    """
+    Splits a total time budget over the shifts of an experiment. Each shift gets an equal share of the
+    remaining budget; time a shift does not use (e.g. stopped by a stop policy) is passed on to the
+    following shifts, so hard shifts get the time saved on easy ones.
+    """
+    def __init__(self, total_budget: float, number_of_shifts: int,
+                 min_time_limit: float = 1.0, max_time_limit: Optional[float] = None):
+        if total_budget <= 0 or number_of_shifts <= 0:
+            raise ValueError("total_budget and number_of_shifts must be > 0.")
+        self.total_budget = total_budget
+        self.remaining_budget = float(total_budget)
+        self.remaining_shifts = number_of_shifts
+        self.min_time_limit = min_time_limit
+        self.max_time_limit = max_time_limit
+
+    def next_time_limit(self) -> float:
+        time_limit = self.remaining_budget / max(self.remaining_shifts, 1)
+        if self.max_time_limit is not None:
+            time_limit = min(time_limit, self.max_time_limit)
+        return max(time_limit, self.min_time_limit)
+
+    def register(self, used_time: float):
+        self.remaining_budget = max(self.remaining_budget - used_time, 0.0)
+        self.remaining_shifts = max(self.remaining_shifts - 1, 0)
@@ -1,12 +1,258 @@
+import math
 import random
-import os
-from collections import defaultdict
-from typing import Optional, Dict, List, Tuple
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Sequence, Tuple
 
 from deap import base, creator, tools, algorithms
 
 from src.Logger import Logger
 from src.domain.Collection import LiveJobCollection
+from src.solvers.heuristics.GT_EventScheduler import EventScheduler
+
+
+@dataclass(frozen=True)
+class DecodingProblem:
+    """
+    Problem data as flat lists for the decoder (operations of job j: op_offset[j] .. op_offset[j + 1] - 1).
+    job_release contains the schedule start and the delays of the active operations,
+    machine_ready the machine blocks of the active operations.
+    """
+    op_offset: List[int]
+    op_machine: List[int]
+    op_duration: List[int]
+    job_release: List[int]
+    op_job: List[int]
+    job_due_date: List[Optional[int]]
+    op_previous_start: List[Optional[int]]
+    machine_ready: List[int]
+    objective: str = "makespan"
+    w_t: int = 1
+    w_e: int = 1
+    w_dev: int = 1
+    active_decoding: bool = False
+
+    @property
+    def number_of_machines(self) -> int:
+        return len(self.machine_ready)
+
+
+def decode_chromosome(chromosome: List[int], problem: DecodingProblem) -> List[int]:
+    """
+    Semi-active schedule of a chromosome in job-repetition encoding: the k-th occurrence of job j is the k-th
+    operation of job j, each operation starts as early as its job and machine allow.
+    O(n) with preallocated lists.
+
+    :return: Start per operation index
+    """
+    next_operation = problem.op_offset[:-1]
+    job_free = problem.job_release[:]
+    machine_free = problem.machine_ready[:]
+    starts = [0] * len(problem.op_machine)
+    op_machine, op_duration = problem.op_machine, problem.op_duration
+
+    for j in chromosome:
+        o = next_operation[j]
+        next_operation[j] = o + 1
+        m = op_machine[o]
+        start = job_free[j] if job_free[j] > machine_free[m] else machine_free[m]
+        end = start + op_duration[o]
+        starts[o] = start
+        job_free[j] = end
+        machine_free[m] = end
+    return starts
+
+
+def evaluate_starts(starts: List[int], problem: DecodingProblem) -> int:
+    """
+    Objective value of the starts like the CP models:
+        - "makespan"
+        - "tardiness": sum of the tardiness of the jobs
+        - "absolute_lateness__start_deviation": w_t * tardiness + w_e * earliness (end of the last operation)
+          + w_dev * |start - previous start| (as build_model__absolute_lateness__start_deviation__minimization)
+    """
+    op_offset, op_duration = problem.op_offset, problem.op_duration
+    if problem.objective == "makespan":
+        return max((start + duration for start, duration in zip(starts, op_duration)), default=0)
+
+    value = 0
+    for j, due_date in enumerate(problem.job_due_date):
+        last = op_offset[j + 1] - 1
+        if due_date is None or last < op_offset[j]:
+            continue
+        lateness = starts[last] + op_duration[last] - due_date
+        if lateness > 0:
+            value += lateness if problem.objective == "tardiness" else problem.w_t * lateness
+        elif problem.objective != "tardiness":
+            value -= problem.w_e * lateness
+
+    if problem.objective == "absolute_lateness__start_deviation" and problem.w_dev:
+        for start, previous_start in zip(starts, problem.op_previous_start):
+            if previous_start is not None:
+                value += problem.w_dev * abs(start - previous_start)
+    return value
+
+
+def decode_chromosome_active(chromosome: List[int], problem: DecodingProblem) -> Tuple[List[int], List[int]]:
+    """
+    Active schedule (Giffler-Thompson) of a chromosome in job-repetition encoding: the machine of the operation
+    with the earliest possible end is planned next; from its conflict set (operations on this machine that could
+    start before this end) the operation whose gene comes first in the chromosome is chosen.
+    O(n * number of jobs).
+
+    :return: Start per operation index and the operations in the order they were planned
+    """
+    op_offset, op_machine, op_duration = problem.op_offset, problem.op_machine, problem.op_duration
+    gene_position = [0] * len(op_machine)
+    next_operation = op_offset[:-1]
+    for index, j in enumerate(chromosome):
+        gene_position[next_operation[j]] = index
+        next_operation[j] += 1
+
+    next_operation = op_offset[:-1]
+    job_free = problem.job_release[:]
+    machine_free = problem.machine_ready[:]
+    starts = [0] * len(op_machine)
+    order = []
+    ready_jobs = [j for j in range(len(job_free)) if op_offset[j] < op_offset[j + 1]]
+
+    while ready_jobs:
+        # Maschine der Operation mit dem frühesten möglichen Ende
+        best_end, best_operation = math.inf, -1
+        for j in ready_jobs:
+            o = next_operation[j]
+            m = op_machine[o]
+            end = (job_free[j] if job_free[j] > machine_free[m] else machine_free[m]) + op_duration[o]
+            if end < best_end:
+                best_end, best_operation = end, o
+        machine = op_machine[best_operation]
+
+        # Konfliktmenge: Operationen dieser Maschine mit Start vor best_end, erstes Gen gewinnt
+        chosen, chosen_job = -1, -1
+        for j in ready_jobs:
+            o = next_operation[j]
+            if op_machine[o] != machine:
+                continue
+            if o == best_operation or max(job_free[j], machine_free[machine]) < best_end:
+                if chosen < 0 or gene_position[o] < gene_position[chosen]:
+                    chosen, chosen_job = o, j
+
+        start = max(job_free[chosen_job], machine_free[machine])
+        end = start + op_duration[chosen]
+        starts[chosen] = start
+        order.append(chosen)
+        job_free[chosen_job] = end
+        machine_free[machine] = end
+        next_operation[chosen_job] = chosen + 1
+        if chosen + 1 == op_offset[chosen_job + 1]:
+            ready_jobs.remove(chosen_job)
+    return starts, order
+
+
+def _operation_order(chromosome: List[int], problem: DecodingProblem) -> List[int]:
+    # Operationen in der Reihenfolge ihrer Gene (Planungsreihenfolge des semi-aktiven Decoders)
+    next_operation = problem.op_offset[:-1]
+    order = []
+    for j in chromosome:
+        order.append(next_operation[j])
+        next_operation[j] += 1
+    return order
+
+
+def _operation_cost(o: int, start: int, problem: DecodingProblem) -> int:
+    cost = 0
+    previous_start = problem.op_previous_start[o]
+    if previous_start is not None:
+        cost += problem.w_dev * abs(start - previous_start)
+    j = problem.op_job[o]
+    due_date = problem.job_due_date[j]
+    if due_date is not None and o == problem.op_offset[j + 1] - 1:
+        lateness = start + problem.op_duration[o] - due_date
+        cost += problem.w_t * lateness if lateness > 0 else -problem.w_e * lateness
+    return cost
+
+
+def shift_to_targets(starts: List[int], order: List[int], problem: DecodingProblem) -> List[int]:
+    """
+    Backwards over the planning order each operation is shifted from its start towards the cheapest start
+    (previous start, due date of the job) as far as its job and machine successors allow
+    (same timing as TS_Solver). Machine sequences stay unchanged.
+    """
+    op_offset, op_machine, op_duration = problem.op_offset, problem.op_machine, problem.op_duration
+    op_job = problem.op_job
+    machine_next = [-1] * len(starts)
+    last_on_machine = [-1] * problem.number_of_machines
+    for o in order:
+        m = op_machine[o]
+        if last_on_machine[m] >= 0:
+            machine_next[last_on_machine[m]] = o
+        last_on_machine[m] = o
+
+    shifted = starts[:]
+    for o in reversed(order):
+        if problem.op_previous_start[o] is None and problem.job_due_date[op_job[o]] is None:
+            continue
+        latest = math.inf
+        if o + 1 < op_offset[op_job[o] + 1]:
+            latest = shifted[o + 1] - op_duration[o]
+        if machine_next[o] >= 0:
+            latest = min(latest, shifted[machine_next[o]] - op_duration[o])
+        if latest <= starts[o]:
+            continue
+
+        # günstigster Start in [start, latest] (stückweise lineare, konvexe Kosten -> Knickstellen prüfen)
+        best, best_cost = starts[o], _operation_cost(o, starts[o], problem)
+        candidates = [] if latest == math.inf else [int(latest)]
+        if problem.op_previous_start[o] is not None:
+            candidates.append(problem.op_previous_start[o])
+        if problem.job_due_date[op_job[o]] is not None:
+            candidates.append(problem.job_due_date[op_job[o]] - op_duration[o])
+        for candidate in candidates:
+            candidate = int(min(max(candidate, starts[o]), latest))
+            cost = _operation_cost(o, candidate, problem)
+            if cost < best_cost or (cost == best_cost and candidate < best):
+                best, best_cost = candidate, cost
+        shifted[o] = best
+    return shifted
+
+
+def decode_schedule(chromosome: List[int], problem: DecodingProblem) -> List[int]:
+    """
+    Starts of a chromosome: semi-active or active decoding, for the lateness/deviation objective
+    shifted towards the target starts.
+    """
+    if problem.active_decoding:
+        starts, order = decode_chromosome_active(chromosome, problem)
+    else:
+        starts, order = decode_chromosome(chromosome, problem), None
+    if problem.objective == "absolute_lateness__start_deviation":
+        if order is None:
+            order = _operation_order(chromosome, problem)
+        starts = shift_to_targets(starts, order, problem)
+    return starts
+
+
+def evaluate_chromosome(chromosome: List[int], problem: DecodingProblem) -> Tuple[int]:
+    return (evaluate_starts(decode_schedule(chromosome, problem), problem),)
+
+
+def crossover_job_order(parent1: list, parent2: list) -> Tuple[list, list]:
+    """
+    Job-based order crossover (JOX) for the job-repetition encoding: the genes of a random subset of jobs keep their
+    positions, the other positions are filled with the remaining genes in the order of the other parent.
+    """
+    jobs = set(parent1)
+    kept = {j for j in jobs if random.random() < 0.5}
+    child1 = _fill_job_order(parent1, parent2, kept)
+    child2 = _fill_job_order(parent2, parent1, kept)
+    parent1[:], parent2[:] = child1, child2
+    return parent1, parent2
+
+
+def _fill_job_order(keeper: list, donor: list, kept: set) -> list:
+    fill = iter([j for j in donor if j not in kept])
+    return [j if j in kept else next(fill) for j in keeper]
 
 
 class Solver:
@@ -15,93 +261,179 @@ class Solver:
         self.jobs_collection = jobs_collection
         self.schedule_start = schedule_start
 
+        # Modell (optional, für den Schichtbetrieb)
+        self.objective: Optional[str] = None
+        self.previous_schedule_jobs_collection: Optional[LiveJobCollection] = None
+        self.active_jobs_collection: Optional[LiveJobCollection] = None
+        self.w_t, self.w_e, self.w_dev = 1, 1, 1
+
         # Ergebnisvariablen
         self.best_value: Optional[int] = None
         self.best_individual = None
         self.best_schedule: List[Tuple[str, int, str, int, int, int]] = []
         self.model_completed = False
 
+        self.number_of_generations: int = 0
+        self.number_of_evaluations: int = 0
+        self.workers: int = 1
+        self.wall_time: float = 0.0
+
+    def build_model__absolute_lateness__start_deviation__minimization(
+            self, previous_schedule_jobs_collection: Optional[LiveJobCollection] = None,
+            active_jobs_collection: Optional[LiveJobCollection] = None,
+            w_t: int = 1, w_e: int = 1, w_dev: int = 1):
+        """
+        Same objective and hard constraints as
+        CP_Solver.Solver.build_model__absolute_lateness__start_deviation__minimization() (schedule start, machines
+        blocked and jobs delayed by active operations, reasonable earliest start of jobs that have not started yet).
+        The model is solved by solve_model().
+        """
+        self.objective = "absolute_lateness__start_deviation"
+        self.previous_schedule_jobs_collection = previous_schedule_jobs_collection
+        self.active_jobs_collection = active_jobs_collection
+        self.w_t, self.w_e, self.w_dev = w_t, w_e, w_dev
+
     # -----------------------------------------------------------
     # Hilfsfunktionen
     # -----------------------------------------------------------
-    def _extract_problem(self):
-        jobs_ops = {}
-        earliest_start = {}
-        due_date = {}
-        machines = set()
+    def _build_problem(
+            self, objective: str, previous_schedule_jobs_collection: Optional[LiveJobCollection] = None,
+            w_t: int = 1, w_e: int = 1, w_dev: int = 1, active_decoding: bool = False) -> DecodingProblem:
+        previous_starts: Dict[Tuple[str, int], int] = {}
+        if previous_schedule_jobs_collection is not None:
+            for job in previous_schedule_jobs_collection.values():
+                for operation in job.operations:
+                    previous_starts[(job.id, operation.position_number)] = operation.start
+
+        # Aktive Operationen: Maschinen blockiert bis zum Ende, Jobs verzögert
+        machine_ready: Dict[str, int] = {}
+        job_delays: Dict[str, int] = {}
+        if self.active_jobs_collection is not None:
+            for job in self.active_jobs_collection.values():
+                for operation in job.operations:
+                    end = int(math.ceil(operation.end))
+                    machine = str(operation.machine_name)
+                    machine_ready[machine] = max(machine_ready.get(machine, end), end)
+                    job_delays[job.id] = max(job_delays.get(job.id, end), end)
+
+        self._job_ids, self._operations = [], []
+        op_offset, op_machine, op_job, op_previous_start = [0], [], [], []
+        job_release, job_due_date = [], []
+        machine_index: Dict[str, int] = {}
         for job in self.jobs_collection.values():
-            earliest_start[job.id] = int(getattr(job, "earliest_start", 0) or 0)
-            due_date[job.id] = int(getattr(job, "due_date", 0) or 0)
-            ops_sorted = sorted(job.operations, key=lambda op: op.position_number)
-            seq = []
-            for op in ops_sorted:
-                m = str(op.machine_name)
-                d = int(op.duration)
-                machines.add(m)
-                seq.append((m, d))
-            jobs_ops[job.id] = seq
-        return jobs_ops, earliest_start, due_date, machines
-
-    def _build_operation_index(self, jobs_ops):
-        op_list = []
-        for j, ops in jobs_ops.items():
-            for k, (m, d) in enumerate(ops):
-                op_list.append((j, k, m, d))
-        return op_list
-
-    def _decode(self, perm, op_list, earliest_start):
-        next_needed = {j: 0 for j, *_ in op_list}
-        machines = {m for (_, _, m, _) in op_list}
-
-        machine_free = {m: 0 for m in machines}
-        job_free = defaultdict(int)
-        for j in next_needed:
-            job_free[j] = earliest_start.get(j, 0)
-
-        schedule = []
-        queue = list(perm)
-        while queue:
-            op_id = queue.pop(0)
-            j, k, m, d = op_list[op_id]
-            if k != next_needed[j]:
-                queue.append(op_id)
-                continue
-            start = max(machine_free[m], job_free[j])
-            end = start + d
-            machine_free[m] = end
-            job_free[j] = end
-            next_needed[j] += 1
-            schedule.append((j, k, m, start, d, end))
-
-        makespan = max(e for *_, e in schedule) if schedule else 0
-        return makespan, schedule
-
-    def _evaluate(self, ind, op_list, earliest_start, due_date, objective="makespan"):
-        mk, sched = self._decode(ind, op_list, earliest_start)
-        if objective == "makespan":
-            return (mk,)
-        job_end = defaultdict(int)
-        for j, k, m, s, d, e in sched:
-            job_end[j] = max(job_end[j], e)
-        tard = sum(max(0, job_end[j] - due_date.get(j, 0)) for j in job_end)
-        return (tard,)
+            operations = sorted(job.operations, key=lambda op: op.position_number)
+            release = max(int(getattr(job, "earliest_start", 0) or 0), int(self.schedule_start))
+            if (objective == "absolute_lateness__start_deviation" and operations
+                    and operations[0].position_number == 0 and job.due_date is not None):
+                # wie CP_Solver.Solver._get_first_operation_min_start(with_transition_times=True)
+                release = max(release, job.due_date - job.sum_duration - job.sum_transition_time(0))
+            job_release.append(max(release, job_delays.get(job.id, release)))
+            job_due_date.append(int(job.due_date) if getattr(job, "due_date", None) is not None else None)
+
+            for operation in operations:
+                op_job.append(len(self._job_ids))
+                self._operations.append(operation)
+                op_machine.append(machine_index.setdefault(str(operation.machine_name), len(machine_index)))
+                op_previous_start.append(previous_starts.get((job.id, operation.position_number)))
+            self._job_ids.append(job.id)
+            op_offset.append(len(self._operations))
+
+        return DecodingProblem(
+            op_offset=op_offset,
+            op_machine=op_machine,
+            op_duration=[int(operation.duration) for operation in self._operations],
+            job_release=job_release,
+            op_job=op_job,
+            job_due_date=job_due_date,
+            op_previous_start=op_previous_start,
+            machine_ready=[machine_ready.get(machine, 0) for machine in machine_index],
+            objective=objective,
+            w_t=w_t, w_e=w_e, w_dev=w_dev if previous_starts else 0,
+            active_decoding=active_decoding,
+        )
+
+    def _get_seed_chromosomes(self, problem: DecodingProblem, priority_rules: Sequence[str]) -> List[List[int]]:
+        """
+        Chromosomes of the previous shift's sequence (operations by previous start, new operations by the latest
+        start for their due date) and of the GT schedules of the priority rules.
+        """
+        chromosomes = []
+        if any(previous_start is not None for previous_start in problem.op_previous_start):
+            remaining_work = [0] * len(problem.op_job)
+            for o in reversed(range(len(problem.op_job))):
+                is_last = o + 1 == problem.op_offset[problem.op_job[o] + 1]
+                remaining_work[o] = problem.op_duration[o] + (0 if is_last else remaining_work[o + 1])
+
+            def target_start(o: int) -> int:
+                j = problem.op_job[o]
+                if problem.op_previous_start[o] is not None:
+                    return problem.op_previous_start[o]
+                if problem.job_due_date[j] is not None:
+                    return max(problem.job_release[j], problem.job_due_date[j] - remaining_work[o])
+                return problem.job_release[j]
+
+            order = sorted(range(len(problem.op_job)), key=lambda o: (target_start(o), o))
+            chromosomes.append([problem.op_job[o] for o in order])
+
+        job_index = {job_id: j for j, job_id in enumerate(self._job_ids)}
+        for rule in priority_rules:
+            schedule = EventScheduler(self.jobs_collection, schedule_start=self.schedule_start).get_schedule(rule)
+            operations = sorted(
+                (operation.start, job_index[operation.job_id], operation.position_number)
+                for job in schedule.values() for operation in job.operations
+            )
+            chromosomes.append([j for _, j, _ in operations])
+        return chromosomes
 
     # -----------------------------------------------------------
     # GA Solver
     # -----------------------------------------------------------
     def solve_model(self,
-                    objective: str = "makespan",
+                    objective: Optional[str] = None,
                     pop_size: int = 80,
-                    ngen: int = 120,
+                    ngen: Optional[int] = 120,
                     cxpb: float = 0.85,
                     mutpb: float = 0.2,
                     seed: int = 0,
-                    tournament: int = 3):
-
+                    tournament: int = 3,
+                    max_workers: int = 1,
+                    previous_schedule_jobs_collection: Optional[LiveJobCollection] = None,
+                    w_t: Optional[int] = None, w_e: Optional[int] = None, w_dev: Optional[int] = None,
+                    memetic: bool = False,
+                    time_limit: Optional[float] = None,
+                    elite_size: int = 4,
+                    local_search_steps: int = 30,
+                    priority_rules: Sequence[str] = ("EDD", "SLACK", "SPT", "FCFS", "MWKR")):
+        """
+        :param objective: "makespan", "tardiness" or "absolute_lateness__start_deviation" (see evaluate_starts()),
+                          default: objective of the built model or "makespan"
+        :param ngen: Number of generations (None: only time_limit, memetic mode)
+        :param max_workers: Processes for the fitness evaluation (default 1 = serial: for the shift instances the
+                            transfer of the chromosomes costs more than the evaluation, see test_scripts/23)
+        :param previous_schedule_jobs_collection: Previous schedule for the start deviation (default: from the model)
+        :param w_t, w_e, w_dev: Weights (default: from the model or 1)
+        :param memetic: If True, active schedule decoding (Giffler-Thompson), population seeded with the previous
+                        shift's sequence and the GT priority rules, elitism and a short local search on the elite
+                        instead of eaSimple with semi-active decoding
+        :param time_limit: Wall-clock time limit in seconds (memetic mode)
+        :param elite_size: Best individuals taken over unchanged into the next generation (memetic mode)
+        :param local_search_steps: Insertion moves tried per elite individual and generation (memetic mode)
+        :param priority_rules: GT priority rules for the seed chromosomes (memetic mode)
+        """
+        if ngen is None and (not memetic or time_limit is None):
+            raise ValueError("ngen=None requires memetic=True and a time_limit")
         random.seed(seed)
-        jobs_ops, earliest_start, due_date, _ = self._extract_problem()
-        op_list = self._build_operation_index(jobs_ops)
-        n_ops = len(op_list)
+        if objective is None:
+            objective = self.objective or "makespan"
+        if previous_schedule_jobs_collection is None:
+            previous_schedule_jobs_collection = self.previous_schedule_jobs_collection
+        problem = self._build_problem(
+            objective, previous_schedule_jobs_collection,
+            w_t=self.w_t if w_t is None else w_t, w_e=self.w_e if w_e is None else w_e,
+            w_dev=self.w_dev if w_dev is None else w_dev, active_decoding=memetic
+        )
+        genes = [j for j in range(len(self._job_ids)) for _ in range(problem.op_offset[j + 1] - problem.op_offset[j])]
+        n_ops = len(genes)
 
         if "FitnessMin" not in creator.__dict__:
             creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
@@ -111,29 +443,124 @@ class Solver:
         toolbox = base.Toolbox()
 
         def _init_individual():
-            perm = list(range(n_ops))
-            random.shuffle(perm)
-            return creator.Individual(perm)
-
-        def _eval(ind):
-            return self._evaluate(ind, op_list, earliest_start, due_date, objective)
+            chromosome = list(genes)
+            random.shuffle(chromosome)
+            return creator.Individual(chromosome)
 
         toolbox.register("individual", _init_individual)
         toolbox.register("population", tools.initRepeat, list, toolbox.individual)
-        toolbox.register("evaluate", _eval)
-        toolbox.register("mate", tools.cxPartialyMatched)
+        toolbox.register("evaluate", evaluate_chromosome, problem=problem)
+        toolbox.register("mate", crossover_job_order)
         toolbox.register("mutate", tools.mutShuffleIndexes, indpb=1.0 / max(1, n_ops))
         toolbox.register("select", tools.selTournament, tournsize=tournament)
-        toolbox.register("map", map)
 
-        pop = toolbox.population(n=pop_size)
-        algorithms.eaSimple(pop, toolbox, cxpb=cxpb, mutpb=mutpb, ngen=ngen, verbose=False)
+        self.workers = max(1, min(max_workers, pop_size))
+
+        pool = None
+        evaluations = 0
+
+        def _map(function, individuals):
+            nonlocal evaluations
+            individuals = list(individuals)
+            evaluations += len(individuals)
+            if pool is None:
+                return list(map(function, individuals))
+            # nur die Chromosomen (Listen) an die Prozesse, Problem einmal je Prozess (initializer)
+            chunksize = max(1, len(individuals) // (self.workers * 4))
+            return list(pool.map(_evaluate_worker_chromosome, [list(ind) for ind in individuals], chunksize=chunksize))
+
+        toolbox.register("map", _map)
+
+        started = time.perf_counter()
+        if self.workers > 1:
+            pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(problem,))
+        try:
+            if memetic:
+                deadline = started + time_limit if time_limit is not None else math.inf
+                seeds = self._get_seed_chromosomes(problem, priority_rules)
+                pop, generations, local_evaluations = self._run_memetic(
+                    toolbox, problem, seeds, pop_size=pop_size, ngen=ngen, cxpb=cxpb, mutpb=mutpb,
+                    elite_size=elite_size, local_search_steps=local_search_steps, deadline=deadline
+                )
+                evaluations += local_evaluations
+            else:
+                pop = toolbox.population(n=pop_size)
+                algorithms.eaSimple(pop, toolbox, cxpb=cxpb, mutpb=mutpb, ngen=ngen, verbose=False)
+                generations = ngen
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        self.wall_time = time.perf_counter() - started
+        self.number_of_generations = generations
+        self.number_of_evaluations = evaluations
 
         best = tools.selBest(pop, k=1)[0]
-        self.best_value, self.best_schedule = self._decode(best, op_list, earliest_start)
+        starts = decode_schedule(best, problem)
+        self.best_value = evaluate_starts(starts, problem)
+        self.best_schedule = [
+            (operation.job_id, operation.position_number, operation.machine_name, start, duration, start + duration)
+            for operation, start, duration in zip(self._operations, starts, problem.op_duration)
+        ]
         self.best_individual = best
         self.model_completed = True
 
+    def _run_memetic(
+            self, toolbox: base.Toolbox, problem: DecodingProblem, seeds: List[List[int]], pop_size: int,
+            ngen: Optional[int], cxpb: float, mutpb: float, elite_size: int, local_search_steps: int,
+            deadline: float) -> Tuple[list, int, int]:
+        """
+        Elitist generational loop: the elite (after local search) survives unchanged, the rest of the population is
+        replaced by offspring of tournament selection, crossover and mutation.
+
+        :return: Population, number of generations and number of local search evaluations
+        """
+        pop = [creator.Individual(chromosome) for chromosome in seeds[:pop_size]]
+        pop += toolbox.population(n=pop_size - len(pop))
+        for individual, fitness in zip(pop, toolbox.map(toolbox.evaluate, pop)):
+            individual.fitness.values = fitness
+
+        elite_size = min(elite_size, pop_size)
+        generation = local_evaluations = 0
+        while (ngen is None or generation < ngen) and time.perf_counter() < deadline:
+            generation += 1
+            elite = [toolbox.clone(individual) for individual in tools.selBest(pop, k=elite_size)]
+            for individual in elite:
+                local_evaluations += self._local_search(individual, problem, local_search_steps, deadline)
+
+            offspring = algorithms.varAnd(toolbox.select(pop, pop_size - elite_size), toolbox, cxpb, mutpb)
+            invalid = [individual for individual in offspring if not individual.fitness.valid]
+            for individual, fitness in zip(invalid, toolbox.map(toolbox.evaluate, invalid)):
+                individual.fitness.values = fitness
+            pop = elite + offspring
+        return pop, generation, local_evaluations
+
+    @staticmethod
+    def _local_search(individual: list, problem: DecodingProblem, steps: int, deadline: float) -> int:
+        """
+        First improvement with insertion moves of single genes (at most number of jobs positions away).
+
+        :return: Number of evaluations
+        """
+        value = individual.fitness.values[0]
+        max_distance = max(2, len(problem.job_release))
+        evaluations = 0
+        for _ in range(steps):
+            if time.perf_counter() >= deadline:
+                break
+            i = random.randrange(len(individual))
+            j = min(max(i + random.randint(-max_distance, max_distance), 0), len(individual) - 1)
+            if individual[i] == individual[j]:
+                continue
+            individual.insert(j, individual.pop(i))
+            candidate = evaluate_chromosome(individual, problem)[0]
+            evaluations += 1
+            if candidate < value:
+                value = candidate
+            else:
+                individual.insert(i, individual.pop(j))
+        individual.fitness.values = (value,)
+        return evaluations
+
     # -----------------------------------------------------------
     # Ergebnisse
     # -----------------------------------------------------------
@@ -143,14 +570,41 @@ class Solver:
             return None
 
         sched_collection = LiveJobCollection()
+        operations = {(operation.job_id, operation.position_number): operation for operation in self._operations}
         for j, k, m, s, d, e in self.best_schedule:
             # Hole originale Operation aus jobs_collection
-            job = self.jobs_collection[j]
-            operation = job.operations[k]
+            operation = operations[(j, k)]
             sched_collection.add_operation_instance(op=operation, new_start=s, new_end=e)
         return sched_collection
 
     def get_solver_info(self) -> dict:
         if not self.model_completed:
             return {"access_fault": "Model is not complete!"}
-        return {"objective_value": self.best_value}
+        return {
+            "objective_value": self.best_value,
+            "number_of_generations": self.number_of_generations,
+            "number_of_evaluations": self.number_of_evaluations,
+            "generations_per_second": round(self.number_of_generations / self.wall_time, 2) if self.wall_time else None,
+            "workers": self.workers,
+            "wall_time": round(self.wall_time, 2),
+        }
+
+    def log_solver_info(self):
+        self.logger.info("Solver info " + "-" * 14)
+        for key, value in self.get_solver_info().items():
+            label = key.replace("_", " ").capitalize()
+            self.logger.info(f"{label:24}: {value}")
+
+
+# Process pool --------------------------------------------------------------------------------------
+_worker_problem: Optional[DecodingProblem] = None
+
+
+def _init_worker(problem: DecodingProblem):
+    # Problem only transferred once per process
+    global _worker_problem
+    _worker_problem = problem
+
+
+def _evaluate_worker_chromosome(chromosome: List[int]) -> Tuple[int]:
+    return evaluate_chromosome(chromosome, _worker_problem)
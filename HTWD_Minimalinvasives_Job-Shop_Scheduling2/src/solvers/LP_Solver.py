@@ -3,90 +3,49 @@ import pulp
 from typing import Literal, Optional
 
 from src.domain.Collection import LiveJobCollection
+from src.solvers.MIP_ModelBuilder import JobShopMIPBuilder, PulpBackend
 
 class Solver:
 
     def __init__(
             self, jobs_collection: LiveJobCollection, problem_name:str  = "jss_makespan_problem",
-            var_cat: Literal["Continuous", "Integer"] = "Continuous", epsilon: float = 0.2):
+            var_cat: Literal["Continuous", "Integer"] = "Continuous", epsilon: float = 0.2,
+            schedule_start: int = 0, big_m: Literal["pair", "machine", "global"] = "pair",
+            formulation: Literal["disjunctive", "time_indexed", "auto"] = "disjunctive"):
+        """
+        :param big_m: Big-M of the disjunctions (JobShopMIPBuilder): "pair" (latest start and release of the pair),
+                      "machine" (maximum per machine) or "global" (latest earliest start + total duration)
+        :param formulation: "disjunctive" (one binary per pair of operations on a machine), "time_indexed"
+                            (requires epsilon = 0) or "auto" (time-indexed for small horizons if epsilon = 0)
+        """
 
         self.jobs_collection = jobs_collection
         self.runtime = None
         self.var_cat = var_cat
         # Model initialization and Helper objects ------------------------------------------------------
         self.problem = pulp.LpProblem(problem_name, pulp.LpMinimize)
-        self.start_times = {}
+        self.backend = PulpBackend(self.problem, var_cat=self.var_cat)
 
         self.machine_names = jobs_collection.get_unique_machine_names()
 
-        # Big-M (Worst-case start difference between operation starts) ---------------------------------
-        total_duration = jobs_collection.get_total_duration()
-        latest_earliest_start = jobs_collection.get_latest_earliest_start()
-        self.big_m = latest_earliest_start + total_duration
-
-        # Create Variables -----------------------------------------------------------------------------
         self.jobs_collection.sort_operations()
         self.jobs_collection.sort_jobs_by_arrival()
 
-        for job in self.jobs_collection.values():
-            for operation in job.operations:
-                op_numb = operation.position_number
-
-                self.start_times[(job.id, op_numb)] = pulp.LpVariable(
-                    name=f"start_{job.id}_{op_numb}",
-                    lowBound=job.earliest_start,
-                    cat=self.var_cat
-                )
-
-        # Operation-level constraints ------------------------------------------------------------------
-        for job in self.jobs_collection.values():
-            for operation in job.operations:
-                op_numb = operation.position_number
-
-                # Technological constraint: operation order within the job
-                prev_op = job.get_previous_operation(op_numb)
-                if prev_op:
-                    prev_op_numb = prev_op.position_number
-                    self.problem += (self.start_times[(job.id, op_numb)]
-                                     >= self.start_times[(job.id, prev_op_numb)] + prev_op.duration)
-
-        # Machine-level constraints (NoOverlap) --------------------------------------------------------
-        for machine_name in self.machine_names:
-            machine_operations = self.jobs_collection.get_all_operations_on_machine(machine_name=machine_name)
-
-            for operation_a in machine_operations:
-                for operation_b in machine_operations:
-                    if operation_a == operation_b:
-                        continue
-
-                    job_a = operation_a.job_id
-                    job_b = operation_b.job_id
-                    op_numb_a = operation_a.position_number
-                    op_numb_b = operation_b.position_number
-                    duration_a = operation_a.duration
-                    duration_b = operation_b.duration
-
-                    y = pulp.LpVariable(
-                        name=f"y_{job_a}_{op_numb_a}_{job_b}_{op_numb_b}",
-                        cat="Binary"
-                    )
-                    self.problem += (self.start_times[(job_a, op_numb_a)] + duration_a + epsilon
-                                     <= self.start_times[(job_b, op_numb_b)] + self.big_m * (1 - y))
-
-                    self.problem += (self.start_times[(job_b, op_numb_b)] + duration_b + epsilon
-                                     <= self.start_times[(job_a, op_numb_a)] + self.big_m * y)
+        # Variables, technological and machine constraints (NoOverlap) ---------------------------------
+        self.model_builder = JobShopMIPBuilder(
+            jobs_collection=self.jobs_collection, schedule_start=schedule_start,
+            big_m=big_m, formulation=formulation, epsilon=epsilon
+        )
+        self.start_times = self.model_builder.build(self.backend)
+        self.big_m = self.model_builder.max_big_m
 
 
     def build_makespan_problem(self):
-        makespan = pulp.LpVariable("makespan", lowBound=0, cat=self.var_cat)
+        makespan = self.model_builder.add_makespan(self.backend, self.start_times)
         self.problem += makespan
 
-        for job in self.jobs_collection.values():
-            last_operation = job.get_last_operation()
-            if last_operation:
-                last_op_number = last_operation.position_number
-                last_op_duration = last_operation.duration
-                self.problem += makespan >= self.start_times[(job.id, last_op_number)] + last_op_duration
+        # Dispatching-Schedule des Builders als Startlösung (warmStart in solve_problem)
+        self.model_builder.set_initial_solution(self.backend, self.start_times, makespan)
 
 
     def solve_problem(
@@ -97,7 +56,8 @@ class Solver:
         start_timer = time.time()
         solver_args = {
             "gapRel": relative_gap_limit,
-            "msg": print_log_search_progress
+            "msg": print_log_search_progress,
+            "warmStart": True
         }
         if time_limit:
             solver_args["timeLimit"] = time_limit
@@ -116,6 +76,8 @@ class Solver:
 
     def get_schedule(self):
         if self.runtime:
+            if self.problem.sol_status not in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible):
+                return "No solution found."
             schedule_job_collection = LiveJobCollection()
 
             for job in self.jobs_collection.values():
@@ -138,6 +100,8 @@ class Solver:
             "objective_value": pulp.value(self.problem.objective),
             "number_of_variables": len(self.problem.variables()),
             "number_of_constraints": len(self.problem.constraints),
+            "number_of_binaries": self.model_builder.number_of_binaries,
+            "formulation": self.model_builder.formulation,
             "runtime": round(self.runtime, 2)
         }
         return solver_info
@@ -0,0 +1,315 @@
+import math
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+
+from src.domain.Collection import LiveJobCollection
+
+OperationKey = Tuple[str, int]  # (job_id, position_number)
+
+
+class PulpBackend:
+    """
+    Adds variables and constraints of JobShopMIPBuilder to a pulp.LpProblem.
+    """
+    def __init__(self, problem, var_cat: Literal["Continuous", "Integer"] = "Continuous"):
+        import pulp
+        self._pulp = pulp
+        self.problem = problem
+        self.var_cat = var_cat
+
+    def add_variable(self, name: str, lb: Optional[float] = None, ub: Optional[float] = None, binary: bool = False):
+        return self._pulp.LpVariable(name=name, lowBound=lb, upBound=ub, cat="Binary" if binary else self.var_cat)
+
+    def add_constraint(self, constraint):
+        self.problem += constraint
+
+    def quicksum(self, terms: Iterable):
+        return self._pulp.lpSum(terms)
+
+    def set_initial_solution(self, values: List[Tuple[Any, float]]):
+        # wird nur mit warmStart=True an den Solver übergeben
+        for variable, value in values:
+            variable.setInitialValue(value)
+
+
+class ScipBackend:
+    """
+    Adds variables and constraints of JobShopMIPBuilder to a pyscipopt.Model.
+    """
+    def __init__(self, model):
+        from pyscipopt import quicksum
+        self._quicksum = quicksum
+        self.model = model
+
+    def add_variable(self, name: str, lb: Optional[float] = None, ub: Optional[float] = None, binary: bool = False):
+        return self.model.addVar(name=name, lb=lb, ub=ub, vtype="B" if binary else "C")
+
+    def add_constraint(self, constraint):
+        self.model.addCons(constraint)
+
+    def quicksum(self, terms: Iterable):
+        return self._quicksum(terms)
+
+    def set_initial_solution(self, values: List[Tuple[Any, float]]):
+        solution = self.model.createSol()
+        for variable, value in values:
+            self.model.setSolVal(solution, variable, value)
+        self.model.addSol(solution)
+
+
+class JobShopMIPBuilder:
+    """
+    Shared MIP model of the job shop (makespan) for LP_Solver and BNB_Scheduler.
+
+    Bounds per operation (valid for all schedules with makespan <= upper_bound):
+        - release: earliest start (job earliest start, schedule start, delays and machine blocks of active operations)
+        - tail:    remaining work of the job after the operation
+        - latest start = upper_bound - tail - duration (upper_bound: makespan of a dispatching schedule)
+
+    Disjunctive formulation: one binary per unordered pair of operations on a machine
+    (y = 1: a before b). Big-M of each direction:
+        - "pair":    latest start + duration of the first minus release of the second operation
+        - "machine": maximum of the pair values on the machine
+        - "global":  latest earliest start + total duration (as before, without latest starts)
+    Pairs whose order follows from the bounds (or from the job) get no binary.
+
+    Time-indexed formulation (small horizons): one binary per operation and possible start time,
+    at most one operation per machine and time. It has no gap between operations, so it requires epsilon = 0.
+    "auto" uses it if epsilon = 0 and the number of start time binaries is at most max_time_indexed_variables.
+
+    The dispatching schedule of upper_bound is a feasible solution of every formulation and is passed to the solver
+    as MIP start (set_initial_solution). Without it, CBC often finds no solution within the time limit for the
+    "pair" and "machine" big-M.
+    """
+
+    def __init__(
+            self, jobs_collection: LiveJobCollection, schedule_start: int = 0,
+            active_jobs_collection: Optional[LiveJobCollection] = None,
+            big_m: Literal["pair", "machine", "global"] = "pair",
+            formulation: Literal["disjunctive", "time_indexed", "auto"] = "disjunctive",
+            max_time_indexed_variables: int = 20_000, epsilon: float = 0.0):
+        """
+        :param epsilon: Minimum gap between two operations on a machine (disjunctive formulation)
+        """
+        self.jobs_collection = jobs_collection
+        self.schedule_start = schedule_start
+        self.big_m = big_m
+        self.epsilon = epsilon
+
+        # Aktive Operationen: Maschinen blockiert bis zum Ende, Jobs verzögert
+        machine_ready: Dict[str, int] = {}
+        job_delays: Dict[str, int] = {}
+        if active_jobs_collection is not None:
+            for job in active_jobs_collection.values():
+                for operation in job.operations:
+                    end = int(math.ceil(operation.end))
+                    machine = str(operation.machine_name)
+                    machine_ready[machine] = max(machine_ready.get(machine, end), end)
+                    job_delays[job.id] = max(job_delays.get(job.id, end), end)
+
+        self.machine: Dict[OperationKey, str] = {}
+        self.duration: Dict[OperationKey, int] = {}
+        self.release: Dict[OperationKey, int] = {}
+        self.tail: Dict[OperationKey, int] = {}
+        self._job_keys: List[List[OperationKey]] = []
+        for job in jobs_collection.values():
+            previous_end = max(int(job.earliest_start or 0), int(schedule_start), job_delays.get(job.id, 0))
+            keys = []
+            for operation in sorted(job.operations, key=lambda op: op.position_number):
+                key = (job.id, operation.position_number)
+                self.machine[key] = str(operation.machine_name)
+                self.duration[key] = int(operation.duration)
+                self.release[key] = max(previous_end, machine_ready.get(self.machine[key], 0))
+                previous_end = self.release[key] + self.duration[key]
+                keys.append(key)
+            work = 0
+            for key in reversed(keys):
+                self.tail[key] = work
+                work += self.duration[key]
+            self._job_keys.append(keys)
+
+        self.upper_bound = self._get_dispatching_makespan(machine_ready)
+        self.latest_start: Dict[OperationKey, int] = {
+            key: self.upper_bound - self.tail[key] - duration for key, duration in self.duration.items()
+        }
+
+        self.formulation = formulation
+        if formulation == "time_indexed" and epsilon > 0:
+            raise ValueError("The time-indexed formulation requires epsilon = 0.")
+        if formulation == "auto":
+            variables = sum(self.latest_start[key] - self.release[key] + 1 for key in self.duration)
+            use_time_indexed = epsilon == 0 and variables <= max_time_indexed_variables
+            self.formulation = "time_indexed" if use_time_indexed else "disjunctive"
+
+        self._pair_variables: Dict[Tuple[OperationKey, OperationKey], Any] = {}
+        self._time_variables: Dict[OperationKey, Dict[int, Any]] = {}
+        self.number_of_binaries = 0
+        self.number_of_fixed_pairs = 0
+        self.max_big_m = 0
+
+    def _get_dispatching_makespan(self, machine_ready: Dict[str, int]) -> int:
+        """
+        Makespan of the better of two dispatching schedules (earliest start, then shortest duration or most work
+        remaining, epsilon between operations on a machine): upper bound of the optimal makespan.
+        The integer start times of this schedule are kept in initial_starts.
+        """
+        schedules = [
+            self._dispatch(machine_ready, priority=lambda key: self.duration[key]),
+            self._dispatch(machine_ready, priority=lambda key: -(self.duration[key] + self.tail[key])),
+        ]
+        makespan, self.initial_starts = min(schedules, key=lambda schedule: schedule[0])
+        return makespan
+
+    def _dispatch(self, machine_ready: Dict[str, int], priority) -> Tuple[int, Dict[OperationKey, int]]:
+        starts: Dict[OperationKey, int] = {}
+        machine_free = dict(machine_ready)
+        next_index = [0] * len(self._job_keys)
+        job_free = [self.release[keys[0]] if keys else 0 for keys in self._job_keys]
+        makespan = int(self.schedule_start)
+        for _ in range(len(self.duration)):
+            best = None
+            for j, keys in enumerate(self._job_keys):
+                if next_index[j] < len(keys):
+                    key = keys[next_index[j]]
+                    candidate = (max(job_free[j], machine_free.get(self.machine[key], 0)), priority(key), j)
+                    if best is None or candidate < best:
+                        best = candidate
+            start, _, j = best
+            key = self._job_keys[j][next_index[j]]
+            end = start + self.duration[key]
+            starts[key] = start
+            job_free[j] = end
+            machine_free[self.machine[key]] = int(math.ceil(end + self.epsilon))
+            next_index[j] += 1
+            makespan = max(makespan, end)
+        return int(math.ceil(makespan)), starts
+
+    def get_big_m(self, first: OperationKey, second: OperationKey, machine_big_m: Optional[int] = None) -> float:
+        """
+        Big-M of 'first before second' (S_first + p_first + epsilon <= S_second + M * (1 - y)).
+        """
+        if self.big_m == "global":
+            return self._global_big_m
+        if self.big_m == "machine" and machine_big_m is not None:
+            return machine_big_m
+        return max(0.0, self.latest_start[first] + self.duration[first] + self.epsilon - self.release[second])
+
+    @property
+    def _global_big_m(self) -> int:
+        latest_earliest_start = self.jobs_collection.get_latest_earliest_start() or 0
+        return latest_earliest_start + self.jobs_collection.get_total_duration()
+
+    # Model --------------------------------------------------------------------------------------------------------
+    def build(self, backend) -> Dict[OperationKey, Any]:
+        """
+        Start variables, job order and machine constraints.
+
+        :return: Start variable per (job_id, position_number)
+        """
+        starts = {}
+        for key in self.duration:
+            upper_bound = None if self.big_m == "global" else self.latest_start[key]
+            starts[key] = backend.add_variable(
+                name=f"start_{key[0]}_{key[1]}", lb=self.release[key], ub=upper_bound
+            )
+
+        # Technologische Reihenfolge im Job
+        for keys in self._job_keys:
+            for previous_key, key in zip(keys, keys[1:]):
+                backend.add_constraint(starts[key] >= starts[previous_key] + self.duration[previous_key])
+
+        if self.formulation == "time_indexed":
+            self._add_time_indexed_machine_constraints(backend, starts)
+        else:
+            self._add_disjunctive_machine_constraints(backend, starts)
+        return starts
+
+    def add_makespan(self, backend, starts: Dict[OperationKey, Any]):
+        makespan = backend.add_variable(name="makespan", lb=0)
+        for keys in self._job_keys:
+            if keys:
+                backend.add_constraint(makespan >= starts[keys[-1]] + self.duration[keys[-1]])
+        return makespan
+
+    def set_initial_solution(self, backend, starts: Dict[OperationKey, Any], makespan: Optional[Any] = None):
+        """
+        Passes the dispatching schedule (initial_starts) as MIP start to the backend.
+        """
+        values = [(starts[key], start) for key, start in self.initial_starts.items()]
+        for (a, b), y in self._pair_variables.items():
+            values.append((y, 1 if self.initial_starts[a] < self.initial_starts[b] else 0))
+        for key, variables in self._time_variables.items():
+            values.extend((x, 1 if t == self.initial_starts[key] else 0) for t, x in variables.items())
+        if makespan is not None:
+            values.append((makespan, self.upper_bound))
+        backend.set_initial_solution(values)
+
+    def _get_operations_by_machine(self) -> Dict[str, List[OperationKey]]:
+        by_machine: Dict[str, List[OperationKey]] = {}
+        for key, machine in self.machine.items():
+            by_machine.setdefault(machine, []).append(key)
+        return by_machine
+
+    def _add_disjunctive_machine_constraints(self, backend, starts: Dict[OperationKey, Any]):
+        for machine, keys in self._get_operations_by_machine().items():
+            pairs = []
+            for i in range(len(keys)):
+                for k in range(i + 1, len(keys)):
+                    a, b = keys[i], keys[k]
+                    if a[0] == b[0]:
+                        continue  # gleicher Job: Reihenfolge durch die Technologie
+                    if self.big_m != "global":
+                        # Reihenfolge folgt aus den Schranken
+                        if self.latest_start[a] + self.duration[a] + self.epsilon <= self.release[b]:
+                            self.number_of_fixed_pairs += 1
+                            continue
+                        if self.latest_start[b] + self.duration[b] + self.epsilon <= self.release[a]:
+                            self.number_of_fixed_pairs += 1
+                            continue
+                    pairs.append((a, b))
+
+            machine_big_m = None
+            if self.big_m == "machine" and pairs:
+                machine_big_m = max(max(self.get_big_m(a, b), self.get_big_m(b, a)) for a, b in pairs)
+
+            for a, b in pairs:
+                big_m_ab = self.get_big_m(a, b, machine_big_m)
+                big_m_ba = self.get_big_m(b, a, machine_big_m)
+                self.max_big_m = max(self.max_big_m, big_m_ab, big_m_ba)
+                y = backend.add_variable(name=f"y_{a[0]}_{a[1]}_{b[0]}_{b[1]}", binary=True)
+                self._pair_variables[(a, b)] = y
+                self.number_of_binaries += 1
+                backend.add_constraint(starts[a] + self.duration[a] + self.epsilon <= starts[b] + big_m_ab * (1 - y))
+                backend.add_constraint(starts[b] + self.duration[b] + self.epsilon <= starts[a] + big_m_ba * y)
+
+    def _add_time_indexed_machine_constraints(self, backend, starts: Dict[OperationKey, Any]):
+        x = self._time_variables
+        for key in self.duration:
+            x[key] = {
+                t: backend.add_variable(name=f"x_{key[0]}_{key[1]}_{t}", binary=True)
+                for t in range(self.release[key], self.latest_start[key] + 1)
+            }
+            self.number_of_binaries += len(x[key])
+            backend.add_constraint(backend.quicksum(x[key].values()) == 1)
+            backend.add_constraint(starts[key] == backend.quicksum(t * var for t, var in x[key].items()))
+
+        # Technologische Reihenfolge auf den Zeitvariablen (stärkere LP-Relaxation als über die Startzeiten):
+        # bis t gestartet -> Vorgänger bis t - p gestartet
+        for keys in self._job_keys:
+            for previous_key, key in zip(keys, keys[1:]):
+                previous_duration = self.duration[previous_key]
+                for t in x[key]:
+                    started = [var for s, var in x[key].items() if s <= t]
+                    previous_started = [var for s, var in x[previous_key].items() if s <= t - previous_duration]
+                    backend.add_constraint(backend.quicksum(started) <= backend.quicksum(previous_started))
+
+        # je Maschine und Zeitpunkt höchstens eine laufende Operation
+        for machine, keys in self._get_operations_by_machine().items():
+            running: Dict[int, List[Any]] = {}
+            for key in keys:
+                duration = self.duration[key]
+                for start, var in x[key].items():
+                    for t in range(start, start + duration):
+                        running.setdefault(t, []).append(var)
+            for t, variables in running.items():
+                if len(variables) > 1:
+                    backend.add_constraint(backend.quicksum(variables) <= 1)
@@ -0,0 +1,594 @@
+import heapq
+import math
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.Logger import Logger
+from src.domain.Collection import LiveJobCollection
+from src.solvers.CP_RollingHorizonSolver import evaluate_lateness_deviation_objective
+
+Move = Tuple[int, int, int]  # (Maschine, von Index, nach Index) in der Maschinenreihenfolge
+
+
+class Solver:
+    """
+    Tabu search over the machine sequences (disjunctive graph) for the shift model of
+    CP_Solver.Solver.build_model__absolute_lateness__start_deviation__minimization()
+    (weighted tardiness + earliness + start deviation, same hard constraints).
+
+    A solution is one operation sequence per machine. Its schedule:
+        - Heads:  earliest starts (job earliest start, schedule start, delays and machine blocks of active operations,
+                  technological order and machine sequence)
+        - Starts: backwards over the graph each operation with a target (previous start, due date of the job) is
+                  shifted from its head towards the cheapest start, as far as its successors allow;
+                  operations without target start at their head
+    Neighborhood: critical blocks (consecutive operations on one machine) on the head-critical paths of the
+    operations that are too late and on the start-critical paths of the blocked early operations - N5 (swap of the
+    first/last two operations of a block) and N7 (move an operation of a block to the start or the end of the block).
+    The moves are ranked by an estimate (changed heads of the machine segment times the delay costs); the best ones
+    are evaluated exactly. A move only changes the heads of the descendants of the moved machine segment and the
+    starts of their ancestors; both are updated incrementally and give the exact objective change of the move.
+    """
+
+    def __init__(self, jobs_collection: LiveJobCollection, logger: Logger, schedule_start: int = 0):
+        self.logger = logger
+        self.jobs_collection = jobs_collection
+        self.schedule_start = schedule_start
+
+        self.previous_schedule_jobs_collection: Optional[LiveJobCollection] = None
+        self.active_jobs_collection: Optional[LiveJobCollection] = None
+        self.w_t, self.w_e, self.w_dev = 1, 1, 1
+        self.model_completed: bool = False
+
+        self.schedule_jobs_collection: Optional[LiveJobCollection] = None
+        self.initial_objective_value: Optional[int] = None
+        self.objective_value: Optional[int] = None
+        self.number_of_iterations: int = 0
+        self.number_of_evaluated_moves: int = 0
+        self.wall_time: float = 0.0
+
+    # Model --------------------------------------------------------------------------------------------------------
+    def build_model__absolute_lateness__start_deviation__minimization(
+            self, previous_schedule_jobs_collection: Optional[LiveJobCollection] = None,
+            active_jobs_collection: Optional[LiveJobCollection] = None,
+            w_t: int = 1, w_e: int = 1, w_dev: int = 1):
+        """
+        Same parameters as CP_Solver.Solver.build_model__absolute_lateness__start_deviation__minimization().
+        """
+        self.previous_schedule_jobs_collection = previous_schedule_jobs_collection
+        self.active_jobs_collection = active_jobs_collection
+        if previous_schedule_jobs_collection is None or previous_schedule_jobs_collection.count_operations() == 0:
+            w_dev = 0
+        self.w_t, self.w_e, self.w_dev = w_t, w_e, w_dev
+
+        # gleiche Reihenfolge wie im CP-Modell
+        self.jobs_collection.sort_operations()
+        self.jobs_collection.sort_jobs_by_arrival()
+
+        # Aktive Operationen: Maschinen blockiert bis zum Ende, Jobs verzögert
+        machine_ready: Dict[str, int] = {}
+        job_delays: Dict[str, int] = {}
+        if active_jobs_collection is not None:
+            for job in active_jobs_collection.values():
+                for operation in job.operations:
+                    end = int(math.ceil(operation.end))
+                    machine_ready[operation.machine_name] = max(machine_ready.get(operation.machine_name, end), end)
+                    job_delays[job.id] = max(job_delays.get(job.id, end), end)
+
+        previous_starts: Dict[Tuple[str, int], int] = {}
+        if previous_schedule_jobs_collection is not None:
+            for job in previous_schedule_jobs_collection.values():
+                for operation in job.operations:
+                    previous_starts[(job.id, operation.position_number)] = operation.start
+
+        self._operations = []
+        self._release, self._job_prev, self._job_next = [], [], []
+        self._previous_start, self._due = [], []
+        machine_index: Dict[str, int] = {}
+        self._machine = []
+        for job in self.jobs_collection.values():
+            for k, operation in enumerate(job.operations):
+                o = len(self._operations)
+                self._operations.append(operation)
+                self._machine.append(machine_index.setdefault(operation.machine_name, len(machine_index)))
+                self._job_prev.append(o - 1 if k > 0 else -1)
+                self._job_next.append(o + 1 if k + 1 < len(job.operations) else -1)
+
+                release = 0
+                if k == 0:
+                    release = self._get_first_operation_min_start(operation, job_delays)
+                if operation.duration > 0:
+                    release = max(release, machine_ready.get(operation.machine_name, release))
+                self._release.append(release)
+
+                self._previous_start.append(previous_starts.get((job.id, operation.position_number)))
+                is_last = operation.position_number == job.last_operation_position_number
+                self._due.append(operation.job_due_date if is_last else None)
+
+        self._machine_names = list(machine_index)
+        self._duration = [int(operation.duration) for operation in self._operations]
+        # Köpfe ohne Zyklus bleiben unter dem Horizont (Abbruch der inkrementellen Propagation bei Zyklen)
+        self._horizon = max(self._release, default=0) + sum(self._duration)
+        self._max_pops = 50 * max(len(self._operations), 1)
+        self._has_target = [
+            (self.w_dev > 0 and previous_start is not None) or (self.w_e > 0 and due is not None)
+            for previous_start, due in zip(self._previous_start, self._due)
+        ]
+        self.model_completed = True
+
+    def _get_first_operation_min_start(self, operation, job_delays: Dict[str, int]) -> int:
+        # wie CP_Solver.Solver._get_first_operation_min_start(with_transition_times=True)
+        min_start = max(operation.job_earliest_start, int(self.schedule_start))
+        if operation.position_number == 0 and operation.job_due_date is not None:
+            reasonable_min_start = (operation.job_due_date - operation.job.sum_duration
+                                    - operation.job.sum_transition_time(operation.position_number))
+            min_start = max(min_start, reasonable_min_start)
+        return max(min_start, job_delays.get(operation.job_id, min_start))
+
+    # Objective ----------------------------------------------------------------------------------------------------
+    def _operation_cost(self, o: int, start: int) -> int:
+        cost = 0
+        previous_start = self._previous_start[o]
+        if previous_start is not None:
+            cost += self.w_dev * abs(start - previous_start)
+        due = self._due[o]
+        if due is not None:
+            end = start + self._duration[o]
+            cost += self.w_t * (end - due) if end > due else self.w_e * (due - end)
+        return cost
+
+    def _best_start(self, o: int, head: int, latest: float) -> int:
+        # günstigster Start in [head, latest] (stückweise lineare, konvexe Kosten -> Knickstellen prüfen)
+        if not self._has_target[o] or latest <= head:
+            return head
+        best, best_cost = head, self._operation_cost(o, head)
+        candidates = []
+        if self._previous_start[o] is not None:
+            candidates.append(self._previous_start[o])
+        if self._due[o] is not None:
+            candidates.append(self._due[o] - self._duration[o])
+        if latest != math.inf:
+            candidates.append(int(latest))
+        for candidate in candidates:
+            candidate = min(max(candidate, head), latest)
+            cost = self._operation_cost(o, candidate)
+            if cost < best_cost or (cost == best_cost and candidate < best):
+                best, best_cost = candidate, cost
+        return best
+
+    # Graph --------------------------------------------------------------------------------------------------------
+    def _machine_prev(self, o: int) -> int:
+        k = self._position[o]
+        return self._sequences[self._machine[o]][k - 1] if k > 0 else -1
+
+    def _machine_next(self, o: int) -> int:
+        sequence = self._sequences[self._machine[o]]
+        k = self._position[o] + 1
+        return sequence[k] if k < len(sequence) else -1
+
+    def _set_sequences(self, sequences: List[List[int]]):
+        self._sequences = [list(sequence) for sequence in sequences]
+        self._position = [0] * len(self._operations)
+        for sequence in self._sequences:
+            for k, o in enumerate(sequence):
+                self._position[o] = k
+
+    def _compute_times(self) -> Optional[Tuple[List[int], List[int]]]:
+        """
+        Heads and starts of the current sequences from scratch (None if the sequences contain a cycle).
+        """
+        n = len(self._operations)
+        in_degree = [0] * n
+        for o in range(n):
+            in_degree[o] = (self._job_prev[o] >= 0) + (self._position[o] > 0)
+        order = [o for o in range(n) if in_degree[o] == 0]
+        for o in order:
+            for successor in (self._job_next[o], self._machine_next(o)):
+                if successor >= 0:
+                    in_degree[successor] -= 1
+                    if in_degree[successor] == 0:
+                        order.append(successor)
+        if len(order) < n:
+            return None
+
+        heads = [0] * n
+        for o in order:
+            heads[o] = self._get_head(o, heads)
+        starts = [0] * n
+        for o in reversed(order):
+            starts[o] = self._best_start(o, heads[o], self._get_latest_start(o, starts))
+        return heads, starts
+
+    def _get_head(self, o: int, heads, changed: Optional[Dict[int, int]] = None) -> int:
+        head = self._release[o]
+        for predecessor in (self._job_prev[o], self._machine_prev(o)):
+            if predecessor >= 0:
+                value = changed.get(predecessor, heads[predecessor]) if changed else heads[predecessor]
+                head = max(head, value + self._duration[predecessor])
+        return head
+
+    def _get_latest_start(self, o: int, starts, changed: Optional[Dict[int, int]] = None) -> float:
+        latest = math.inf
+        for successor in (self._job_next[o], self._machine_next(o)):
+            if successor >= 0:
+                value = changed.get(successor, starts[successor]) if changed else starts[successor]
+                latest = min(latest, value - self._duration[o])
+        return latest
+
+    # Moves --------------------------------------------------------------------------------------------------------
+    def _apply_sequence_change(self, move: Move):
+        m, i, j = move
+        sequence = self._sequences[m]
+        sequence.insert(j, sequence.pop(i))
+        for k in range(min(i, j), max(i, j) + 1):
+            self._position[sequence[k]] = k
+
+    def _may_create_cycle(self, move: Move) -> bool:
+        """
+        Necessary condition for a cycle (a path between the moved operation and an operation it passes that does not
+        use the machine): a path a -> b in the current graph implies head[a] <= head[b].
+        """
+        m, i, j = move
+        sequence, heads = self._sequences[m], self._heads
+        u = sequence[i]
+        if j < i:
+            job_prev = self._job_prev[u]
+            if job_prev < 0:
+                return False
+            return any(
+                self._job_next[w] >= 0 and heads[self._job_next[w]] <= heads[job_prev] for w in sequence[j:i]
+            )
+        job_next = self._job_next[u]
+        if job_next < 0:
+            return False
+        return any(
+            self._job_prev[w] >= 0 and heads[job_next] <= heads[self._job_prev[w]] for w in sequence[i + 1:j + 1]
+        )
+
+    def _evaluate_move(self, move: Move) -> Optional[Tuple[int, Dict[int, int], Dict[int, int]]]:
+        """
+        Objective change of the move with the changed heads and starts (None if the move may create a cycle).
+        """
+        if self._may_create_cycle(move):
+            return None
+        m, i, j = move
+        self._apply_sequence_change(move)
+        try:
+            return self._evaluate_changed_segment(m, min(i, j), max(i, j))
+        finally:
+            self._apply_sequence_change((m, j, i))
+
+    def _evaluate_changed_segment(self, m: int, low: int, high: int):
+        sequence = self._sequences[m]
+        heads, starts = self._heads, self._starts
+
+        # Köpfe vorwärts: erst das Segment in neuer Reihenfolge, dann nur über geänderte Köpfe weiter in der
+        # Reihenfolge der alten Köpfe (außerhalb des Segments eine topologische Sortierung)
+        new_heads: Dict[int, int] = {}
+        heap = []
+        for o in sequence[low:high + 1]:
+            head = self._get_head(o, heads, new_heads)
+            if head != heads[o]:
+                new_heads[o] = head
+                if self._job_next[o] >= 0:
+                    heap.append((heads[self._job_next[o]], self._job_next[o]))
+        if high + 1 < len(sequence):
+            heap.append((heads[sequence[high + 1]], sequence[high + 1]))
+        heapq.heapify(heap)
+        pops = 0
+        while heap:
+            _, o = heapq.heappop(heap)
+            pops += 1
+            if pops > self._max_pops:
+                return None
+            head = self._get_head(o, heads, new_heads)
+            if head != new_heads.get(o, heads[o]):
+                if head > self._horizon:
+                    return None  # Zyklus: Köpfe wachsen unbeschränkt
+                new_heads[o] = head
+                for successor in (self._job_next[o], self._machine_next(o)):
+                    if successor >= 0:
+                        heapq.heappush(heap, (heads[successor], successor))
+
+        # Starts rückwärts: geänderte Köpfe, Segment mit Maschinenvorgänger und deren Vorgänger mit Ziel
+        heap = [(-new_heads.get(o, heads[o]), o) for o in new_heads]
+        heap.extend((-new_heads.get(o, heads[o]), o) for o in sequence[max(low - 1, 0):high + 1])
+        heapq.heapify(heap)
+        new_starts: Dict[int, int] = {}
+        while heap:
+            _, o = heapq.heappop(heap)
+            head = new_heads.get(o, heads[o])
+            if self._has_target[o]:
+                start = self._best_start(o, head, self._get_latest_start(o, starts, new_starts))
+            else:
+                start = head
+            if start != new_starts.get(o, starts[o]):
+                new_starts[o] = start
+                for predecessor in (self._job_prev[o], self._machine_prev(o)):
+                    if predecessor >= 0 and self._has_target[predecessor]:
+                        heapq.heappush(heap, (-new_heads.get(predecessor, heads[predecessor]), predecessor))
+
+        delta = sum(
+            self._operation_cost(o, start) - self._operation_cost(o, starts[o]) for o, start in new_starts.items()
+        )
+        return delta, new_heads, new_starts
+
+    def _get_critical_blocks(self, late_sources: List[int], early_sources: List[int]) -> List[Tuple[int, int, int]]:
+        """
+        Blocks (machine, first index, last index) with at least two operations on the head-critical paths
+        of the late source operations (backwards) and on the start-critical paths of the early source operations
+        (forwards). Machine arcs are preferred if job and machine arc are both critical.
+        """
+        blocks = set()
+        heads, starts, duration = self._heads, self._starts, self._duration
+        for o in late_sources:
+            block_end = o
+            while True:
+                head = heads[o]
+                machine_prev = self._machine_prev(o)
+                if machine_prev >= 0 and heads[machine_prev] + duration[machine_prev] == head:
+                    o = machine_prev
+                    continue
+                if block_end != o:
+                    blocks.add((self._machine[o], self._position[o], self._position[block_end]))
+                job_prev = self._job_prev[o]
+                if job_prev >= 0 and heads[job_prev] + duration[job_prev] == head:
+                    o = block_end = job_prev
+                    continue
+                break
+        for o in early_sources:
+            block_start = o
+            while True:
+                end = starts[o] + duration[o]
+                machine_next = self._machine_next(o)
+                if machine_next >= 0 and starts[machine_next] == end:
+                    o = machine_next
+                    continue
+                if block_start != o:
+                    blocks.add((self._machine[o], self._position[block_start], self._position[o]))
+                job_next = self._job_next[o]
+                if job_next >= 0 and starts[job_next] == end:
+                    o = block_start = job_next
+                    continue
+                break
+        return sorted(blocks)
+
+    def _get_moves(self, max_sources: int) -> List[Move]:
+        # Quellen (teuerste zuerst): Operationen am Kopf, die durch einen früheren Start günstiger würden (zu spät),
+        # und Operationen, die durch einen späteren Start günstiger würden, aber von Nachfolgern blockiert sind
+        sources = []
+        for o, (head, start) in enumerate(zip(self._heads, self._starts)):
+            if not self._has_target[o] and start == head:
+                continue
+            cost = self._operation_cost(o, start)
+            if start == head and head > self._release[o] and cost > self._operation_cost(o, start - 1):
+                sources.append((-cost, o, True))
+            elif self._has_target[o] and cost > self._operation_cost(o, start + 1):
+                sources.append((-cost, o, False))
+        sources = heapq.nsmallest(max_sources, sources)
+        late_sources = [o for _, o, is_late in sources if is_late]
+        early_sources = [o for _, o, is_late in sources if not is_late]
+
+        moves = set()
+        for m, first, last in self._get_critical_blocks(late_sources, early_sources):
+            # N5: erste und letzte zwei Operationen tauschen
+            moves.add((m, first, first + 1))
+            moves.add((m, last - 1, last))
+            # N7: Operation an den Anfang bzw. an das Ende des Blocks
+            for k in range(first + 1, last + 1):
+                moves.add((m, k, first))
+            for k in range(first, last):
+                moves.add((m, k, last))
+        return sorted(moves)
+
+    def _get_delay_costs(self) -> List[int]:
+        """
+        Estimated cost change per minute delay of the head of each operation: own marginal cost (if it starts at
+        its head) plus the delay costs of the operations whose head it determines (critical tree, machine arc
+        preferred). Operations starting after their head absorb the delay.
+        """
+        heads, starts, duration = self._heads, self._starts, self._duration
+        delay_costs = [0] * len(self._operations)
+        for o in sorted(range(len(self._operations)), key=lambda o: (-heads[o], -self._position[o])):
+            if starts[o] != heads[o]:
+                continue
+            delay_costs[o] += self._operation_cost(o, starts[o] + 1) - self._operation_cost(o, starts[o])
+            parent = self._machine_prev(o)
+            if parent < 0 or heads[parent] + duration[parent] != heads[o]:
+                parent = self._job_prev[o]
+                if parent < 0 or heads[parent] + duration[parent] != heads[o]:
+                    continue
+            delay_costs[parent] += delay_costs[o]
+        return delay_costs
+
+    def _estimate_move(self, move: Move, delay_costs: List[int]) -> int:
+        # neue Köpfe nur im geänderten Segment, gewichtet mit den Verzögerungskosten
+        m, i, j = move
+        sequence = self._sequences[m]
+        low, high = min(i, j), max(i, j)
+        segment = sequence[low:high + 1]
+        segment.insert(j - low, segment.pop(i - low))
+        heads, duration = self._heads, self._duration
+        machine_end = heads[sequence[low - 1]] + duration[sequence[low - 1]] if low > 0 else 0
+        estimate = 0
+        for o in segment:
+            head = max(self._release[o], machine_end)
+            job_prev = self._job_prev[o]
+            if job_prev >= 0:
+                head = max(head, heads[job_prev] + duration[job_prev])
+            estimate += (head - heads[o]) * delay_costs[o]
+            machine_end = head + duration[o]
+        return estimate
+
+    # Initial sequences --------------------------------------------------------------------------------------------
+    def _get_initial_sequences(self, initial_schedule_jobs_collection: Optional[LiveJobCollection]) -> List[List[int]]:
+        """
+        Serial schedule by target start: start in the initial schedule if given, otherwise the previous start or
+        (new operations) the latest start for the due date (due date minus remaining work).
+        """
+        n = len(self._operations)
+        initial_starts: Dict[Tuple[str, int], int] = {}
+        if initial_schedule_jobs_collection is not None:
+            for job in initial_schedule_jobs_collection.values():
+                for operation in job.operations:
+                    initial_starts[(job.id, operation.position_number)] = operation.start
+
+        remaining_work = [0] * n
+        for o in reversed(range(n)):
+            job_next = self._job_next[o]
+            remaining_work[o] = self._duration[o] + (remaining_work[job_next] if job_next >= 0 else 0)
+
+        target_starts = [0] * n
+        for o in range(n):
+            operation = self._operations[o]
+            initial_start = initial_starts.get((operation.job_id, operation.position_number))
+            if initial_start is not None:
+                target_starts[o] = initial_start
+            elif self._previous_start[o] is not None:
+                target_starts[o] = self._previous_start[o]
+            elif operation.job_due_date is not None:
+                target_starts[o] = max(self._release[o], operation.job_due_date - remaining_work[o])
+            else:
+                target_starts[o] = self._release[o]
+
+        heap = [(target_starts[o], o) for o in range(n) if self._job_prev[o] < 0]
+        heapq.heapify(heap)
+        sequences: List[List[int]] = [[] for _ in self._machine_names]
+        while heap:
+            _, o = heapq.heappop(heap)
+            sequences[self._machine[o]].append(o)
+            if self._job_next[o] >= 0:
+                heapq.heappush(heap, (target_starts[self._job_next[o]], self._job_next[o]))
+        return sequences
+
+    # Search -------------------------------------------------------------------------------------------------------
+    def solve_model(
+            self, time_limit: Optional[float] = 10.0, initial_schedule_jobs_collection: Optional[LiveJobCollection] = None,
+            max_iterations: Optional[int] = None, max_no_improvement: Optional[int] = 1000,
+            tenure: Tuple[int, int] = (5, 15), max_sources: int = 20, candidate_moves: int = 10, seed: int = 0):
+        """
+        :param time_limit: Time limit in seconds (None: only the iteration limits)
+        :param initial_schedule_jobs_collection: Start solution, e.g. a GT schedule (default: previous schedule
+                                                 order, new operations by earliest start and due date)
+        :param max_no_improvement: Stop after this many iterations without a new best solution (None: only the time
+                                   and iteration limits)
+        :param tenure: Range of the random tabu tenure (iterations)
+        :param max_sources: Number of most expensive late operations whose critical paths give the neighborhood
+        :param candidate_moves: Number of feasible moves with the best estimate (changed heads of the machine segment
+                                times the delay costs) that are evaluated exactly per iteration
+        """
+        if not self.model_completed:
+            self.logger.warning("Model was not completed yet.")
+            return
+
+        started = time.perf_counter()
+        rng = random.Random(seed)
+        self._set_sequences(self._get_initial_sequences(initial_schedule_jobs_collection))
+        self._heads, self._starts = self._compute_times()
+        cost = sum(self._operation_cost(o, start) for o, start in enumerate(self._starts))
+
+        self.initial_objective_value = cost
+        best_cost, best_sequences, best_starts = cost, [list(s) for s in self._sequences], list(self._starts)
+        tabu: Dict[Tuple[int, int], int] = {}  # (Operation, Index) -> gesperrt bis Iteration
+        iteration = since_improvement = evaluated = 0
+
+        while True:
+            if time_limit is not None and time.perf_counter() - started >= time_limit:
+                break
+            if max_iterations is not None and iteration >= max_iterations:
+                break
+            if max_no_improvement is not None and since_improvement >= max_no_improvement:
+                break
+            iteration += 1
+
+            # Moves nach Schätzung sortiert, nur die besten zulässigen (ohne Zyklus) exakt bewerten
+            moves = self._get_moves(max_sources)
+            delay_costs = self._get_delay_costs()
+            moves.sort(key=lambda move: self._estimate_move(move, delay_costs))
+
+            best_move, best_result, best_tabu_move, best_tabu_result = None, None, None, None
+            feasible = 0
+            for move in moves:
+                if feasible >= candidate_moves:
+                    break
+                result = self._evaluate_move(move)
+                evaluated += 1
+                if result is None:
+                    continue
+                feasible += 1
+                m, i, j = move
+                is_tabu = tabu.get((self._sequences[m][i], j), 0) > iteration
+                if is_tabu and cost + result[0] >= best_cost:
+                    if best_tabu_result is None or result[0] < best_tabu_result[0]:
+                        best_tabu_move, best_tabu_result = move, result
+                    continue
+                if best_result is None or result[0] < best_result[0] or (
+                        result[0] == best_result[0] and rng.random() < 0.5):
+                    best_move, best_result = move, result
+            if best_move is None:
+                # alle Moves tabu -> am wenigsten schlechten nehmen, keine Moves -> keine späte Operation mehr
+                best_move, best_result = best_tabu_move, best_tabu_result
+                if best_move is None:
+                    break
+
+            m, i, j = best_move
+            moved = self._sequences[m][i]
+            tabu[(moved, i)] = iteration + rng.randint(*tenure)
+            if abs(i - j) == 1:
+                tabu[(self._sequences[m][j], j)] = iteration + rng.randint(*tenure)
+            self._apply_sequence_change(best_move)
+            delta, new_heads, new_starts = best_result
+            for o, head in new_heads.items():
+                self._heads[o] = head
+            for o, start in new_starts.items():
+                self._starts[o] = start
+            cost += delta
+
+            if cost < best_cost:
+                best_cost, best_sequences, best_starts = cost, [list(s) for s in self._sequences], list(self._starts)
+                since_improvement = 0
+            else:
+                since_improvement += 1
+
+        self._set_sequences(best_sequences)
+        self._starts = best_starts
+        self.objective_value = best_cost
+        self.number_of_iterations = iteration
+        self.number_of_evaluated_moves = evaluated
+        self.wall_time = time.perf_counter() - started
+
+        schedule_jobs_collection = LiveJobCollection()
+        for o, operation in enumerate(self._operations):
+            start = best_starts[o]
+            schedule_jobs_collection.add_operation_instance(
+                op=operation, new_start=start, new_end=start + self._duration[o]
+            )
+        self.schedule_jobs_collection = schedule_jobs_collection
+
+    def get_schedule(self) -> Optional[LiveJobCollection]:
+        return self.schedule_jobs_collection
+
+    def get_solver_info(self) -> dict:
+        if self.schedule_jobs_collection is None:
+            return {"access_fault": "Solver status is not available!"}
+
+        solver_info = {
+            "status": "FEASIBLE",
+            "objective_value": self.objective_value,
+            "initial_objective_value": self.initial_objective_value,
+            "number_of_iterations": self.number_of_iterations,
+            "number_of_evaluated_moves": self.number_of_evaluated_moves,
+            "wall_time": round(self.wall_time, 2),
+        }
+        solver_info.update(evaluate_lateness_deviation_objective(
+            self.schedule_jobs_collection, self.previous_schedule_jobs_collection,
+            w_t=self.w_t, w_e=self.w_e, w_dev=self.w_dev
+        ))
+        return solver_info
+
+    def log_solver_info(self):
+        self.logger.info("Solver info " + "-" * 14)
+        for key, value in self.get_solver_info().items():
+            label = key.replace("_", " ").capitalize()
+            self.logger.info(f"{label:20}: {value}")
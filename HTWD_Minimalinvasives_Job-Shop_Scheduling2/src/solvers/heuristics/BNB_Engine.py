@@ -0,0 +1,482 @@
+"""
+Native Branch-and-Bound for the job shop problem (makespan) on a LiveJobCollection.
+
+Successor of the B&B scripts (Eigenversuche/BnB_copy_3.py, BnB4.py, BnB2.py) as a library module:
+    - Node state:  heads r and tails q per operation and the machine precedences as bit masks
+                   (bef/aft per operation over the operations of its machine) - flat int lists, copied per child
+    - Branching:   rank-first on the machine with the smallest slack, the unranked operations of this machine
+                   without unranked predecessor are the children
+    - Bounds:      incremental heads/tails (propagation only from the machines that changed), edge finding and
+                   pairwise immediate selection per machine (Carlier & Pinson) against the target makespan T;
+                   carlier_pinson_bound() (preemptive one-machine relaxation) is kept per machine and
+                   recomputed only for machines touched by the propagation
+    - Search:      dichotomic over T between the root bound and the best schedule; every node runs a GT dispatch
+                   over its precedences, so good schedules are found early. Subtrees that failed for T are kept in
+                   an LRU cache (key = rank sequences per machine) and are skipped for all T' <= T.
+"""
+
+from __future__ import annotations
+
+import heapq
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.orm_models import JobOperation
+
+INF = 10 ** 12
+
+
+def carlier_pinson_bound(heads: Sequence[int], durations: Sequence[int], tails: Sequence[int]) -> int:
+    """
+    Lower bound max(C_i + q_i) of the one-machine problem with heads and tails, with preemption allowed
+    (Jackson's preemptive schedule: always the available operation with the largest tail).
+    """
+    n = len(durations)
+    order = sorted(range(n), key=heads.__getitem__)
+    remaining = list(durations)
+    heap: List[Tuple[int, int]] = []
+    t, k, bound = 0, 0, 0
+    while k < n or heap:
+        if not heap and t < heads[order[k]]:
+            t = heads[order[k]]
+        while k < n and heads[order[k]] <= t:
+            i = order[k]
+            heapq.heappush(heap, (-tails[i], i))
+            k += 1
+        neg_tail, i = heap[0]
+        if k < n and t + remaining[i] > heads[order[k]]:
+            # Unterbrechung bei der nächsten Freigabe
+            remaining[i] -= heads[order[k]] - t
+            t = heads[order[k]]
+        else:
+            heapq.heappop(heap)
+            t += remaining[i]
+            if t - neg_tail > bound:
+                bound = t - neg_tail
+    return bound
+
+
+def edge_finding(heads: Sequence[int], durations: Sequence[int], deadlines: Sequence[int],
+                 order: Optional[Sequence[int]] = None) -> Optional[List[int]]:
+    """
+    Edge finding on one machine in O(n^2) (Baptiste, Le Pape & Nuijten): new heads of the operations that
+    must be processed after a set of other operations, or None if the deadlines cannot be met.
+
+    :param order: Operation indices sorted by head (computed if None)
+    """
+    n = len(durations)
+    if order is None:
+        order = sorted(range(n), key=heads.__getitem__)
+    reverse = order[::-1]
+    new_heads = list(heads)
+    completion = [0] * n
+    for k in range(n):
+        deadline = deadlines[k]
+        work, c = 0, -INF
+        for i in reverse:
+            if deadlines[i] <= deadline:
+                work += durations[i]
+                value = heads[i] + work
+                if value > c:
+                    c = value
+                    if c > deadline:
+                        return None
+            completion[i] = c
+        h = -INF
+        for i in order:
+            if deadlines[i] <= deadline:
+                value = heads[i] + work
+                if value > h:
+                    h = value
+                work -= durations[i]
+            else:
+                p = durations[i]
+                if heads[i] + work + p > deadline and completion[i] > new_heads[i]:
+                    new_heads[i] = completion[i]
+                if h + p > deadline and c > new_heads[i]:
+                    new_heads[i] = c
+    return new_heads
+
+
+class _Found(Exception):
+    pass
+
+
+class _TimeLimitReached(Exception):
+    pass
+
+
+class BranchAndBoundEngine:
+    """
+    Makespan-optimal schedule of all operations of the jobs_collection from schedule_start on.
+    Jobs start at the earliest at max(job.earliest_start, schedule_start), machines and jobs with active
+    operations (set_active_jobs_collection) at the end of these operations - as in GT_Scheduler.
+
+    After get_schedule(): makespan, lower_bound, is_optimal and stats (nodes, fails, cache_hits, probes).
+    """
+
+    def __init__(self, jobs_collection: LiveJobCollection, schedule_start: int = 0,
+                 active_jobs_collection: Optional[LiveJobCollection] = None, cache_size: int = 200_000):
+        self.jobs_collection = jobs_collection
+        self.schedule_start = schedule_start
+        self.cache_size = cache_size
+
+        self.machines = sorted(jobs_collection.get_unique_machine_names())
+        self.machine_ready_time: Dict[str, int] = {m: schedule_start for m in self.machines}
+        self.job_ready_time: Dict[str, int] = {
+            job.id: max(job.earliest_start, schedule_start) for job in jobs_collection.values()
+        }
+        if active_jobs_collection is not None:
+            self.set_active_jobs_collection(active_jobs_collection)
+
+        self.makespan: Optional[int] = None
+        self.lower_bound: Optional[int] = None
+        self.is_optimal = False
+        self.stats: Dict[str, int] = {}
+
+    def set_active_jobs_collection(self, active_jobs_collection: LiveJobCollection):
+        for active_job in active_jobs_collection.values():
+            last_end = None
+            for op in active_job.operations:
+                if op.end is None:
+                    continue
+                if op.machine_name in self.machine_ready_time:
+                    self.machine_ready_time[op.machine_name] = max(self.machine_ready_time[op.machine_name], int(op.end))
+                last_end = int(op.end) if last_end is None else max(last_end, int(op.end))
+            if last_end is not None and active_job.id in self.job_ready_time:
+                self.job_ready_time[active_job.id] = max(self.schedule_start, last_end)
+
+    # Schedule -----------------------------------------------------------------------------------
+    def get_schedule(self, time_limit: Optional[float] = None) -> LiveJobCollection:
+        """
+        Optimal schedule (is_optimal = True) or the best schedule found within time_limit seconds.
+        """
+        self._build()
+        self._deadline = None if time_limit is None else time.time() + time_limit
+        self._cache: OrderedDict = OrderedDict()
+        self.stats = dict(nodes=0, fails=0, cache_hits=0, probes=0)
+
+        best, starts = self._dispatch(self._r0, self._q0, [0] * self._n)
+        self._best_starts = starts
+        lower = max(r + p + q for r, p, q in zip(self._r0, self._p, self._q0))
+        for m in range(len(self.machines)):
+            lower = max(lower, self._machine_bound(self._r0, self._q0, m))
+
+        # kleinstes T, für das die Propagation im Wurzelknoten nicht scheitert
+        high = best - 1
+        if lower > high or self._root(high) is None:
+            lower = best
+        while lower < high:
+            mid = (lower + high) // 2
+            if self._root(mid) is None:
+                lower = mid + 1
+            else:
+                high = mid
+
+        recursion_limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(recursion_limit, 2 * self._n + 1000))
+        try:
+            while lower < best:
+                target = (lower + best - 1) // 2
+                self.stats["probes"] += 1
+                found = self._probe(target)
+                if found is None:
+                    lower = target + 1
+                else:
+                    best, self._best_starts = found
+        except _TimeLimitReached:
+            pass
+        finally:
+            sys.setrecursionlimit(recursion_limit)
+
+        self.makespan = best
+        self.lower_bound = lower
+        self.is_optimal = lower >= best
+
+        schedule_job_collection = LiveJobCollection()
+        for o in sorted(range(self._n), key=lambda o: (self._best_starts[o], o)):
+            start = self._best_starts[o]
+            schedule_job_collection.add_operation_instance(
+                op=self._operations[o], new_start=start, new_end=start + self._p[o]
+            )
+        return schedule_job_collection
+
+    def _build(self):
+        # Operationen als Indizes 0..n-1, Maschinen als Indizes in self.machines
+        machine_index = {m: i for i, m in enumerate(self.machines)}
+        self._operations: List[JobOperation] = []
+        first_operations = []
+        nxt, prv, r0 = [], [], []
+        for job in self.jobs_collection.values():
+            operations = sorted(job.operations, key=lambda op: op.position_number)
+            if not operations:
+                continue
+            first_operations.append(len(self._operations))
+            for k, op in enumerate(operations):
+                o = len(self._operations)
+                self._operations.append(op)
+                prv.append(o - 1 if k > 0 else -1)
+                nxt.append(o + 1 if k + 1 < len(operations) else -1)
+                r0.append(self.job_ready_time[job.id] if k == 0 else 0)
+
+        self._n = n = len(self._operations)
+        self._mach = [machine_index[op.machine_name] for op in self._operations]
+        self._p = p = [int(op.duration) for op in self._operations]
+        self._nxt, self._prv = nxt, prv
+        self._first_operations = first_operations
+        self._mops = [[o for o in range(n) if self._mach[o] == m] for m in range(len(self.machines))]
+        self._mp = [[p[o] for o in mo] for mo in self._mops]
+        self._loc = [0] * n
+        for mo in self._mops:
+            for i, o in enumerate(mo):
+                self._loc[o] = i
+        self._full = [(1 << len(mo)) - 1 for mo in self._mops]
+
+        # Köpfe: Freigabe des Jobs, Bereitschaft der Maschine, Vorgänger im Job; Schwänze: Restarbeit im Job
+        ready = [self.machine_ready_time[m] for m in self.machines]
+        for o in range(n):
+            r0[o] = max(r0[o], ready[self._mach[o]])
+            if prv[o] != -1:
+                r0[o] = max(r0[o], r0[prv[o]] + p[prv[o]])
+        q0 = [0] * n
+        for o in range(n - 1, -1, -1):
+            if nxt[o] != -1:
+                q0[o] = q0[nxt[o]] + p[nxt[o]]
+        self._r0, self._q0 = r0, q0
+
+    def _root(self, target: int):
+        r, q = self._r0[:], self._q0[:]
+        bef, aft = [0] * self._n, [0] * self._n
+        touched = set()
+        if not self._propagate(r, q, bef, aft, target, set(range(len(self.machines))), touched):
+            return None
+        bounds = [self._machine_bound(r, q, m) for m in range(len(self.machines))]
+        return r, q, bef, aft, bounds
+
+    def _probe(self, target: int) -> Optional[Tuple[int, List[int]]]:
+        # Schedule mit Makespan <= target oder None (bewiesen unzulässig)
+        root = self._root(target)
+        if root is None:
+            return None
+        self._target = target
+        empty = tuple(() for _ in self.machines)
+        try:
+            self._recurse(*root, empty)
+        except _Found as found:
+            return found.args[0]
+        return None
+
+    def _machine_bound(self, r: List[int], q: List[int], m: int) -> int:
+        mo = self._mops[m]
+        return carlier_pinson_bound([r[o] for o in mo], self._mp[m], [q[o] for o in mo])
+
+    # Suche --------------------------------------------------------------------------------------
+    def _recurse(self, r, q, bef, aft, bounds, ranks):
+        stats = self.stats
+        stats["nodes"] += 1
+        if self._deadline is not None and stats["nodes"] % 256 == 0 and time.time() > self._deadline:
+            raise _TimeLimitReached()
+
+        target = self._target
+        failed_at = self._cache.get(ranks)
+        if failed_at is not None and failed_at >= target:
+            self._cache.move_to_end(ranks)
+            stats["cache_hits"] += 1
+            return
+
+        makespan, starts = self._dispatch(r, q, bef)
+        if makespan <= target:
+            raise _Found((makespan, starts))
+
+        mops, mp, loc = self._mops, self._mp, self._loc
+        machine, machine_slack = -1, None
+        for m, mo in enumerate(mops):
+            if len(ranks[m]) == len(mo):
+                continue
+            ranked = 0
+            for i in ranks[m]:
+                ranked |= 1 << i
+            unranked = [mo[i] for i in range(len(mo)) if not ranked >> i & 1]
+            slack = (target - min(q[o] for o in unranked)) - min(r[o] for o in unranked) \
+                - sum(mp[m][loc[o]] for o in unranked)
+            if machine_slack is None or slack < machine_slack:
+                machine, machine_slack = m, slack
+        if machine < 0:
+            # alle Maschinen vollständig rangiert -> Köpfe sind der Schedule
+            raise _Found((max(r[o] + self._p[o] for o in range(self._n)), r[:]))
+
+        m, mo = machine, mops[machine]
+        n = len(mo)
+        ranked = 0
+        for i in ranks[m]:
+            ranked |= 1 << i
+        unranked = self._full[m] & ~ranked
+
+        children = []
+        for i in range(n):
+            if not unranked >> i & 1 or bef[mo[i]] & unranked:
+                continue
+            r2, q2, bef2, aft2 = r[:], q[:], bef[:], aft[:]
+            others = unranked & ~(1 << i)
+            aft2[mo[i]] |= others
+            for j in range(n):
+                if others >> j & 1:
+                    bef2[mo[j]] |= bef2[mo[i]] | (1 << i)
+            touched = set()
+            if not self._propagate(r2, q2, bef2, aft2, target, {m}, touched):
+                stats["fails"] += 1
+                continue
+            bounds2 = bounds[:]
+            for t in touched:
+                bounds2[t] = self._machine_bound(r2, q2, t)
+            ranks2 = ranks[:m] + (ranks[m] + (i,),) + ranks[m + 1:]
+            children.append((max(bounds2), r2[mo[i]], i, (r2, q2, bef2, aft2, bounds2, ranks2)))
+
+        children.sort(key=lambda child: child[:3])
+        for child in children:
+            self._recurse(*child[3])
+
+        self._cache[ranks] = target
+        self._cache.move_to_end(ranks)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _dispatch(self, r, q, bef) -> Tuple[int, List[int]]:
+        # GT-Verfahren unter den Maschinenreihenfolgen des Knotens, Priorität: größter Schwanz
+        p, mach, nxt, loc = self._p, self._mach, self._nxt, self._loc
+        current = list(self._first_operations)
+        job_ready = [0] * len(current)
+        machine_ready = [self.machine_ready_time[m] for m in self.machines]
+        done = [0] * len(self.machines)
+        starts = [0] * self._n
+        makespan = 0
+        for _ in range(self._n):
+            earliest_end, machine = INF, -1
+            for j, o in enumerate(current):
+                if o == -1 or bef[o] & ~done[mach[o]]:
+                    continue
+                end = max(job_ready[j], machine_ready[mach[o]], r[o]) + p[o]
+                if end < earliest_end:
+                    earliest_end, machine = end, mach[o]
+            selected = -1
+            for j, o in enumerate(current):
+                if o == -1 or mach[o] != machine or bef[o] & ~done[machine]:
+                    continue
+                if max(job_ready[j], machine_ready[machine], r[o]) < earliest_end:
+                    if selected < 0 or q[o] > q[current[selected]]:
+                        selected = j
+            o = current[selected]
+            start = max(job_ready[selected], machine_ready[machine], r[o])
+            starts[o] = start
+            job_ready[selected] = machine_ready[machine] = start + p[o]
+            makespan = max(makespan, start + p[o])
+            done[machine] |= 1 << loc[o]
+            current[selected] = nxt[o]
+        return makespan, starts
+
+    def _propagate(self, r, q, bef, aft, target, dirty, touched) -> bool:
+        """
+        Heads and tails up to the fixpoint for makespan <= target, starting with the dirty machines.
+        Fixes machine precedences found by pairwise immediate selection. False if the node is infeasible.
+        """
+        mops, mp, mach, p, nxt, prv = self._mops, self._mp, self._mach, self._p, self._nxt, self._prv
+        while dirty:
+            m = dirty.pop()
+            touched.add(m)
+            mo = mops[m]
+            n = len(mo)
+            pp = mp[m]
+            b = [bef[o] for o in mo]
+            a = [aft[o] for o in mo]
+            rr = [r[o] for o in mo]
+            qq = [q[o] for o in mo]
+            while True:
+                changed = False
+                # Köpfe/Schwänze aus den festgelegten Vorgängern/Nachfolgern auf der Maschine
+                for i in range(n):
+                    for masks, values in ((b, rr), (a, qq)):
+                        mask = masks[i]
+                        if not mask:
+                            continue
+                        low, total, high, j = INF, 0, 0, 0
+                        while mask:
+                            if mask & 1:
+                                x = values[j]
+                                if x < low:
+                                    low = x
+                                x += pp[j]
+                                if x > high:
+                                    high = x
+                                total += pp[j]
+                            mask >>= 1
+                            j += 1
+                        value = max(low + total, high)
+                        if value > values[i]:
+                            values[i] = value
+                for i in range(n):
+                    if rr[i] + pp[i] + qq[i] > target:
+                        return False
+
+                new_r = edge_finding(rr, pp, [target - x for x in qq], sorted(range(n), key=rr.__getitem__))
+                if new_r is None:
+                    return False
+                new_q = edge_finding(qq, pp, [target - x for x in new_r], sorted(range(n), key=qq.__getitem__))
+                if new_q is None:
+                    return False
+
+                # paarweise Immediate Selection: i vor j unmöglich -> j vor i (transitiv)
+                for i in range(n):
+                    known = b[i] | a[i]
+                    for j in range(i + 1, n):
+                        if known >> j & 1:
+                            continue
+                        i_first = new_r[i] + pp[i] + pp[j] + new_q[j] <= target
+                        j_first = new_r[j] + pp[j] + pp[i] + new_q[i] <= target
+                        if i_first and j_first:
+                            continue
+                        if not i_first and not j_first:
+                            return False
+                        x, y = (j, i) if not i_first else (i, j)
+                        before_y = b[x] | (1 << x)
+                        after_x = a[y] | (1 << y)
+                        for z in range(n):
+                            if before_y >> z & 1:
+                                a[z] |= after_x
+                            if after_x >> z & 1:
+                                b[z] |= before_y
+                        known = b[i] | a[i]
+                        changed = True
+
+                if new_r != rr or new_q != qq:
+                    rr, qq = new_r, new_q
+                    changed = True
+                if not changed:
+                    break
+
+            # zurückschreiben und entlang der Jobs weitergeben
+            for i, o in enumerate(mo):
+                bef[o], aft[o] = b[i], a[i]
+                if rr[i] > r[o]:
+                    r[o] = rr[i]
+                    end, k = rr[i] + pp[i], nxt[o]
+                    while k != -1 and end > r[k]:
+                        r[k] = end
+                        dirty.add(mach[k])
+                        if end + p[k] + q[k] > target:
+                            return False
+                        end += p[k]
+                        k = nxt[k]
+                if qq[i] > q[o]:
+                    q[o] = qq[i]
+                    tail, k = qq[i] + pp[i], prv[o]
+                    while k != -1 and tail > q[k]:
+                        q[k] = tail
+                        dirty.add(mach[k])
+                        if r[k] + p[k] + tail > target:
+                            return False
+                        tail += p[k]
+                        k = prv[k]
+        return True
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional
 
 from src.domain.Collection import LiveJobCollection
+from src.solvers.MIP_ModelBuilder import JobShopMIPBuilder, ScipBackend
 
 from pyscipopt import Model
 
@@ -22,62 +23,23 @@ class Scheduler:
         self.bnb_params = bnb_params or {}
 
     def get_schedule(self) -> LiveJobCollection:
-        jobs = list(self.jobs_collection.values())
         self.jobs_collection.sort_jobs_by_id()
         self.jobs_collection.sort_operations()
 
-        ops: List[Tuple[Any, int, str, int, Any]] = []
-        for job in self.jobs_collection.values():
-            for k, op in enumerate(job.operations):
-                p = int(getattr(op, "duration", 0))
-                m = str(op.machine_name)
-                ops.append((job, k, m, p, op))
-
-        machines = sorted({m for _, _, m, _, _ in ops})
-        M = sum(p for _, _, _, p, _ in ops)
-
         model = Model("JobShop_BNB")
 
-        jobs_ordered = list(self.jobs_collection.values())
-        jobs_ordered.sort(key=lambda j: str(getattr(j, "id", "")))
-
-        job_idx_by_id = {str(job.id): idx for idx, job in enumerate(jobs_ordered)}
-
-        # ------------------------------------------------------
-
-        # Startvariablen S[j,k]
-        S: Dict[Tuple[int, int], Any] = {}
-        for job, k, m, p, op in ops:
-            j = job_idx_by_id[str(job.id)]
-
-            S[(j, k)] = model.addVar(lb=float(self.schedule_start), vtype="C", name=f"S_{j}_{k}")
-
-        Cmax = model.addVar(lb=0.0, vtype="C", name="Cmax")
-
-        # Job-Precedence
-        for job in self.jobs_collection.values():
-            j = job_idx_by_id[str(job.id)]
-
-            for k in range(len(job.operations) - 1):
-                p = int(getattr(job.operations[k], "duration", 0))
-                model.addCons(S[(j, k + 1)] >= S[(j, k)] + p)
-
-        # Maschinenkonflikte
-        for m in machines:
-            ops_m = [(job_idx_by_id[str(job.id)], k, p) for (job, k, mm, p, _) in ops if mm == m]
-            for i in range(len(ops_m)):
-                for j in range(i + 1, len(ops_m)):
-                    j1, k1, p1 = ops_m[i]
-                    j2, k2, p2 = ops_m[j]
-                    y = model.addVar(vtype="B", name=f"y_{j1}_{k1}_{j2}_{k2}")
-
-                    model.addCons(S[(j1, k1)] + p1 <= S[(j2, k2)] + M * (1 - y))
-                    model.addCons(S[(j2, k2)] + p2 <= S[(j1, k1)] + M * y)
-
-        # Makespan
-        for job, k, m, p, op in ops:
-            j = job_idx_by_id[str(job.id)]
-            model.addCons(Cmax >= S[(j, k)] + p)
+        # Gemeinsames MIP-Modell (eine Binärvariable je Paar, Big-M je Paar aus Release und Tail)
+        model_builder = JobShopMIPBuilder(
+            jobs_collection=self.jobs_collection,
+            schedule_start=self.schedule_start,
+            active_jobs_collection=self.active_jobs_collection,
+            big_m=self.bnb_params.get("big_m", "pair"),
+            formulation=self.bnb_params.get("formulation", "disjunctive"),
+        )
+        backend = ScipBackend(model)
+        S = model_builder.build(backend)
+        Cmax = model_builder.add_makespan(backend, S)
+        model_builder.set_initial_solution(backend, S, Cmax)
 
         model.setObjective(Cmax, "minimize")
 
@@ -90,23 +52,15 @@ class Scheduler:
         # Lösung zurück
         schedule_job_collection = LiveJobCollection()
 
-        op_by_key: Dict[Tuple[int, int], Any] = {}
-        dur_by_key: Dict[Tuple[int, int], int] = {}
-
-        for job, k, m, p, op in ops:
-            j = job_idx_by_id[str(job.id)]
-            op_by_key[(j, k)] = op
-            dur_by_key[(j, k)] = p
-
-        for (j, k), var in S.items():
-            start = float(model.getVal(var))
-            p = dur_by_key[(j, k)]
-            end = start + p
-            schedule_job_collection.add_operation_instance(
-                op=op_by_key[(j, k)],
-                new_start=int(round(start)),
-                new_end=int(round(end)),
-            )
+        for job in self.jobs_collection.values():
+            for op in job.operations:
+                start = float(model.getVal(S[(job.id, op.position_number)]))
+                p = int(getattr(op, "duration", 0))
+                end = start + p
+                schedule_job_collection.add_operation_instance(
+                    op=op,
+                    new_start=int(round(start)),
+                    new_end=int(round(end)),
+                )
 
         return schedule_job_collection
-
@@ -0,0 +1,290 @@
+import heapq
+from itertools import count
+from typing import Literal, List, Dict, Optional, Tuple, Callable
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.orm_models import JobOperation
+from src.solvers.heuristics.GT_Scheduler import Scheduler
+
+
+class EventScheduler(Scheduler):
+    """
+    Event-driven Giffler-Thompson engine with the same decisions as Scheduler.get_schedule().
+
+    - The candidate set (current operation of each job) is kept per machine (_MachineCandidates) and only
+      updated for the job and the machine of a scheduled operation.
+    - A heap of the earliest candidate end per machine gives the next decision time T.
+    - Rules with static keys (SPT, FCFS, EDD, MWKR_LPT) use a priority queue per machine.
+      Rules depending on the current start time or on random tie-breaking (SLACK, MWKR, DEVIATION, ...)
+      evaluate select_by_priority() on the conflict set of the machine.
+
+    Ties are resolved exactly like in Scheduler: conflict set = operations ending at T, then operations
+    starting before T, each in the job order of the jobs_collection; machines in the order of their first job.
+    """
+
+    # Static priority keys (min-key wins, ties in conflict set order)
+    _STATIC_KEYS: Dict[str, Callable[[JobOperation], Tuple]] = {
+        "SPT": lambda op: (
+            op.duration, _arrival(op), op.job_earliest_start, op.job.sum_duration
+        ),
+        "FCFS": lambda op: (
+            _arrival(op), op.job_earliest_start, op.duration, op.job.sum_duration
+        ),
+        "EDD": lambda op: (
+            _due_date(op), _arrival(op), op.job_earliest_start, op.job.sum_duration
+        ),
+        "MWKR_LPT": lambda op: (
+            -op.job.sum_left_duration(op.position_number), -op.duration
+        ),
+    }
+
+    def __init__(self, jobs_collection: LiveJobCollection, schedule_start: int = 0):
+        super().__init__(jobs_collection=jobs_collection, schedule_start=schedule_start)
+
+        # Job order of the jobs_collection (tie-breaker of Scheduler)
+        self._job_rank: Dict[str, int] = {job_id: rank for rank, job_id in enumerate(self.jobs_collection.keys())}
+
+        self._machine_candidates: Dict[str, _MachineCandidates] = {}
+        self._min_end: Dict[str, int] = {}
+        self._end_heap: List[Tuple[int, str]] = []
+
+    def get_schedule(
+            self, priority_rule: Literal["SPT", "FCFS", "EDD", "MWKR", "SLACK", "DEVIATION"] = "SPT",
+            add_overlap_to_conflict: bool = True):
+        static_key = self._STATIC_KEYS.get(priority_rule)
+        self._init_candidates(static_key)
+
+        schedule_job_collection = LiveJobCollection()
+        planned = 0
+        while planned < self.total_ops:
+            next_event = self._pop_machines_ending_first()
+            if next_event is None:
+                # Nichts planbar
+                break
+            machines, earliest_end_t = next_event
+
+            # 1) Auswahl auf allen Maschinen aus demselben Zustand (wie Scheduler.get_schedule)
+            selections: List[Tuple[str, JobOperation]] = []
+            for machine in machines:
+                candidates = self._machine_candidates[machine]
+                if static_key is not None:
+                    selected_op = candidates.select_static(earliest_end_t, add_overlap_to_conflict)
+                else:
+                    conflict_ops = candidates.get_conflict_ops(earliest_end_t, add_overlap_to_conflict)
+                    selected_op = self.select_by_priority(conflict_ops, priority_rule)
+                if selected_op is not None:
+                    selections.append((machine, selected_op))
+
+            # 2) Zustand nur für die betroffenen Jobs und Maschinen aktualisieren
+            changed_machines = set(machines)
+            for machine, selected_op in selections:
+                job = selected_op.job
+                self._machine_candidates[machine].remove(self._job_rank[job.id])
+
+                job.current_operation = job.get_next_operation(selected_op.position_number)
+                job.current_operation_earliest_start = selected_op.end
+
+                planned += 1
+                self.machine_ready_time[machine] = selected_op.end
+                self._machine_candidates[machine].set_ready_time(selected_op.end)
+
+                schedule_job_collection.add_operation_instance(selected_op)
+
+            for _, selected_op in selections:
+                next_op = selected_op.job.current_operation
+                if next_op is not None:
+                    self._add_candidate(next_op, static_key)
+                    changed_machines.add(next_op.machine_name)
+
+            for machine in changed_machines:
+                self._update_min_end(machine)
+
+        return schedule_job_collection
+
+    # Candidates -----------------------------------------------------------------------------------
+    def _init_candidates(self, static_key: Optional[Callable[[JobOperation], Tuple]]):
+        self._machine_candidates = {}
+        self._min_end = {}
+        self._end_heap = []
+
+        for job in self.jobs_collection.values():
+            if job.current_operation is not None:
+                self._add_candidate(job.current_operation, static_key)
+        for machine in self._machine_candidates:
+            self._update_min_end(machine)
+
+    def _add_candidate(self, operation: JobOperation, static_key: Optional[Callable[[JobOperation], Tuple]]):
+        machine = operation.machine_name
+        candidates = self._machine_candidates.get(machine)
+        if candidates is None:
+            candidates = _MachineCandidates(self.machine_ready_time[machine], static_key)
+            self._machine_candidates[machine] = candidates
+        candidates.add(
+            operation, rank=self._job_rank[operation.job_id],
+            earliest_start=operation.job.current_operation_earliest_start
+        )
+
+    def _update_min_end(self, machine: str):
+        min_end = self._machine_candidates[machine].get_min_end()
+        if min_end is None:
+            self._min_end.pop(machine, None)
+        else:
+            self._min_end[machine] = min_end
+            heapq.heappush(self._end_heap, (min_end, machine))
+
+    def _pop_machines_ending_first(self) -> Optional[Tuple[List[str], int]]:
+        """
+        Earliest end T over all candidates and the machines with a candidate ending at T,
+        in the order of their first job.
+        """
+        earliest_end_t = None
+        machines = []
+        while self._end_heap:
+            min_end, machine = self._end_heap[0]
+            if self._min_end.get(machine) != min_end:
+                heapq.heappop(self._end_heap)       # veraltet
+                continue
+            if earliest_end_t is None:
+                earliest_end_t = min_end
+            elif min_end != earliest_end_t:
+                break
+            heapq.heappop(self._end_heap)
+            if machine not in machines:
+                machines.append(machine)
+
+        if earliest_end_t is None:
+            return None
+        machines.sort(key=lambda m: self._machine_candidates[m].get_first_rank())
+        return machines, earliest_end_t
+
+
+class _MachineCandidates:
+    """
+    Candidates of one machine. start = max(ready_time, earliest start of the job), end = start + duration.
+
+    Candidates are 'released' (earliest start <= ready_time, end = ready_time + duration) or 'waiting'
+    (end = earliest start + duration). Removed candidates stay in the heaps and are skipped lazily
+    (entry no longer in 'operations').
+    """
+
+    def __init__(self, ready_time: int, static_key: Optional[Callable[[JobOperation], Tuple]]):
+        self.ready_time = ready_time
+        self.static_key = static_key
+
+        self.operations: Dict[int, JobOperation] = {}
+        self.earliest_starts: Dict[int, int] = {}
+
+        self._released: List[Tuple[int, int, int, JobOperation]] = []       # (duration, rank, seq, op)
+        self._waiting: List[Tuple[int, int, int, JobOperation]] = []        # (earliest start, rank, seq, op)
+        self._waiting_end: List[Tuple[int, int, int, JobOperation]] = []    # (earliest start + duration, ...)
+        self._ranks: List[Tuple[int, int, JobOperation]] = []
+        self._priority_queue: List[Tuple[Tuple, int, int, JobOperation]] = []
+        self._counter = count()
+
+    def add(self, operation: JobOperation, rank: int, earliest_start: int):
+        seq = next(self._counter)
+        self.operations[rank] = operation
+        self.earliest_starts[rank] = earliest_start
+        heapq.heappush(self._ranks, (rank, seq, operation))
+        if earliest_start <= self.ready_time:
+            heapq.heappush(self._released, (operation.duration, rank, seq, operation))
+        else:
+            heapq.heappush(self._waiting, (earliest_start, rank, seq, operation))
+            heapq.heappush(self._waiting_end, (earliest_start + operation.duration, rank, seq, operation))
+        if self.static_key is not None:
+            heapq.heappush(self._priority_queue, (self.static_key(operation), rank, seq, operation))
+
+    def remove(self, rank: int):
+        del self.operations[rank]
+        del self.earliest_starts[rank]
+
+    def _is_current(self, rank: int, operation: JobOperation) -> bool:
+        return self.operations.get(rank) is operation
+
+    def set_ready_time(self, ready_time: int):
+        self.ready_time = ready_time
+        while self._waiting and self._waiting[0][0] <= ready_time:
+            earliest_start, rank, seq, operation = heapq.heappop(self._waiting)
+            if self._is_current(rank, operation):
+                heapq.heappush(self._released, (operation.duration, rank, seq, operation))
+
+    def get_min_end(self) -> Optional[int]:
+        released, waiting_end = self._released, self._waiting_end
+        while released and not self._is_current(released[0][1], released[0][3]):
+            heapq.heappop(released)
+        while waiting_end and (not self._is_current(waiting_end[0][1], waiting_end[0][3])
+                               or self.earliest_starts[waiting_end[0][1]] <= self.ready_time):
+            heapq.heappop(waiting_end)
+
+        ends = []
+        if released:
+            ends.append(self.ready_time + released[0][0])
+        if waiting_end:
+            ends.append(waiting_end[0][0])
+        return min(ends) if ends else None
+
+    def get_first_rank(self) -> int:
+        while not self._is_current(self._ranks[0][0], self._ranks[0][2]):
+            heapq.heappop(self._ranks)
+        return self._ranks[0][0]
+
+    def _set_times(self, rank: int, operation: JobOperation):
+        # = Scheduler.get_machine_candidates()
+        operation.start = max(self.ready_time, self.earliest_starts[rank])
+        operation.end = operation.start + operation.duration
+
+    @staticmethod
+    def _is_conflict(operation: JobOperation, earliest_end_t: int, add_overlap_to_conflict: bool) -> bool:
+        # Überlappung mit einer bei T endenden Operation <=> start < T (da end >= T für alle Kandidaten)
+        return operation.end == earliest_end_t or (add_overlap_to_conflict and operation.start < earliest_end_t)
+
+    def get_conflict_ops(self, earliest_end_t: int, add_overlap_to_conflict: bool) -> List[JobOperation]:
+        ordered = []
+        for rank in sorted(self.operations):
+            operation = self.operations[rank]
+            self._set_times(rank, operation)
+            ordered.append(operation)
+
+        conflict_ops = [op for op in ordered if op.end == earliest_end_t]
+        if add_overlap_to_conflict:
+            conflict_ops.extend(op for op in ordered if op.end != earliest_end_t and op.start < earliest_end_t)
+        return conflict_ops
+
+    def select_static(self, earliest_end_t: int, add_overlap_to_conflict: bool) -> Optional[JobOperation]:
+        """
+        Smallest static key within the conflict set. For equal keys, operations ending at T come first,
+        then the job order (like min() over the conflict list of Scheduler).
+        """
+        queue = self._priority_queue
+        popped = []
+        best_key = None
+        tied: List[Tuple[int, JobOperation]] = []
+
+        while queue:
+            key, rank, _, operation = queue[0]
+            if not self._is_current(rank, operation):
+                heapq.heappop(queue)                # bereits eingeplant
+                continue
+            if best_key is not None and key != best_key:
+                break
+            popped.append(heapq.heappop(queue))
+            self._set_times(rank, operation)
+            if self._is_conflict(operation, earliest_end_t, add_overlap_to_conflict):
+                best_key = key
+                tied.append((rank, operation))
+
+        for entry in popped:
+            heapq.heappush(queue, entry)
+
+        if not tied:
+            return None
+        ending = [entry for entry in tied if entry[1].end == earliest_end_t]
+        return min(ending or tied, key=lambda entry: entry[0])[1]
+
+
+def _arrival(op: JobOperation) -> int:
+    return op.job_arrival if op.job_arrival is not None else 0
+
+
+def _due_date(op: JobOperation) -> int:
+    return op.job_due_date if op.job_due_date is not None else 0
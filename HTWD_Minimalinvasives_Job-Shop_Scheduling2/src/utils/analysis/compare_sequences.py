@@ -1,10 +1,10 @@
-import editdistance
 import pandas as pd
 
 from statistics import mean
-from scipy.stats import kendalltau
 from typing import Dict, List, Tuple, Optional
 
+from src.analyses.nervousness_metrics import get_machine_sequence_metrics
+
 
 def compute_sum_levenshtein_distance(
         previous_schedule: pd.DataFrame, new_schedule: pd.DataFrame,
@@ -22,18 +22,8 @@ def compute_sum_levenshtein_distance(
 
     :return: The sum of Levenshtein distances across all machines.
     """
-    machines, original_sequences, revised_sequences = _get_machines_and_sequences_dicts(
-        previous_schedule, new_schedule, comparison_start_time
-    )
-
-    total_distance = 0
-    for machine in machines:
-        orig = original_sequences[machine]
-        revised = revised_sequences[machine]
-        distance = _compute_levenshtein_distance(orig, revised)
-        total_distance += distance
-
-    return total_distance
+    df_machines = _get_machine_metrics(previous_schedule, new_schedule, comparison_start_time)
+    return int(df_machines["Levenshtein"].sum())
 
 
 def compute_mean_kendall_tau(
@@ -52,21 +42,10 @@ def compute_mean_kendall_tau(
 
     :return: The mean Kendall's Tau across all machines, or None if no valid sequences are found.
     """
-    machines, original_sequences, revised_sequences = _get_machines_and_sequences_dicts(
-        previous_schedule, new_schedule, comparison_start_time
-    )
-
-    taus = []
-    for machine in machines:
-        orig = original_sequences[machine]
-        revised = revised_sequences[machine]
-        tau = _compute_kendall_tau(orig, revised)
-        if tau is not None:
-            taus.append(tau)
-
-    if not taus:
+    df_machines = _get_machine_metrics(previous_schedule, new_schedule, comparison_start_time)
+    if df_machines.empty:
         return None  # No valid comparisons possible
-    return mean(taus)
+    return mean(df_machines["Kendall Tau"].tolist())
 
 
 def has_sequence_changed(
@@ -81,14 +60,8 @@ def has_sequence_changed(
 
     :return: True if at least one machine has a different job sequence, else False.
     """
-    machines, original_sequences, revised_sequences = _get_machines_and_sequences_dicts(
-        previous_schedule, new_schedule, comparison_start_time
-    )
-
-    for machine in machines:
-        if original_sequences[machine] != revised_sequences[machine]:
-            return True  # early exit on first change
-    return False
+    df_machines = _get_machine_metrics(previous_schedule, new_schedule, comparison_start_time)
+    return bool(df_machines["Changed"].any())
 
 
 def get_shared_operations_number(
@@ -104,13 +77,8 @@ def get_shared_operations_number(
 
     :return: Total number of shared jobs (operations) across all common machines.
     """
-    machines, original_sequences, _ = _get_machines_and_sequences_dicts(
-        previous_schedule, new_schedule, comparison_start_time
-    )
-
-    # Since _get_machines_and_sequences_dicts returns symmetrically filtered sequences,
-    # the length of original_sequences[machine] directly corresponds to the number of shared jobs
-    return sum(len(original_sequences[machine]) for machine in machines)
+    df_machines = _get_machine_metrics(previous_schedule, new_schedule, comparison_start_time)
+    return int(df_machines["Shared Operations"].sum())
 
 def get_comparison_dataframe(
         previous_schedule: pd.DataFrame, new_schedule: pd.DataFrame,
@@ -130,24 +98,17 @@ def get_comparison_dataframe(
     machines, original_sequences, revised_sequences = _get_machines_and_sequences_dicts(
         previous_schedule, new_schedule, comparison_start_time
     )
-
-    records = []
-    for machine in machines:
-        orig = original_sequences[machine]
-        revised = revised_sequences[machine]
-
-        record = {
-            "Original Sequence": orig,
-            "Revised Sequence": revised,
-            "Levenshtein": _compute_levenshtein_distance(orig, revised),
-            "Kendall Tau": _compute_kendall_tau(orig, revised)
-        }
-        records.append((machine, record))
-
-    df = pd.DataFrame.from_dict(dict(records), orient='index')
-    df.index.name = "Machine"
+    df_machines = _get_machine_metrics(previous_schedule, new_schedule, comparison_start_time).set_index("Machine")
+
+    df = pd.DataFrame({
+        "Original Sequence": pd.Series(original_sequences, dtype=object),
+        "Revised Sequence": pd.Series(revised_sequences, dtype=object),
+        "Levenshtein": df_machines["Levenshtein"],
+        "Kendall Tau": df_machines["Kendall Tau"],
+    }, index=pd.Index(machines, name="Machine"))
     return df
 
+
 def _get_machines_and_sequences_dicts(
     previous_schedule: pd.DataFrame,
     new_schedule: pd.DataFrame,
@@ -204,38 +165,15 @@ def _get_machines_and_sequences_dicts(
     return machines, original_sequences, revised_sequences
 
 
-def _compute_kendall_tau(original_sequence: List[str], revised_sequence: List[str]) -> Optional[float]:
-    """
-    Computes Kendall's Tau between two job sequences with identical elements.
-
-    :param original_sequence: Reference job sequence.
-    :param revised_sequence: Job sequence to compare (same elements, different order).
-    :return: Kendall's Tau correlation coefficient rounded to 4 decimals (or 1.0 if undefined).
-    """
-    if len(original_sequence) != len(revised_sequence) or len(original_sequence) < 2:
-        return 1.0  # Invalid input or too short for Tau
-
-    # Map each job to its rank in the original sequence
-    rank_original = {job: i for i, job in enumerate(original_sequence)}
-
-    # Translate revised_sequence into the corresponding ranks from original_sequence
-    rank_revised = [rank_original[job] for job in revised_sequence]
-
-    # Baseline represents the ideal order (0, 1, 2, ..., n-1)
-    baseline = list(range(len(rank_revised)))
-
-    # Compare the order in revised_sequence against the original using Kendall's Tau
-    tau, _ = kendalltau(baseline, rank_revised)
-
-    return round(tau, 4) if tau is not None else 1.0
-
-
-def _compute_levenshtein_distance(original_sequence: List[str], revised_sequence: List[str]) -> int:
+def _get_machine_metrics(
+        previous_schedule: pd.DataFrame, new_schedule: pd.DataFrame,
+        comparison_start_time: float) -> pd.DataFrame:
     """
-    Computes the Levenshtein distance between two job sequences.
-
-    :param original_sequence: Reference job sequence.
-    :param revised_sequence: Job sequence to compare.
-    :return: Minimum number of edit operations to transform original_sequence into revised_sequence.
+    Shared operations, Levenshtein distance, Kendall's Tau and changed flag per common machine
+    (computed on rank arrays, see src.analyses.nervousness_metrics).
     """
-    return editdistance.eval(original_sequence, revised_sequence)
\ No newline at end of file
+    return get_machine_sequence_metrics(
+        previous_schedule.assign(Job=previous_schedule["Job"].astype(str)),
+        new_schedule.assign(Job=new_schedule["Job"].astype(str)),
+        comparison_start=comparison_start_time, pair_columns=[],
+    )
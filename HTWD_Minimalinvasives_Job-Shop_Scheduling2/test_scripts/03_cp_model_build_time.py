@@ -0,0 +1,45 @@
+import time
+from decimal import Decimal
+
+from src.Logger import Logger
+from src.domain.Collection import LiveJobCollection
+from src.domain.Query import JobQuery
+from src.solvers.CP_Solver import Solver
+
+if __name__ == '__main__':
+    max_util = 1.0
+    source_name = "Fisher and Thompson 10x10"
+    logger = Logger(name="cp_model_build_time")
+
+    # Modellaufbau mit vorherigem Schedule (alle Operationen mappbar) für wachsende Backlogs
+    for shifts in [2, 4, 8, 16, 24]:
+        jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
+            source_name=source_name,
+            max_bottleneck_utilization=Decimal(f"{max_util}"),
+            arrival_limit=60 * 24 * shifts
+        )
+        jobs_collection = LiveJobCollection(jobs)
+
+        previous_schedule = LiveJobCollection()
+        for job in jobs_collection.values():
+            for operation in job.operations:
+                previous_schedule.add_operation_instance(operation, new_start=job.earliest_start)
+
+        start = time.perf_counter()
+        solver = Solver(jobs_collection=jobs_collection, logger=logger, schedule_start=1440)
+        solver.build_model__absolute_lateness__start_deviation__minimization(
+            previous_schedule_jobs_collection=previous_schedule,
+            active_jobs_collection=None,
+            w_t=10, w_e=2, w_dev=1
+        )
+        end = time.perf_counter()
+
+        index_start = time.perf_counter()
+        mapped = solver.index_mapper.map_collection(previous_schedule)
+        index_end = time.perf_counter()
+
+        print(
+            f"Shifts: {shifts:>3} | Operations: {jobs_collection.count_operations():>6} | "
+            f"Model build: {end - start:8.3f} s | map_collection: {index_end - index_start:8.4f} s "
+            f"({len(mapped)} mapped)"
+        )
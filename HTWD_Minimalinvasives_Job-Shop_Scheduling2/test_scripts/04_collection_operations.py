@@ -0,0 +1,123 @@
+import timeit
+from decimal import Decimal
+from typing import List, Tuple
+
+import pandas as pd
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.Query import JobQuery
+from src.domain.orm_models import LiveJob
+
+
+# bisherige Implementierung (Referenz) ---------------------------------------------------------------------------
+def previous_difference(main: LiveJobCollection, exclude: LiveJobCollection) -> LiveJobCollection:
+    result = LiveJobCollection()
+    excluded_pairs = {(op.job_id, op.position_number) for job in exclude.values() for op in job.operations}
+    for job in main.values():
+        for op in job.operations:
+            if (op.job_id, op.position_number) not in excluded_pairs:
+                result.add_operation_instance(op)
+    result.sort_operations()
+    return result
+
+
+def previous_merge(main: LiveJobCollection, include: LiveJobCollection) -> LiveJobCollection:
+    result = LiveJobCollection()
+    for job_id, job_main in main.items():
+        result[job_id] = LiveJob.copy_from(job_main)
+    for job_id, job_include in include.items():
+        if job_id not in result:
+            result[job_id] = LiveJob.copy_from(job_include)
+        else:
+            existing_ops = {op.position_number for op in result[job_id].operations}
+            for op in job_include.operations:
+                if op.position_number not in existing_ops:
+                    result[job_id].add_operation_instance(op)
+    result.sort_operations()
+    result.sort_jobs_by_arrival()
+    return result
+
+
+def previous_subset_by_earliest_start(collection: LiveJobCollection, earliest_start: int) -> LiveJobCollection:
+    subset = LiveJobCollection()
+    for job in collection.values():
+        if job.earliest_start == earliest_start:
+            subset[job.id] = job
+    return subset
+
+
+def previous_operations_dataframe(collection: LiveJobCollection) -> pd.DataFrame:
+    records = []
+    for job in collection.values():
+        for op in job.operations:
+            records.append({
+                "Job": job.id, "Routing_ID": job.routing_id, "Operation": op.position_number,
+                "Machine": op.machine_name, "Start": op.start, "Processing Time": op.duration, "End": op.end,
+                "Arrival": job.arrival, "Ready Time": job.earliest_start, "Due Date": job.due_date
+            })
+    return pd.DataFrame(records)
+
+
+# Vergleich -------------------------------------------------------------------------------------------------------
+def collection_signature(collection: LiveJobCollection) -> List[Tuple]:
+    return [
+        (type(collection), job_id, job.id, job.routing_id, job.arrival, job.due_date,
+         [(op.job is job, op.position_number, op.machine_name, op.start, op.duration, op.end, op.sim_duration)
+          for op in job.operations])
+        for job_id, job in collection.items()
+    ]
+
+
+def measure(name: str, func, previous_func, repetitions: int = 5, rounds: int = 5):
+    # bestes von mehreren Runden (weniger Rauschen durch die Garbage Collection)
+    durations = [
+        min(timeit.repeat(f, number=repetitions, repeat=rounds)) / repetitions for f in (previous_func, func)
+    ]
+    print(f"{name:28}: {durations[0] * 1000:9.2f} ms -> {durations[1] * 1000:9.2f} ms")
+
+
+if __name__ == '__main__':
+    max_util = 1.0
+    source_name = "Fisher and Thompson 10x10"
+
+    # Set-Operationen der LiveJobCollection (Rolling Horizon) für wachsende Backlogs
+    for shifts in [4, 8, 16, 24]:
+        jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
+            source_name=source_name,
+            max_bottleneck_utilization=Decimal(f"{max_util}"),
+            arrival_limit=60 * 24 * shifts
+        )
+        jobs_collection = LiveJobCollection(jobs)
+        half_collection = LiveJobCollection(list(jobs_collection.values())[::2])
+        # nur ein Teil der Operationen je Job (wie aktive/wartende Operationen im Rolling Horizon)
+        tail_collection = LiveJobCollection()
+        for job in list(jobs_collection.values())[::3]:
+            for op in job.operations[len(job.operations) // 2:]:
+                tail_collection.add_operation_instance(op)
+        print(f"Shifts: {shifts:>3} | Jobs: {len(jobs_collection):>5} | "
+              f"Operations: {jobs_collection.count_operations():>6}")
+
+        # gleiche Jobs, Operationen und Reihenfolge wie die bisherige Implementierung
+        for main, other in [(jobs_collection, half_collection), (jobs_collection, tail_collection),
+                            (tail_collection, jobs_collection), (half_collection, tail_collection)]:
+            assert collection_signature(main / other) == collection_signature(previous_difference(main, other))
+            assert collection_signature(main + other) == collection_signature(previous_merge(main, other))
+        for earliest_start in [0, 60 * 24, 60 * 24 * 2]:
+            subset = jobs_collection.get_subset_by_earliest_start(earliest_start)
+            assert collection_signature(subset) == collection_signature(
+                previous_subset_by_earliest_start(jobs_collection, earliest_start))
+        for collection in [jobs_collection, tail_collection, jobs_collection / half_collection]:
+            pd.testing.assert_frame_equal(
+                collection.to_operations_dataframe(), previous_operations_dataframe(collection)
+            )
+
+        # Laufzeit: bisherige Implementierung -> aktuelle Implementierung
+        measure("difference (/)", lambda: jobs_collection / half_collection,
+                lambda: previous_difference(jobs_collection, half_collection))
+        measure("merge (+)", lambda: half_collection + jobs_collection,
+                lambda: previous_merge(half_collection, jobs_collection))
+        measure("get_subset_by_earliest_start", lambda: jobs_collection.get_subset_by_earliest_start(60 * 24),
+                lambda: previous_subset_by_earliest_start(jobs_collection, 60 * 24))
+        measure("to_operations_dataframe", jobs_collection.to_operations_dataframe,
+                lambda: previous_operations_dataframe(jobs_collection))
+    print("Results equal to the previous implementation")
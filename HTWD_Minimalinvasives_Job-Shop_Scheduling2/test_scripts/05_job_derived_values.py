@@ -0,0 +1,102 @@
+import time
+from decimal import Decimal
+
+import numpy as np
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.Query import JobQuery
+from src.domain.orm_models import LiveJob
+
+
+def previous_values(job: LiveJob):
+    # bisherige Berechnung ohne Cache
+    positions = [op.position_number for op in job.operations]
+    earliest_start = 0 if job.arrival is None else int(np.ceil((job.arrival + 1) / 1440) * 1440)
+    return (
+        sum(op.duration for op in job.operations), max(positions, default=None), min(positions, default=None),
+        earliest_start,
+        [(sum(op.duration for op in job.operations if op.position_number >= position),
+          sum(op.transition_time for op in job.operations if op.position_number >= position))
+         for position in range(-1, max(positions, default=0) + 2)]
+    )
+
+
+def cached_values(job: LiveJob):
+    return (
+        job.sum_duration, job.last_operation_position_number, job.first_operation_position_number,
+        job.earliest_start,
+        [(job.sum_left_duration(position), job.sum_transition_time(position))
+         for position in range(-1, max((op.position_number for op in job.operations), default=0) + 2)]
+    )
+
+
+def check_after_mutations(jobs_collection: LiveJobCollection):
+    """
+    Cached values equal the uncached ones after each kind of change (cache built before every change).
+    """
+    def check():
+        for job in jobs_collection.values():
+            assert cached_values(job) == previous_values(job), job.id
+
+    check()
+    jobs = list(jobs_collection.values())
+    for job in jobs[::2]:                               # Operationen ändern (explizit invalidieren)
+        for op in job.operations:
+            op.duration += 1
+            op.transition_time = op.position_number * 10
+        job.invalidate_derived_values()
+    check()
+    for job in jobs[1::3]:                              # Liste ändern
+        job.operations.pop()
+        job.operations.sort(key=lambda op: -op.position_number)
+    check()
+    for job in jobs[2::3]:                              # Liste neu zuweisen, danach ändern
+        job.operations = list(job.operations[1:])
+        cached_values(job)
+        job.operations.append(job.operations[0].copy_for_job(job, duration=7))
+        job.operations[-1].position_number = 99
+        job.invalidate_derived_values()
+    check()
+    for job in jobs[::5]:                               # arrival neu setzen
+        job.arrival = None if job.arrival is None else job.arrival + 1000
+    check()
+    for job in jobs[::7]:
+        del job.operations[:]
+    check()
+
+
+if __name__ == '__main__':
+    max_util = 1.0
+    source_name = "Fisher and Thompson 10x10"
+
+    # Zugriffe wie im CP-Modell (je Operation) und in select_by_priority (MWKR-Sortierschlüssel)
+    for shifts in [4, 8, 16, 24]:
+        jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
+            source_name=source_name,
+            max_bottleneck_utilization=Decimal(f"{max_util}"),
+            arrival_limit=60 * 24 * shifts
+        )
+        jobs_collection = LiveJobCollection(jobs)
+        operations = [op for job in jobs_collection.values() for op in job.operations]
+
+        start = time.perf_counter()
+        for _ in range(10):
+            for op in operations:
+                op.job.last_operation_position_number
+                op.job.sum_left_duration(op.position_number)
+                op.job.sum_transition_time(op.position_number)
+                op.job.earliest_start
+        end = time.perf_counter()
+
+        start_sort = time.perf_counter()
+        for _ in range(10):
+            sorted(operations, key=lambda op: (-op.job.sum_left_duration(op.position_number), op.job.sum_duration))
+        end_sort = time.perf_counter()
+
+        print(
+            f"Shifts: {shifts:>3} | Operations: {len(operations):>6} | "
+            f"Property access: {(end - start) / 10 * 1000:8.2f} ms | "
+            f"MWKR sort: {(end_sort - start_sort) / 10 * 1000:8.2f} ms"
+        )
+        check_after_mutations(jobs_collection)
+    print("Cached values equal to the previous computation after all changes")
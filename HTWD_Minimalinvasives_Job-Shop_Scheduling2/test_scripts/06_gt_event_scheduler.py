@@ -0,0 +1,55 @@
+import random
+import time
+from decimal import Decimal
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.Query import JobQuery
+from src.solvers.heuristics.GT_EventScheduler import EventScheduler
+from src.solvers.heuristics.GT_Scheduler import Scheduler
+
+
+def run_scheduler(scheduler_class, jobs, priority_rule: str, schedule_start: int):
+    jobs_collection = LiveJobCollection(jobs)
+    scheduler = scheduler_class(jobs_collection=jobs_collection, schedule_start=schedule_start)
+    random.seed(42)     # MWKR mit Zufall als Tie-Breaker
+
+    start = time.perf_counter()
+    schedule = scheduler.get_schedule(priority_rule=priority_rule)
+    duration = time.perf_counter() - start
+
+    signature = [
+        (job.id, [(op.position_number, op.machine_name, op.start, op.end) for op in job.operations])
+        for job in schedule.values()
+    ]
+    return signature, duration
+
+
+if __name__ == '__main__':
+    max_util = 1.0
+    source_name = "Fisher and Thompson 10x10"
+    priority_rules = ["SPT", "EDD", "MWKR", "SLACK", "DEVIATION"]
+
+    all_identical = True
+    # Backlogs bis ca. 10.000 Operationen; Scheduler (Referenz) nur bis 2.500 Operationen
+    for shifts in [2, 5, 11, 22, 45]:
+        jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
+            source_name=source_name,
+            max_bottleneck_utilization=Decimal(f"{max_util}"),
+            arrival_limit=60 * 24 * shifts
+        )
+        number_of_operations = sum(len(job.operations) for job in jobs)
+
+        for priority_rule in priority_rules:
+            event_signature, event_time = run_scheduler(EventScheduler, jobs, priority_rule, schedule_start=1440)
+            line = (f"Operations: {number_of_operations:>6} | {priority_rule:9} | "
+                    f"EventScheduler: {event_time:8.3f} s")
+
+            if number_of_operations <= 2500:
+                signature, reference_time = run_scheduler(Scheduler, jobs, priority_rule, schedule_start=1440)
+                identical = signature == event_signature
+                all_identical &= identical
+                line += f" | Scheduler: {reference_time:8.3f} s | identical: {identical}"
+            print(line)
+
+    if not all_identical:
+        raise SystemExit("EventScheduler differs from Scheduler")
@@ -0,0 +1,39 @@
+import os
+from decimal import Decimal
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.Query import JobQuery
+from src.simulation.MonteCarloSimulation import MonteCarloSimulation
+from src.solvers.heuristics.GT_EventScheduler import EventScheduler
+
+if __name__ == '__main__':
+    max_util = 0.85
+    source_name = "Fisher and Thompson 10x10"
+    shift_length = 1440
+    replications = 200
+
+    # Schedule der ersten Schicht (GT, SLACK) als zu bewertender Plan
+    jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
+        source_name=source_name,
+        max_bottleneck_utilization=Decimal(f"{max_util}"),
+        arrival_limit=shift_length * 2
+    )
+    jobs_collection = LiveJobCollection(jobs).get_subset_by_earliest_start(earliest_start=shift_length)
+    scheduler = EventScheduler(jobs_collection=jobs_collection, schedule_start=shift_length)
+    schedule = scheduler.get_schedule(priority_rule="SLACK")
+    print(f"Schedule: {len(schedule)} jobs, {schedule.count_operations()} operations")
+
+    seeds = range(replications)
+    for engine in ["simpy", "replay"]:
+        for workers in [1, max(2, os.cpu_count() or 1)]:
+            monte_carlo = MonteCarloSimulation(
+                schedule_collection=schedule, start_time=shift_length, end_time=2 * shift_length,
+                sigma=0.2, max_workers=workers, engine=engine
+            )
+            result = monte_carlo.run(seeds)
+            print(f"{engine:6}, {result.workers:>2} process(es): {result.wall_time:7.2f} s "
+                  f"({result.replications_per_second:8.1f} replications/s)")
+
+    df = result.to_dataframe()
+    print(df[["Total Tardiness", "Total Earliness", "Tardy Jobs", "Active Operations", "Waiting Operations"]]
+          .describe(percentiles=[0.05, 0.5, 0.95]).round(1))
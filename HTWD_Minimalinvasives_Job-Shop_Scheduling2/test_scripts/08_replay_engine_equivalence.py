@@ -0,0 +1,114 @@
+import gc
+import random
+import time
+from decimal import Decimal
+from typing import List, Tuple
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.Query import JobQuery
+from src.simulation.LognormalFactorGenerator import LognormalFactorGenerator
+from src.simulation.ProductionSimulation import ProductionSimulation
+from src.solvers.heuristics.GT_EventScheduler import EventScheduler
+
+
+def collection_signature(collection: LiveJobCollection) -> List[Tuple]:
+    return [
+        (job.id, [(op.position_number, op.machine_name, op.start, op.duration, op.end, op.sim_duration,
+                   op.request_time_on_machine, op.granted_time_on_machine) for op in job.operations])
+        for job in collection.values()
+    ]
+
+
+def simulation_signature(simulation: ProductionSimulation) -> Tuple:
+    return (
+        collection_signature(simulation.get_finished_operation_collection()),
+        [(key, op.start, op.duration, op.end) for key, op in simulation.active_operations.items()],
+        collection_signature(simulation.get_waiting_operation_collection()),
+        collection_signature(simulation.get_entire_finished_operation_collection()),
+    )
+
+
+def run_rolling_horizon(
+        engine: str, jobs, total_shift_number: int, shift_length: int, sigma: float,
+        with_earliest_start: bool, priority_rule: str) -> Tuple[List[Tuple], float]:
+    """
+    Shift loop as in GT_Experiment: schedule (GT) -> simulation -> active/waiting operations for the next shift.
+    """
+    gc.collect()        # gleiche Ausgangslage für beide Engines (Zeitmessung)
+    jobs_collection = LiveJobCollection(jobs)
+    jobs_collection.sort_jobs_by_id()
+    jobs_collection.sort_operations()
+    factor_gen = LognormalFactorGenerator(sigma=sigma, seed=42)
+    for job in jobs_collection.values():
+        for operation in job.operations:
+            operation.sim_duration = int(operation.duration * factor_gen.sample())
+
+    simulation = ProductionSimulation(verbose=False, with_earliest_start=with_earliest_start, engine=engine)
+    random.seed(42)     # MWKR mit Zufall als Tie-Breaker
+    schedule_jobs_collection = LiveJobCollection()
+    active_job_ops_collection = LiveJobCollection()
+    waiting_job_ops_collection = LiveJobCollection()
+
+    signatures = []
+    simulation_time = 0.0
+    for shift_number in range(1, total_shift_number + 1):
+        shift_start = shift_number * shift_length
+        new_jobs_collection = jobs_collection.get_subset_by_earliest_start(earliest_start=shift_start)
+        current_jobs_collection = new_jobs_collection + waiting_job_ops_collection
+
+        scheduler = EventScheduler(jobs_collection=current_jobs_collection, schedule_start=shift_start)
+        scheduler.set_active_jobs_collection(active_job_ops_collection)
+        scheduler.set_previous_schedule_jobs_collection(schedule_jobs_collection)
+        schedule_jobs_collection = scheduler.get_schedule(priority_rule=priority_rule)
+
+        start = time.perf_counter()
+        simulation.run(schedule_collection=schedule_jobs_collection, start_time=shift_start,
+                       end_time=shift_start + shift_length)
+        simulation_time += time.perf_counter() - start
+
+        signatures.append(simulation_signature(simulation))
+        active_job_ops_collection = simulation.get_active_operation_collection()
+        waiting_job_ops_collection = simulation.get_waiting_operation_collection()
+
+    # Rest ohne Endzeitpunkt
+    start = time.perf_counter()
+    simulation.run(schedule_collection=waiting_job_ops_collection,
+                   start_time=(total_shift_number + 1) * shift_length, end_time=None)
+    simulation_time += time.perf_counter() - start
+    signatures.append(simulation_signature(simulation))
+    return signatures, simulation_time
+
+
+if __name__ == '__main__':
+    source_name = "Fisher and Thompson 10x10"
+    shift_length = 1440
+
+    cases = [
+        # (max_util, shifts, sigma, with_earliest_start, priority_rule)
+        (0.85, 6, 0.2, False, "SLACK"),
+        (1.0, 6, 0.4, False, "DEVIATION"),
+        (1.0, 4, 0.0, False, "SPT"),           # sigma 0: viele gleichzeitige Ereignisse
+        (0.85, 4, 0.3, True, "EDD"),
+        (1.0, 8, 0.1, False, "MWKR"),
+    ]
+
+    all_identical = True
+    for max_util, shifts, sigma, with_earliest_start, priority_rule in cases:
+        jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
+            source_name=source_name,
+            max_bottleneck_utilization=Decimal(f"{max_util}"),
+            arrival_limit=shift_length * (shifts + 1)
+        )
+        simpy_signatures, simpy_time = run_rolling_horizon(
+            "simpy", jobs, shifts, shift_length, sigma, with_earliest_start, priority_rule)
+        replay_signatures, replay_time = run_rolling_horizon(
+            "replay", jobs, shifts, shift_length, sigma, with_earliest_start, priority_rule)
+
+        identical = simpy_signatures == replay_signatures
+        all_identical &= identical
+        print(f"util {max_util:4} | shifts {shifts} | sigma {sigma:3} | earliest_start {with_earliest_start!s:5} | "
+              f"{priority_rule:9} | identical: {identical} | "
+              f"SimPy {simpy_time:6.3f} s | Replay {replay_time:6.3f} s | speedup {simpy_time / replay_time:5.1f}x")
+
+    if not all_identical:
+        raise SystemExit("Replay engine differs from SimPy engine")
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import time
+from decimal import Decimal
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.Query import JobQuery, ExperimentQuery
+from src.domain.orm_models import ScheduleJob, ScheduleOperation, SimulationJob, SimulationOperation
+from src.domain.orm_setup import SessionLocal, mapper_registry, _set_sqlite_pragmas
+
+
+def save_schedule_jobs_orm(experiment_id: int, shift_number: int, live_jobs):
+    # bisheriger Weg: ORM-Objekte + session.add_all (Unit of Work)
+    objects = []
+    for lj in live_jobs:
+        objects.append(ScheduleJob(id=lj.id, experiment_id=experiment_id, shift_number=shift_number))
+        for op in lj.operations:
+            objects.append(ScheduleOperation(
+                job_id=lj.id, experiment_id=experiment_id, shift_number=shift_number,
+                position_number=op.position_number, start=op.start, end=op.end
+            ))
+    with SessionLocal() as session:
+        session.add_all(objects)
+        session.commit()
+    return len(objects)
+
+
+def save_simulation_jobs_orm(experiment_id: int, live_jobs):
+    objects = []
+    for lj in live_jobs:
+        objects.append(SimulationJob(id=lj.id, experiment_id=experiment_id))
+        for op in lj.operations:
+            objects.append(SimulationOperation(
+                job_id=lj.id, experiment_id=experiment_id, position_number=op.position_number,
+                start=op.start, duration=op.duration, end=op.end
+            ))
+    with SessionLocal() as session:
+        session.add_all(objects)
+        session.commit()
+    return len(objects)
+
+
+def count_rows(model) -> int:
+    with SessionLocal() as session:
+        return session.query(model).count()
+
+
+if __name__ == '__main__':
+    source_name = "Fisher and Thompson 10x10"
+    shifts = 60
+
+    jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
+        source_name=source_name,
+        max_bottleneck_utilization=Decimal("1.0"),
+        arrival_limit=60 * 24 * shifts
+    )
+    jobs_collection = LiveJobCollection(jobs)
+    for job in jobs_collection.values():
+        for op in job.operations:
+            op.start, op.end = 0, op.duration
+
+    # Benchmark in einer temporären Datenbank (SessionLocal wird umgebunden)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'benchmark.db')}")
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        mapper_registry.metadata.create_all(engine)
+        SessionLocal.configure(bind=engine)
+
+        print(f"Jobs: {len(jobs_collection)}, operations: {jobs_collection.count_operations()}")
+        for experiment_offset in [0, 100]:
+            experiment_id = experiment_offset + 1
+            cases = [
+                ("Schedule   (ORM add_all)", lambda: save_schedule_jobs_orm(experiment_id, 1, jobs_collection.values())),
+                ("Schedule   (core insert)", lambda: ExperimentQuery.save_schedule_jobs(
+                    experiment_id + 1, 1, jobs_collection.values())),
+                ("Simulation (ORM add_all)", lambda: save_simulation_jobs_orm(experiment_id, jobs_collection.values())),
+                ("Simulation (core insert)", lambda: ExperimentQuery.save_simulation_jobs(
+                    experiment_id + 1, jobs_collection.values())),
+            ]
+            for name, save in cases:
+                start = time.perf_counter()
+                rows = save()
+                elapsed = time.perf_counter() - start
+                print(f"{name}: {rows:>7} rows in {elapsed:6.3f} s ({rows / elapsed:10,.0f} rows/s)")
+
+        # Streaming je Schicht mit bereits vorhandenen Zeilen (Resume): keine IntegrityError, keine Duplikate
+        operations_before = count_rows(SimulationOperation)
+        start = time.perf_counter()
+        rows = 0
+        job_list = list(jobs_collection.values())
+        chunk = max(1, len(job_list) // shifts)
+        for i in range(0, len(job_list), chunk):
+            rows += ExperimentQuery.save_simulation_jobs(102, job_list[i:i + chunk], ignore_existing=True)
+        elapsed = time.perf_counter() - start
+        print(f"Streaming per shift (existing rows ignored): {rows:>7} rows in {elapsed:6.3f} s "
+              f"({rows / elapsed:10,.0f} rows/s) | duplicates: {count_rows(SimulationOperation) - operations_before}")
+
+        # Schedule + Simulation einer Schicht in einer Transaktion (CP_Experiment_Runner, Resume)
+        for shift_number, i in enumerate(range(0, len(job_list), chunk), start=1):
+            ExperimentQuery.save_shift_jobs(103, shift_number, job_list[i:i + chunk], job_list[i:i + chunk])
+        counts = (count_rows(ScheduleOperation), count_rows(SimulationOperation))
+        # fortgesetzte Schicht: Schedule bereits gespeichert -> vorhandene Simulationszeilen übersprungen
+        ExperimentQuery.save_shift_jobs(103, 1, None, job_list[:chunk])
+        assert (count_rows(ScheduleOperation), count_rows(SimulationOperation)) == counts
+        # fehlschlagende Transaktion (Schedule der Schicht doppelt) -> auch ihre Simulationszeilen nicht gespeichert
+        try:
+            ExperimentQuery.save_shift_jobs(103, 1, job_list[:chunk], job_list[-chunk:])
+            raise SystemExit("save_shift_jobs: duplicate schedule was not rejected")
+        except IntegrityError:
+            pass
+        assert (count_rows(ScheduleOperation), count_rows(SimulationOperation)) == counts
+        print(f"Schedule + simulation per shift in one transaction: {counts[1] - operations_before} "
+              f"simulation operations, resume and rollback consistent")
+        engine.dispose()
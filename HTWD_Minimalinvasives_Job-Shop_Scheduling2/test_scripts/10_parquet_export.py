@@ -0,0 +1,69 @@
+import tempfile
+import time
+
+import pandas as pd
+
+from src.analyses.parquet_store import export_experiments_to_parquet, scan_schedule_operations, \
+    scan_simulation_operations, read_experiments
+from src.analyses.schedule_jobs_dataframe import jobs_metrics_from_operations_df
+from src.domain.Query import ExperimentAnalysisQuery
+
+def schedule_operations_dataframe_from_orm() -> pd.DataFrame:
+    # bisheriger Weg: ORM-Graph (joinedload) -> Python-Schleife -> DataFrame
+    records = []
+    for sj in ExperimentAnalysisQuery.get_schedule_jobs():
+        for op in sj.operations:
+            route_op = sj.job.routing.get_operation_by_position(op.position_number)
+            records.append({
+                "Job": sj.id, "Routing_ID": sj.job.routing_id, "Experiment_ID": sj.experiment_id,
+                "Arrival": sj.job.arrival, "Ready Time": sj.job.earliest_start, "Due Date": sj.job.due_date,
+                "Shift": sj.shift_number, "Operation": op.position_number, "Machine": route_op.machine_name,
+                "Original Duration": route_op.duration, "Start": op.start, "End": op.end,
+            })
+    return pd.DataFrame.from_records(records)
+
+
+if __name__ == '__main__':
+    sort_columns = ["Experiment_ID", "Shift", "Job", "Operation"]
+
+    start = time.perf_counter()
+    df_orm = schedule_operations_dataframe_from_orm()
+    orm_time = time.perf_counter() - start
+    df_orm = df_orm.sort_values(sort_columns, ignore_index=True)
+
+    start = time.perf_counter()
+    df_sql = ExperimentAnalysisQuery.get_schedule_jobs_operations_dataframe()
+    sql_time = time.perf_counter() - start
+    df_sql = df_sql[df_orm.columns].sort_values(sort_columns, ignore_index=True)
+    pd.testing.assert_frame_equal(df_orm, df_sql, check_dtype=False)
+
+    with tempfile.TemporaryDirectory() as root:
+        start = time.perf_counter()
+        row_counts = export_experiments_to_parquet(root)
+        export_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        df_parquet = scan_schedule_operations(root)
+        scan_time = time.perf_counter() - start
+
+        print(f"Exported rows: {row_counts}")
+        print(f"ORM DataFrame:        {orm_time:7.3f} s ({len(df_orm)} rows)")
+        print(f"SQL DataFrame:        {sql_time:7.3f} s (get_schedule_jobs_operations_dataframe)")
+        print(f"SQL -> Arrow/Parquet: {export_time:7.3f} s (all datasets)")
+        print(f"Parquet scan:         {scan_time:7.3f} s ({len(df_parquet)} rows)")
+
+        df_parquet = df_parquet[df_orm.columns].sort_values(sort_columns, ignore_index=True)
+        pd.testing.assert_frame_equal(df_orm, df_parquet, check_dtype=False)
+        print("Schedule operations identical (ORM, SQL and Parquet)")
+
+        # Spaltenauswahl und Partitionsfilter
+        experiment_id = int(read_experiments(root, columns=["Experiment_ID"])["Experiment_ID"].iloc[-1])
+        columns = ["Job", "Routing_ID", "Experiment_ID", "Shift", "Arrival", "Due Date", "Operation", "End"]
+        start = time.perf_counter()
+        df_subset = scan_schedule_operations(root, columns=columns, experiment_ids=[experiment_id])
+        print(f"Experiment {experiment_id}, {len(columns)} columns: {len(df_subset)} rows "
+              f"in {time.perf_counter() - start:.3f} s")
+        print(jobs_metrics_from_operations_df(df_subset).head())
+
+        df_simulation = scan_simulation_operations(root, columns=["Job", "Experiment_ID", "Operation", "End"])
+        print(f"Simulation operations: {len(df_simulation)} rows")
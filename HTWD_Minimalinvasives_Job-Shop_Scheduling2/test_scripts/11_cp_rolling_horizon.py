@@ -0,0 +1,78 @@
+import time
+from decimal import Decimal
+
+from src.Logger import Logger
+from src.domain.Collection import LiveJobCollection
+from src.domain.Query import JobQuery
+from src.solvers.CP_RollingHorizonSolver import RollingHorizonSolver, evaluate_lateness_deviation_objective
+from src.solvers.CP_Solver import Solver
+from src.solvers.heuristics.GT_EventScheduler import EventScheduler
+
+
+def check_schedule(schedule: LiveJobCollection, jobs_collection: LiveJobCollection):
+    # alle Operationen geplant, keine Überlappung je Maschine, Reihenfolge im Job
+    assert schedule.count_operations() == jobs_collection.count_operations()
+    by_machine = {}
+    for job in schedule.values():
+        previous_end = None
+        for operation in job.operations:
+            assert previous_end is None or operation.start >= previous_end
+            previous_end = operation.end
+            by_machine.setdefault(operation.machine_name, []).append((operation.start, operation.end))
+    for intervals in by_machine.values():
+        intervals.sort()
+        for (_, end), (start, _) in zip(intervals, intervals[1:]):
+            assert start >= end
+
+
+if __name__ == '__main__':
+    max_util = 1.0
+    source_name = "Fisher and Thompson 10x10"
+    logger = Logger(name="cp_rolling_horizon")
+    schedule_start = 1440
+    time_limit = 30        # monolithisch und Summe über alle Fenster
+    w_t, w_e, w_dev = 10, 2, 1
+
+    for shifts in [4, 8]:
+        jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
+            source_name=source_name,
+            max_bottleneck_utilization=Decimal(f"{max_util}"),
+            arrival_limit=60 * 24 * shifts
+        )
+
+        # Vorheriger Schedule (GT) als Referenz für die Startabweichung
+        previous_collection = LiveJobCollection(jobs)
+        previous_schedule = EventScheduler(previous_collection, schedule_start=0).get_schedule("EDD")
+
+        results = []
+        for window_size, overlap in [(None, None), (1440, 0), (2 * 1440, 0), (2 * 1440, 720)]:
+            jobs_collection = LiveJobCollection(jobs)
+            start = time.perf_counter()
+            if window_size is None:
+                solver = Solver(jobs_collection=jobs_collection, logger=logger, schedule_start=schedule_start)
+            else:
+                solver = RollingHorizonSolver(
+                    jobs_collection=jobs_collection, logger=logger, schedule_start=schedule_start,
+                    window_size=window_size, overlap=overlap
+                )
+            solver.build_model__absolute_lateness__start_deviation__minimization(
+                previous_schedule_jobs_collection=previous_schedule, w_t=w_t, w_e=w_e, w_dev=w_dev
+            )
+            solver.solve_model(time_limit=time_limit, gap_limit=0.002, bound_no_improvement_time=None)
+            wall_time = time.perf_counter() - start
+
+            schedule = solver.get_schedule()
+            check_schedule(schedule, jobs_collection)
+            objective = sum(evaluate_lateness_deviation_objective(schedule, previous_schedule, w_t, w_e, w_dev).values())
+            info = solver.get_solver_info()
+            results.append((window_size, overlap, objective, wall_time, info))
+
+        _, _, mono_objective, mono_time, mono_info = results[0]
+        print(f"Shifts {shifts} | operations {jobs_collection.count_operations()}")
+        for window_size, overlap, objective, wall_time, info in results:
+            name = "monolithic" if window_size is None else f"window {window_size:>4}, overlap {overlap:>3}"
+            print(
+                f"  {name:26} | {info['status']:8} | objective {objective:>9} "
+                f"({objective / max(mono_objective, 1):5.2f}x) | {wall_time:6.1f} s "
+                f"({wall_time / mono_time:4.2f}x) | windows {info.get('number_of_windows', 1)}"
+            )
@@ -0,0 +1,51 @@
+import time
+from decimal import Decimal
+
+from src.Logger import Logger
+from src.domain.Collection import LiveJobCollection
+from src.domain.Query import JobQuery
+from src.solvers.CP_Solver import Solver
+from src.solvers.heuristics.GT_EventScheduler import EventScheduler
+
+
+if __name__ == '__main__':
+    max_util = 1.0
+    source_name = "Fisher and Thompson 10x10"
+    logger = Logger(name="cp_tight_domains")
+    schedule_start = 1440
+    time_limit = 30
+    w_t, w_e, w_dev = 10, 2, 1
+
+    for shifts in [2, 4, 8]:
+        jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
+            source_name=source_name,
+            max_bottleneck_utilization=Decimal(f"{max_util}"),
+            arrival_limit=60 * 24 * shifts
+        )
+        previous_schedule = EventScheduler(LiveJobCollection(jobs), schedule_start=0).get_schedule("EDD")
+
+        print(f"Shifts {shifts} | operations {previous_schedule.count_operations()}")
+        # globale Domänen [earliest_start, horizon] vs. Head/Tail-Domänen (ohne und mit Tardiness-Cap)
+        for name, tight_domains, max_tardiness in [
+            ("global horizon", False, None), ("tight", True, None), ("tight, cap 2880", True, 2 * 1440)
+        ]:
+            solver = Solver(
+                jobs_collection=LiveJobCollection(jobs), logger=logger, schedule_start=schedule_start,
+                tight_domains=tight_domains, max_tardiness=max_tardiness
+            )
+            start = time.perf_counter()
+            solver.build_model__absolute_lateness__start_deviation__minimization(
+                previous_schedule_jobs_collection=previous_schedule, w_t=w_t, w_e=w_e, w_dev=w_dev
+            )
+            build_time = time.perf_counter() - start
+            solver.solve_model(time_limit=time_limit, gap_limit=0.002, bound_no_improvement_time=None)
+
+            model_info = solver.get_model_info()
+            info = solver.get_solver_info()
+            print(
+                f"  {name:16} | avg. start domain {model_info['average_start_domain_size']:>8} "
+                f"({model_info['start_domain_size_reduction']:>6} smaller) | build {build_time:5.2f} s | "
+                f"{info['status']:8} | objective {info['objective_value']:>9.0f} | "
+                f"bound {info['best_objective_bound']:>9.0f} | first solution {info['time_to_first_solution']:5.2f} s | "
+                f"{info['wall_time']:5.1f} s"
+            )
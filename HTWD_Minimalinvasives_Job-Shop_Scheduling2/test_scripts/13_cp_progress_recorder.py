@@ -0,0 +1,71 @@
+import os
+import tempfile
+import time
+from decimal import Decimal
+
+from sqlalchemy import create_engine, event
+
+from src.Logger import Logger
+from src.SolverAnalyses import ConvergenceAnalysis
+from src.domain.Collection import LiveJobCollection
+from src.domain.Query import JobQuery, ExperimentQuery
+from src.domain.orm_setup import SessionLocal, mapper_registry, _set_sqlite_pragmas
+from src.solvers.CP_Solver import Solver
+from src.solvers.heuristics.GT_EventScheduler import EventScheduler
+
+
+if __name__ == '__main__':
+    max_util = 1.0
+    source_name = "Fisher and Thompson 10x10"
+    logger = Logger(name="cp_progress_recorder")
+    shifts = 4
+    time_limit = 20
+
+    jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
+        source_name=source_name,
+        max_bottleneck_utilization=Decimal(f"{max_util}"),
+        arrival_limit=60 * 24 * shifts
+    )
+    previous_schedule = EventScheduler(LiveJobCollection(jobs), schedule_start=0).get_schedule("EDD")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Solve mit Log-Datei (bisherige Auswertung) und ProgressRecorder
+        solver = Solver(jobs_collection=LiveJobCollection(jobs), logger=logger, schedule_start=1440)
+        solver.build_model__absolute_lateness__start_deviation__minimization(
+            previous_schedule_jobs_collection=previous_schedule, w_t=10, w_e=2, w_dev=1
+        )
+        log_file = os.path.join(tmp_dir, "Shift_01.log")
+        solver.solve_model(time_limit=time_limit, gap_limit=0.002, bound_no_improvement_time=None, log_file=log_file)
+        info = solver.get_solver_info()
+        points = solver.progress_recorder.get_points()
+
+        df_log = ConvergenceAnalysis.parse_cp_sat_bound_log_to_dataframe(log_file)
+        solutions = [p for p in points if p.objective is not None]
+        last = points[-1]
+        print(f"Solver: {info['status']}, objective {info['objective_value']:.0f}, bound {info['best_objective_bound']:.0f}")
+        with open(log_file) as file:
+            log_lines = file.readlines()
+        last_log_best = df_log["BestSol"].iloc[-1] if len(df_log) else None
+        print(f"Log file: {len(log_lines)} lines, {len(df_log)} #Bound rows with solution (last best {last_log_best})")
+        print(f"ProgressRecorder: {len(points)} points ({solver.progress_recorder.number_of_solutions} solutions), "
+              f"last objective {last.objective:.0f}, bound {last.best_bound:.0f}, "
+              f"costs {last.tardiness_cost} + {last.earliness_cost} + {last.deviation_cost}")
+        assert last.objective == info["objective_value"]
+        assert last.tardiness_cost + last.earliness_cost + last.deviation_cost == last.objective
+        assert all(p.wall_time <= q.wall_time + 0.05 for p, q in zip(points, points[1:]))
+
+        # Persistenz in temporärer Datenbank (SessionLocal wird umgebunden)
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'progress.db')}")
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        mapper_registry.metadata.create_all(engine)
+        SessionLocal.configure(bind=engine)
+
+        start = time.perf_counter()
+        rows = ExperimentQuery.save_solver_progress(experiment_id=1, shift_number=1, progress_points=points)
+        rows = ExperimentQuery.save_solver_progress(experiment_id=1, shift_number=1, progress_points=points)
+        save_time = time.perf_counter() - start
+        df_progress = ConvergenceAnalysis.get_progress_dataframe(experiment_id=1, shift_number=1)
+        print(f"Saved {rows} rows twice in {save_time:.3f} s -> {len(df_progress)} rows with solution in the table")
+        print(df_progress.tail(5).to_string(index=False))
+        assert df_progress["BestSol"].iloc[-1] == info["objective_value"]
+        engine.dispose()
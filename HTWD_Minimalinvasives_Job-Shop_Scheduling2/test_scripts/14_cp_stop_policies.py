@@ -0,0 +1,69 @@
+import time
+from decimal import Decimal
+
+from src.Logger import Logger
+from src.domain.Collection import LiveJobCollection
+from src.domain.Query import JobQuery
+from src.solvers.CP_Solver import Solver
+from src.solvers.CP_StopPolicies import GapStopPolicy, PrimalStagnationStopPolicy, CombinedStagnationStopPolicy, \
+    TimeBudgetAllocator
+from src.solvers.heuristics.GT_EventScheduler import EventScheduler
+
+
+def build_solver(shifts: int, logger: Logger) -> Solver:
+    jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
+        source_name="Fisher and Thompson 10x10",
+        max_bottleneck_utilization=Decimal("1.0"),
+        arrival_limit=60 * 24 * shifts
+    )
+    previous_schedule = EventScheduler(LiveJobCollection(jobs), schedule_start=0).get_schedule("EDD")
+    solver = Solver(jobs_collection=LiveJobCollection(jobs), logger=logger, schedule_start=1440)
+    solver.build_model__absolute_lateness__start_deviation__minimization(
+        previous_schedule_jobs_collection=previous_schedule, w_t=10, w_e=2, w_dev=1
+    )
+    return solver
+
+
+if __name__ == '__main__':
+    logger = Logger(name="cp_stop_policies")
+    time_limit = 30
+    model_sizes = [1, 2, 4, 8]     # Schichten im Backlog (leichte bis schwere Modelle)
+    run_variants = True
+
+    # feste BoundGuard-Schwellen vs. Stop-Policies (die Policy-Objekte werden für alle Modelle wiederverwendet)
+    variants = [
+        ("BoundGuard 10s", dict(bound_no_improvement_time=10, bound_warmup_time=5)),
+        ("gap 1% | primal stagnation", dict(stop_policies=[
+            GapStopPolicy(relative_gap=0.01), PrimalStagnationStopPolicy(min_seconds=3, factor=1.0)
+        ])),
+        ("gap 1% | bound + incumbent", dict(stop_policies=[
+            GapStopPolicy(relative_gap=0.01), CombinedStagnationStopPolicy(min_seconds=3, factor=1.0)
+        ])),
+    ]
+    for shifts in model_sizes if run_variants else []:
+        print(f"Shifts {shifts}")
+        for name, kwargs in variants:
+            solver = build_solver(shifts, logger)
+            solver.solve_model(time_limit=time_limit, gap_limit=0.0, **kwargs)
+            info = solver.get_solver_info()
+            print(f"  {name:28} | {info['wall_time']:5.1f} s | objective {info['objective_value']:>9.0f} | "
+                  f"bound {info['best_objective_bound']:>9.0f} | stopped by {info.get('stop_policy', '-')}")
+
+    # Gesamtbudget: gleiche Aufteilung ohne Early Stop vs. Allocator mit Stop-Policies
+    total_budget = time_limit * len(model_sizes)
+    policies = [GapStopPolicy(relative_gap=0.01), CombinedStagnationStopPolicy(min_seconds=10, factor=2.0)]
+    for name, use_policies in [("equal split", False), ("allocator + policies", True)]:
+        allocator = TimeBudgetAllocator(total_budget=total_budget, number_of_shifts=len(model_sizes))
+        results = []
+        for shifts in model_sizes:
+            shift_time_limit = allocator.next_time_limit()
+            shift_started = time.perf_counter()   # wie CP_Experiment_Runner: Modellaufbau + Lösen
+            solver = build_solver(shifts, logger)
+            solver.solve_model(time_limit=shift_time_limit, gap_limit=0.0, bound_no_improvement_time=None,
+                               stop_policies=policies if use_policies else None)
+            used_time = time.perf_counter() - shift_started
+            allocator.register(used_time)
+            info = solver.get_solver_info()
+            results.append(f"{shifts}: {info['objective_value']:.0f} ({shift_time_limit:.0f}s limit, "
+                           f"{used_time:.0f}s used)")
+        print(f"Budget {total_budget}s, {name:20} | " + " | ".join(results))
@@ -0,0 +1,91 @@
+import contextlib
+import io
+import time
+from collections import Counter
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from src.DataFrameAnalyses import DataFrameChecker
+from src.analyses.schedule_validation import validate_experiments
+from src.domain.Collection import LiveJobCollection
+from src.domain.Query import JobQuery
+from src.solvers.heuristics.GT_EventScheduler import EventScheduler
+
+
+def machine_conflicts_loop(df: pd.DataFrame) -> set:
+    # bisherige Implementierung (Maschine für Maschine mit .iloc), nur die später startende Operation
+    df = df.sort_values(["Machine", "Start"]).reset_index()
+    conflicts = set()
+    for machine in df["Machine"].unique():
+        machine_df = df[df["Machine"] == machine].sort_values("Start")
+        for i in range(1, len(machine_df)):
+            prev, curr = machine_df.iloc[i - 1], machine_df.iloc[i]
+            if curr["Start"] < prev["End"]:
+                conflicts.add((curr["Machine"], curr["Job"], curr["Operation"]))
+    return conflicts
+
+
+def job_order_violations_loop(df: pd.DataFrame) -> set:
+    # bisherige Implementierung (groupby + iterrows)
+    violations = set()
+    for job, grp in df.groupby("Job"):
+        previous_end = -1
+        for _, row in grp.sort_values("Operation").iterrows():
+            if row["Start"] < previous_end:
+                violations.add((job, row["Operation"]))
+            previous_end = row["End"]
+    return violations
+
+
+if __name__ == '__main__':
+    shifts = 60
+    jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
+        source_name="Fisher and Thompson 10x10",
+        max_bottleneck_utilization=Decimal("1.0"),
+        arrival_limit=60 * 24 * shifts
+    )
+    schedule = EventScheduler(LiveJobCollection(jobs), schedule_start=0).get_schedule("EDD")
+    df = schedule.to_operations_dataframe()
+
+    # Verletzungen einstreuen: 1 % der Operationen 30 min früher
+    rng = np.random.default_rng(42)
+    shifted = rng.choice(len(df), size=len(df) // 100, replace=False)
+    df.loc[shifted, "Start"] -= 30
+    df.loc[shifted, "End"] -= 30
+
+    print(f"Operations: {len(df)}, shifted: {len(shifted)}")
+    start = time.perf_counter()
+    old_machine = machine_conflicts_loop(df)
+    old_job = job_order_violations_loop(df)
+    old_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    violations = DataFrameChecker.get_schedule_violations(df)
+    new_time = time.perf_counter() - start
+
+    new_machine = set(violations.loc[violations["Check"] == "machine conflict", ["Machine", "Job", "Operation"]].itertuples(index=False, name=None))
+    new_job = set(violations.loc[violations["Check"] == "job order", ["Job", "Operation"]].itertuples(index=False, name=None))
+    print(violations.groupby("Check").size().to_string())
+    # gleiche Starts: welche der beiden Operationen gemeldet wird, hängt von der Sortierung ab -> je Maschine zählen
+    per_machine = lambda conflicts: Counter(machine for machine, _, _ in conflicts)
+    print(f"Machine conflicts: loop {len(old_machine)}, vectorized {len(new_machine)} "
+          f"(equal per machine: {per_machine(old_machine) == per_machine(new_machine)})")
+    print(f"Job order:         loop {len(old_job)}, vectorized {len(new_job)} (equal: {old_job == new_job})")
+    print(f"Loop checks: {old_time:7.3f} s | vectorized: {new_time:7.3f} s ({old_time / new_time:,.0f}x)")
+    assert per_machine(old_machine) == per_machine(new_machine) and old_job == new_job
+
+    # Gültiger Schedule: keine Verletzungen, check_core_schedule_constraints() weiterhin True
+    df_valid = schedule.to_operations_dataframe()
+    assert DataFrameChecker.get_schedule_violations(df_valid).empty
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert DataFrameChecker.check_core_schedule_constraints(df_valid)
+        assert not DataFrameChecker.check_core_schedule_constraints(df)
+
+    # Alle Schedules und Simulationen der Datenbank in einem Durchlauf
+    start = time.perf_counter()
+    df_db = validate_experiments()
+    print(f"Database: {len(df_db)} violations in {time.perf_counter() - start:.2f} s")
+    if not df_db.empty:
+        print(df_db.groupby(["Source", "Check"]).size().to_string())
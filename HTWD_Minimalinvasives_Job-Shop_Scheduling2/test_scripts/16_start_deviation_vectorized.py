@@ -0,0 +1,79 @@
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.analyses.parquet_store import export_experiments_to_parquet
+from src.analyses.schedule_jobs_dataframe import _calculate_start_deviation_per_shift_df, \
+    start_deviation_per_shift_from_parquet
+from src.domain.Query import ExperimentAnalysisQuery
+
+
+def start_deviation_merge_loop(df_ops: pd.DataFrame, method: str = "mean") -> pd.DataFrame:
+    # bisherige Implementierung als Referenz: ein merge je (Schicht, Experiment)
+    shifts = sorted(df_ops["Shift"].unique())
+    experiments = sorted(df_ops["Experiment_ID"].unique())
+    columns = ["Experiment_ID", "Job", "Operation", "Start"]
+    rows = []
+    for s_prev, s_curr in zip(shifts, shifts[1:]):
+        for exp in experiments:
+            df_prev = df_ops.loc[(df_ops["Shift"] == s_prev) & (df_ops["Experiment_ID"] == exp), columns]
+            df_curr = df_ops.loc[(df_ops["Shift"] == s_curr) & (df_ops["Experiment_ID"] == exp), columns]
+            merged = pd.merge(df_curr.rename(columns={"Start": "Start_new"}),
+                              df_prev.rename(columns={"Start": "Start_orig"}),
+                              on=["Experiment_ID", "Job", "Operation"], how="inner")
+            if merged.empty:
+                rows.append({"Experiment_ID": exp, "Shift": s_curr, "Deviation": 0.0, "Pairs": 0})
+                continue
+            deviation = (merged["Start_new"] - merged["Start_orig"]).abs()
+            dev = deviation.sum() if method == "sum" else deviation.mean()
+            rows.append({"Experiment_ID": exp, "Shift": s_curr, "Deviation": float(dev), "Pairs": len(merged)})
+    return pd.DataFrame(rows).sort_values(["Experiment_ID", "Shift"], ignore_index=True)
+
+
+def synthetic_operations(experiments: int, shifts: int, jobs: int, operations: int, seed: int = 0) -> pd.DataFrame:
+    # Jobs bleiben einige Schichten im Schedule, Startzeiten verschieben sich zufällig
+    rng = np.random.default_rng(seed)
+    frames = []
+    for shift in range(1, shifts + 1):
+        job_ids = np.arange(shift * 5, shift * 5 + jobs)
+        df = pd.DataFrame({
+            "Job": np.repeat([f"J{j}" for j in job_ids], operations),
+            "Operation": np.tile(np.arange(operations), jobs),
+        })
+        df["Shift"] = shift
+        frames.append(df)
+    df_shifts = pd.concat(frames, ignore_index=True)
+    df_ops = pd.concat([df_shifts.assign(Experiment_ID=e) for e in range(1, experiments + 1)], ignore_index=True)
+    df_ops["Start"] = rng.integers(0, 20_000, size=len(df_ops))
+    return df_ops
+
+
+if __name__ == '__main__':
+    df_db = ExperimentAnalysisQuery.get_schedule_jobs_operations_dataframe()
+    df_synthetic = synthetic_operations(experiments=40, shifts=20, jobs=30, operations=10)
+
+    for name, df_ops in [("database", df_db), ("synthetic 40 experiments x 20 shifts", df_synthetic)]:
+        for method in ["mean", "sum"]:
+            start = time.perf_counter()
+            df_loop = start_deviation_merge_loop(df_ops, method=method)
+            loop_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            df_vectorized = _calculate_start_deviation_per_shift_df(df_ops, method=method)
+            vectorized_time = time.perf_counter() - start
+
+            pd.testing.assert_frame_equal(df_loop, df_vectorized, check_dtype=False)
+            print(f"{name:38} | {method:4} | {len(df_ops):>7} rows | merge loop {loop_time:7.3f} s | "
+                  f"vectorized {vectorized_time:6.3f} s ({loop_time / vectorized_time:5.1f}x) | identical")
+
+    with tempfile.TemporaryDirectory() as root:
+        export_experiments_to_parquet(root)
+        start = time.perf_counter()
+        df_stream = start_deviation_per_shift_from_parquet(root)
+        stream_time = time.perf_counter() - start
+        pd.testing.assert_frame_equal(
+            _calculate_start_deviation_per_shift_df(df_db), df_stream, check_dtype=False
+        )
+        print(f"Parquet streaming (shift by shift)     | mean | {stream_time:6.3f} s | identical")
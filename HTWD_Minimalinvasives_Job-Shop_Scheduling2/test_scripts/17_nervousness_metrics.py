@@ -0,0 +1,108 @@
+import time
+from statistics import mean
+
+import editdistance
+import numpy as np
+import pandas as pd
+from scipy.stats import kendalltau
+
+from src.analyses.nervousness_metrics import get_nervousness_metrics, count_inversions, levenshtein_to_identity
+from src.domain.Query import ExperimentAnalysisQuery
+from src.utils.analysis.compare_sequences import _get_machines_and_sequences_dicts
+
+
+def reference_pair_metrics(df_prev: pd.DataFrame, df_new: pd.DataFrame, t1: float) -> dict:
+    # bisheriger Weg: Listen je Maschine, scipy.stats.kendalltau und editdistance je Maschine
+    machines, original_sequences, revised_sequences = _get_machines_and_sequences_dicts(df_prev, df_new, t1)
+    levenshtein, taus, changed, shared = 0, [], False, 0
+    for machine in machines:
+        orig, revised = original_sequences[machine], revised_sequences[machine]
+        levenshtein += editdistance.eval(orig, revised)
+        if len(orig) >= 2:
+            rank_original = {job: i for i, job in enumerate(orig)}
+            tau, _ = kendalltau(list(range(len(orig))), [rank_original[job] for job in revised])
+            taus.append(round(tau, 4))
+        else:
+            taus.append(1.0)
+        changed = changed or orig != revised
+        shared += len(orig)
+
+    # P_T wie in 00_raw/nervousness_comparator.compute_P_T
+    details = (
+        df_prev[["Job", "Operation", "Start"]].rename(columns={"Start": "Start_plan"})
+        .merge(df_new[["Job", "Operation", "Start"]].rename(columns={"Start": "Start_rev"}), on=["Job", "Operation"])
+        .query("Start_plan >= @t1")
+    )
+    horizon = max(df_prev["End"].max(), df_new["End"].max())
+    weight = details["Start_plan"].apply(lambda t: (np.log(horizon) - np.log(t)) / (np.log(horizon) - np.log(t1)))
+    p_t = float((weight * (details["Start_plan"] - details["Start_rev"]).abs()).sum())
+
+    return {"Shared Operations": shared, "Levenshtein": levenshtein,
+            "Kendall Tau": mean(taus) if taus else np.nan, "Changed": changed, "P_T": p_t}
+
+
+def reference_metrics(df_ops: pd.DataFrame, shift_length: int = 1440) -> pd.DataFrame:
+    shifts = sorted(df_ops["Shift"].unique())
+    rows = []
+    for experiment_id, df_experiment in df_ops.groupby("Experiment_ID"):
+        for s_prev, s_curr in zip(shifts, shifts[1:]):
+            df_prev = df_experiment[df_experiment["Shift"] == s_prev]
+            df_new = df_experiment[df_experiment["Shift"] == s_curr]
+            rows.append({"Experiment_ID": experiment_id, "Shift": s_curr,
+                         **reference_pair_metrics(df_prev, df_new, s_curr * shift_length)})
+    return pd.DataFrame(rows)
+
+
+def synthetic_operations(experiments: int, shifts: int, jobs: int, machines: int, seed: int = 0) -> pd.DataFrame:
+    # Jobs bleiben mehrere Schichten im Schedule, jede Operation auf einer anderen Maschine
+    rng = np.random.default_rng(seed)
+    frames = []
+    for experiment_id in range(1, experiments + 1):
+        for shift in range(1, shifts + 1):
+            job_ids = np.arange(shift * 10, shift * 10 + jobs)
+            routing = rng.permuted(np.tile(np.arange(machines), (jobs, 1)), axis=1)
+            # eindeutige Startzeiten (bei Gleichstand ist die Reihenfolge der alten Sortierung nicht definiert)
+            start = shift * 1440 - 2000 + rng.choice(22_000, size=(jobs, machines), replace=False)
+            frames.append(pd.DataFrame({
+                "Experiment_ID": experiment_id, "Shift": shift,
+                "Job": np.repeat([f"J{j}" for j in job_ids], machines),
+                "Operation": np.tile(np.arange(machines), jobs),
+                "Machine": [f"M{m}" for m in routing.ravel()],
+                "Start": start.ravel(), "End": start.ravel() + 30,
+            }))
+    return pd.concat(frames, ignore_index=True)
+
+
+if __name__ == '__main__':
+    # Bausteine gegen die direkte Berechnung
+    rng = np.random.default_rng(1)
+    lengths = rng.integers(0, 60, size=300)
+    ranks = np.concatenate([rng.permutation(n) for n in lengths])
+    group_ids = np.repeat(np.arange(len(lengths)), lengths)
+    inversions = count_inversions(ranks, group_ids, lengths)
+    distances = levenshtein_to_identity(ranks, lengths)
+    offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    for g, (offset, n) in enumerate(zip(offsets, lengths)):
+        r = ranks[offset:offset + n]
+        assert inversions[g] == sum(int(r[i] > r[j]) for i in range(n) for j in range(i + 1, n))
+        assert distances[g] == editdistance.eval(list(range(n)), r.tolist())
+    print("Inversion count and Levenshtein distance identical on 300 random permutations")
+
+    df_db = ExperimentAnalysisQuery.get_schedule_jobs_operations_dataframe()
+    df_synthetic = synthetic_operations(experiments=20, shifts=15, jobs=40, machines=10)
+
+    for name, df_ops in [("database", df_db), ("synthetic 20 experiments x 15 shifts", df_synthetic)]:
+        start = time.perf_counter()
+        df_reference = reference_metrics(df_ops)
+        reference_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        df_metrics = get_nervousness_metrics(df_ops)
+        metrics_time = time.perf_counter() - start
+
+        df_reference = df_reference.sort_values(["Experiment_ID", "Shift"], ignore_index=True)
+        pd.testing.assert_frame_equal(df_reference, df_metrics[df_reference.columns], check_dtype=False,
+                                      check_exact=False, rtol=1e-9)
+        print(f"{name:38} | {len(df_ops):>7} operations | {len(df_metrics):>4} shift pairs | "
+              f"loops {reference_time:7.3f} s | rank arrays {metrics_time:6.3f} s "
+              f"({reference_time / metrics_time:5.1f}x) | identical")
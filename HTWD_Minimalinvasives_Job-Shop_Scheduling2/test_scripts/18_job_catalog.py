@@ -0,0 +1,130 @@
+import sqlite3
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.JobCatalog import JobCatalog
+from src.domain.Query import JobQuery, MachineInstanceQuery
+from src.domain.orm_setup import SessionLocal
+
+
+def jobs_collection_from_orm(source_name: str, max_bottleneck_utilization: Decimal, arrival_limit: int):
+    # bisheriger Weg der Experiment-Runner: joinedload-Abfragen je Experiment + Schleife über alle Maschinen
+    jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(
+        source_name=source_name, max_bottleneck_utilization=max_bottleneck_utilization, arrival_limit=arrival_limit
+    )
+    jobs_collection = LiveJobCollection(jobs)
+    machines_instances = MachineInstanceQuery.get_by_source_name_and_max_bottleneck_utilization(
+        source_name=source_name, max_bottleneck_utilization=max_bottleneck_utilization
+    )
+    for machine_instance in machines_instances:
+        for job in jobs_collection.values():
+            for operation in job.operations:
+                if operation.machine_name == machine_instance.name:
+                    operation.transition_time = machine_instance.transition_time
+    return jobs_collection
+
+
+def job_values(collection: LiveJobCollection):
+    return {
+        job.id: (job.routing_id, job.arrival, job.due_date, job.max_bottleneck_utilization, job.earliest_start,
+                 [(op.position_number, op.machine_name, op.duration, op.transition_time, op.start, op.end)
+                  for op in job.operations])
+        for job in collection.values()
+    }
+
+
+if __name__ == '__main__':
+    source_name = "Fisher and Thompson 10x10"
+    utilizations = ["0.75", "0.80", "0.85", "0.90", "0.95", "1.00"]
+    experiments_per_utilization = 4
+    arrival_limit = 60 * 24 * 100
+
+    # Gleichheit der Collections
+    for util in utilizations:
+        orm_collection = jobs_collection_from_orm(source_name, Decimal(util), arrival_limit)
+        catalog_collection = JobCatalog.get(source_name, util).get_jobs_collection(arrival_limit=arrival_limit)
+        assert job_values(orm_collection) == job_values(catalog_collection)
+        assert list(orm_collection.keys()) == list(catalog_collection.keys())
+    print(f"Collections identical for {len(utilizations)} utilizations (jobs, operations, transition times, order)")
+
+    # Experiment-Raster: mehrere Experimente je Auslastung
+    JobCatalog.clear_cache()
+    start = time.perf_counter()
+    for util in utilizations:
+        for _ in range(experiments_per_utilization):
+            jobs_collection_from_orm(source_name, Decimal(util), arrival_limit)
+    orm_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for util in utilizations:
+        for _ in range(experiments_per_utilization):
+            JobCatalog.get(source_name, util).get_jobs_collection(arrival_limit=arrival_limit)
+    catalog_time = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        JobCatalog.clear_cache()
+        start = time.perf_counter()
+        for util in utilizations:
+            JobCatalog.get(source_name, util, snapshot_dir=snapshot_dir)
+        snapshot_write_time = time.perf_counter() - start
+
+        JobCatalog.clear_cache()  # neuer Prozess
+        start = time.perf_counter()
+        for util in utilizations:
+            JobCatalog.get(source_name, util, snapshot_dir=snapshot_dir)
+        snapshot_read_time = time.perf_counter() - start
+        snapshot_size = sum(path.stat().st_size for path in Path(snapshot_dir).iterdir())
+
+        JobCatalog.clear_cache()
+        start = time.perf_counter()
+        for util in utilizations:
+            JobCatalog.from_database(source_name, util)
+        database_time = time.perf_counter() - start
+
+    runs = len(utilizations) * experiments_per_utilization
+    print(f"Grid with {runs} experiments ({experiments_per_utilization} per utilization, arrival < {arrival_limit}):")
+    print(f"  ORM queries per experiment:   {orm_time:6.2f} s")
+    print(f"  JobCatalog (process cache):   {catalog_time:6.2f} s ({orm_time / catalog_time:4.1f}x)")
+    print(f"Catalogs of {len(utilizations)} utilizations: database {database_time:5.2f} s | "
+          f"database + snapshot {snapshot_write_time:5.2f} s | snapshot {snapshot_read_time:5.2f} s "
+          f"({snapshot_size / 1024:.0f} KiB)")
+
+    # Geänderte Daten -> neuer Content-Hash, Katalog wird neu geladen
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "copy.db")
+        source_db = SessionLocal.kw["bind"].url.database
+        with sqlite3.connect(source_db) as source, sqlite3.connect(db_path) as target:
+            source.backup(target)
+        catalog = JobCatalog.get(source_name, "0.85", db_path=db_path)
+        job_id = catalog.job_ids[0]
+        with sqlite3.connect(db_path) as connection:
+            connection.execute("UPDATE job SET due_date = due_date + 1 WHERE id = ?", (str(job_id),))
+        changed = JobCatalog.get(source_name, "0.85", db_path=db_path)
+        assert changed is not catalog and changed.content_hash != catalog.content_hash
+        assert changed.due_dates[0] == catalog.due_dates[0] + 1
+
+        # gleiche Summen, anderer Inhalt: Routings zweier Jobs getauscht, Namen zweier Maschinen getauscht
+        hashes = {changed.content_hash}
+        with sqlite3.connect(db_path) as connection:
+            (job_a, routing_a), (job_b, routing_b) = connection.execute(
+                "SELECT id, routing_id FROM job WHERE id IN (?, ?)", (str(catalog.job_ids[0]), str(catalog.job_ids[1]))
+            ).fetchall()
+            assert routing_a != routing_b
+            connection.execute("UPDATE job SET routing_id = ? WHERE id = ?", (routing_b, job_a))
+            connection.execute("UPDATE job SET routing_id = ? WHERE id = ?", (routing_a, job_b))
+        hashes.add(JobCatalog.get(source_name, "0.85", db_path=db_path).content_hash)
+        with sqlite3.connect(db_path) as connection:
+            (id_a, name_a), (id_b, name_b) = connection.execute(
+                "SELECT m.id, m.name FROM machine m JOIN routing_source rs ON rs.id = m.source_id "
+                "WHERE rs.name = ? ORDER BY m.id LIMIT 2", (source_name,)
+            ).fetchall()
+            connection.execute("UPDATE machine SET name = ? WHERE id = ?", (name_a + "_tmp", id_a))
+            connection.execute("UPDATE machine SET name = ? WHERE id = ?", (name_a, id_b))
+            connection.execute("UPDATE machine SET name = ? WHERE id = ?", (name_b, id_a))
+        hashes.add(JobCatalog.get(source_name, "0.85", db_path=db_path).content_hash)
+        assert len(hashes) == 3
+        JobCatalog.clear_cache()
+    print("Changed due date, swapped routings and swapped machine names -> new content hash, catalog reloaded")
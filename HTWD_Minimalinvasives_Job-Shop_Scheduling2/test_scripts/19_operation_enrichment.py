@@ -0,0 +1,61 @@
+import time
+from decimal import Decimal
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.JobCatalog import JobCatalog
+from src.domain.OperationEnrichment import enrich_operations_by_machine, machine_attributes_from_instances, \
+    set_sim_durations
+from src.domain.Query import JobQuery, MachineInstanceQuery
+from src.simulation.LognormalFactorGenerator import LognormalFactorGenerator
+
+
+def enrich_loops(jobs_collection: LiveJobCollection, machines_instances, sigma: float):
+    # bisheriger Weg: Maschinen x Jobs x Operationen, dann ein sample() je Operation
+    for machine_instance in machines_instances:
+        for job in jobs_collection.values():
+            for operation in job.operations:
+                if operation.machine_name == machine_instance.name:
+                    operation.transition_time = machine_instance.transition_time
+    factor_gen = LognormalFactorGenerator(sigma=sigma, seed=42)
+    for job in jobs_collection.values():
+        for operation in job.operations:
+            operation.sim_duration = int(operation.duration * factor_gen.sample())
+
+
+def enrich_stage(jobs_collection: LiveJobCollection, machines_instances, sigma: float):
+    enrich_operations_by_machine(jobs_collection, machine_attributes_from_instances(machines_instances))
+    set_sim_durations(jobs_collection, LognormalFactorGenerator(sigma=sigma, seed=42))
+
+
+def operation_values(jobs_collection: LiveJobCollection):
+    return [(op.job_id, op.position_number, op.transition_time, op.sim_duration)
+            for job in jobs_collection.values() for op in job.operations]
+
+
+if __name__ == '__main__':
+    source_name = "Fisher and Thompson 10x10"
+    util = Decimal("0.85")
+    jobs = JobQuery.get_by_source_name_max_util_and_lt_arrival(source_name, util, arrival_limit=60 * 24 * 400)
+    machines_instances = MachineInstanceQuery.get_by_source_name_and_max_bottleneck_utilization(source_name, util)
+
+    for sigma in [0.1, 0.3]:
+        results, times = [], []
+        for enrich in [enrich_loops, enrich_stage]:
+            jobs_collection = LiveJobCollection(jobs)
+            jobs_collection.sort_jobs_by_id()
+            jobs_collection.sort_operations()
+            start = time.perf_counter()
+            enrich(jobs_collection, machines_instances, sigma)
+            times.append(time.perf_counter() - start)
+            results.append(operation_values(jobs_collection))
+        assert results[0] == results[1]
+        print(f"sigma {sigma} | {len(results[0])} operations | loops {times[0]:6.3f} s | "
+              f"enrichment stage {times[1]:6.3f} s ({times[0] / times[1]:4.1f}x) | identical")
+
+    # Katalog (Übergangszeiten schon in den Vorlagen) + Simulationsdauern
+    catalog_collection = JobCatalog.get(source_name, util).get_jobs_collection(arrival_limit=60 * 24 * 400)
+    catalog_collection.sort_jobs_by_id()
+    catalog_collection.sort_operations()
+    set_sim_durations(catalog_collection, LognormalFactorGenerator(sigma=0.3, seed=42))
+    assert operation_values(catalog_collection) == results[1]
+    print("JobCatalog collection + set_sim_durations identical")
@@ -0,0 +1,90 @@
+import random
+import time
+
+import numpy as np
+
+from src.domain.JobCatalog import JobCatalog
+from src.simulation.LognormalFactorGenerator import LognormalFactorGenerator
+from src.simulation.MonteCarloSimulation import MonteCarloSimulation, draw_factor_matrix, draw_sim_durations
+from src.solvers.heuristics.GT_EventScheduler import EventScheduler
+
+
+def factors_by_operation(collection, sigma: float, seed: int, per_operation: bool):
+    sim_collection = draw_sim_durations(collection, sigma=sigma, seed=seed, per_operation=per_operation)
+    return {(op.job_id, op.position_number): op.sim_duration for job in sim_collection.values() for op in job.operations}
+
+
+if __name__ == '__main__':
+    source_name = "Fisher and Thompson 10x10"
+    shift_length = 1440
+    sigma = 0.2
+    catalog = JobCatalog.get(source_name, "0.85")
+
+    # 1) Unabhängig von Reihenfolge und weiteren Jobs
+    jobs_collection = catalog.get_jobs_collection(arrival_limit=shift_length * 10)
+    jobs = list(jobs_collection.values())
+    job_ids = [op.job_id for job in jobs for op in job.operations]
+    positions = [op.position_number for job in jobs for op in job.operations]
+    factor_gen = LognormalFactorGenerator(sigma=sigma, seed=7)
+    factors = factor_gen.sample_operations(job_ids, positions)
+
+    order = np.random.default_rng(0).permutation(len(job_ids))
+    shuffled = factor_gen.sample_operations([job_ids[i] for i in order], [positions[i] for i in order])
+    assert np.array_equal(shuffled, factors[order])
+    more_jobs = catalog.get_jobs_collection(arrival_limit=shift_length * 11)
+    more_factors = LognormalFactorGenerator(sigma=sigma, seed=7).sample_operations(
+        [op.job_id for job in more_jobs.values() for op in job.operations],
+        [op.position_number for job in more_jobs.values() for op in job.operations],
+    )
+    assert np.array_equal(more_factors[:len(factors)], factors)
+    print(f"Counter-based factors: order independent, {len(more_factors) - len(factors)} additional operations "
+          f"leave the {len(factors)} others unchanged")
+
+    sequential = factors_by_operation(jobs_collection, sigma, seed=7, per_operation=False)
+    fewer = factors_by_operation(catalog.get_jobs_collection(arrival_limit=shift_length * 10 - 720), sigma, 7, False)
+    changed = sum(sequential[key] != value for key, value in fewer.items())
+    print(f"random.Random stream for comparison: dropping the last jobs keeps {len(fewer) - changed} of {len(fewer)} "
+          f"sim durations (prefix), shuffling the job order changes the factors")
+
+    # 2) Verteilung: E[F] = 1, Standardabweichung von log(F) = sigma
+    large = LognormalFactorGenerator(sigma=sigma, seed=1).sample_operations(
+        [f"J{i // 10}" for i in range(1_000_000)], [i % 10 for i in range(1_000_000)]
+    )
+    print(f"1,000,000 factors: mean {large.mean():.4f} (1), std(log) {np.log(large).std():.4f} ({sigma})")
+    numpy_factors = LognormalFactorGenerator(sigma=sigma, seed=1, backend="numpy").sample_many(1_000_000)
+    print(f"numpy backend sample_many: mean {numpy_factors.mean():.4f}, std(log) {np.log(numpy_factors).std():.4f}")
+
+    # 3) Faktor-Matrix für viele Replikationen auf einmal
+    jobs_shift = catalog.get_jobs_collection(arrival_limit=shift_length * 2).get_subset_by_earliest_start(shift_length)
+    schedule = EventScheduler(jobs_collection=jobs_shift, schedule_start=shift_length).get_schedule(priority_rule="SLACK")
+    seeds = list(range(5000))
+
+    start = time.perf_counter()
+    keys, matrix = draw_factor_matrix(schedule, sigma=sigma, seeds=seeds)
+    matrix_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for seed in seeds:
+        rng = random.Random(seed)
+        [rng.lognormvariate(-0.5 * sigma ** 2, sigma) for _ in keys]
+    loop_time = time.perf_counter() - start
+    print(f"Factor matrix {matrix.shape[0]} replications x {matrix.shape[1]} operations: {matrix_time:6.3f} s "
+          f"| random.lognormvariate loop {loop_time:6.3f} s ({loop_time / matrix_time:5.1f}x)")
+
+    for seed in [0, 17, 4999]:
+        durations = factors_by_operation(schedule, sigma, seed=seed, per_operation=True)
+        row = {key: int(op_duration * factor) for key, factor, op_duration in
+               zip(keys, matrix[seed], [op.duration for job in schedule.values() for op in job.operations])}
+        assert durations == row
+    print("Matrix rows identical to draw_sim_durations(..., per_operation=True)")
+
+    # 4) Monte-Carlo mit zählerbasierten Faktoren: gleiche Ergebnisse mit 1 und mehreren Prozessen
+    results = []
+    for workers in [1, 4]:
+        monte_carlo = MonteCarloSimulation(
+            schedule_collection=schedule, start_time=shift_length, end_time=2 * shift_length,
+            sigma=sigma, max_workers=workers, per_operation_factors=True
+        )
+        results.append(monte_carlo.run(range(200)).to_dataframe())
+    assert results[0].equals(results[1])
+    print("Monte-Carlo (200 replications, per-operation factors): identical with 1 and 4 processes")
@@ -0,0 +1,121 @@
+import random
+import time
+
+from ortools.sat.python import cp_model
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.JobCatalog import JobCatalog
+from src.domain.orm_models import JobOperation, LiveJob
+from src.solvers.heuristics.BNB_Engine import BranchAndBoundEngine
+
+
+def random_jobs_collection(rng: random.Random, n_jobs: int, n_machines: int) -> LiveJobCollection:
+    collection = LiveJobCollection()
+    for j in range(n_jobs):
+        arrival = rng.choice([None, None, rng.randint(0, 1439)])  # earliest_start 0 oder 1440
+        job = LiveJob(id=f"J{j:02d}", routing_id=f"R{j:02d}", arrival=arrival, due_date=None)
+        job.operations = [
+            JobOperation(job=job, position_number=k, machine_name=f"M{m:02d}", duration=rng.randint(1, 20))
+            for k, m in enumerate(rng.sample(range(n_machines), n_machines))
+        ]
+        collection.data[job.id] = job
+    return collection
+
+
+def active_jobs_collection(rng: random.Random, n_machines: int, schedule_start: int) -> LiveJobCollection:
+    # laufende Operationen, die einzelne Maschinen über schedule_start hinaus belegen
+    collection = LiveJobCollection()
+    for m in rng.sample(range(n_machines), rng.randint(0, n_machines)):
+        job = LiveJob(id=f"A{m:02d}", routing_id="A", arrival=None, due_date=None)
+        end = schedule_start + rng.randint(1, 40)
+        job.operations = [JobOperation(job=job, position_number=0, machine_name=f"M{m:02d}", duration=end, start=0,
+                                       end=end)]
+        collection.data[job.id] = job
+    return collection
+
+
+def cp_sat_makespan(jobs_collection: LiveJobCollection, schedule_start: int, machine_ready: dict) -> int:
+    # Referenz: klassisches CP-SAT-Modell mit NoOverlap
+    model = cp_model.CpModel()
+    horizon = max([schedule_start, *machine_ready.values()]) + 1440 + sum(
+        op.duration for job in jobs_collection.values() for op in job.operations
+    )
+    intervals, ends = {}, []
+    for machine, ready in machine_ready.items():
+        intervals.setdefault(machine, []).append(model.NewFixedSizeIntervalVar(0, ready, ""))
+    for job in jobs_collection.values():
+        previous_end = max(job.earliest_start, schedule_start)
+        for op in job.operations:
+            start = model.NewIntVar(0, horizon, "")
+            end = model.NewIntVar(0, horizon, "")
+            intervals.setdefault(op.machine_name, []).append(model.NewIntervalVar(start, op.duration, end, ""))
+            model.Add(start >= previous_end)
+            previous_end = end
+        ends.append(previous_end)
+    for machine_intervals in intervals.values():
+        model.AddNoOverlap(machine_intervals)
+    makespan = model.NewIntVar(0, horizon, "")
+    model.AddMaxEquality(makespan, ends)
+    model.Minimize(makespan)
+    solver = cp_model.CpSolver()
+    solver.parameters.num_workers = 1
+    assert solver.Solve(model) == cp_model.OPTIMAL
+    return int(solver.ObjectiveValue())
+
+
+def check_schedule(jobs_collection: LiveJobCollection, schedule: LiveJobCollection, schedule_start: int,
+                   machine_ready: dict) -> int:
+    operations = [op for job in schedule.values() for op in job.operations]
+    assert len(operations) == jobs_collection.count_operations()
+    by_machine = {}
+    for job in schedule.values():
+        ops = sorted(job.operations, key=lambda op: op.position_number)
+        assert ops[0].start >= max(jobs_collection[job.id].earliest_start, schedule_start)
+        for a, b in zip(ops, ops[1:]):
+            assert a.end <= b.start
+        for op in ops:
+            assert op.end - op.start == op.duration and op.start >= machine_ready.get(op.machine_name, 0)
+            by_machine.setdefault(op.machine_name, []).append(op)
+    for ops in by_machine.values():
+        ops.sort(key=lambda op: op.start)
+        for a, b in zip(ops, ops[1:]):
+            assert a.end <= b.start
+    return max(op.end for op in operations)
+
+
+if __name__ == '__main__':
+    # 1) kleine Zufallsinstanzen (mit Ankunftszeiten) gegen CP-SAT
+    rng = random.Random(42)
+    for instance in range(60):
+        schedule_start = rng.choice([0, 10])
+        n_machines = rng.randint(2, 5)
+        jobs_collection = random_jobs_collection(rng, rng.randint(3, 7), n_machines)
+        active = active_jobs_collection(rng, n_machines, schedule_start)
+        machine_ready = {job.operations[0].machine_name: job.operations[0].end for job in active.values()}
+
+        engine = BranchAndBoundEngine(jobs_collection, schedule_start=schedule_start, active_jobs_collection=active)
+        schedule = engine.get_schedule()
+        makespan = check_schedule(jobs_collection, schedule, schedule_start, machine_ready)
+        reference = cp_sat_makespan(jobs_collection, schedule_start, machine_ready)
+        assert engine.is_optimal and makespan == engine.makespan == reference, (makespan, engine.makespan, reference)
+    print("60 random instances (release times, busy machines): optimal makespan equal to CP-SAT, schedules valid")
+
+    # 2) FT10 (ohne Rüstzeiten, alle Jobs ab 0: arrival None)
+    catalog = JobCatalog.get("Fisher and Thompson 10x10", "0.85")
+    jobs_collection = catalog.get_jobs_collection(with_transition_times=False)
+    ft10 = LiveJobCollection()
+    for job in jobs_collection.values():
+        if all(other.routing_id != job.routing_id for other in ft10.values()):
+            job.arrival = None
+            ft10.data[job.id] = job
+    print(f"FT10: {len(ft10)} jobs, {ft10.count_operations()} operations")
+
+    start_time = time.perf_counter()
+    engine = BranchAndBoundEngine(ft10, schedule_start=0)
+    schedule = engine.get_schedule(time_limit=1800)
+    elapsed = time.perf_counter() - start_time
+    makespan = check_schedule(ft10, schedule, 0, {})
+    print(f"BranchAndBoundEngine: makespan {makespan}, lower bound {engine.lower_bound}, optimal {engine.is_optimal}, "
+          f"{elapsed:.1f} s, {engine.stats}")
+    assert makespan == 930 and engine.is_optimal
+    print("old scripts (Eigenversuche/BnB_copy_3.py): about 80 minutes for FT10")
@@ -0,0 +1,99 @@
+import random
+import time
+from collections import defaultdict
+
+from src.Logger import Logger
+from src.domain.JobCatalog import JobCatalog
+from src.solvers.GA_Solver import Solver, decode_chromosome, evaluate_starts
+
+
+def queue_decode(perm, op_list, earliest_start):
+    # bisheriger Decoder (GA_Solver._decode): Operationen, die noch nicht dran sind, ans Ende der Queue
+    next_needed = {j: 0 for j, *_ in op_list}
+    machine_free = defaultdict(int)
+    job_free = defaultdict(int)
+    for j in next_needed:
+        job_free[j] = earliest_start.get(j, 0)
+
+    schedule = []
+    queue = list(perm)
+    while queue:
+        op_id = queue.pop(0)
+        j, k, m, d = op_list[op_id]
+        if k != next_needed[j]:
+            queue.append(op_id)
+            continue
+        start = max(machine_free[m], job_free[j])
+        end = start + d
+        machine_free[m] = end
+        job_free[j] = end
+        next_needed[j] += 1
+        schedule.append((j, k, m, start, d, end))
+    return schedule
+
+
+if __name__ == '__main__':
+    logger = Logger(name="ga_decoder")
+    catalog = JobCatalog.get("Fisher and Thompson 10x10", "0.85")
+    jobs_collection = catalog.get_jobs_collection(arrival_limit=1440 * 5)
+
+    solver = Solver(jobs_collection, logger)
+    problem = solver._build_problem("tardiness")
+    n_jobs = len(problem.job_release)
+    genes = [j for j in range(n_jobs) for _ in range(problem.op_offset[j + 1] - problem.op_offset[j])]
+    print(f"{n_jobs} jobs, {len(genes)} operations")
+
+    # 1) gleiche Schedules wie der Queue-Decoder (Permutation der Operationen in Reihenfolge der Wiederholungen)
+    op_list = [(j, k - problem.op_offset[j], problem.op_machine[k], problem.op_duration[k])
+               for j in range(n_jobs) for k in range(problem.op_offset[j], problem.op_offset[j + 1])]
+    earliest_start = dict(enumerate(problem.job_release))
+    rng = random.Random(0)
+    chromosomes = []
+    for _ in range(20):
+        chromosome = list(genes)
+        rng.shuffle(chromosome)
+        chromosomes.append(chromosome)
+
+    queue_time = shuffled_queue_time = decoder_time = 0.0
+    for chromosome in chromosomes:
+        counter = list(problem.op_offset[:-1])
+        perm = []
+        for j in chromosome:
+            perm.append(counter[j])
+            counter[j] += 1
+        shuffled_perm = list(perm)
+        rng.shuffle(shuffled_perm)  # beliebige Permutation: Queue-Decoder stellt die Reihenfolge selbst her
+
+        start = time.perf_counter()
+        reference = queue_decode(perm, op_list, earliest_start)
+        queue_time += time.perf_counter() - start
+        start = time.perf_counter()
+        queue_decode(shuffled_perm, op_list, earliest_start)
+        shuffled_queue_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        starts = decode_chromosome(chromosome, problem)
+        decoder_time += time.perf_counter() - start
+
+        by_operation = {(j, k): s for j, k, m, s, d, e in reference}
+        assert starts == [by_operation[(j, k)] for j, k, _, _ in op_list]
+        reference_tardiness = sum(
+            max(0, e - problem.job_due_date[j]) for j, k, m, s, d, e in reference if k == len(jobs_collection[
+                solver._job_ids[j]].operations) - 1
+        )
+        assert evaluate_starts(starts, problem) == reference_tardiness
+    print(f"Decoder equal to the queue decoder (20 chromosomes) | job repetition {decoder_time / 20 * 1000:6.2f} ms "
+          f"| queue {queue_time / 20 * 1000:7.2f} ms ({queue_time / decoder_time:5.1f}x), "
+          f"queue with random operation permutation (GA so far) {shuffled_queue_time / 20 * 1000:7.2f} ms "
+          f"({shuffled_queue_time / decoder_time:5.1f}x)")
+
+    # 2) seriell und im Prozess-Pool: gleiches Ergebnis
+    results = []
+    for max_workers in [1, 4]:
+        solver = Solver(jobs_collection, logger)
+        solver.solve_model(objective="tardiness", pop_size=80, ngen=30, seed=1, max_workers=max_workers)
+        info = solver.get_solver_info()
+        results.append(info["objective_value"])
+        print(f"workers {info['workers']}: {info}")
+    assert results[0] == results[1]
+    print("Serial and process pool evaluation identical")
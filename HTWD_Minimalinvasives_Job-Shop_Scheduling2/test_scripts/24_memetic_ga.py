@@ -0,0 +1,107 @@
+import math
+import time
+
+from src.Logger import Logger
+from src.domain.Collection import LiveJobCollection
+from src.domain.JobCatalog import JobCatalog
+from src.domain.OperationEnrichment import set_sim_durations
+from src.simulation.LognormalFactorGenerator import LognormalFactorGenerator
+from src.simulation.ProductionSimulation import ProductionSimulation
+from src.solvers.CP_RollingHorizonSolver import evaluate_lateness_deviation_objective
+from src.solvers.CP_Solver import Solver
+from src.solvers.GA_Solver import Solver as GeneticAlgorithmSolver
+
+def check_schedule(schedule: LiveJobCollection, jobs_collection: LiveJobCollection, schedule_start: int,
+                   active_jobs_collection: LiveJobCollection):
+    # alle Operationen geplant, Reihenfolge im Job, keine Überlappung je Maschine, laufende Operationen blockieren
+    assert schedule.count_operations() == jobs_collection.count_operations()
+    by_machine = {}
+    for job in active_jobs_collection.values():
+        for operation in job.operations:
+            by_machine.setdefault(operation.machine_name, []).append((0, int(math.ceil(operation.end))))
+    for job in schedule.values():
+        previous_end = schedule_start
+        for operation in job.operations:
+            assert operation.start >= max(previous_end, operation.job_earliest_start)
+            previous_end = operation.end
+            by_machine.setdefault(operation.machine_name, []).append((operation.start, operation.end))
+    for intervals in by_machine.values():
+        intervals.sort()
+        for (_, end), (start, _) in zip(intervals, intervals[1:]):
+            assert start >= end
+
+
+if __name__ == '__main__':
+    source_name = "Fisher and Thompson 10x10"
+    logger = Logger(name="memetic_ga")
+    shift_length = 1440
+    total_shift_number = 4
+    w_t, w_e, w_dev = 10, 2, 1
+    ga_time_limit = 10
+    cp_time_limits = [10, 60]
+
+    # Schichtweise wie CP_Experiment_Runner (Simulation mit dem Schedule des memetischen GA)
+    catalog = JobCatalog.get(source_name, "0.85")
+    jobs_collection = catalog.get_jobs_collection(arrival_limit=shift_length * total_shift_number)
+    jobs_collection.sort_jobs_by_id()
+    jobs_collection.sort_operations()
+    set_sim_durations(jobs_collection, LognormalFactorGenerator(sigma=0.2, seed=42))
+
+    simulation = ProductionSimulation(verbose=False)
+    schedule_jobs_collection = LiveJobCollection()
+    active_job_ops_collection = LiveJobCollection()
+    waiting_job_ops_collection = LiveJobCollection()
+
+    for shift_number in range(1, total_shift_number + 1):
+        shift_start = shift_number * shift_length
+        current_jobs_collection = (jobs_collection.get_subset_by_earliest_start(earliest_start=shift_start)
+                                   + waiting_job_ops_collection)
+        previous_w_dev = w_dev if schedule_jobs_collection.count_operations() else 0
+
+        def objective(schedule: LiveJobCollection) -> int:
+            return sum(evaluate_lateness_deviation_objective(
+                schedule, schedule_jobs_collection, w_t, w_e, previous_w_dev
+            ).values())
+
+        results = []
+        for name, memetic, ngen in [("GA (eaSimple)", False, 30), ("memetic GA", True, None)]:
+            solver = GeneticAlgorithmSolver(current_jobs_collection, logger, schedule_start=shift_start)
+            solver.build_model__absolute_lateness__start_deviation__minimization(
+                previous_schedule_jobs_collection=schedule_jobs_collection,
+                active_jobs_collection=active_job_ops_collection, w_t=w_t, w_e=w_e, w_dev=w_dev
+            )
+            solver.solve_model(ngen=ngen, memetic=memetic, time_limit=ga_time_limit, max_workers=1)
+            schedule = solver.get_schedule()
+            check_schedule(schedule, current_jobs_collection, shift_start, active_job_ops_collection)
+            assert objective(schedule) == solver.best_value
+            info = solver.get_solver_info()
+            results.append((name, solver.best_value, solver.wall_time,
+                            f"{info['number_of_generations']} generations, {info['generations_per_second']}/s"))
+            if memetic:
+                ga_schedule = schedule
+
+        # CP-SAT (1 Worker)
+        for time_limit in cp_time_limits:
+            solver = Solver(current_jobs_collection, logger, schedule_start=shift_start)
+            solver.build_model__absolute_lateness__start_deviation__minimization(
+                previous_schedule_jobs_collection=schedule_jobs_collection,
+                active_jobs_collection=active_job_ops_collection, w_t=w_t, w_e=w_e, w_dev=w_dev
+            )
+            start = time.perf_counter()
+            solver.solve_model(time_limit=time_limit, gap_limit=0.002, num_search_workers=1,
+                               bound_no_improvement_time=None)
+            wall_time = time.perf_counter() - start
+            schedule = solver.get_schedule()
+            check_schedule(schedule, current_jobs_collection, shift_start, active_job_ops_collection)
+            results.append((f"CP-SAT {time_limit:>3} s", objective(schedule), wall_time,
+                            solver.get_solver_info()["status"]))
+
+        print(f"Shift {shift_number} | operations {current_jobs_collection.count_operations()}")
+        for name, value, wall_time, info in results:
+            print(f"  {name:14} | objective {value:>8} | {wall_time:6.1f} s | {info}")
+
+        schedule_jobs_collection = ga_schedule
+        simulation.run(schedule_collection=schedule_jobs_collection, start_time=shift_start,
+                       end_time=shift_start + shift_length)
+        active_job_ops_collection = simulation.get_active_operation_collection()
+        waiting_job_ops_collection = simulation.get_waiting_operation_collection()
@@ -0,0 +1,132 @@
+import time
+
+import pulp
+
+from src.domain.Collection import LiveJobCollection
+from src.domain.JobCatalog import JobCatalog
+from src.domain.orm_models import JobOperation, LiveJob
+from src.solvers.LP_Solver import Solver
+
+FT06 = [
+    [(2, 1), (0, 3), (1, 6), (3, 7), (5, 3), (4, 6)],
+    [(1, 8), (2, 5), (4, 10), (5, 10), (0, 10), (3, 4)],
+    [(2, 5), (3, 4), (5, 8), (0, 9), (1, 1), (4, 7)],
+    [(1, 5), (0, 5), (2, 5), (3, 3), (4, 8), (5, 9)],
+    [(2, 9), (1, 3), (4, 5), (5, 4), (0, 3), (3, 1)],
+    [(1, 3), (3, 3), (5, 9), (0, 10), (4, 4), (2, 1)],
+]
+
+
+def ft06_collection() -> LiveJobCollection:
+    collection = LiveJobCollection()
+    for j, routing in enumerate(FT06):
+        job = LiveJob(id=f"J{j}", routing_id=f"R{j}", arrival=None, due_date=None)
+        job.operations = [JobOperation(job=job, position_number=k, machine_name=f"M{m}", duration=p)
+                          for k, (m, p) in enumerate(routing)]
+        collection.data[job.id] = job
+    return collection
+
+
+def previous_lp_problem(jobs_collection: LiveJobCollection, var_cat: str) -> pulp.LpProblem:
+    # bisheriges LP_Solver-Modell: je geordnetem Paar eine Binärvariable, globales M
+    problem = pulp.LpProblem("previous", pulp.LpMinimize)
+    big_m = (jobs_collection.get_latest_earliest_start() or 0) + jobs_collection.get_total_duration()
+    starts = {
+        (job.id, op.position_number): pulp.LpVariable(f"s_{job.id}_{op.position_number}", job.earliest_start,
+                                                      cat=var_cat)
+        for job in jobs_collection.values() for op in job.operations
+    }
+    makespan = pulp.LpVariable("makespan", 0, cat=var_cat)
+    problem += makespan
+    for job in jobs_collection.values():
+        for a, b in zip(job.operations, job.operations[1:]):
+            problem += starts[(job.id, b.position_number)] >= starts[(job.id, a.position_number)] + a.duration
+        last = job.operations[-1]
+        problem += makespan >= starts[(job.id, last.position_number)] + last.duration
+    for machine in jobs_collection.get_unique_machine_names():
+        operations = jobs_collection.get_all_operations_on_machine(machine_name=machine)
+        for a in operations:
+            for b in operations:
+                if a is b:
+                    continue
+                s_a, s_b = starts[(a.job_id, a.position_number)], starts[(b.job_id, b.position_number)]
+                y = pulp.LpVariable(f"y_{a.job_id}_{a.position_number}_{b.job_id}_{b.position_number}", cat="Binary")
+                problem += s_a + a.duration <= s_b + big_m * (1 - y)
+                problem += s_b + b.duration <= s_a + big_m * y
+    return problem
+
+
+def solve(problem: pulp.LpProblem, relaxed: bool, time_limit: int, warm_start: bool):
+    if relaxed:
+        for variable in problem.variables():
+            if variable.isBinary():
+                variable.cat = pulp.LpContinuous
+    start = time.perf_counter()
+    problem.solve(pulp.PULP_CBC_CMD(msg=False, timeLimit=time_limit, warmStart=warm_start and not relaxed))
+    # sol_status: "Optimal Solution Found" nur mit Optimalitätsnachweis (sonst Zeitlimit)
+    found = problem.sol_status in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible)
+    value = pulp.value(problem.objective) if found else None
+    return value, pulp.LpSolution[problem.sol_status], time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    time_limit = 30
+    catalog = JobCatalog.get("Fisher and Thompson 10x10", "0.85")
+
+    ft10 = LiveJobCollection()
+    for job in catalog.get_jobs_collection(with_transition_times=False).values():
+        if all(other.routing_id != job.routing_id for other in ft10.values()):
+            job.arrival = None
+            ft10.data[job.id] = job
+
+    jobs_collection = catalog.get_jobs_collection(arrival_limit=1440 * 3, with_transition_times=False)
+    instances = [
+        ("FT06", ft06_collection, 0),
+        ("FT10", lambda: LiveJobCollection(list(ft10.values())), 0),
+        ("Shift 1 (FT10, 0.85)", lambda: jobs_collection.get_subset_by_earliest_start(1440), 1440),
+        ("Shift 2 (FT10, 0.85)", lambda: jobs_collection.get_subset_by_earliest_start(2880), 2880),
+    ]
+
+    for name, get_collection, schedule_start in instances:
+        print(f"{name}: {get_collection().count_operations()} operations")
+        results = []
+        for variant in ["previous", "global", "machine", "pair", "time_indexed"]:
+            values = []
+            for relaxed in [True, False]:
+                start = time.perf_counter()
+                if variant == "previous":
+                    problem = previous_lp_problem(get_collection(), "Continuous")
+                    binaries = sum(variable.isBinary() for variable in problem.variables())
+                    fixed_pairs = 0
+                else:
+                    solver = Solver(
+                        get_collection(), epsilon=0.0, schedule_start=schedule_start,
+                        big_m="pair" if variant == "time_indexed" else variant,
+                        formulation="auto" if variant == "time_indexed" else "disjunctive"
+                    )
+                    if variant == "time_indexed" and solver.model_builder.formulation != "time_indexed":
+                        break  # Horizont zu groß
+                    solver.build_makespan_problem()
+                    problem = solver.problem
+                    binaries = solver.model_builder.number_of_binaries
+                    fixed_pairs = solver.model_builder.number_of_fixed_pairs
+                build_time = time.perf_counter() - start
+                values.append(solve(problem, relaxed, time_limit, warm_start=variant != "previous"))
+            if not values:
+                continue
+            (lp_value, _, _), (value, status, solve_time) = values
+            results.append((variant, value, status))
+            mip_value = "-" if value is None else f"{value:.1f}"
+            print(f"  {variant:12} | binaries {binaries:>6} (fixed pairs {fixed_pairs:>5}) "
+                  f"| constraints {len(problem.constraints):>6} | build {build_time:5.2f} s "
+                  f"| LP relaxation {lp_value:9.1f} | MIP {mip_value:>9} {status:24} {solve_time:6.1f} s")
+
+        optimal = {value for _, value, status in results if status == pulp.LpSolution[pulp.LpSolutionOptimal]}
+        assert len(optimal) <= 1, results
+
+        # kein Rückschritt gegenüber dem bisherigen Modell (Startlösung: mindestens der Dispatching-Schedule)
+        previous_value = results[0][1]
+        for variant, value, _ in results[1:]:
+            assert value is not None, (name, variant, "no solution")
+            assert previous_value is None or value <= previous_value + 1e-6, (name, variant, value, previous_value)
+    print("Proven optimal makespans equal and no formulation worse than the previous model")